@@ -19,9 +19,12 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+from abc import ABCMeta
 
 from pynestml.meta_model.ast_node import ASTNode
+from pynestml.visitors.ast_visitor import ASTVisitor
 
 
 class CoCo:
@@ -35,11 +38,19 @@ class CoCo:
     __metaclass__ = ABCMeta
     description = None
 
-    @abstractmethod
-    def check_co_co(self, node: ASTNode) -> bool:
+    @classmethod
+    def check_co_co(cls, node: ASTNode):
+        """
+        Checks the coco on the handed over node. Concrete cocos either override this method, or provide a visitor by ``get_visitor()``, which is then run on the node.
+        :param node: a single neuron instance on which the coco will be checked.
+        """
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNode) -> Optional[ASTVisitor]:
         """
-        This is an abstract method which should be implemented by all concrete cocos.
+        Returns a visitor that checks the coco while it traverses the handed over node, if the coco can be checked by a single visitor that uses the standard traversal (see ``ASTFusedVisitor``). The visitors of several cocos can then be run in one traversal of the model, as in ``CoCosManager.check_cocos()``.
         :param node: a single neuron instance on which the coco will be checked.
-        :return: True, if CoCo holds, otherwise False.
+        :return: a visitor, or None if the coco is only checked by ``check_co_co()``.
         """
-        return False
+        return None
@@ -21,7 +21,6 @@
 
 from pynestml.cocos.co_co import CoCo
 from pynestml.meta_model.ast_model import ASTModel
-from pynestml.utils.channel_processing import ChannelProcessing
 
 
 class CoCoCmChannelModel(CoCo):
@@ -32,4 +31,5 @@ class CoCoCmChannelModel(CoCo):
         If yes, it checks the presence of expected functions and declarations.
         :param model: a single neuron instance.
         """
+        from pynestml.utils.channel_processing import ChannelProcessing
         return ChannelProcessing.check_co_co(model)
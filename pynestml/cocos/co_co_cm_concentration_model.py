@@ -21,7 +21,6 @@
 
 from pynestml.cocos.co_co import CoCo
 from pynestml.meta_model.ast_model import ASTModel
-from pynestml.utils.concentration_processing import ConcentrationProcessing
 
 
 class CoCoCmConcentrationModel(CoCo):
@@ -33,4 +32,5 @@ class CoCoCmConcentrationModel(CoCo):
         If yes, it checks the presence of expected functions and declarations.
         :param model: a single neuron instance.
         """
+        from pynestml.utils.concentration_processing import ConcentrationProcessing
         return ConcentrationProcessing.check_co_co(model)
@@ -21,7 +21,6 @@
 
 from pynestml.cocos.co_co import CoCo
 from pynestml.meta_model.ast_model import ASTModel
-from pynestml.utils.continuous_input_processing import ContinuousInputProcessing
 
 
 class CoCoCmContinuousInputModel(CoCo):
@@ -33,4 +32,5 @@ class CoCoCmContinuousInputModel(CoCo):
         :param neuron: a single neuron instance.
         :type neuron: ast_neuron
         """
+        from pynestml.utils.continuous_input_processing import ContinuousInputProcessing
         return ContinuousInputProcessing.check_co_co(neuron)
@@ -21,7 +21,6 @@
 
 from pynestml.cocos.co_co import CoCo
 from pynestml.meta_model.ast_model import ASTModel
-from pynestml.utils.synapse_processing import SynapseProcessing
 
 
 class CoCoCmSynapseModel(CoCo):
@@ -33,4 +32,5 @@ class CoCoCmSynapseModel(CoCo):
         If yes, it checks the presence of expected functions and declarations.
         :param model: a single neuron instance.
         """
+        from pynestml.utils.synapse_processing import SynapseProcessing
         return SynapseProcessing.check_co_co(model)
@@ -40,12 +40,8 @@ class CoCoConvolveCondCorrectlyBuilt(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
-        node.accept(ConvolveCheckerVisitor())
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return ConvolveCheckerVisitor()
 
 
 class ConvolveCheckerVisitor(ASTVisitor):
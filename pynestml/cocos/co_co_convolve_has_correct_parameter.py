@@ -41,13 +41,9 @@ class CoCoConvolveHasCorrectParameter(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model):
-        """
-        Ensures the coco for the handed over model.
-        :param model: a single model instance.
-=        """
+    def get_visitor(cls, model) -> ASTVisitor:
         visitor = ConvolveParametersCorrectVisitor()
-        model.accept(visitor)
+        return visitor
 
 
 class ConvolveParametersCorrectVisitor(ASTVisitor):
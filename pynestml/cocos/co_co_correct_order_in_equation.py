@@ -39,12 +39,8 @@ class CoCoCorrectOrderInEquation(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param model: a single neuron instance.
-        """
-        model.accept(OrderOfEquationVisitor())
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        return OrderOfEquationVisitor()
 
 
 class OrderOfEquationVisitor(ASTVisitor):
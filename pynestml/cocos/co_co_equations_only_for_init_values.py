@@ -53,12 +53,8 @@ class CoCoEquationsOnlyForInitValues(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
-        node.accept(EquationsOnlyForInitValues())
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return EquationsOnlyForInitValues()
 
 
 class EquationsOnlyForInitValues(ASTVisitor):
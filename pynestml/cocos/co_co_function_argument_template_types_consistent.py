@@ -35,13 +35,8 @@ class CoCoFunctionArgumentTemplateTypesConsistent(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, neuron):
-        """
-        Ensures the coco for the handed over neuron.
-        :param neuron: a single neuron instance.
-        :type neuron: ASTModel
-        """
-        neuron.accept(CorrectTemplatedArgumentTypesVisitor())
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        return CorrectTemplatedArgumentTypesVisitor()
 
 
 class CorrectTemplatedArgumentTypesVisitor(ASTVisitor):
@@ -38,13 +38,8 @@ class CoCoFunctionCallsConsistent(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
-        """
-        Checks the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        :type node: ASTModel
-        """
-        node.accept(FunctionCallConsistencyVisitor())
+    def get_visitor(cls, node) -> ASTVisitor:
+        return FunctionCallConsistencyVisitor()
 
 
 class FunctionCallConsistencyVisitor(ASTVisitor):
@@ -38,13 +38,8 @@ class CoCoIllegalExpression(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, neuron):
-        """
-        Ensures the coco for the handed over neuron.
-        :param neuron: a single neuron instance.
-        :type neuron: ASTModel
-        """
-        neuron.accept(CorrectExpressionVisitor())
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        return CorrectExpressionVisitor()
 
 
 class CorrectExpressionVisitor(ASTVisitor):
@@ -35,14 +35,10 @@ class CoCoInlineExpressionNotAssignedTo(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         visitor = NoInlineExpressionAssignedToVisitor()
         visitor.neuron_ = node
-        node.accept(visitor)
+        return visitor
 
 
 class NoInlineExpressionAssignedToVisitor(ASTVisitor):
@@ -33,12 +33,8 @@ class CoCoInlineExpressionsHaveRhs(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
-        node.accept(InlineRhsVisitor())
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return InlineRhsVisitor()
 
 
 class InlineRhsVisitor(ASTVisitor):
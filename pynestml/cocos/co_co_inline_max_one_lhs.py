@@ -37,12 +37,8 @@ class CoCoInlineMaxOneLhs(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param model: a single model instance.
-        """
-        model.accept(InlineMaxOneLhs())
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        return InlineMaxOneLhs()
 
 
 class InlineMaxOneLhs(ASTVisitor):
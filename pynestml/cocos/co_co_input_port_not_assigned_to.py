@@ -54,12 +54,8 @@ class CoCoInputPortNotAssignedTo(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
-        node.accept(NoInputPortAssignedToVisitor())
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return NoInputPortAssignedToVisitor()
 
 
 class NoInputPortAssignedToVisitor(ASTVisitor):
@@ -45,13 +45,9 @@ class CoCoInputPortQualifierUnique(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Ensures the coco for the handed over model.
-        :param node: a single model instance.
-        """
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
         cls.neuronName = model.get_name()
-        model.accept(InputPortQualifierUniqueVisitor())
+        return InputPortQualifierUniqueVisitor()
 
 
 class InputPortQualifierUniqueVisitor(ASTVisitor):
@@ -35,12 +35,8 @@ class CoCoIntegrateODEsParamsCorrect(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Ensures the coco for the handed over model.
-        :param node: a single model instance.
-        """
-        model.accept(IntegrateODEsCheckerVisitor())
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        return IntegrateODEsCheckerVisitor()
 
 
 class IntegrateODEsCheckerVisitor(ASTVisitor):
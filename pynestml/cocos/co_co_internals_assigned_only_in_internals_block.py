@@ -37,16 +37,12 @@ class CoCoInternalsAssignedOnlyInInternalsBlock(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         assert (node is not None and isinstance(node, ASTModel)), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type of neuron provided (%s)!' % type(node)
         visitor = InternalsAssignmentVisitor()
         visitor.neuron_ = node
-        node.accept(visitor)
+        return visitor
 
 
 class InternalsAssignmentVisitor(ASTVisitor):
@@ -37,13 +37,9 @@ class CoCoInvariantIsBoolean(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Ensures the coco for the handed over model.
-        :param model: a single model instance.
-        """
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
         visitor = InvariantTypeVisitor()
-        model.accept(visitor)
+        return visitor
 
 
 class InvariantTypeVisitor(ASTVisitor):
@@ -39,14 +39,10 @@ class CoCoKernelType(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         kernel_type_visitor = KernelTypeVisitor()
         kernel_type_visitor._neuron = node
-        node.accept(kernel_type_visitor)
+        return kernel_type_visitor
 
 
 class KernelTypeVisitor(ASTVisitor):
@@ -32,12 +32,8 @@ class CoCoOdeFunctionsHaveConsistentUnits(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
-        node.accept(OdeFunctionConsistentUnitsVisitor())
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return OdeFunctionConsistentUnitsVisitor()
 
 
 class OdeFunctionConsistentUnitsVisitor(ASTVisitor):
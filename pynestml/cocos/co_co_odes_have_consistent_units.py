@@ -34,12 +34,8 @@ class CoCoOdesHaveConsistentUnits(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        """
-        node.accept(OdeConsistentUnitsVisitor())
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return OdeConsistentUnitsVisitor()
 
 
 class OdeConsistentUnitsVisitor(ASTVisitor):
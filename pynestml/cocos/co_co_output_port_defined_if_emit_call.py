@@ -37,14 +37,10 @@ class CoCoOutputPortDefinedIfEmitCall(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, neuron: ASTModel):
-        """
-        Checks the coco for the handed over neuron.
-        :param neuron: a single neuron instance.
-        """
+    def get_visitor(cls, neuron: ASTModel) -> ASTVisitor:
         visitor = OutputPortDefinedIfEmitCalledVisitor()
         visitor.neuron = neuron
-        neuron.accept(visitor)
+        return visitor
 
 
 class OutputPortDefinedIfEmitCalledVisitor(ASTVisitor):
@@ -44,16 +44,10 @@ class CoCoParametersAssignedOnlyInParameterBlock(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
-        """
-        Ensures the coco for the handed over neuron.
-        :param node: a single neuron instance.
-        :type node: ASTModel
-        """
+    def get_visitor(cls, node) -> ASTVisitor:
         assert (node is not None and (isinstance(node, ASTModel))), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type of neuron provided (%s)!' % type(node)
-        node.accept(ParametersAssignmentVisitor())
-        return
+        return ParametersAssignmentVisitor()
 
 
 class ParametersAssignmentVisitor(ASTVisitor):
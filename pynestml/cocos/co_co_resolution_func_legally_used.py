@@ -35,14 +35,10 @@ class CoCoResolutionFuncLegallyUsed(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
-        """
-        Checks the coco.
-        :param node: a single node (typically, a neuron or synapse)
-        """
+    def get_visitor(cls, node) -> ASTVisitor:
         visitor = CoCoResolutionFuncLegallyUsedVisitor()
         visitor.neuron = node
-        node.accept(visitor)
+        return visitor
 
 
 class CoCoResolutionFuncLegallyUsedVisitor(ASTVisitor):
@@ -34,11 +34,7 @@ class CoCoResolutionOrStepsFuncUsed(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Checks the coco.
-        :param model: a single neuron
-        """
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
         class CoCoResolutionOrStepsFuncUsedVisitor(ASTVisitor):
             def visit_simple_expression(self, node):
                 if node.get_function_call() is None:
@@ -51,4 +47,4 @@ class CoCoResolutionOrStepsFuncUsed(CoCo):
 
         visitor = CoCoResolutionOrStepsFuncUsedVisitor()
         visitor.neuron = model
-        model.accept(visitor)
+        return visitor
@@ -24,6 +24,7 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.meta_model.ast_kernel import ASTKernel
 
@@ -34,13 +35,7 @@ class CoCoSimpleDeltaFunction(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
-        """
-        Checks if this coco applies for the handed over neuron.
-
-        :param model: a single model instance.
-        """
-
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
         def check_simple_delta(_expr=None):
             if _expr.is_function_call() and _expr.get_function_call().get_name() == "delta":
                 deltafunc = _expr.get_function_call()
@@ -63,4 +58,4 @@ class CoCoSimpleDeltaFunction(CoCo):
         def func(x):
             return check_simple_delta(x) if isinstance(x, ASTSimpleExpression) else True
 
-        model.accept(ASTHigherOrderVisitor(func))
+        return ASTHigherOrderVisitor(func)
@@ -35,14 +35,10 @@ class CoCoTimestepFuncLegallyUsed(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
-        """
-        Checks the coco.
-        :param node: a single node (typically, a neuron or synapse)
-        """
+    def get_visitor(cls, node) -> ASTVisitor:
         visitor = CoCoTimestepFuncLegallyUsedVisitor()
         visitor.neuron = node
-        node.accept(visitor)
+        return visitor
 
 
 class CoCoTimestepFuncLegallyUsedVisitor(ASTVisitor):
@@ -36,10 +36,10 @@ class CoCoVectorDeclarationRightSize(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         visitor = VectorDeclarationVisitor()
         visitor._neuron = node
-        node.accept(visitor)
+        return visitor
 
 
 class VectorDeclarationVisitor(ASTVisitor):
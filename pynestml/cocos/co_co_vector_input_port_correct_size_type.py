@@ -35,9 +35,9 @@ class CoCoVectorInputPortsCorrectSizeType(CoCo):
     This CoCo checks if the size of the vector input port is of the type integer and its value is greater than 0.
     """
     @classmethod
-    def check_co_co(cls, node: ASTModel):
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         visitor = InputPortsVisitor()
-        node.accept(visitor)
+        return visitor
 
 
 class InputPortsVisitor(ASTVisitor):
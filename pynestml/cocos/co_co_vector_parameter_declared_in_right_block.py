@@ -36,9 +36,9 @@ class CoCoVectorParameterDeclaredInRightBlock(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         visitor = VectorDeclarationVisitor()
-        node.accept(visitor)
+        return visitor
 
 
 class VectorDeclarationVisitor(ASTVisitor):
@@ -35,16 +35,10 @@ class CoCoVectorVariableInNonVectorDeclaration(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
-        """
-        Ensures the coco for the handed over node.
-        :param node: a single node instance.
-        :type node: ASTModel
-        """
+    def get_visitor(cls, node) -> ASTVisitor:
         assert node is not None and (isinstance(node, ASTModel)), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type provided (%s): expecting neuron or synapse!' % type(node)
-        node.accept(VectorInDeclarationVisitor())
-        return
+        return VectorInDeclarationVisitor()
 
 
 class VectorInDeclarationVisitor(ASTVisitor):
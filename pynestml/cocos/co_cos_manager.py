@@ -19,8 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Union
+from typing import List, Type, Union
 
+from pynestml.cocos.co_co import CoCo
 from pynestml.cocos.co_co_all_variables_defined import CoCoAllVariablesDefined
 from pynestml.cocos.co_co_cm_channel_model import CoCoCmChannelModel
 from pynestml.cocos.co_co_cm_concentration_model import CoCoCmConcentrationModel
@@ -72,6 +73,7 @@ from pynestml.cocos.co_co_vector_variable_in_non_vector_declaration import CoCoV
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.utils.logger import Logger
+from pynestml.visitors.ast_fused_visitor import ASTFusedVisitor
 
 
 class CoCosManager:
@@ -428,59 +430,86 @@ class CoCosManager:
         CoCoNestRandomFunctionsLegallyUsed.check_co_co(model)
 
     @classmethod
-    def check_cocos(cls, model: ASTModel, after_ast_rewrite: bool = False):
+    def get_cocos(cls, after_ast_rewrite: bool = False) -> List[Type[CoCo]]:
         """
-        Checks all context conditions.
-        :param model: a single model object.
+        Returns the context conditions that are checked by ``check_cocos()``, in the order in which they are checked when they are not fused.
+        :param after_ast_rewrite: whether the model has been transformed already
+        :return: a list of coco classes
         """
-        Logger.set_current_node(model)
-
-        cls.check_each_block_defined_at_most_once(model)
-        cls.check_function_defined(model)
-        cls.check_variables_unique_in_scope(model)
-        cls.check_inline_expression_not_assigned_to(model)
-        cls.check_state_variables_initialized(model)
-        cls.check_variables_defined_before_usage(model)
+        cocos = [CoCoEachBlockDefinedAtMostOnce,
+                 CoCoFunctionUnique,
+                 CoCoVariableOncePerScope,
+                 CoCoInlineExpressionNotAssignedTo,
+                 CoCoStateVariablesInitialized,
+                 CoCoAllVariablesDefined]
         if FrontendConfiguration.get_target_platform().upper() == 'NEST_COMPARTMENTAL':
             # XXX: TODO: refactor this out; define a ``cocos_from_target_name()`` in the frontend instead.
-            cls.check_v_comp_requirement(model)
-            cls.check_compartmental_model(model)
-        cls.check_inline_expressions_have_rhs(model)
-        cls.check_inline_has_max_one_lhs(model)
-        cls.check_input_ports_not_assigned_to(model)
-        cls.check_order_of_equations_correct(model)
-        cls.check_numerator_of_unit_is_one_if_numeric(model)
-        cls.check_no_nest_namespace_collisions(model)
-        cls.check_input_port_qualifier_unique(model)
-        cls.check_parameters_not_assigned_outside_parameters_block(model)
-        cls.check_internals_not_assigned_outside_internals_block(model)
-        cls.check_user_defined_function_correctly_built(model)
-        cls.check_initial_ode_initial_values(model)
-        cls.check_kernel_type(model)
-        cls.check_convolve_cond_curr_is_correct(model)
-        cls.check_integrate_odes_params_correct(model)
-        cls.check_output_port_defined_if_emit_call(model)
+            cocos += [CoCoVCompDefined,
+                      CoCoCmChannelModel,
+                      CoCoCmConcentrationModel,
+                      CoCoCmSynapseModel,
+                      CoCoCmContinuousInputModel]
+        cocos += [CoCoInlineExpressionsHaveRhs,
+                  CoCoInlineMaxOneLhs,
+                  CoCoInputPortNotAssignedTo,
+                  CoCoCorrectOrderInEquation,
+                  CoCoCorrectNumeratorOfUnit,
+                  CoCoNoNestNameSpaceCollision,
+                  CoCoInputPortQualifierUnique,
+                  CoCoParametersAssignedOnlyInParameterBlock,
+                  CoCoInternalsAssignedOnlyInInternalsBlock,
+                  CoCoUserDefinedFunctionCorrectlyDefined,
+                  CoCoEquationsOnlyForInitValues,
+                  CoCoKernelType,
+                  CoCoConvolveCondCorrectlyBuilt,
+                  CoCoIntegrateODEsParamsCorrect,
+                  CoCoOutputPortDefinedIfEmitCall]
         if not after_ast_rewrite:
             # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
-            cls.check_odes_have_consistent_units(model)
-            # ODE functions have been removed at this point
-            cls.check_function_declared_and_correctly_typed(model)
-            cls.check_ode_functions_have_consistent_units(model)
-            cls.check_correct_usage_of_kernels(model)
-            cls.check_resolution_func_used(model)    # ``__h = resolution()`` is added after transformations; put this check inside the ``if`` to make sure it's not always triggered
+            cocos += [CoCoOdesHaveConsistentUnits,
+                      # ODE functions have been removed at this point
+                      CoCoFunctionCallsConsistent,
+                      CoCoOdeFunctionsHaveConsistentUnits,
+                      CoCoNoKernelsExceptInConvolve,
+                      CoCoResolutionOrStepsFuncUsed]    # ``__h = resolution()`` is added after transformations; put this check inside the ``if`` to make sure it's not always triggered
             if FrontendConfiguration.get_target_platform().upper() != 'NEST_COMPARTMENTAL':
-                cls.check_integrate_odes_called_if_equations_defined(model)
-        cls.check_invariant_type_correct(model)
-        cls.check_vector_in_non_vector_declaration_detected(model)
-        cls.check_convolve_has_correct_parameter(model)
-        cls.check_expression_correct(model)
-        cls.check_simple_delta_function(model)
-        cls.check_function_argument_template_types_consistent(model)
-        cls.check_vector_parameter_declaration(model)
-        cls.check_vector_declaration_size(model)
-        cls.check_co_co_priorities_correctly_specified(model)
-        cls.check_resolution_func_legally_used(model)
-        cls.check_input_port_size_type(model)
-        cls.check_timestep_func_legally_used(model)
+                cocos += [CoCoIntegrateOdesCalledIfEquationsDefined]
+        cocos += [CoCoInvariantIsBoolean,
+                  CoCoVectorVariableInNonVectorDeclaration,
+                  CoCoConvolveHasCorrectParameter,
+                  CoCoIllegalExpression,
+                  CoCoSimpleDeltaFunction,
+                  CoCoFunctionArgumentTemplateTypesConsistent,
+                  CoCoVectorParameterDeclaredInRightBlock,
+                  CoCoVectorDeclarationRightSize,
+                  CoCoPrioritiesCorrectlySpecified,
+                  CoCoResolutionFuncLegallyUsed,
+                  CoCoVectorInputPortsCorrectSizeType,
+                  CoCoTimestepFuncLegallyUsed]
+
+        return cocos
+
+    @classmethod
+    def check_cocos(cls, model: ASTModel, after_ast_rewrite: bool = False, fused: bool = True):
+        """
+        Checks all context conditions.
+
+        If ``fused`` is True, the cocos that provide a visitor (see ``CoCo.get_visitor()``) are checked in a single traversal of the model, after the other cocos have been checked. Otherwise, each coco is checked by its own ``check_co_co()``, in the order given by ``get_cocos()``. Both give the same messages, but possibly in a different order.
+        :param model: a single model object.
+        :param after_ast_rewrite: whether the model has been transformed already
+        :param fused: whether to check the cocos that provide a visitor in a single traversal of the model
+        """
+        Logger.set_current_node(model)
+
+        visitors = []
+        for coco in cls.get_cocos(after_ast_rewrite):
+            visitor = coco.get_visitor(model) if fused else None
+            if visitor is None:
+                coco.check_co_co(model)
+            else:
+                visitors.append(visitor)
+
+        if visitors:
+            model.accept(ASTFusedVisitor(visitors))
 
         Logger.set_current_node(None)
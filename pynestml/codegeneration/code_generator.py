@@ -21,15 +21,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Mapping, List, Optional, Sequence
 
 import glob
 import os
 
 from abc import abstractmethod
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateRuntimeError
-
 from pynestml.exceptions.invalid_path_exception import InvalidPathException
 from pynestml.exceptions.invalid_target_exception import InvalidTargetException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
@@ -38,20 +36,29 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.utils.with_options import WithOptions
 
+if TYPE_CHECKING:
+    # jinja2 is only imported once templates are loaded
+    from jinja2 import Environment, Template
+
 
 class CodeGenerator(WithOptions):
     r"""Generate code for a given target platform."""
 
     _default_options: Mapping[str, Any] = {}
 
+    # template environments by set of template directories, shared between code generator instances so that templates are loaded and compiled only once per process
+    _template_environments: Dict[frozenset, Environment] = {}
+
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
         super(CodeGenerator, self).__init__(options)
 
         self._init_templates_list()
 
     def raise_helper(self, msg):
+        from jinja2 import TemplateRuntimeError
         raise TemplateRuntimeError(msg)
 
     def setup_template_env(self):
@@ -91,6 +98,7 @@ class CodeGenerator(WithOptions):
             self._module_templates.extend(self._setup_template_env(module_templates, templates_root_dir))
 
     def raise_helper(self, msg):
+        from jinja2 import TemplateRuntimeError
         raise TemplateRuntimeError(msg)
 
     def _init_templates_list(self):
@@ -111,7 +119,12 @@ class CodeGenerator(WithOptions):
         _template_dirs = set([os.path.dirname(_file) for _file in _template_files])
 
         # Environment for neuron templates
-        env = Environment(loader=FileSystemLoader(_template_dirs))
+        env = CodeGenerator._template_environments.get(frozenset(_template_dirs))
+        if env is None:
+            from jinja2 import Environment, FileSystemLoader
+            env = Environment(loader=FileSystemLoader(_template_dirs))
+            CodeGenerator._template_environments[frozenset(_template_dirs)] = env
+
         env.globals["raise"] = self.raise_helper
         env.globals["is_delta_kernel"] = ASTUtils.is_delta_kernel
 
@@ -147,6 +160,30 @@ class CodeGenerator(WithOptions):
         """the base class CodeGenerator does not generate any code"""
         pass
 
+    def supports_parallel_generation(self) -> bool:
+        r"""
+        Indicates whether the code for disjoint groups of models can be generated independently of each other, for instance, in separate processes. If so, ``generate_code()`` is equivalent to calling ``generate_models()`` for each group of models, followed by calling ``generate_module()`` once for all models. Models that refer to each other (such as a neuron and a synapse that were co-generated) are always in the same group.
+
+        :return: True if the code generator implements ``generate_models()`` and ``generate_module()``, False otherwise.
+        """
+        return False
+
+    def generate_models(self, models: Sequence[ASTModel]) -> None:
+        r"""
+        Analyse the given models and generate the code for each of them, but not the code that is common to all models (see ``generate_module()``). Only called if ``supports_parallel_generation()`` returns True.
+
+        :param models: a list of models
+        """
+        raise NotImplementedError()
+
+    def generate_module(self, models: Sequence[ASTModel]) -> None:
+        r"""
+        Generate the code that is common to all models, such as the code for an extension module. Only called if ``supports_parallel_generation()`` returns True.
+
+        :param models: a list of all models
+        """
+        raise NotImplementedError()
+
     def generate_neurons(self, neurons: Sequence[ASTModel]) -> None:
         """
         Generate code for the given neurons.
@@ -205,7 +242,8 @@ class CodeGenerator(WithOptions):
                 templ_file_base_name = templ_file_base_name + "." + file_extension
             rendered_templ_file_name = os.path.join(FrontendConfiguration.get_target_path(),
                                                     templ_file_base_name)
-            _file = _model_templ.render(template_namespace)
+            with Profiler.phase("render", name=templ_file_name, model=model_name):
+                _file = _model_templ.render(template_namespace)
             Logger.log_message(message="Rendering template " + rendered_templ_file_name,
                                log_level=LoggingLevel.INFO)
             with open(rendered_templ_file_name, "w+") as f:
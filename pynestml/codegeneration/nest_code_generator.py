@@ -24,7 +24,6 @@ from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 import datetime
 import re
 
-import odetoolbox
 import pynestml
 
 from pynestml.cocos.co_co_nest_synapse_delay_not_assigned_to import CoCoNESTSynapseDelayNotAssignedTo
@@ -61,14 +60,17 @@ from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.real_type_symbol import RealTypeSymbol
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.transformers.common_subexpression_elimination_transformer import CommonSubexpressionEliminationTransformer
 from pynestml.transformers.inline_expression_expansion_transformer import InlineExpressionExpansionTransformer
 from pynestml.transformers.synapse_post_neuron_transformer import SynapsePostNeuronTransformer
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
 from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
 from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+from pynestml.utils.profiler import Profiler
 from pynestml.utils.string_utils import removesuffix
 from pynestml.visitors.ast_equations_with_delay_vars_visitor import ASTEquationsWithDelayVarsVisitor
 from pynestml.visitors.ast_equations_with_vector_variables import ASTEquationsWithVectorVariablesVisitor
@@ -80,7 +82,7 @@ from pynestml.visitors.ast_random_number_generator_visitor import ASTRandomNumbe
 
 
 def find_spiking_post_port(synapse, namespace):
-    if "paired_neuron" in dir(synapse):
+    if hasattr(synapse, "paired_neuron"):
         for post_port_name in namespace["post_ports"]:
             if ASTUtils.get_input_port_by_name(synapse.get_input_blocks(), post_port_name).is_spike():
                 return post_port_name
@@ -115,6 +117,7 @@ class NESTCodeGenerator(CodeGenerator):
     - **continuous_state_buffering_method**: Which method to use for buffering state variables between neuron and synapse pairs. When a synapse has a "continuous" input port, connected to a postsynaptic neuron, either the value is obtained taking the synaptic (dendritic, that is, synapse-soma) delay into account, requiring a buffer to store the value at each timepoint (``continuous_state_buffering_method = "continuous_time_buffer"); or the value is obtained at the times of the somatic spikes of the postsynaptic neuron, ignoring the synaptic delay (``continuous_state_buffering_method == "post_spike_based"``). The former is more physically accurate but requires a large buffer and can require a long time to simulate. The latter ignores the dendritic delay but is much more computationally efficient.
     - **delay_variable**: A mapping identifying, for each synapse (the name of which is given as a key), the variable or parameter in the model that corresponds with the NEST ``Connection`` class delay property.
     - **weight_variable**: Like ``delay_variable``, but for synaptic weight.
+    - **common_subexpression_elimination**: Set to True to perform common-subexpression elimination on the propagators and update expressions of the analytic solver (see ``CommonSubexpressionEliminationTransformer``). Sub-expressions that only depend on parameters, internals and the timestep are then computed once, together with the internals, instead of during every timestep. The default is False.
     - **redirect_build_output**: An optional boolean key for redirecting the build output. Setting the key to ``True``, two files will be created for redirecting the ``stdout`` and the ``stderr`. The ``target_path`` will be used as the default location for creating the two files.
     - **build_output_dir**: An optional string key representing the new path where the files corresponding to the output of the build phase will be created. This key requires that the ``redirect_build_output`` is set to ``True``.
 
@@ -146,7 +149,8 @@ class NESTCodeGenerator(CodeGenerator):
         "numeric_solver": "rk45",
         "continuous_state_buffering_method": "continuous_time_buffer",
         "delay_variable": {},
-        "weight_variable": {}
+        "weight_variable": {},
+        "common_subexpression_elimination": False
     }
 
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
@@ -265,6 +269,13 @@ class NESTCodeGenerator(CodeGenerator):
         super().generate_synapse_code(synapse)
 
     def generate_code(self, models: Sequence[ASTModel]) -> None:
+        self.generate_models(models)
+        self.generate_module(models)
+
+    def supports_parallel_generation(self) -> bool:
+        return True
+
+    def generate_models(self, models: Sequence[ASTModel]) -> None:
         neurons, synapses = CodeGeneratorUtils.get_model_types_from_names(models, synapse_models=self.get_option("synapse_models"))
 
         self.run_nest_target_specific_cocos(neurons, synapses)
@@ -273,19 +284,22 @@ class NESTCodeGenerator(CodeGenerator):
 
         for synapse in synapses:
 
-            if "neuron_synapse_pairs" in FrontendConfiguration.get_codegen_opts().keys() and "paired_neuron" in dir(synapse):
+            if "neuron_synapse_pairs" in FrontendConfiguration.get_codegen_opts().keys() and hasattr(synapse, "paired_neuron"):
                 post_ports = ASTUtils.get_post_ports_of_neuron_synapse_pair(synapse.paired_neuron, synapse, FrontendConfiguration.get_codegen_opts()["neuron_synapse_pairs"])
                 synapse.continuous_post_ports = [v for v in post_ports if isinstance(v, tuple) or isinstance(v, list)]
                 synapse.paired_neuron.continuous_post_ports = synapse.continuous_post_ports
 
         self.generate_neurons(neurons)
         self.generate_synapses(synapses)
-        self.generate_module_code(neurons, synapses)
 
         for astnode in neurons + synapses:
             if Logger.has_errors(astnode):
                 raise Exception("Error(s) occurred during code generation")
 
+    def generate_module(self, models: Sequence[ASTModel]) -> None:
+        neurons, synapses = CodeGeneratorUtils.get_model_types_from_names(models, synapse_models=self.get_option("synapse_models"))
+        self.generate_module_code(neurons, synapses)
+
     def _get_module_namespace(self, neurons: List[ASTModel], synapses: List[ASTModel]) -> Dict:
         """
         Creates a namespace for generating NEST extension module code
@@ -310,8 +324,8 @@ class NESTCodeGenerator(CodeGenerator):
         :param neurons: a list of neurons.
         """
         for neuron in neurons:
-            code, message = Messages.get_analysing_transforming_model(neuron.get_name())
-            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+            message = DeferredMessage(Messages.get_analysing_transforming_model, neuron.get_name())
+            Logger.log_message(None, MessageCode.ANALYSING_TRANSFORMING_MODEL, message, None, LoggingLevel.INFO)
             spike_updates, post_spike_updates, equations_with_delay_vars, equations_with_vector_vars, analytic_solver, parameter_value_dict = self.analyse_neuron(neuron)
             neuron.spike_updates = spike_updates
             neuron.post_spike_updates = post_spike_updates
@@ -326,7 +340,7 @@ class NESTCodeGenerator(CodeGenerator):
         :param synapses: a list of synapses.
         """
         for synapse in synapses:
-            Logger.log_message(None, None, "Analysing/transforming synapse {}.".format(synapse.get_name()), None, LoggingLevel.INFO)
+            Logger.log_message(None, None, DeferredMessage("Analysing/transforming synapse {}.", synapse.get_name()), None, LoggingLevel.INFO)
             synapse.spike_updates = self.analyse_synapse(synapse)
 
     def analyse_neuron(self, neuron: ASTModel) -> Tuple[Dict[str, ASTAssignment], Dict[str, ASTAssignment], List[ASTOdeEquation], List[ASTOdeEquation]]:
@@ -338,8 +352,8 @@ class NESTCodeGenerator(CodeGenerator):
         :return: equations_with_delay_vars: list of equations containing delay variables
         :return: equations_with_vector_vars: list of equations containing delay variables
         """
-        code, message = Messages.get_start_processing_model(neuron.get_name())
-        Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
+        message = DeferredMessage(Messages.get_start_processing_model, neuron.get_name())
+        Logger.log_message(neuron, MessageCode.START_PROCESSING_MODEL, message, neuron.get_source_position(), LoggingLevel.INFO)
 
         if not neuron.get_equations_blocks():
             # add all declared state variables as none of them are used in equations block
@@ -379,7 +393,8 @@ class NESTCodeGenerator(CodeGenerator):
         neuron.accept(eqns_with_vector_vars_visitor)
         equations_with_vector_vars = eqns_with_vector_vars_visitor.equations
 
-        analytic_solver, numeric_solver = self.ode_toolbox_analysis(neuron, kernel_buffers)
+        with Profiler.phase("ode_toolbox_analysis", model=neuron.get_name()):
+            analytic_solver, numeric_solver = self.ode_toolbox_analysis(neuron, kernel_buffers)
         self.analytic_solver[neuron.get_name()] = analytic_solver
         self.numeric_solver[neuron.get_name()] = numeric_solver
 
@@ -416,6 +431,9 @@ class NESTCodeGenerator(CodeGenerator):
         ASTUtils.add_timestep_symbol(neuron)
 
         if self.analytic_solver[neuron.get_name()] is not None:
+            if self.get_option("common_subexpression_elimination"):
+                CommonSubexpressionEliminationTransformer({"analytic_solver": self.analytic_solver[neuron.get_name()]}).transform(neuron)
+
             neuron = ASTUtils.add_declarations_to_internals(
                 neuron, self.analytic_solver[neuron.get_name()]["propagators"])
 
@@ -433,8 +451,8 @@ class NESTCodeGenerator(CodeGenerator):
         Analyse and transform a single synapse.
         :param synapse: a single synapse.
         """
-        code, message = Messages.get_start_processing_model(synapse.get_name())
-        Logger.log_message(synapse, code, message, synapse.get_source_position(), LoggingLevel.INFO)
+        message = DeferredMessage(Messages.get_start_processing_model, synapse.get_name())
+        Logger.log_message(synapse, MessageCode.START_PROCESSING_MODEL, message, synapse.get_source_position(), LoggingLevel.INFO)
 
         spike_updates = {}
         if synapse.get_equations_blocks():
@@ -448,7 +466,8 @@ class NESTCodeGenerator(CodeGenerator):
             delta_factors = ASTUtils.get_delta_factors_(synapse, equations_block)
             ASTUtils.replace_convolve_calls_with_buffers_(synapse, equations_block)
 
-            analytic_solver, numeric_solver = self.ode_toolbox_analysis(synapse, kernel_buffers)
+            with Profiler.phase("ode_toolbox_analysis", model=synapse.get_name()):
+                analytic_solver, numeric_solver = self.ode_toolbox_analysis(synapse, kernel_buffers)
             self.analytic_solver[synapse.get_name()] = analytic_solver
             self.numeric_solver[synapse.get_name()] = numeric_solver
 
@@ -464,10 +483,11 @@ class NESTCodeGenerator(CodeGenerator):
             spike_updates, _ = self.get_spike_update_expressions(synapse, kernel_buffers, [analytic_solver, numeric_solver], delta_factors)
 
             if not self.analytic_solver[synapse.get_name()] is None:
+                if self.get_option("common_subexpression_elimination"):
+                    CommonSubexpressionEliminationTransformer({"analytic_solver": self.analytic_solver[synapse.get_name()]}).transform(synapse)
+
                 synapse = ASTUtils.add_declarations_to_internals(
                     synapse, self.analytic_solver[synapse.get_name()]["propagators"])
-
-            self.update_symbol_table(synapse)
         else:
             ASTUtils.add_timestep_symbol(synapse)
             self.update_symbol_table(synapse)
@@ -564,7 +584,7 @@ class NESTCodeGenerator(CodeGenerator):
         # continuous post ports
         namespace["continuous_state_buffering_method"] = self.get_option("continuous_state_buffering_method")
         namespace["continuous_post_ports"] = []
-        if "continuous_post_ports" in dir(astnode):
+        if hasattr(astnode, "continuous_post_ports"):
             namespace["continuous_post_ports"] = astnode.continuous_post_ports
 
         return namespace
@@ -583,14 +603,14 @@ class NESTCodeGenerator(CodeGenerator):
         for input_block in synapse.get_input_blocks():
             all_input_port_names.extend([p.name for p in input_block.get_input_ports()])
 
-        if "paired_neuron" in dir(synapse):
+        if hasattr(synapse, "paired_neuron"):
             # synapse is being co-generated with neuron
             namespace["paired_neuron"] = synapse.paired_neuron
             namespace["paired_neuron_name"] = synapse.paired_neuron.get_name()
             namespace["post_ports"] = synapse.post_port_names
             namespace["spiking_post_ports"] = synapse.spiking_post_port_names
 
-            if "state_vars_that_need_continuous_buffering" in dir(synapse.paired_neuron):
+            if hasattr(synapse.paired_neuron, "state_vars_that_need_continuous_buffering"):
                 namespace["state_vars_that_need_continuous_buffering"] = synapse.paired_neuron.state_vars_that_need_continuous_buffering
                 codegen_and_builder_opts = FrontendConfiguration.get_codegen_opts()
                 xfrm = SynapsePostNeuronTransformer(codegen_and_builder_opts)
@@ -654,8 +674,7 @@ class NESTCodeGenerator(CodeGenerator):
                 namespace["initial_values"][sym] = expr
             for sym in namespace["analytic_state_variables"]:
                 expr_str = self.analytic_solver[synapse.get_name()]["update_expressions"][sym]
-                expr_str = ODEToolboxUtils._rewrite_piecewise_into_ternary(expr_str)
-                expr_ast = ModelParser.parse_expression(expr_str)
+                expr_ast = ODEToolboxUtils.parse_expression(expr_str)
                 # pretend that update expressions are in "equations" block, which should always be present,
                 # as differential equations must have been defined to get here
                 expr_ast.update_scope(synapse.get_equations_blocks()[0].get_scope())
@@ -673,8 +692,7 @@ class NESTCodeGenerator(CodeGenerator):
                 namespace["initial_values"][sym] = expr
             for sym in namespace["numeric_state_variables"]:
                 expr_str = self.numeric_solver[synapse.get_name()]["update_expressions"][sym]
-                expr_str = ODEToolboxUtils._rewrite_piecewise_into_ternary(expr_str)
-                expr_ast = ModelParser.parse_expression(expr_str)
+                expr_ast = ODEToolboxUtils.parse_expression(expr_str)
                 # pretend that update expressions are in "equations" block, which should always be present,
                 # as differential equations must have been defined to get here
                 expr_ast.update_scope(synapse.get_equations_blocks()[0].get_scope())
@@ -705,8 +723,8 @@ class NESTCodeGenerator(CodeGenerator):
         """
         namespace = self._get_model_namespace(neuron)
 
-        if "paired_synapse" in dir(neuron):
-            if "state_vars_that_need_continuous_buffering" in dir(neuron):
+        if hasattr(neuron, "paired_synapse"):
+            if hasattr(neuron, "state_vars_that_need_continuous_buffering"):
                 assert self.get_option("continuous_state_buffering_method") in ["continuous_time_buffer", "post_spike_based"]
                 namespace["state_vars_that_need_continuous_buffering"] = neuron.state_vars_that_need_continuous_buffering
 
@@ -718,10 +736,10 @@ class NESTCodeGenerator(CodeGenerator):
                     namespace["state_vars_that_need_continuous_buffering_transformed_iv"][var_name] = self._nest_printer.print(neuron.get_initial_value(var_name_transformed))
             else:
                 namespace["state_vars_that_need_continuous_buffering"] = []
-            if "extra_on_emit_spike_stmts_from_synapse" in dir(neuron):
+            if hasattr(neuron, "extra_on_emit_spike_stmts_from_synapse"):
                 namespace["extra_on_emit_spike_stmts_from_synapse"] = neuron.extra_on_emit_spike_stmts_from_synapse
             namespace["paired_synapse"] = neuron.paired_synapse
-            if "paired_synapse_original_model" in dir(neuron):
+            if hasattr(neuron, "paired_synapse_original_model"):
                 namespace["paired_synapse_original_model"] = neuron.paired_synapse_original_model
             namespace["paired_synapse_name"] = neuron.paired_synapse.get_name()
             namespace["post_spike_updates"] = neuron.post_spike_updates
@@ -756,7 +774,7 @@ class NESTCodeGenerator(CodeGenerator):
             and self.analytic_solver[neuron.get_name()] is not None
         namespace["analytic_state_variables_moved"] = []
         if namespace["uses_analytic_solver"]:
-            if "paired_synapse" in dir(neuron):
+            if hasattr(neuron, "paired_synapse"):
                 namespace["analytic_state_variables"] = []
                 for sv in self.analytic_solver[neuron.get_name()]["state_variables"]:
                     moved = False
@@ -782,8 +800,7 @@ class NESTCodeGenerator(CodeGenerator):
             namespace["update_expressions"] = {}
             for sym in namespace["analytic_state_variables"] + namespace["analytic_state_variables_moved"]:
                 expr_str = self.analytic_solver[neuron.get_name()]["update_expressions"][sym]
-                expr_str = ODEToolboxUtils._rewrite_piecewise_into_ternary(expr_str)
-                expr_ast = ModelParser.parse_expression(expr_str)
+                expr_ast = ODEToolboxUtils.parse_expression(expr_str)
                 # pretend that update expressions are in "equations" block, which should always be present, as differential equations must have been defined to get here
                 expr_ast.update_scope(neuron.get_equations_blocks()[0].get_scope())
                 expr_ast.accept(ASTSymbolTableVisitor())
@@ -804,7 +821,7 @@ class NESTCodeGenerator(CodeGenerator):
 
             namespace["propagators_are_state_dependent"] = False
             for prop_name, prop_expr in namespace["propagators"].items():
-                prop_expr_ast = ModelParser.parse_expression(prop_expr)
+                prop_expr_ast = ODEToolboxUtils.parse_expression(prop_expr)
 
                 for var_sym in neuron.get_state_symbols():
                     if var_sym.get_symbol_name() in [var.get_name() for var in prop_expr_ast.get_variables()]:
@@ -818,7 +835,7 @@ class NESTCodeGenerator(CodeGenerator):
 
         if namespace["uses_numeric_solver"]:
             namespace["numeric_state_variables_moved"] = []
-            if "paired_synapse" in dir(neuron):
+            if hasattr(neuron, "paired_synapse"):
                 namespace["numeric_state_variables"] = []
                 for sv in self.numeric_solver[neuron.get_name()]["state_variables"]:
                     moved = False
@@ -858,8 +875,7 @@ class NESTCodeGenerator(CodeGenerator):
             namespace["numeric_update_expressions"] = {}
             for sym in namespace["numeric_state_variables"] + namespace["numeric_state_variables_moved"]:
                 expr_str = self.numeric_solver[neuron.get_name()]["update_expressions"][sym]
-                expr_str = ODEToolboxUtils._rewrite_piecewise_into_ternary(expr_str)
-                expr_ast = ModelParser.parse_expression(expr_str)
+                expr_ast = ODEToolboxUtils.parse_expression(expr_str)
                 # pretend that update expressions are in "equations" block, which should always be present, as differential equations must have been defined to get here
                 expr_ast.update_scope(neuron.get_equations_blocks()[0].get_scope())
                 expr_ast.accept(ASTSymbolTableVisitor())
@@ -907,7 +923,7 @@ class NESTCodeGenerator(CodeGenerator):
             namespace["gap_junction_membrane_potential_variable"] = self.get_option("gap_junctions")["membrane_potential_variable"]
 
             var = ASTUtils.get_state_variable_by_name(neuron, self.get_option("gap_junctions")["membrane_potential_variable"])
-            namespace["gap_junction_membrane_potential_variable_is_numeric"] = "_is_numeric" in dir(var) and var._is_numeric
+            namespace["gap_junction_membrane_potential_variable_is_numeric"] = hasattr(var, "_is_numeric") and var._is_numeric
 
             namespace["gap_junction_membrane_potential_variable_cpp"] = NESTVariablePrinter(expression_printer=None).print(var)
             namespace["gap_junction_port"] = self.get_option("gap_junctions")["gap_current_port"]
@@ -931,35 +947,20 @@ class NESTCodeGenerator(CodeGenerator):
         odetoolbox_indict["options"] = {}
         odetoolbox_indict["options"]["output_timestep_symbol"] = "__h"
         disable_analytic_solver = self.get_option("solver") != "analytic"
-        solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                            disable_stiffness_check=True,
-                                            disable_analytic_solver=disable_analytic_solver,
-                                            preserve_expressions=self.get_option("preserve_expressions"),
-                                            simplify_expression=self.get_option("simplify_expression"),
-                                            log_level=FrontendConfiguration.logging_level)
+
+        # if numeric solver is required, ODE-toolbox additionally generates a stepping function that includes each state variable, including the analytic ones
+        solver_result, numeric_solver = ODEToolboxCache.analysis_with_numeric_solver(odetoolbox_indict,
+                                                                                     disable_stiffness_check=True,
+                                                                                     disable_analytic_solver=disable_analytic_solver,
+                                                                                     preserve_expressions=self.get_option("preserve_expressions"),
+                                                                                     simplify_expression=self.get_option("simplify_expression"),
+                                                                                     log_level=FrontendConfiguration.logging_level)
         analytic_solver = None
         analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
         assert len(analytic_solvers) <= 1, "More than one analytic solver not presently supported"
         if len(analytic_solvers) > 0:
             analytic_solver = analytic_solvers[0]
 
-        # if numeric solver is required, generate a stepping function that includes each state variable, including the analytic ones
-        numeric_solver = None
-        numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-        if numeric_solvers:
-            if analytic_solver:
-                # previous solver_result contains both analytic and numeric solver; re-run ODE-toolbox generating only numeric solver
-                solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                                    disable_stiffness_check=True,
-                                                    disable_analytic_solver=True,
-                                                    preserve_expressions=self.get_option("preserve_expressions"),
-                                                    simplify_expression=self.get_option("simplify_expression"),
-                                                    log_level=FrontendConfiguration.logging_level)
-            numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-            assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
-            if len(numeric_solvers) > 0:
-                numeric_solver = numeric_solvers[0]
-
         return analytic_solver, numeric_solver
 
     def update_symbol_table(self, model) -> None:
@@ -998,7 +999,7 @@ class NESTCodeGenerator(CodeGenerator):
             if not spike_input_port_name in spike_updates.keys():
                 spike_updates[str(spike_input_port)] = []
 
-            if "_is_post_port" in dir(spike_input_port.get_variable()) \
+            if hasattr(spike_input_port.get_variable(), "_is_post_port") \
                and spike_input_port.get_variable()._is_post_port:
                 # it's a port in the neuron ??? that receives post spikes ???
                 orig_port_name = spike_input_port_name[:spike_input_port_name.index("__for_")]
@@ -1018,7 +1019,7 @@ class NESTCodeGenerator(CodeGenerator):
                         continue    # skip adding the statement if we are only adding zero
 
                     assignment_str = kernel_spike_buf_name + " += "
-                    if "_is_post_port" in dir(spike_input_port.get_variable()) \
+                    if hasattr(spike_input_port.get_variable(), "_is_post_port") \
                        and spike_input_port.get_variable()._is_post_port:
                         assignment_str += "1."
                     else:
@@ -1036,8 +1037,8 @@ class NESTCodeGenerator(CodeGenerator):
                     if neuron.get_scope().resolve_to_symbol(spike_input_port_name, SymbolKind.VARIABLE) is None:
                         # this case covers variables that were moved from synapse to the neuron
                         post_spike_updates[kernel_var.get_name()] = ast_assignment
-                    elif "_is_post_port" in dir(spike_input_port.get_variable()) and spike_input_port.get_variable()._is_post_port:
-                        Logger.log_message(None, None, "Adding post assignment string: " + str(ast_assignment), None, LoggingLevel.INFO)
+                    elif hasattr(spike_input_port.get_variable(), "_is_post_port") and spike_input_port.get_variable()._is_post_port:
+                        Logger.log_message(None, None, DeferredMessage("Adding post assignment string: {}", ast_assignment), None, LoggingLevel.INFO)
                         spike_updates[str(spike_input_port)].append(ast_assignment)
                     else:
                         spike_updates[str(spike_input_port)].append(ast_assignment)
@@ -1052,7 +1053,7 @@ class NESTCodeGenerator(CodeGenerator):
                 factor_expr.accept(ASTSymbolTableVisitor())
                 assignment_str += "(" + self._printer_no_origin.print(factor_expr) + ") * "
 
-            if "_is_post_port" in dir(inport) and inport._is_post_port:
+            if hasattr(inport, "_is_post_port") and inport._is_post_port:
                 orig_port_name = inport[:inport.index("__for_")]
                 buffer_type = neuron.paired_synapse.get_scope().resolve_to_symbol(orig_port_name, SymbolKind.VARIABLE).get_type_symbol()
             else:
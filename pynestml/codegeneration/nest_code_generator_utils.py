@@ -44,7 +44,7 @@ class NESTCodeGeneratorUtils:
         :return: the corresponding prefix
         """
         if variable_symbol.block_type in [BlockType.STATE, BlockType.EQUATION]:
-            if "_is_numeric" in dir(variable) and variable._is_numeric:
+            if hasattr(variable, "_is_numeric") and variable._is_numeric:
                 return "S_.ode_state[State_::%s]"
 
             return "S_.%s"
@@ -26,7 +26,6 @@ import os
 
 from jinja2 import TemplateRuntimeError
 
-from odetoolbox import analysis
 from pynestml.codegeneration.printers.sympy_simple_expression_printer import SympySimpleExpressionPrinter
 
 import pynestml
@@ -70,8 +69,11 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.chan_info_enricher import ChanInfoEnricher
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
 from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+from pynestml.utils.profiler import Profiler
 from pynestml.utils.syns_info_enricher import SynsInfoEnricher
 from pynestml.utils.synapse_processing import SynapseProcessing
 from pynestml.visitors.ast_random_number_generator_visitor import ASTRandomNumberGeneratorVisitor
@@ -284,9 +286,8 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
         :param neurons: a list of neurons.
         """
         for neuron in neurons:
-            code, message = Messages.get_analysing_transforming_model(
-                neuron.get_name())
-            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+            message = DeferredMessage(Messages.get_analysing_transforming_model, neuron.get_name())
+            Logger.log_message(None, MessageCode.ANALYSING_TRANSFORMING_MODEL, message, None, LoggingLevel.INFO)
             spike_updates = self.analyse_neuron(neuron)
             neuron.spike_updates = spike_updates
 
@@ -309,7 +310,7 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
         odetoolbox_indict = self.create_ode_indict(
             neuron, parameters_block, kernel_buffers)
 
-        full_solver_result = analysis(
+        full_solver_result = ODEToolboxCache.analysis(
             odetoolbox_indict,
             disable_stiffness_check=True,
             preserve_expressions=self.get_option("preserve_expressions"),
@@ -343,31 +344,25 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
 
         parameters_block = neuron.get_parameters_blocks()[0]
 
-        solver_result, analytic_solver = self.ode_solve_analytically(
+        odetoolbox_indict = self.create_ode_indict(
             neuron, parameters_block, kernel_buffers)
 
-        # if numeric solver is required, generate a stepping function that
-        # includes each state variable
-        numeric_solver = None
-        numeric_solvers = [
-            x for x in solver_result if x["solver"].startswith("numeric")]
-
-        if numeric_solvers:
-            odetoolbox_indict = self.create_ode_indict(
-                neuron, parameters_block, kernel_buffers)
-            solver_result = analysis(
-                odetoolbox_indict,
-                disable_stiffness_check=True,
-                disable_analytic_solver=True,
-                preserve_expressions=self.get_option("preserve_expressions"),
-                simplify_expression=self.get_option("simplify_expression"),
-                log_level=FrontendConfiguration.logging_level)
-            numeric_solvers = [
-                x for x in solver_result if x["solver"].startswith("numeric")]
-            assert len(
-                numeric_solvers) <= 1, "More than one numeric solver not presently supported"
-            if len(numeric_solvers) > 0:
-                numeric_solver = numeric_solvers[0]
+        # if numeric solver is required, ODE-toolbox additionally generates a
+        # stepping function that includes each state variable
+        solver_result, numeric_solver = ODEToolboxCache.analysis_with_numeric_solver(
+            odetoolbox_indict,
+            disable_stiffness_check=True,
+            preserve_expressions=self.get_option("preserve_expressions"),
+            simplify_expression=self.get_option("simplify_expression"),
+            log_level=FrontendConfiguration.logging_level)
+
+        analytic_solver = None
+        analytic_solvers = [
+            x for x in solver_result if x["solver"] == "analytical"]
+        assert len(
+            analytic_solvers) <= 1, "More than one analytic solver not presently supported"
+        if len(analytic_solvers) > 0:
+            analytic_solver = analytic_solvers[0]
 
         return analytic_solver, numeric_solver
 
@@ -411,8 +406,8 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
         :param neuron: a single neuron.
         :return: spike_updates: list of spike updates, see documentation for get_spike_update_expressions() for more information.
         """
-        code, message = Messages.get_start_processing_model(neuron.get_name())
-        Logger.log_message(neuron, code, message,
+        message = DeferredMessage(Messages.get_start_processing_model, neuron.get_name())
+        Logger.log_message(neuron, MessageCode.START_PROCESSING_MODEL, message,
                            neuron.get_source_position(), LoggingLevel.INFO)
 
         assert len(neuron.get_equations_blocks()) == 1, "Only one equations block supported for now"
@@ -458,8 +453,9 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
         # "update_expressions" key in those solvers contains a mapping
         # {expression1: update_expression1, expression2: update_expression2}
 
-        analytic_solver, numeric_solver = self.ode_toolbox_analysis(
-            neuron, kernel_buffers)
+        with Profiler.phase("ode_toolbox_analysis", model=neuron.get_name()):
+            analytic_solver, numeric_solver = self.ode_toolbox_analysis(
+                neuron, kernel_buffers)
 
         """
         # separate analytic solutions by kernel
@@ -644,7 +640,7 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
             for sym in namespace["analytic_state_variables"]:
                 expr_str = self.analytic_solver[neuron.get_name(
                 )]["update_expressions"][sym]
-                expr_ast = ModelParser.parse_expression(expr_str)
+                expr_ast = ODEToolboxUtils.parse_expression(expr_str)
                 # pretend that update expressions are in "equations" block,
                 # which should always be present, as differential equations
                 # must have been defined to get here
@@ -678,7 +674,7 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
             for sym in namespace["numeric_state_variables"]:
                 expr_str = self.numeric_solver[neuron.get_name(
                 )]["update_expressions"][sym]
-                expr_ast = ModelParser.parse_expression(expr_str)
+                expr_ast = ODEToolboxUtils.parse_expression(expr_str)
                 # pretend that update expressions are in "equations" block,
                 # which should always be present, as differential equations
                 # must have been defined to get here
@@ -21,12 +21,18 @@
 
 from astropy import units
 
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+
 
 class NESTUnitConverter:
     r"""
     NEST Simulator uses a set of default physical units internally. This class calculates the factor needed to convert any given physical unit to its NEST counterpart.
+
+    The factors are memoized on the canonical key of the unit (see ``UnitTypeSymbol.get_unit_key()``), as they are requested every time a variable with a unit is printed.
     """
 
+    _factors = {}
+
     @classmethod
     def get_factor(cls, unit: units.UnitBase) -> float:
         """
@@ -40,6 +46,14 @@ class NESTUnitConverter:
                 or isinstance(unit, units.Unit) or isinstance(unit, units.PrefixUnit)), \
             "UnitConverter: given parameter is not a unit (%s)!" % type(unit)
 
+        unit_key = UnitTypeSymbol.get_unit_key(unit)
+        if unit_key not in cls._factors.keys():
+            cls._factors[unit_key] = cls.__compute_factor(unit)
+
+        return cls._factors[unit_key]
+
+    @classmethod
+    def __compute_factor(cls, unit: units.UnitBase) -> float:
         # check if it is dimensionless, thus only a prefix
         if unit.physical_type == 'dimensionless':
             return unit.si
@@ -34,7 +34,7 @@ class PythonCodeGeneratorUtils:
         :return: the corresponding prefix
         """
         if variable_symbol.block_type in [BlockType.STATE, BlockType.EQUATION]:
-            if "_is_numeric" in dir(variable) and variable._is_numeric:
+            if hasattr(variable, "_is_numeric") and variable._is_numeric:
                 return 'self.S_.ode_state[self.S_.ode_state_variable_name_to_index["%s"]]'
 
             return 'self.S_.%s'
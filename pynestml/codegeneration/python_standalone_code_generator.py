@@ -51,6 +51,7 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
             - **neuron**: A list of neuron model jinja templates.
         - **module_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to generating the module/package.
     - **solver**: A string identifying the preferred ODE solver. ``"analytic"`` for propagator solver preferred; fallback to numeric solver in case ODEs are not analytically solvable. Use ``"numeric"`` to disable analytic solver.
+    - **common_subexpression_elimination**: Set to True to perform common-subexpression elimination on the propagators and update expressions of the analytic solver. See the NEST code generator for details.
     """
 
     _default_options = {
@@ -68,7 +69,8 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
         "numeric_solver": "rk45",
         "neuron_synapse_pairs": [],
         "delay_variable": {},
-        "weight_variable": {}
+        "weight_variable": {},
+        "common_subexpression_elimination": False
     }
 
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
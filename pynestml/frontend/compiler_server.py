@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+#
+# compiler_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TextIO
+
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import traceback
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.logger import Logger
+from pynestml.utils.messages import MessageCode
+
+
+class CompilerServer:
+    r"""
+    A long-running ("warm") compiler process that serves compilation requests, so that the cost of importing the toolchain, registering the predefined symbols and loading the Jinja2 templates is paid only once, rather than for every invocation of ``nestml``.
+
+    Requests and responses are JSON objects, one per line. A compilation request has the form
+
+    .. code-block:: json
+
+       {"args": ["--input_path", "models/neurons/iaf_psc_exp_neuron.nestml", "--target_path", "target"], "cwd": "/home/user"}
+
+    where ``args`` are the command-line arguments as accepted by ``nestml``, and the optional ``cwd`` is the directory relative to which paths are resolved. The response has the form
+
+    .. code-block:: json
+
+       {"exit_code": 0, "messages": [...], "output": "..."}
+
+    where ``messages`` contains all logged messages (in the same format as the log file written with ``--store_log``) and ``output`` the text that would have been printed to the console. The request ``{"command": "shutdown"}`` stops the server.
+
+    The logger, the symbol table and the frontend configuration are reset before each request; the predefined symbols and the template environments remain resident.
+    """
+
+    COMMAND_SHUTDOWN_ = "shutdown"
+
+    @classmethod
+    def start(cls, socket_path: Optional[str] = None) -> int:
+        r"""
+        Start serving requests until a shutdown request is received (or, when serving on standard input, until end of input).
+
+        :param socket_path: path of the UNIX domain socket to listen on. If None, requests are read from standard input and responses written to standard output.
+        :return: the process exit code
+        """
+        from pynestml.frontend.pynestml_frontend import keep_predefined_resident
+
+        # the default Python recursion limit is 1000, which might not be enough in practice when running an AST visitor on a deep tree, e.g. containing an automatically generated expression
+        sys.setrecursionlimit(10000)
+
+        keep_predefined_resident()
+
+        if socket_path is not None:
+            cls.serve_socket(socket_path)
+            return 0
+
+        # reserve the standard output for responses; anything that is written to it directly (e.g. by the build tools) goes to the standard error instead
+        sys.stdout.flush()
+        response_stream = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        with response_stream:
+            cls.serve_stdio(sys.stdin, response_stream)
+
+        return 0
+
+    @classmethod
+    def serve_stdio(cls, instream: TextIO, outstream: TextIO) -> None:
+        r"""
+        Serve requests read from ``instream``, writing the responses to ``outstream``.
+
+        :param instream: the stream to read requests from, one per line
+        :param outstream: the stream to write responses to, one per line
+        """
+        for line in instream:
+            if not line.strip():
+                continue
+
+            response = cls.handle_line(line)
+            outstream.write(json.dumps(response) + "\n")
+            outstream.flush()
+
+            if response.get("shutdown"):
+                break
+
+    @classmethod
+    def serve_socket(cls, socket_path: str) -> None:
+        r"""
+        Serve requests from clients connecting to a UNIX domain socket. Each client can send any number of requests over a single connection; requests are handled one at a time.
+
+        :param socket_path: path of the socket; an existing file with the same name is replaced
+        """
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server_socket.bind(socket_path)
+            server_socket.listen()
+            shutdown = False
+            while not shutdown:
+                connection, _ = server_socket.accept()
+                with connection, connection.makefile("r") as instream, connection.makefile("w") as outstream:
+                    for line in instream:
+                        if not line.strip():
+                            continue
+
+                        response = cls.handle_line(line)
+                        outstream.write(json.dumps(response) + "\n")
+                        outstream.flush()
+
+                        if response.get("shutdown"):
+                            shutdown = True
+                            break
+        finally:
+            server_socket.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    @classmethod
+    def send_request(cls, socket_path: str, request: Mapping[str, Any]) -> Dict[str, Any]:
+        r"""
+        Send a single request to a server listening on a UNIX domain socket, and wait for the response.
+
+        :param socket_path: path of the socket the server is listening on
+        :param request: the request
+        :return: the response
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(socket_path)
+            with client_socket.makefile("r") as instream, client_socket.makefile("w") as outstream:
+                outstream.write(json.dumps(request) + "\n")
+                outstream.flush()
+                line = instream.readline()
+
+        if not line:
+            raise ConnectionError("The compiler server at \"" + socket_path + "\" closed the connection without responding")
+
+        return json.loads(line)
+
+    @classmethod
+    def handle_line(cls, line: str) -> Dict[str, Any]:
+        r"""
+        Handle a single request in its JSON representation.
+
+        :param line: the request as JSON string
+        :return: the response
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"exit_code": 1, "messages": [], "output": "Invalid request: " + str(e) + "\n"}
+
+        if not isinstance(request, dict):
+            return {"exit_code": 1, "messages": [], "output": "Invalid request: expected a JSON object\n"}
+
+        return cls.handle_request(request)
+
+    @classmethod
+    def handle_request(cls, request: Mapping[str, Any]) -> Dict[str, Any]:
+        r"""
+        Handle a single request.
+
+        :param request: the request
+        :return: the response
+        """
+        if request.get("command") == cls.COMMAND_SHUTDOWN_:
+            return {"exit_code": 0, "messages": [], "output": "", "shutdown": True}
+
+        if request.get("command") is not None:
+            return {"exit_code": 1, "messages": [], "output": "Unknown command: " + str(request["command"]) + "\n"}
+
+        args = request.get("args", [])
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            return {"exit_code": 1, "messages": [], "output": "Invalid request: \"args\" should be a list of strings\n"}
+
+        output = io.StringIO()
+        cwd = os.getcwd()
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                if request.get("cwd"):
+                    os.chdir(request["cwd"])
+
+                exit_code = cls._compile(args)
+        finally:
+            os.chdir(cwd)
+
+        return {"exit_code": exit_code, "messages": cls._get_messages(), "output": output.getvalue()}
+
+    @classmethod
+    def _reset_state(cls) -> None:
+        Logger.set_current_node(None)
+        Logger.freeze_log(False)
+        Logger.no_print = False
+        SymbolTable.clean_up_table()
+        FrontendConfiguration.codegen_opts = {}
+
+    @classmethod
+    def _compile(cls, args: Sequence[str]) -> int:
+        from pynestml.frontend.pynestml_frontend import process
+
+        cls._reset_state()
+
+        try:
+            FrontendConfiguration.parse_config(args)
+        except InvalidPathException as e:
+            print(e)
+            return 1
+        except SystemExit as e:
+            # invalid command-line arguments; the error message has been printed by the argument parser
+            return e.code if isinstance(e.code, int) else 1
+
+        try:
+            return int(process())
+        except Exception:
+            traceback.print_exc()
+            return 1
+
+    @classmethod
+    def _get_messages(cls) -> List[Dict[str, str]]:
+        messages = []
+        for (artifact_name, node, log_level, code, error_position, message) in Logger.get_log().values():
+            messages.append({"filename": artifact_name,
+                             "nodeName": node.get_name() if node is not None else "GLOBAL",
+                             "severity": log_level.name,
+                             "code": code.name if isinstance(code, MessageCode) else str(code),
+                             "row": str(error_position.get_start_line()) if error_position is not None else "",
+                             "col": str(error_position.get_start_column()) if error_position is not None else "",
+                             "message": str(message)})
+
+        return messages
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
 
 import argparse
 import glob
@@ -32,6 +32,9 @@ from pynestml.exceptions.invalid_target_exception import InvalidTargetException
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages, MessageCode
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
+from pynestml.utils.parse_cache import ParseCache
+from pynestml.utils.profiler import Profiler
 
 help_input_path = 'One or more input path(s). Each path is a NESTML file, or a directory containing NESTML files. Directories will be searched recursively for files matching \'*.nestml\'.'
 help_target_path = 'Path to a directory where generated code should be written to. Standard is "target".'
@@ -40,9 +43,20 @@ help_target_platform = 'Name of the target platform to build code for. The avail
 help_logging = 'Indicates which messages shall be logged and printed to the screen. Standard is ERROR.'
 help_module = 'Indicates the name of the module. Optional. If not indicated, the name of the directory containing the models is used'
 help_log = 'Indicates whether a log file containing all messages shall be stored. Standard is NO.'
+help_log_max_messages = 'Keep only the given number of most recent messages in memory (the numbers of errors and warnings still count all messages). Default is to keep all messages.'
+help_log_stream = 'Path to a file to which each message is written as soon as it is logged, as one JSON object per line.'
 help_suffix = 'A suffix string that will be appended to the name of all generated models.'
 help_dev = 'Enable development mode: extra information is rendered in the generated code, like the name of the template that generates the code.'
 help_codegen_opts = 'Path to a JSON file containing additional options for the target platform code generator.'
+help_no_parse_cache = 'Disable the on-disk cache of parsed models.'
+help_parse_cache_dir = 'Path to the directory in which parsed models are cached. Default is "nestml/parse_cache" in the user cache directory.'
+help_no_ode_toolbox_cache = 'Disable the on-disk cache of ODE-toolbox analysis results.'
+help_jobs = 'Number of processes to use for analysing the models and generating code. Default is 1.'
+help_ode_toolbox_cache_dir = 'Path to the directory in which ODE-toolbox analysis results are cached. Default is "nestml/ode_toolbox_cache" in the user cache directory.'
+help_serve = 'Run as a long-running compiler server that reads compilation requests (one JSON object per line) from the standard input, or from the UNIX domain socket given by --server_socket.'
+help_profile = 'Record the wall time and peak memory usage of each processing phase (parsing, context condition checks, transformations, ODE-toolbox analysis, template rendering and building) and store them in "profile.json" in the report directory.'
+help_cprofile = 'In addition to --profile, store cProfile statistics of each processing phase as ".prof" files in the "profile" subdirectory of the report directory.'
+help_server_socket = 'Path to the UNIX domain socket of a compiler server. Together with --serve, the server listens on this socket; otherwise, the remaining arguments are sent to the server listening on it.'
 
 qualifier_input_path_arg = '--input_path'
 qualifier_target_path_arg = '--target_path'
@@ -51,9 +65,20 @@ qualifier_target_platform_arg = '--target_platform'
 qualifier_logging_level_arg = '--logging_level'
 qualifier_module_name_arg = '--module_name'
 qualifier_store_log_arg = '--store_log'
+qualifier_log_max_messages_arg = '--log_max_messages'
+qualifier_log_stream_arg = '--log_stream'
 qualifier_suffix_arg = '--suffix'
 qualifier_dev_arg = '--dev'
 qualifier_codegen_opts_arg = '--codegen_opts'
+qualifier_no_parse_cache_arg = '--no_parse_cache'
+qualifier_parse_cache_dir_arg = '--parse_cache_dir'
+qualifier_no_ode_toolbox_cache_arg = '--no_ode_toolbox_cache'
+qualifier_ode_toolbox_cache_dir_arg = '--ode_toolbox_cache_dir'
+qualifier_jobs_arg = '--jobs'
+qualifier_profile_arg = '--profile'
+qualifier_cprofile_arg = '--cprofile'
+qualifier_serve_arg = '--serve'
+qualifier_server_socket_arg = '--server_socket'
 
 
 class FrontendConfiguration:
@@ -79,6 +104,7 @@ class FrontendConfiguration:
     is_dev = False
     codegen_opts = {}  # type: Mapping[str, Any]
     codegen_opts_fn = ""
+    n_jobs = 1
 
     @classmethod
     def parse_config(cls, args):
@@ -108,14 +134,27 @@ appropriate numeric solver otherwise.
                                          'DEBUG', 'INFO', 'WARNING', 'WARNINGS', 'ERROR', 'ERRORS', 'NONE', 'NO'], type=str, help=help_logging, default='ERROR')
         cls.argument_parser.add_argument(qualifier_module_name_arg, metavar='NAME', type=str, help=help_module)
         cls.argument_parser.add_argument(qualifier_store_log_arg, action='store_true', help=help_log)
+        cls.argument_parser.add_argument(qualifier_log_max_messages_arg, metavar='N', type=int, help=help_log_max_messages)
+        cls.argument_parser.add_argument(qualifier_log_stream_arg, metavar='PATH', type=str, help=help_log_stream)
         cls.argument_parser.add_argument(qualifier_suffix_arg, metavar='SUFFIX', type=str, help=help_suffix, default='')
         cls.argument_parser.add_argument(qualifier_dev_arg, action='store_true', help=help_dev)
         cls.argument_parser.add_argument(qualifier_codegen_opts_arg, metavar='PATH', type=str, help=help_codegen_opts, default='', dest='codegen_opts_fn')
+        cls.argument_parser.add_argument(qualifier_no_parse_cache_arg, action='store_true', help=help_no_parse_cache)
+        cls.argument_parser.add_argument(qualifier_parse_cache_dir_arg, metavar='PATH', type=str, help=help_parse_cache_dir)
+        cls.argument_parser.add_argument(qualifier_no_ode_toolbox_cache_arg, action='store_true', help=help_no_ode_toolbox_cache)
+        cls.argument_parser.add_argument(qualifier_ode_toolbox_cache_dir_arg, metavar='PATH', type=str, help=help_ode_toolbox_cache_dir)
+        cls.argument_parser.add_argument(qualifier_jobs_arg, metavar='N', type=int, help=help_jobs, default=1, dest='n_jobs')
+        cls.argument_parser.add_argument(qualifier_profile_arg, action='store_true', help=help_profile)
+        cls.argument_parser.add_argument(qualifier_cprofile_arg, action='store_true', help=help_cprofile)
+        # handled by the entry point before the configuration is parsed (see ``parse_server_config()``); listed here for the help text
+        cls.argument_parser.add_argument(qualifier_serve_arg, action='store_true', help=help_serve)
+        cls.argument_parser.add_argument(qualifier_server_socket_arg, metavar='PATH', type=str, help=help_server_socket)
         parsed_args = cls.argument_parser.parse_args(args)
 
         # initialize the logger
         cls.logging_level = Logger.level_to_string(Logger.string_to_level(parsed_args.logging_level))
-        Logger.init_logger(Logger.string_to_level(parsed_args.logging_level))
+        Logger.init_logger(Logger.string_to_level(parsed_args.logging_level), max_messages=parsed_args.log_max_messages,
+                           log_stream_path=parsed_args.log_stream)
 
         cls.handle_input_path(parsed_args.input_path)
         cls.handle_target_platform(parsed_args.target_platform)
@@ -127,6 +166,25 @@ appropriate numeric solver otherwise.
         cls.store_log = parsed_args.store_log
         cls.suffix = parsed_args.suffix
         cls.is_dev = parsed_args.dev
+        cls.handle_n_jobs(parsed_args.n_jobs)
+
+        ParseCache.configure(enabled=not parsed_args.no_parse_cache, cache_dir=parsed_args.parse_cache_dir)
+        ODEToolboxCache.configure(enabled=not parsed_args.no_ode_toolbox_cache, cache_dir=parsed_args.ode_toolbox_cache_dir)
+        Profiler.configure(enabled=parsed_args.profile or parsed_args.cprofile, cprofile=parsed_args.cprofile)
+
+    @classmethod
+    def parse_server_config(cls, args: Sequence[str]) -> Tuple[bool, Optional[str], List[str]]:
+        """
+        Extracts the compiler server arguments, which are handled before (and separately from) the rest of the configuration.
+        :param args: a set of arguments as handed over to the frontend
+        :return: whether to run as compiler server, the path of the server socket (or None), and the remaining arguments
+        """
+        argument_parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+        argument_parser.add_argument(qualifier_serve_arg, action='store_true')
+        argument_parser.add_argument(qualifier_server_socket_arg, type=str)
+        parsed_args, remaining_args = argument_parser.parse_known_args(args)
+
+        return parsed_args.serve, parsed_args.server_socket, remaining_args
 
     @classmethod
     def get_provided_input_path(cls) -> Sequence[str]:
@@ -197,6 +255,14 @@ appropriate numeric solver otherwise.
         """
         return cls.is_dev
 
+    @classmethod
+    def get_n_jobs(cls) -> int:
+        """
+        Returns the number of processes to use for analysing the models and generating code.
+        :return: the number of processes.
+        """
+        return cls.n_jobs
+
     @classmethod
     def get_codegen_opts(cls):
         """Get a copy of the code generator options dictionary"""
@@ -242,6 +308,13 @@ appropriate numeric solver otherwise.
             Logger.log_message(code=MessageCode.MODULE_NAME_INFO, message='No module name specified; the generated module will be named "'
                                + cls.module_name + '"', log_level=LoggingLevel.INFO)
 
+    @classmethod
+    def handle_n_jobs(cls, n_jobs: int):
+        if n_jobs < 1:
+            raise Exception('Invalid number of jobs specified (' + str(n_jobs) + '): should be at least 1')
+
+        cls.n_jobs = n_jobs
+
     @classmethod
     def handle_target_platform(cls, target_platform: Optional[str]):
         if target_platform is None:
@@ -19,30 +19,34 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import copy
+import multiprocessing
 import os
+import pickle
 import sys
 
-from pynestml.cocos.co_cos_manager import CoCosManager
-from pynestml.codegeneration.builder import Builder
-from pynestml.codegeneration.code_generator import CodeGenerator
 from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException, \
     qualifier_store_log_arg, qualifier_module_name_arg, qualifier_logging_level_arg, \
     qualifier_target_platform_arg, qualifier_target_path_arg, qualifier_input_path_arg, qualifier_suffix_arg, \
-    qualifier_dev_arg, qualifier_install_path_arg
-from pynestml.meta_model.ast_model import ASTModel
-from pynestml.symbols.predefined_functions import PredefinedFunctions
-from pynestml.symbols.predefined_types import PredefinedTypes
-from pynestml.symbols.predefined_units import PredefinedUnits
-from pynestml.symbols.predefined_variables import PredefinedVariables
-from pynestml.transformers.transformer import Transformer
+    qualifier_dev_arg, qualifier_install_path_arg, qualifier_no_parse_cache_arg, qualifier_parse_cache_dir_arg, \
+    qualifier_no_ode_toolbox_cache_arg, qualifier_ode_toolbox_cache_dir_arg, qualifier_jobs_arg, \
+    qualifier_profile_arg, qualifier_cprofile_arg
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
-from pynestml.utils.model_parser import ModelParser
-from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
+from pynestml.utils.profiler import Profiler
+
+if TYPE_CHECKING:
+    # the parser, context conditions, code generators and their dependencies are only imported once the processing phase that needs them is started
+    from pynestml.codegeneration.builder import Builder
+    from pynestml.codegeneration.code_generator import CodeGenerator
+    from pynestml.meta_model.ast_model import ASTModel
+    from pynestml.transformers.transformer import Transformer
 
 
 def get_known_targets():
@@ -101,6 +105,14 @@ def transformers_from_target_name(target_name: str, options: Optional[Mapping[st
         options = synapse_post_neuron_co_generation.set_options(options)
         transformers.append(synapse_post_neuron_co_generation)
 
+    if target_name.upper() in ["NEST", "PYTHON_STANDALONE"]:
+        from pynestml.transformers.loop_invariant_hoisting_transformer import LoopInvariantHoistingTransformer
+
+        # move loop-invariant expressions from the update and onReceive blocks into the internals (if enabled); this has to come after co-generation, which moves variables between the models
+        loop_invariant_hoisting = LoopInvariantHoistingTransformer()
+        options = loop_invariant_hoisting.set_options(options)
+        transformers.append(loop_invariant_hoisting)
+
     return transformers, options
 
 
@@ -147,6 +159,7 @@ def code_generator_from_target_name(target_name: str, options: Optional[Mapping[
         # dummy/null target: user requested to not generate any code (for instance, when just doing validation of a model)
         code, message = Messages.get_no_code_generated()
         Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+        from pynestml.codegeneration.code_generator import CodeGenerator
         return CodeGenerator(options)
 
     # cannot reach here due to earlier assert -- silence static checker warnings
@@ -187,7 +200,10 @@ def builder_from_target_name(target_name: str, options: Optional[Mapping[str, An
 
 def generate_target(input_path: Union[str, Sequence[str]], target_platform: str, target_path=None,
                     install_path: str = None, logging_level="ERROR", module_name=None, store_log=False, suffix="",
-                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None, parse_cache: bool = True,
+                    parse_cache_dir: Optional[str] = None, ode_toolbox_cache: bool = True,
+                    ode_toolbox_cache_dir: Optional[str] = None, n_jobs: int = 1, profile: bool = False,
+                    cprofile: bool = False):
     r"""Generate and build code for the given target platform.
 
     Parameters
@@ -212,6 +228,20 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    parse_cache : bool, optional (default: True)
+        Whether to use the on-disk cache of parsed models.
+    parse_cache_dir : str, optional (default: None)
+        Path to the directory in which parsed models are cached. If not specified, ``nestml/parse_cache`` in the user cache directory is used.
+    ode_toolbox_cache : bool, optional (default: True)
+        Whether to use the on-disk cache of ODE-toolbox analysis results.
+    ode_toolbox_cache_dir : str, optional (default: None)
+        Path to the directory in which ODE-toolbox analysis results are cached. If not specified, ``nestml/ode_toolbox_cache`` in the user cache directory is used.
+    n_jobs : int, optional (default: 1)
+        Number of processes to use for analysing the models and generating code. Models are distributed over the processes after parsing, validation and transformation.
+    profile : bool, optional (default: False)
+        Record the wall time and peak memory usage of each processing phase, and store them in ``profile.json`` in the report directory.
+    cprofile : bool, optional (default: False)
+        In addition to ``profile``, store cProfile statistics of each processing phase in the ``profile`` subdirectory of the report directory.
 
     Return
     ------
@@ -220,14 +250,18 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
     """
 
     configure_front_end(input_path, target_platform, target_path, install_path, logging_level,
-                        module_name, store_log, suffix, dev, codegen_opts)
+                        module_name, store_log, suffix, dev, codegen_opts, parse_cache, parse_cache_dir,
+                        ode_toolbox_cache, ode_toolbox_cache_dir, n_jobs, profile, cprofile)
 
     return process()
 
 
 def configure_front_end(input_path: Union[str, Sequence[str]], target_platform: str, target_path=None,
                         install_path: str = None, logging_level="ERROR", module_name=None, store_log=False, suffix="",
-                        dev=False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                        dev=False, codegen_opts: Optional[Mapping[str, Any]] = None, parse_cache: bool = True,
+                        parse_cache_dir: Optional[str] = None, ode_toolbox_cache: bool = True,
+                        ode_toolbox_cache_dir: Optional[str] = None, n_jobs: int = 1, profile: bool = False,
+                        cprofile: bool = False):
 
     args = list()
     args.append(qualifier_input_path_arg)
@@ -265,6 +299,30 @@ def configure_front_end(input_path: Union[str, Sequence[str]], target_platform:
     if dev:
         args.append(qualifier_dev_arg)
 
+    if not parse_cache:
+        args.append(qualifier_no_parse_cache_arg)
+
+    if parse_cache_dir is not None:
+        args.append(qualifier_parse_cache_dir_arg)
+        args.append(str(parse_cache_dir))
+
+    if not ode_toolbox_cache:
+        args.append(qualifier_no_ode_toolbox_cache_arg)
+
+    if ode_toolbox_cache_dir is not None:
+        args.append(qualifier_ode_toolbox_cache_dir_arg)
+        args.append(str(ode_toolbox_cache_dir))
+
+    if n_jobs != 1:
+        args.append(qualifier_jobs_arg)
+        args.append(str(n_jobs))
+
+    if profile:
+        args.append(qualifier_profile_arg)
+
+    if cprofile:
+        args.append(qualifier_cprofile_arg)
+
     FrontendConfiguration.parse_config(args)
 
     if codegen_opts:
@@ -436,8 +494,28 @@ def main() -> int:
     exit_code
         The process exit code: 0 for success, > 0 for failure
     """
+    serve, server_socket, args = FrontendConfiguration.parse_server_config(sys.argv[1:])
+
+    if serve:
+        from pynestml.frontend.compiler_server import CompilerServer
+        return CompilerServer.start(server_socket)
+
+    if server_socket is not None:
+        # act as a thin client: forward the request to the compiler server
+        from pynestml.frontend.compiler_server import CompilerServer
+        try:
+            response = CompilerServer.send_request(server_socket, {"args": args, "cwd": os.getcwd()})
+        except (OSError, ValueError) as e:
+            print("Could not connect to the compiler server at \"" + server_socket + "\": " + str(e))
+
+            return 1
+
+        print(response["output"], end="")
+
+        return int(response["exit_code"])
+
     try:
-        FrontendConfiguration.parse_config(sys.argv[1:])
+        FrontendConfiguration.parse_config(args)
     except InvalidPathException as e:
         print(e)
 
@@ -459,6 +537,9 @@ def get_parsed_models() -> List[ASTModel]:
     models
         List of correctly parsed models
     """
+    from pynestml.cocos.co_cos_manager import CoCosManager
+    from pynestml.utils.model_parser import ModelParser
+
     # init log dir
     create_report_dir()
 
@@ -491,24 +572,144 @@ def get_parsed_models() -> List[ASTModel]:
 
 def transform_models(transformers, models):
     for transformer in transformers:
-        models = transformer.transform(models)
+        with Profiler.phase("transform", name=type(transformer).__name__):
+            models = transformer.transform(models)
 
     return models
 
 
 def generate_code(code_generators, models):
+    n_jobs = FrontendConfiguration.get_n_jobs()
+    if n_jobs > 1:
+        model_groups = get_independent_model_groups(models)
+        if len(model_groups) > 1:
+            if not code_generators.supports_parallel_generation():
+                reason = "not supported for target platform " + FrontendConfiguration.get_target_platform()
+            elif "fork" not in multiprocessing.get_all_start_methods():
+                reason = "not supported on this operating system"
+            else:
+                generate_code_parallel(code_generators, models, model_groups, n_jobs)
+                return
+
+            code, message = Messages.get_parallel_generation_not_supported(reason)
+            Logger.log_message(code=code, message=message, log_level=LoggingLevel.WARNING)
+
     code_generators.generate_code(models)
 
 
-def process() -> bool:
+def get_independent_model_groups(models: Sequence[ASTModel]) -> List[List[ASTModel]]:
+    r"""
+    Partition the models into groups that can be analysed and generated independently of each other. A neuron and a synapse that are co-generated refer to each other, and are always placed in the same group. Groups are sorted by model name, so that the partition does not depend on the order of ``models``.
+
+    :param models: a list of models
+    :return: a list of groups of models
+    """
+    groups: List[List[ASTModel]] = []
+    for model in sorted(models, key=lambda model: model.get_name()):
+        partners = [getattr(model, attr) for attr in ["paired_neuron", "paired_synapse"] if getattr(model, attr, None) is not None]
+        for group in groups:
+            if any([partner is model_in_group for partner in partners for model_in_group in group]):
+                group.append(model)
+                break
+        else:
+            groups.append([model])
+
+    return groups
+
+
+# code generator and groups of models, inherited by forked worker processes
+_parallel_generation_state: Optional[Tuple[CodeGenerator, List[List[ASTModel]]]] = None
+
+
+def _generate_code_for_model_group(group_idx: int):
+    r"""
+    Process pool worker: generate code for one group of models. Log messages are not printed, but returned to the parent process (with references to models replaced by model names), together with the ODE-toolbox cache statistics and the exception that was raised, if any.
+    """
+    code_generator, model_groups = _parallel_generation_state
+    first_message_nr = Logger.curr_message
+    first_profiler_record = len(Profiler.records)
+    Logger.no_print = True
+    ODEToolboxCache.reset_statistics()
+
+    exception = None
+    try:
+        code_generator.generate_models(model_groups[group_idx])
+    except Exception as e:
+        exception = e
+
+    try:
+        pickle.dumps(exception)
+    except Exception:
+        exception = Exception(str(exception))
+
+    log_entries = []
+    for message_nr, (_, node, log_level, code, error_position, message) in Logger.get_log().items():
+        if message_nr >= first_message_nr:
+            log_entries.append((node.get_name() if node is not None else None, log_level, code, error_position, str(message)))
+
+    return log_entries, ODEToolboxCache.hits, ODEToolboxCache.misses, Profiler.records[first_profiler_record:], exception
+
+
+def generate_code_parallel(code_generator: CodeGenerator, models: Sequence[ASTModel], model_groups: List[List[ASTModel]], n_jobs: int) -> None:
+    r"""
+    Generate code for each group of models in a pool of (forked) processes, then generate the module code in this process. The log messages (and profiled phases) of all groups are merged into the log in order of the groups, so that the result does not depend on the order in which the processes finish.
+
+    :param code_generator: the code generator, for which ``supports_parallel_generation()`` returns True
+    :param models: a list of all models
+    :param model_groups: the models, partitioned into groups as returned by ``get_independent_model_groups()``
+    :param n_jobs: the maximum number of processes to use
+    """
+    global _parallel_generation_state
+
+    # avoid a race between the processes in creating the target directory
+    os.makedirs(FrontendConfiguration.get_target_path(), exist_ok=True)
+
+    _parallel_generation_state = (code_generator, model_groups)
+    try:
+        with multiprocessing.get_context("fork").Pool(min(n_jobs, len(model_groups))) as pool:
+            results = pool.map(_generate_code_for_model_group, range(len(model_groups)), chunksize=1)
+    finally:
+        _parallel_generation_state = None
+
+    models_by_name = {model.get_name(): model for model in models}
+    current_node = Logger.current_node
+    Logger.set_current_node(None)
+    exception = None
+    for log_entries, hits, misses, profiler_records, group_exception in results:
+        for node_name, log_level, code, error_position, message in log_entries:
+            Logger.log_message(node=models_by_name.get(node_name), code=code, message=message, error_position=error_position, log_level=log_level)
+
+        ODEToolboxCache.hits += hits
+        ODEToolboxCache.misses += misses
+        Profiler.records.extend(profiler_records)
+
+        if exception is None:
+            exception = group_exception
+
+    Logger.set_current_node(current_node)
+
+    if exception is not None:
+        raise exception
+
+    code_generator.generate_module(models)
+
+
+def process(build: bool = True) -> bool:
     r"""
     The main toolchain workflow entry point. For all models: parse, validate, transform, generate code and build.
 
+    Parameters
+    ----------
+    build : bool, optional (default: True)
+        If False, code is only generated, but not built; the builder for the target platform is not initialised.
+
     Return
     ------
     errors_occurred
         Flag indicating whether errors occurred during processing. False if processing was successful; True if errors occurred in any of the models.
     """
+    from pynestml.cocos.co_cos_manager import CoCosManager
+    from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
 
     # initialise model transformers
     transformers, unused_opts_transformer = transformers_from_target_name(FrontendConfiguration.get_target_platform(),
@@ -519,21 +720,29 @@ def process() -> bool:
     unused_opts_codegen = code_generator.set_options(FrontendConfiguration.get_codegen_opts())
 
     # initialise builder
-    _builder, unused_opts_builder = builder_from_target_name(FrontendConfiguration.get_target_platform(),
-                                                             options=FrontendConfiguration.get_codegen_opts())
+    _builder, unused_opts_builder = None, FrontendConfiguration.get_codegen_opts()
+    if build:
+        _builder, unused_opts_builder = builder_from_target_name(FrontendConfiguration.get_target_platform(),
+                                                                 options=FrontendConfiguration.get_codegen_opts())
 
     # check for unused codegen options
     for opt_key in FrontendConfiguration.get_codegen_opts().keys():
         if opt_key in unused_opts_transformer.keys() and opt_key in unused_opts_codegen.keys() and opt_key in unused_opts_builder.keys():
             raise CodeGeneratorOptionsException("The code generator option \"" + opt_key + "\" does not exist.")
 
-    models = get_parsed_models()
+    ODEToolboxCache.reset_statistics()
+    ODEToolboxUtils.clear_printed_expressions()
+    Profiler.reset()
+
+    with Profiler.phase("get_parsed_models"):
+        models = get_parsed_models()
 
     # validation -- check cocos for models that do not have errors already
     excluded_models = []
     for model in models:
         if not Logger.has_errors(model.name):
-            CoCosManager.check_cocos(model)
+            with Profiler.phase("check_cocos", model=model.get_name()):
+                CoCosManager.check_cocos(model)
 
         if Logger.has_errors(model.name):
             code, message = Messages.get_model_contains_errors(model.get_name())
@@ -546,27 +755,69 @@ def process() -> bool:
     models = list(set(models) - set(excluded_models))
 
     if len(models) == 0:
+        if Profiler.enabled:
+            store_profile_to_file()
+
         return True    # there is no model code to generate, return error condition
 
     # transformation(s)
     models = transform_models(transformers, models)
 
     # generate code
-    generate_code(code_generator, models)
+    with Profiler.phase("generate_code"):
+        generate_code(code_generator, models)
+
+    if ODEToolboxCache.hits + ODEToolboxCache.misses > 0:
+        code, message = Messages.get_ode_toolbox_cache_statistics(ODEToolboxCache.hits, ODEToolboxCache.misses)
+        Logger.log_message(code=code, message=message, log_level=LoggingLevel.INFO)
 
     # perform build
     if _builder is not None:
-        _builder.build()
+        with Profiler.phase("build"):
+            _builder.build()
 
     if FrontendConfiguration.store_log:
         store_log_to_file()
 
+    if Profiler.enabled:
+        store_profile_to_file()
+
     # return a boolean indicating whether errors occurred
     return len(Logger.get_all_messages_of_level(LoggingLevel.ERROR)) > 0
 
 
+# the predefined elements as registered by ``keep_predefined_resident()``
+_resident_predefined: Optional[Tuple[Mapping, Mapping, Mapping, Mapping]] = None
+
+
+def keep_predefined_resident():
+    r"""
+    Register the predefined elements once and keep them resident, so that subsequent calls to ``init_predefined()`` restore them instead of registering them anew. Used by long-running processes such as the compiler server.
+    """
+    from pynestml.symbols.predefined_functions import PredefinedFunctions
+    from pynestml.symbols.predefined_types import PredefinedTypes
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.symbols.predefined_variables import PredefinedVariables
+
+    global _resident_predefined
+
+    _resident_predefined = None
+    init_predefined()
+    _resident_predefined = (PredefinedUnits.name2unit, PredefinedTypes.name2type, PredefinedFunctions.name2function, PredefinedVariables.name2variable)
+
+
 def init_predefined():
+    from pynestml.symbols.predefined_functions import PredefinedFunctions
+    from pynestml.symbols.predefined_types import PredefinedTypes
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.symbols.predefined_variables import PredefinedVariables
+
     # initialize the predefined elements
+    if _resident_predefined is not None:
+        # restore the resident elements; units and types that were registered while processing previous models are discarded
+        PredefinedUnits.name2unit, PredefinedTypes.name2type, PredefinedFunctions.name2function, PredefinedVariables.name2variable = [copy.copy(name2symbol) for name2symbol in _resident_predefined]
+        return
+
     PredefinedUnits.register_units()
     PredefinedTypes.register_types()
     PredefinedFunctions.register_functions()
@@ -582,3 +833,7 @@ def store_log_to_file():
     with open(str(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report",
                                "log")) + ".txt", "w+") as f:
         f.write(str(Logger.get_json_format()))
+
+
+def store_profile_to_file():
+    Profiler.store_report(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report"))
@@ -47,6 +47,8 @@ class ASTAssignment(ASTNode):
         rhs = None
     """
 
+    __slots__ = ("lhs", "is_direct_assignment", "is_compound_sum", "is_compound_minus", "is_compound_product", "is_compound_quotient", "rhs")
+
     def __init__(self, lhs: Optional[ASTVariable] = None, is_direct_assignment: bool = False, is_compound_sum: bool = False, is_compound_minus: bool = False,
                  is_compound_product: bool = False, is_compound_quotient: bool = False, rhs: Optional[ASTExpression] = None, *args, **kwargs):
         """
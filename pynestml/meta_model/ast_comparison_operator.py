@@ -39,6 +39,8 @@ class ASTComparisonOperator(ASTNode):
         is_gt = False
     """
 
+    __slots__ = ("is_gt", "is_ge", "is_ne2", "is_ne", "is_eq", "is_le", "is_lt")
+
     def __init__(self, is_lt=False, is_le=False, is_eq=False, is_ne=False, is_ne2=False, is_ge=False,
                  is_gt=False, *args, **kwargs):
         """
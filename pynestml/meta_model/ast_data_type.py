@@ -48,6 +48,8 @@ class ASTDataType(ASTNode):
         type_symbol = None  # the corresponding type symbol
     """
 
+    __slots__ = ("is_integer", "is_real", "is_string", "is_boolean", "is_void", "unit_type", "type_symbol")
+
     def __init__(self, is_integer=False, is_real=False, is_string=False, is_boolean=False, is_void=False,
                  unit_type: Optional[ASTUnitType] = None, type_symbol=None, *args, **kwargs):
         """
@@ -59,6 +59,8 @@ class ASTDeclaration(ASTNode):
         invariant = None
     """
 
+    __slots__ = ("is_recordable", "is_inline_expression", "variables", "data_type", "size_parameter", "expression", "invariant", "decorators")
+
     def __init__(self, is_recordable: bool = False, is_inline_expression: bool = False, _variables: Optional[List[ASTVariable]] = None, data_type: Optional[ASTDataType] = None, size_parameter: Optional[Union[ASTSimpleExpression, ASTExpression]] = None,
                  expression: Optional[ASTExpression] = None, invariant: Optional[ASTExpression] = None, decorators=None, *args, **kwargs):
         """
@@ -169,6 +171,8 @@ class ASTDeclaration(ASTNode):
         :param _parameter: the size parameter
         """
         self.size_parameter = _parameter
+        if _parameter is not None:
+            _parameter.parent_ = self
 
     def has_expression(self) -> bool:
         """
@@ -188,6 +192,8 @@ class ASTDeclaration(ASTNode):
     def set_expression(self, expr):
         # type: (ASTExpression) -> None
         self.expression = expr
+        if expr is not None:
+            expr.parent_ = self
 
     def has_invariant(self):
         """
@@ -31,6 +31,8 @@ class ASTElifClause(ASTNode):
     This class is used to store elif-clauses.
     """
 
+    __slots__ = ("stmts_body", "condition")
+
     def __init__(self, condition, stmts_body: ASTStmtsBody, *args, **kwargs):
         """
         Standard constructor.
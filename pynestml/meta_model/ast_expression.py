@@ -67,6 +67,9 @@ class ASTExpression(ASTExpressionNode):
         simple_expression = None
     """
 
+    __slots__ = ("is_encapsulated", "is_logical_not", "unary_operator", "expression", "lhs", "binary_operator", "rhs", "condition", "if_true",
+                 "if_not", "has_delay")
+
     def __init__(self, is_encapsulated: bool = False, unary_operator: Optional[ASTUnaryOperator] = None,
                  is_logical_not: bool = False, expression: Optional[ASTExpression] = None, lhs: Optional[ASTExpression] = None,
                  binary_operator: Optional[Union[ASTLogicalOperator, ASTComparisonOperator, ASTBitOperator, ASTArithmeticOperator]] = None,
@@ -31,13 +31,17 @@ class ASTExpressionNode(ASTNode):
     """
     This class is not a part of the grammar but is used to store commonalities of expression-type nodes.
 
+    The type of an expression is derived when it is first requested, and kept until the expression, or one of its sub-expressions, is changed (see ``invalidate_type()``).
+
     This class is abstract, thus no instances can be created.
     """
-    __type = None
+
+    __slots__ = ("__type",)
     __metaclass__ = ABCMeta
 
     def __init__(self, *args, **kwargs):
         super(ASTExpressionNode, self).__init__(*args, **kwargs)
+        self.__type = None
 
     @property
     def type(self):
@@ -50,6 +54,22 @@ class ASTExpressionNode(ASTNode):
     def type(self, _value):
         self.__type = _value
 
+    def has_type(self) -> bool:
+        """
+        Returns whether the type of this expression has been derived already.
+        :return: True if the type is known, otherwise False.
+        """
+        return self.__type is not None
+
+    def invalidate_type(self) -> None:
+        """
+        Discards the type of this expression and of all expressions that contain it, so that they are derived again when they are next requested. Has to be called whenever the expression is changed.
+        """
+        node = self
+        while isinstance(node, ASTExpressionNode):
+            node.__type = None
+            node = node.get_parent()
+
     def get_children(self) -> List[ASTNode]:
         r"""
         Returns the children of this node, if any.
@@ -28,8 +28,8 @@ class ASTExternalVariable(ASTVariable):
     r"""
     This class is used to store a single "external" variable: a variable the value of which is obtained during runtime from a neuron's postsynaptic partner.
     """
-    _altscope = None
-    _altname = None
+
+    __slots__ = ("_altname", "_altscope")
 
     def __init__(self, name, altname=None, altscope=None, *args, **kwargs):
         r"""
@@ -54,6 +54,8 @@ class ASTFunction(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("name", "parameters", "return_type", "stmts_body", "type_symbol")
+
     def __init__(self, name: str, parameters: List[ASTParameter], return_type: Optional[ASTDataType], stmts_body: ASTStmtsBody, type_symbol=None, *args, **kwargs):
         """
         Standard constructor.
@@ -38,6 +38,8 @@ class ASTFunctionCall(ASTNode):
         args = None
     """
 
+    __slots__ = ("callee_name", "args")
+
     def __init__(self, callee_name, function_call_args, *args, **kwargs):
         """
         Standard constructor.
@@ -30,6 +30,8 @@ class ASTIfClause(ASTNode):
     This class is used to store a single ``if``-clause.
     """
 
+    __slots__ = ("condition", "stmts_body")
+
     def __init__(self, condition, stmts_body: ASTStmtsBody, *args, **kwargs):
         """
         Standard constructor.
@@ -38,6 +38,8 @@ class ASTInlineExpression(ASTNode):
         expression = None
     """
 
+    __slots__ = ("is_recordable", "variable_name", "data_type", "expression", "decorators")
+
     def __init__(self, is_recordable=False, variable_name=None, data_type=None, expression=None, decorators=None, *args, **kwargs):
         """
         Standard constructor.
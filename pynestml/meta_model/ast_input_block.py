@@ -39,6 +39,8 @@ class ASTInputBlock(ASTNode):
         input_definitions = None
     """
 
+    __slots__ = ("input_definitions",)
+
     def __init__(self, input_definitions=None, *args, **kwargs):
         """
         Standard constructor.
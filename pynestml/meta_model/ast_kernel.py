@@ -31,6 +31,8 @@ class ASTKernel(ASTNode):
         kernel : KERNEL_KEYWORD variable EQUALS expression (COMMA variable EQUALS expression)* (SEMICOLON)?;
     """
 
+    __slots__ = ("variables", "expressions")
+
     def __init__(self, variables, expressions, *args, **kwargs):
         """
         Standard constructor.
@@ -34,6 +34,8 @@ class ASTLogicalOperator(ASTNode):
         is_logical_or = False
     """
 
+    __slots__ = ("is_logical_and", "is_logical_or")
+
     def __init__(self, is_logical_and=False, is_logical_or=False, *args, **kwargs):
         """
         Standard constructor.
@@ -46,6 +46,15 @@ class ASTModel(ASTNode):
     This class is used to stuff common to neurons and synapses
     """
 
+    __slots__ = ("name", "body", "artifact_name", "_default_delay_variable", "_default_delay_expression", "_default_delay_dtype", "file_path",
+                 # the following are only set during transformation and code generation, and remain unset (use ``hasattr()``) otherwise
+                 "paired_neuron", "paired_synapse", "paired_synapse_original_model", "unpaired_name", "recursive_vars_used", "_transferred_variables",
+                 "extra_on_emit_spike_stmts_from_synapse", "state_vars_that_need_continuous_buffering", "post_port_names", "spiking_post_port_names",
+                 "vt_port_names", "continuous_post_ports", "spike_updates", "post_spike_updates", "equations_with_delay_vars", "equations_with_vector_vars",
+                 "analytic_solver", "parameter_value_dict", "integrate_odes_combinations",
+                 # cache for ``get_variable_dependency_graph()``
+                 "_variable_dependency_graph")
+
     def __init__(self, name: str, body: ASTModelBody, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -68,6 +77,7 @@ class ASTModel(ASTNode):
         self.name = name
         self.body = body
         self.artifact_name = artifact_name
+        self._variable_dependency_graph = None
 
     def clone(self):
         """
@@ -172,6 +182,8 @@ class ASTModel(ASTNode):
             if isinstance(elem, ASTEquationsBlock):
                 self.get_body().get_body_elements().remove(elem)
 
+        self.invalidate_variable_dependency_graph()
+
     def get_state_declarations(self):
         """
         Returns a list of initial values declarations made in this neuron.
@@ -453,6 +465,7 @@ class ASTModel(ASTNode):
         block = ASTNodeFactory.create_ast_stmts_body([], ASTSourceLocation.get_predefined_source_position())
         update_block = ASTNodeFactory.create_ast_update_block(block, ASTSourceLocation.get_predefined_source_position())
         self.get_body().get_body_elements().append(update_block)
+        update_block.parent_ = self.get_body()
 
     def add_to_internals_block(self, declaration: ASTDeclaration, index: int = -1) -> None:
         """
@@ -460,7 +473,6 @@ class ASTModel(ASTNode):
         :param declaration: a single declaration
         """
         from pynestml.utils.ast_utils import ASTUtils
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
         from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 
         assert len(self.get_internals_blocks()) <= 1, "Only one internals block supported for now"
@@ -476,11 +488,9 @@ class ASTModel(ASTNode):
 
         self.get_internals_blocks()[0].get_declarations().insert(index, declaration)
         declaration.update_scope(self.get_internals_blocks()[0].get_scope())
-        symtable_vistor = ASTSymbolTableVisitor()
-        symtable_vistor.block_type_stack.push(BlockType.INTERNALS)
-        self.accept(ASTParentVisitor())
-        self.accept(symtable_vistor)
-        symtable_vistor.block_type_stack.pop()
+        declaration.parent_ = self.get_internals_blocks()[0]
+        declaration.accept(ASTParentVisitor())
+        ASTUtils.update_symbol_table_for_node(self, declaration, BlockType.INTERNALS)
 
     def add_to_state_block(self, declaration: ASTDeclaration) -> None:
         """
@@ -489,7 +499,6 @@ class ASTModel(ASTNode):
         """
         from pynestml.symbols.symbol import SymbolKind
         from pynestml.utils.ast_utils import ASTUtils
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
         from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 
         assert len(self.get_state_blocks()) <= 1, "Only one internals block supported for now"
@@ -499,11 +508,9 @@ class ASTModel(ASTNode):
 
         self.get_state_blocks()[0].get_declarations().append(declaration)
         declaration.update_scope(self.get_state_blocks()[0].get_scope())
-        symtable_vistor = ASTSymbolTableVisitor()
-        symtable_vistor.block_type_stack.push(BlockType.STATE)
-        self.accept(ASTParentVisitor())
-        self.accept(symtable_vistor)
-        symtable_vistor.block_type_stack.pop()
+        declaration.parent_ = self.get_state_blocks()[0]
+        declaration.accept(ASTParentVisitor())
+        ASTUtils.update_symbol_table_for_node(self, declaration, BlockType.STATE)
 
         assert declaration.get_variables()[0].get_scope().resolve_to_symbol(declaration.get_variables()[0].get_name(), SymbolKind.VARIABLE) is not None
         assert declaration.get_scope().resolve_to_symbol(declaration.get_variables()[0].get_name(), SymbolKind.VARIABLE) is not None
@@ -523,6 +530,24 @@ class ASTModel(ASTNode):
 
         return ret
 
+    def get_variable_dependency_graph(self):
+        """
+        Returns the dependency graph between the variables of this model. The graph is built on first use and cached until ``invalidate_variable_dependency_graph()`` is called; this happens automatically when declarations or equations are added or removed through ``ASTModel`` and ``ASTUtils`` methods, and when the symbol table of the model is rebuilt.
+        :return: the variable dependency graph
+        """
+        from pynestml.utils.variable_dependency_graph import VariableDependencyGraph
+
+        if self._variable_dependency_graph is None:
+            self._variable_dependency_graph = VariableDependencyGraph(self)
+
+        return self._variable_dependency_graph
+
+    def invalidate_variable_dependency_graph(self) -> None:
+        """
+        Discards the cached variable dependency graph. Call this after changing the model directly.
+        """
+        self._variable_dependency_graph = None
+
     def get_initial_value(self, variable_name: str):
         assert type(variable_name) is str
 
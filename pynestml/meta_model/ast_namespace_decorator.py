@@ -29,6 +29,8 @@ class ASTNamespaceDecorator(ASTNode):
     Namespace decorator, for example "@nest::delay".
     """
 
+    __slots__ = ("namespace", "name")
+
     def __init__(self, namespace: str = "", name: str = "", *args, **kwargs):
         super(ASTNamespaceDecorator, self).__init__(*args, **kwargs)
         self.namespace = namespace
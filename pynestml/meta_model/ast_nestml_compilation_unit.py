@@ -30,6 +30,8 @@ class ASTNestMLCompilationUnit(ASTNode):
     Store a collection of processed ASTModels.
     """
 
+    __slots__ = ("model_list", "artifact_name", "file_path")
+
     def __init__(self, model_list: List[ASTModel] = None, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
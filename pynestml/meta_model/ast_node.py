@@ -45,8 +45,16 @@ class ASTNode(metaclass=ABCMeta):
         in_comment = None
         #
         implicit_conversion_factor = None
+        #
+        parent_ = None (set by ASTNodeFactory, the mutators of the parent node and ASTParentVisitor)
+
+    If ``check_parent_links`` is set to True, ``get_parent()`` additionally checks that this node is among the children of its parent. This is intended for debugging, as the check is linear in the number of children.
     """
 
+    __slots__ = ("source_position", "scope", "comment", "pre_comments", "in_comment", "implicit_conversion_factor", "parent_")
+
+    check_parent_links = False
+
     def __init__(self, source_position: ASTSourceLocation = None, scope: Scope = None, comment: Optional[str] = None, pre_comments: Optional[List[str]] = None,
                  in_comment: Optional[str] = None, implicit_conversion_factor: Optional[float] = None):
         """
@@ -66,6 +74,7 @@ class ASTNode(metaclass=ABCMeta):
         self.pre_comments = pre_comments
         self.in_comment = in_comment
         self.implicit_conversion_factor = implicit_conversion_factor
+        self.parent_ = None
 
     @abstractmethod
     def clone(self):
@@ -86,12 +95,10 @@ class ASTNode(metaclass=ABCMeta):
     def get_parent(self) -> Optional[ASTNode]:
         """
         Get the parent of this node.
-        :return: The parent node
+        :return: The parent node, or None if this node is the root of the tree
         """
-        assert "parent_" in dir(self), "No parent known, please ensure ASTParentVisitor has been run on the AST"
-
-        if self.parent_:
-            assert self in self.parent_.get_children(), "Doubly linked tree is inconsistent: please ensure ASTParentVisitor has been run on the AST"
+        if ASTNode.check_parent_links and self.parent_ is not None:
+            assert any(child is self for child in self.parent_.get_children()), "Doubly linked tree is inconsistent: please ensure ASTParentVisitor has been run on the AST"
 
         return self.parent_
 
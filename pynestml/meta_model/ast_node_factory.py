@@ -49,6 +49,7 @@ from pynestml.meta_model.ast_namespace_decorator import ASTNamespaceDecorator
 from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.meta_model.ast_model_body import ASTModelBody
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.meta_model.ast_on_condition_block import ASTOnConditionBlock
 from pynestml.meta_model.ast_on_receive_block import ASTOnReceiveBlock
@@ -71,14 +72,23 @@ from pynestml.utils.port_signal_type import PortSignalType
 class ASTNodeFactory:
     """
     An implementation of the factory pattern for an easier initialization of new AST nodes.
+
+    Nodes created by the factory have the ``parent_`` links of their children set, so that a tree built bottom-up through the factory is doubly linked without running the ``ASTParentVisitor``.
     """
 
+    @classmethod
+    def _link_children(cls, node: ASTNode) -> ASTNode:
+        for child in node.get_children():
+            child.parent_ = node
+
+        return node
+
     @classmethod
     def create_ast_arithmetic_operator(cls, is_times_op=False, is_div_op=False, is_modulo_op=False, is_plus_op=False,
                                        is_minus_op=False, is_pow_op=False, source_position=None):
         # type:(bool,bool,bool,bool,bool,bool,ASTSourceLocation) -> ASTArithmeticOperator
-        return ASTArithmeticOperator(is_times_op, is_div_op, is_modulo_op, is_plus_op, is_minus_op, is_pow_op,
-                                     source_position=source_position)
+        return cls._link_children(ASTArithmeticOperator(is_times_op, is_div_op, is_modulo_op, is_plus_op, is_minus_op, is_pow_op,
+                                                        source_position=source_position))
 
     @classmethod
     def create_ast_assignment(cls, lhs=None,  # type: ASTVariable
@@ -90,60 +100,60 @@ class ASTNodeFactory:
                               expression=None,  # type: Union(ASTSimpleExpression,ASTExpression)
                               source_position=None  # type: ASTSourceLocation
                               ):  # type: (...) -> ASTAssignment
-        return ASTAssignment(lhs, is_direct_assignment, is_compound_sum, is_compound_minus, is_compound_product,
-                             is_compound_quotient, expression, source_position=source_position)
+        return cls._link_children(ASTAssignment(lhs, is_direct_assignment, is_compound_sum, is_compound_minus, is_compound_product,
+                                                is_compound_quotient, expression, source_position=source_position))
 
     @classmethod
     def create_ast_bit_operator(cls, is_bit_and=False, is_bit_xor=False, is_bit_or=False, is_bit_shift_left=False,
                                 is_bit_shift_right=False, source_position=None):
         # type: (bool,bool,bool,bool,bool,ASTSourceLocation) -> ASTBitOperator
-        return ASTBitOperator(is_bit_and, is_bit_xor, is_bit_or, is_bit_shift_left, is_bit_shift_right, source_position=source_position)
+        return cls._link_children(ASTBitOperator(is_bit_and, is_bit_xor, is_bit_or, is_bit_shift_left, is_bit_shift_right, source_position=source_position))
 
     @classmethod
     def create_ast_stmts_body(cls, stmts, source_position):
         # type: (list(ASTSmallStmt|ASTCompoundStmt),ASTSourceLocation) -> ASTStmtsBody
-        return ASTStmtsBody(stmts, source_position=source_position)
+        return cls._link_children(ASTStmtsBody(stmts, source_position=source_position))
 
     @classmethod
     def create_ast_block_with_variables(cls, is_state=False, is_parameters=False, is_internals=False,
                                         declarations=None, source_position=None):
         # type: (bool,bool,bool,bool,list(ASTDeclaration),ASTSourceLocation) -> ASTBlockWithVariables
-        return ASTBlockWithVariables(is_state, is_parameters, is_internals, declarations,
-                                     source_position=source_position)
+        return cls._link_children(ASTBlockWithVariables(is_state, is_parameters, is_internals, declarations,
+                                                        source_position=source_position))
 
     @classmethod
     def create_ast_namespace_decorator(cls, namespace=None, name=None, source_position=None):
-        return ASTNamespaceDecorator(namespace, name, source_position=source_position)
+        return cls._link_children(ASTNamespaceDecorator(namespace, name, source_position=source_position))
 
     @classmethod
     def create_ast_on_receive_block(cls, block=None, port_name=None, const_parameters=None, source_position=None):
-        return ASTOnReceiveBlock(block, port_name, const_parameters, source_position=source_position)
+        return cls._link_children(ASTOnReceiveBlock(block, port_name, const_parameters, source_position=source_position))
 
     @classmethod
     def create_ast_on_condition_block(cls, block=None, cond_expr=None, const_parameters=None, source_position=None):
-        return ASTOnConditionBlock(block, cond_expr, const_parameters, source_position=source_position)
+        return cls._link_children(ASTOnConditionBlock(block, cond_expr, const_parameters, source_position=source_position))
 
     @classmethod
     def create_ast_model_body(cls, body_elements, source_position):
         # type: (list,ASTSourceLocation) -> ASTModelBody
-        return ASTModelBody(body_elements, source_position=source_position)
+        return cls._link_children(ASTModelBody(body_elements, source_position=source_position))
 
     @classmethod
     def create_ast_comparison_operator(cls, is_lt=False, is_le=False, is_eq=False, is_ne=False, is_ne2=False,
                                        is_ge=False, is_gt=False, source_position=None):
         # type: (bool,bool,bool,bool,bool,bool,bool,ASTSourceLocation) -> ASTComparisonOperator
-        return ASTComparisonOperator(is_lt, is_le, is_eq, is_ne, is_ne2, is_ge, is_gt, source_position=source_position)
+        return cls._link_children(ASTComparisonOperator(is_lt, is_le, is_eq, is_ne, is_ne2, is_ge, is_gt, source_position=source_position))
 
     @classmethod
     def create_ast_compound_stmt(cls, if_stmt, while_stmt, for_stmt, source_position):
         # type: (ASTIfStmt,ASTWhileStmt,ASTForStmt,ASTSourceLocation) -> ASTCompoundStmt
-        return ASTCompoundStmt(if_stmt, while_stmt, for_stmt, source_position=source_position)
+        return cls._link_children(ASTCompoundStmt(if_stmt, while_stmt, for_stmt, source_position=source_position))
 
     @classmethod
     def create_ast_data_type(cls, is_integer=False, is_real=False, is_string=False, is_boolean=False,
                              is_void=False, is_unit_type=None, source_position=None):
         # type: (bool,bool,bool,bool,bool,ASTUnitType,ASTSourceLocation) -> ASTDataType
-        return ASTDataType(is_integer, is_real, is_string, is_boolean, is_void, is_unit_type, source_position=source_position)
+        return cls._link_children(ASTDataType(is_integer, is_real, is_string, is_boolean, is_void, is_unit_type, source_position=source_position))
 
     @classmethod
     def create_ast_declaration(cls,
@@ -157,23 +167,23 @@ class ASTNodeFactory:
                                source_position=None,  # type: ASTSourceLocation
                                decorators=None,  # type: list
                                ) -> ASTDeclaration:
-        return ASTDeclaration(is_recordable, is_inline_expression, variables, data_type, size_parameter, expression, invariant, decorators,
-                              source_position=source_position)
+        return cls._link_children(ASTDeclaration(is_recordable, is_inline_expression, variables, data_type, size_parameter, expression, invariant, decorators,
+                                                 source_position=source_position))
 
     @classmethod
     def create_ast_elif_clause(cls, condition, block, source_position=None):
         # type: (ASTExpression|ASTSimpleExpression,ASTStmtsBody,ASTSourceLocation) -> ASTElifClause
-        return ASTElifClause(condition, block, source_position=source_position)
+        return cls._link_children(ASTElifClause(condition, block, source_position=source_position))
 
     @classmethod
     def create_ast_else_clause(cls, block, source_position):
         # type: (ASTStmtsBody,ASTSourceLocation) -> ASTElseClause
-        return ASTElseClause(block, source_position=source_position)
+        return cls._link_children(ASTElseClause(block, source_position=source_position))
 
     @classmethod
     def create_ast_equations_block(cls, declarations=None, source_position=None):
         # type: (list,ASTSourceLocation) -> ASTEquationsBlock
-        return ASTEquationsBlock(declarations, source_position=source_position)
+        return cls._link_children(ASTEquationsBlock(declarations, source_position=source_position))
 
     @classmethod
     def create_ast_expression(cls, is_encapsulated=False, unary_operator=None,
@@ -183,8 +193,8 @@ class ASTNodeFactory:
         The factory method used to create rhs which are either encapsulated in parentheses (e.g., (10mV))
         OR have a unary (e.g., ~bitVar), OR are negated (e.g., not logVar), or are simple rhs (e.g., 10mV).
         """
-        return ASTExpression(is_encapsulated=is_encapsulated, unary_operator=unary_operator,
-                             is_logical_not=is_logical_not, expression=expression, source_position=source_position)
+        return cls._link_children(ASTExpression(is_encapsulated=is_encapsulated, unary_operator=unary_operator,
+                                                is_logical_not=is_logical_not, expression=expression, source_position=source_position))
 
     @classmethod
     def create_ast_compound_expression(cls,
@@ -202,7 +212,7 @@ class ASTNodeFactory:
                                                  or isinstance(binary_operator, ASTLogicalOperator)
                                                  or isinstance(binary_operator, ASTArithmeticOperator))), \
             '(PyNestML.AST.Expression) No or wrong type of binary operator provided (%s)!' % type(binary_operator)
-        return ASTExpression(lhs=lhs, binary_operator=binary_operator, rhs=rhs, source_position=source_position)
+        return cls._link_children(ASTExpression(lhs=lhs, binary_operator=binary_operator, rhs=rhs, source_position=source_position))
 
     @classmethod
     def create_ast_ternary_expression(cls,
@@ -214,7 +224,7 @@ class ASTNodeFactory:
         """
         The factory method used to create a ternary operator rhs, e.g., 10mV<V_m?10mV:V_m
         """
-        return ASTExpression(condition=condition, if_true=if_true, if_not=if_not, source_position=source_position)
+        return cls._link_children(ASTExpression(condition=condition, if_true=if_true, if_not=if_not, source_position=source_position))
 
     @classmethod
     def create_ast_for_stmt(cls,
@@ -225,48 +235,48 @@ class ASTNodeFactory:
                             block=None,  # type: ASTStmtsBody
                             source_position=None  # type: ASTSourceLocation
                             ):  # type: (...) -> ASTForStmt
-        return ASTForStmt(variable, start_from, end_at, step, block, source_position=source_position)
+        return cls._link_children(ASTForStmt(variable, start_from, end_at, step, block, source_position=source_position))
 
     @classmethod
     def create_ast_function(cls, name, parameters, return_type, block, source_position):
         # type: (str,(None|list(ASTParameter)),(ASTDataType|None),ASTStmtsBody,ASTSourceLocation) -> ASTFunction
-        return ASTFunction(name, parameters, return_type, block, source_position=source_position)
+        return cls._link_children(ASTFunction(name, parameters, return_type, block, source_position=source_position))
 
     @classmethod
     def create_ast_function_call(cls, callee_name, args, source_position=None):
         # type: (str,(None|list(ASTExpression|ASTSimpleExpression)),ASTSourceLocation) -> ASTFunctionCall
-        return ASTFunctionCall(callee_name, args, source_position=source_position)
+        return cls._link_children(ASTFunctionCall(callee_name, args, source_position=source_position))
 
     @classmethod
     def create_ast_if_clause(cls, condition, block, source_position):
         # type: (ASTSimpleExpression|ASTExpression,ASTStmtsBody,ASTSourceLocation) -> ASTIfClause
-        return ASTIfClause(condition, block, source_position=source_position)
+        return cls._link_children(ASTIfClause(condition, block, source_position=source_position))
 
     @classmethod
     def create_ast_if_stmt(cls, if_clause, elif_clauses, else_clause, source_position):
         # type: (ASTIfClause,(None|list(ASTElifClause)),(None|ASTElseClause),ASTSourceLocation) -> ASTIfStmt
-        return ASTIfStmt(if_clause, elif_clauses, else_clause, source_position=source_position)
+        return cls._link_children(ASTIfStmt(if_clause, elif_clauses, else_clause, source_position=source_position))
 
     @classmethod
     def create_ast_input_block(cls, input_definitions, source_position):
         # type: (list(ASTInputPort), ASTSourceLocation) -> ASTInputBlock
-        return ASTInputBlock(input_definitions, source_position=source_position)
+        return cls._link_children(ASTInputBlock(input_definitions, source_position=source_position))
 
     @classmethod
     def create_ast_input_port(cls, name, size_parameter, data_type, input_qualifiers, signal_type, source_position):
         # type:(str,str,(None|ASTDataType),list(ASTInputQualifier),PortSignalType,ASTSourceLocation) -> ASTInputPort
-        return ASTInputPort(name=name, size_parameter=size_parameter, data_type=data_type, input_qualifiers=input_qualifiers,
-                            signal_type=signal_type, source_position=source_position)
+        return cls._link_children(ASTInputPort(name=name, size_parameter=size_parameter, data_type=data_type, input_qualifiers=input_qualifiers,
+                                               signal_type=signal_type, source_position=source_position))
 
     @classmethod
     def create_ast_input_qualifier(cls, is_inhibitory=False, is_excitatory=False, source_position=None):
         # type: (bool,bool,ASTSourceLocation) -> ASTInputQualifier
-        return ASTInputQualifier(is_inhibitory, is_excitatory, source_position=source_position)
+        return cls._link_children(ASTInputQualifier(is_inhibitory, is_excitatory, source_position=source_position))
 
     @classmethod
     def create_ast_logical_operator(cls, is_logical_and=False, is_logical_or=False, source_position=None):
         # type: (bool,bool,ASTSourceLocation) -> ASTLogicalOperator
-        return ASTLogicalOperator(is_logical_and, is_logical_or, source_position=source_position)
+        return cls._link_children(ASTLogicalOperator(is_logical_and, is_logical_or, source_position=source_position))
 
     @classmethod
     def create_ast_nestml_compilation_unit(cls, list_of_models, source_position: ASTSourceLocation, artifact_name: str) -> ASTNestMLCompilationUnit:
@@ -277,36 +287,36 @@ class ASTNodeFactory:
 
     @classmethod
     def create_ast_model(cls, name: str, body: ASTModelBody, source_position: ASTSourceLocation, artifact_name: str) -> ASTModel:
-        return ASTModel(name, body, artifact_name, source_position=source_position)
+        return cls._link_children(ASTModel(name, body, artifact_name, source_position=source_position))
 
     @classmethod
     def create_ast_ode_equation(cls, lhs, rhs, source_position, decorators=None):
         # type: (ASTVariable,ASTSimpleExpression|ASTExpression,ASTSourceLocation,Optional[List]) -> ASTOdeEquation
-        return ASTOdeEquation(lhs, rhs, source_position=source_position, decorators=decorators)
+        return cls._link_children(ASTOdeEquation(lhs, rhs, source_position=source_position, decorators=decorators))
 
     @classmethod
     def create_ast_inline_expression(cls, variable_name, data_type, expression, source_position, is_recordable=False, decorators: Optional[list] = None):
         # type: (str,ASTDataType,ASTExpression|ASTSimpleExpression,ASTSourceLocation,bool,list) -> ASTInlineExpression
-        return ASTInlineExpression(variable_name=variable_name, data_type=data_type, expression=expression,
-                                   is_recordable=is_recordable, source_position=source_position, decorators=decorators)
+        return cls._link_children(ASTInlineExpression(variable_name=variable_name, data_type=data_type, expression=expression,
+                                                      is_recordable=is_recordable, source_position=source_position, decorators=decorators))
 
     @classmethod
     def create_ast_kernel(cls, variables=None, expressions=None, source_position=None) -> ASTKernel:
-        return ASTKernel(variables, expressions, source_position=source_position)
+        return cls._link_children(ASTKernel(variables, expressions, source_position=source_position))
 
     @classmethod
     def create_ast_output_block(cls, s_type: PortSignalType, attributes: Optional[List[ASTParameter]] = None, source_position: ASTSourceLocation = None) -> ASTOutputBlock:
-        return ASTOutputBlock(s_type, attributes=attributes, source_position=source_position)
+        return cls._link_children(ASTOutputBlock(s_type, attributes=attributes, source_position=source_position))
 
     @classmethod
     def create_ast_parameter(cls, name, data_type, source_position):
         # type: (str,ASTDataType,ASTSourceLocation) -> ASTParameter
-        return ASTParameter(name=name, data_type=data_type, source_position=source_position)
+        return cls._link_children(ASTParameter(name=name, data_type=data_type, source_position=source_position))
 
     @classmethod
     def create_ast_return_stmt(cls, expression=None, source_position=None):
         # type: (ASTSimpleExpression|ASTExpression,ASTSourceLocation) -> ASTReturnStmt
-        return ASTReturnStmt(expression, source_position=source_position)
+        return cls._link_children(ASTReturnStmt(expression, source_position=source_position))
 
     @classmethod
     def create_ast_simple_expression(cls, function_call=None,  # type: Union(ASTFunctionCall,None)
@@ -317,8 +327,8 @@ class ASTNodeFactory:
                                      string=None,  # type: Union(str,None)
                                      source_position=None  # type: ASTSourceLocation
                                      ):  # type: (...) -> ASTSimpleExpression
-        return ASTSimpleExpression(function_call, boolean_literal, numeric_literal, is_inf, variable, string,
-                                   source_position=source_position)
+        return cls._link_children(ASTSimpleExpression(function_call, boolean_literal, numeric_literal, is_inf, variable, string,
+                                                      source_position=source_position))
 
     @classmethod
     def create_ast_small_stmt(cls,
@@ -328,13 +338,13 @@ class ASTNodeFactory:
                               return_stmt=None,  # type: ASTReturnStmt
                               source_position=None  # type: ASTSourceLocation
                               ):  # type: (...) -> ASTSmallStmt
-        return ASTSmallStmt(assignment, function_call, declaration, return_stmt, source_position=source_position)
+        return cls._link_children(ASTSmallStmt(assignment, function_call, declaration, return_stmt, source_position=source_position))
 
     @classmethod
     def create_ast_unary_operator(cls, is_unary_plus=False, is_unary_minus=False, is_unary_tilde=False,
                                   source_position=None):
         # type: (bool,bool,bool,ASTSourceLocation) -> ASTUnaryOperator
-        return ASTUnaryOperator(is_unary_plus, is_unary_minus, is_unary_tilde, source_position=source_position)
+        return cls._link_children(ASTUnaryOperator(is_unary_plus, is_unary_minus, is_unary_tilde, source_position=source_position))
 
     @classmethod
     def create_ast_unit_type(cls,
@@ -350,13 +360,13 @@ class ASTNodeFactory:
                              unit=None,  # type: str
                              source_position=None  # type: ASTSourceLocation
                              ):  # type: (...) -> ASTUnitType
-        return ASTUnitType(is_encapsulated, compound_unit, base, is_pow, exponent, lhs, rhs, is_div,
-                           is_times, unit, source_position=source_position)
+        return cls._link_children(ASTUnitType(is_encapsulated, compound_unit, base, is_pow, exponent, lhs, rhs, is_div,
+                                              is_times, unit, source_position=source_position))
 
     @classmethod
     def create_ast_update_block(cls, block, source_position):
         # type: (ASTStmtsBody,ASTSourceLocation) -> ASTUpdateBlock
-        return ASTUpdateBlock(block, source_position=source_position)
+        return cls._link_children(ASTUpdateBlock(block, source_position=source_position))
 
     @classmethod
     def create_ast_variable(cls, name: str, differential_order: int = 0, vector_parameter=None, is_homogeneous=False, source_position: Optional[ASTSourceLocation] = None, scope: Optional[Scope] = None) -> ASTVariable:
@@ -364,7 +374,7 @@ class ASTNodeFactory:
         if scope:
             var.scope = scope
 
-        return var
+        return cls._link_children(var)
 
     @classmethod
     def create_ast_while_stmt(cls,
@@ -372,9 +382,9 @@ class ASTNodeFactory:
                               block,  # type: ASTStmtsBody
                               source_position  # type: ASTSourceLocation
                               ):  # type: (...) -> ASTWhileStmt
-        return ASTWhileStmt(condition, block, source_position=source_position)
+        return cls._link_children(ASTWhileStmt(condition, block, source_position=source_position))
 
     @classmethod
     def create_ast_stmt(cls, small_stmt=None, compound_stmt=None, source_position=None):
         # type: (ASTSmallStmt,ASTCompoundStmt,ASTSourceLocation) -> ASTStmt
-        return ASTStmt(small_stmt, compound_stmt, source_position=source_position)
+        return cls._link_children(ASTStmt(small_stmt, compound_stmt, source_position=source_position))
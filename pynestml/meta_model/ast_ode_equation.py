@@ -42,6 +42,8 @@ class ASTOdeEquation(ASTNode):
         rhs = None
     """
 
+    __slots__ = ("lhs", "rhs", "decorators")
+
     def __init__(self, lhs, rhs, decorators=None, *args, **kwargs):
         """
         Standard constructor.
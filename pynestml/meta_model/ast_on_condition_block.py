@@ -33,6 +33,8 @@ class ASTOnConditionBlock(ASTNode):
     This class is used to store a declaration of an onCondition block
     """
 
+    __slots__ = ("stmts_body", "cond_expr", "const_parameters")
+
     def __init__(self, stmts_body: ASTStmtsBody, cond_expr: ASTExpression, const_parameters: Optional[Mapping] = None, *args, **kwargs):
         r"""
         Standard constructor.
@@ -40,6 +40,8 @@ class ASTOutputBlock(ASTNode):
         type = None
     """
 
+    __slots__ = ("type", "attributes")
+
     def __init__(self, o_type, attributes: Optional[List[ASTParameter]], *args, **kwargs):
         """
         Standard constructor.
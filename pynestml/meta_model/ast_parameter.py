@@ -36,6 +36,8 @@ class ASTParameter(ASTNode):
         data_type (ASTDataType): The data type of the parameter.
     """
 
+    __slots__ = ("data_type", "name")
+
     def __init__(self, name: str, data_type: ASTDataType, *args, **kwargs):
         """
         Standard constructor.
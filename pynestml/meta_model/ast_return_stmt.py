@@ -36,6 +36,8 @@ class ASTReturnStmt(ASTNode):
           expression (ASTSimpleExpression or ASTExpression): An rhs representing the returned value.
     """
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression=None, *args, **kwargs):
         """
         Standard constructor.
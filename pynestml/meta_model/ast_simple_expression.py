@@ -50,6 +50,8 @@ class ASTSimpleExpression(ASTExpressionNode):
 
     """
 
+    __slots__ = ("function_call", "is_boolean_true", "is_boolean_false", "numeric_literal", "is_inf_literal", "variable", "string", "has_delay")
+
     def __init__(self, function_call: ASTFunctionCall = None, boolean_literal: bool = None,
                  numeric_literal: Union[int, float] = None, is_inf: bool = False,
                  variable: ASTVariable = None, string: str = None, has_delay: bool = False, *args, **kwargs):
@@ -193,6 +195,7 @@ class ASTSimpleExpression(ASTExpressionNode):
         :type numeric_literal: int or float
         """
         self.numeric_literal = numeric_literal
+        self.invalidate_type()
 
     def is_variable(self):
         """
@@ -295,6 +298,9 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (variable is None or isinstance(variable, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of variable provided (%s)!' % type(variable)
         self.variable = variable
+        if variable is not None:
+            variable.parent_ = self
+        self.invalidate_type()
 
     def set_function_call(self, function_call):
         """
@@ -305,6 +311,9 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (function_call is None or isinstance(function_call, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of function call provided (%s)!' % type(function_call)
         self.function_call = function_call
+        if function_call is not None:
+            function_call.parent_ = self
+        self.invalidate_type()
 
     def equals(self, other: ASTNode) -> bool:
         r"""
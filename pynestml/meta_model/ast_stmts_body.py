@@ -33,6 +33,8 @@ class ASTStmtsBody(ASTNode):
         stmts = None
     """
 
+    __slots__ = ("stmts",)
+
     def __init__(self, stmts, *args, **kwargs):
         """
         Standard constructor.
@@ -86,6 +88,7 @@ class ASTStmtsBody(ASTNode):
         :type stmt: ASTSmallStmt,ASTCompoundStmt
         """
         self.stmts.append(stmt)
+        stmt.parent_ = self
 
     def delete_stmt(self, stmt):
         """
@@ -30,6 +30,8 @@ class ASTUpdateBlock(ASTNode):
     The ``update`` block in the model.
     """
 
+    __slots__ = ("stmts_body",)
+
     def __init__(self, stmts_body: ASTStmtsBody, *args, **kwargs):
         """
         Standard constructor.
@@ -42,6 +42,10 @@ class ASTVariable(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("name", "differential_order", "type_symbol", "vector_parameter", "is_homogeneous", "delay_parameter",
+                 # only set during code generation, and unset (use ``hasattr()``) otherwise
+                 "_is_numeric", "_is_post_port")
+
     def __init__(self, name, differential_order=0, type_symbol: Optional[str] = None,
                  vector_parameter: Optional[str] = None, is_homogeneous: bool = False, delay_parameter: Optional[str] = None, *args, **kwargs):
         r"""
@@ -103,6 +107,7 @@ class ASTVariable(ASTNode):
         :name: the name to set.
         """
         self.name = name
+        self.__invalidate_type()
 
     def get_is_homogeneous(self) -> bool:
         return self.is_homogeneous
@@ -119,6 +124,7 @@ class ASTVariable(ASTNode):
         Returns the differential order of the variable.
         """
         self.differential_order = differential_order
+        self.__invalidate_type()
 
     def get_complete_name(self) -> str:
         r"""
@@ -169,6 +175,8 @@ class ASTVariable(ASTNode):
         Updates the vector parameter of the variable
         """
         self.vector_parameter = vector_parameter
+        if isinstance(vector_parameter, ASTNode):
+            vector_parameter.parent_ = self
 
     def get_delay_parameter(self):
         r"""
@@ -185,6 +193,14 @@ class ASTVariable(ASTNode):
         assert (delay is not None), '(PyNestML.AST.Variable) No delay parameter provided'
         self.delay_parameter = delay
 
+    def __invalidate_type(self) -> None:
+        """
+        Discards the type of the expression that contains this variable, as it depends on the name and differential order of the variable.
+        """
+        from pynestml.meta_model.ast_expression_node import ASTExpressionNode
+        if isinstance(self.parent_, ASTExpressionNode):
+            self.parent_.invalidate_type()
+
     def is_unit_variable(self) -> bool:
         r"""
         Provided on-the-fly information whether this variable represents a unit-variable, e.g., nS.
@@ -36,6 +36,8 @@ class ASTWhileStmt(ASTNode):
         block = None
     """
 
+    __slots__ = ("stmts_body", "condition")
+
     def __init__(self, condition: ASTExpression, stmts_body: ASTStmtsBody, *args, **kwargs):
         """
         Standard constructor.
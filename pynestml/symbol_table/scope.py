@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from enum import Enum
 
@@ -52,6 +52,10 @@ class Scope:
         declared_elements Elements declared in this scope, i.e., scopes and symbols. Type: list(Scope,Symbol)
         scope_type The type of this scope. Type: ScopeType
         source_position The position in the source file this scope spans over.
+
+    For fast resolution, the symbols declared in this scope are additionally indexed by name and kind, and each scope keeps count of the symbols of each name and kind that are declared in the tree of scopes it spans (i.e., in itself and its sub-scopes, recursively). The indices are kept up to date by ``add_symbol()``, ``delete_symbol()``, ``update_variable_symbol()``, ``add_scope()`` and ``delete_scope()``; ``declared_elements`` should not be modified directly.
+
+    A scope can start out with the symbols of another scope (see ``share_symbols()``) without copying the index: the index entries are shared, and an entry is only copied when a symbol of that name and kind is added to or deleted from this scope.
     """
 
     def __init__(self, scope_type: ScopeType, enclosing_scope: Scope = None, source_position: ASTSourceLocation = None):
@@ -65,6 +69,11 @@ class Scope:
         self.scope_type = scope_type
         self.enclosing_scope = enclosing_scope
         self.source_location = source_position
+        self._scopes: List[Scope] = []
+        self._symbols_by_key: Dict[Tuple[str, SymbolKind], List[Symbol]] = {}
+        self._shared_symbols_by_key: Optional[Dict[Tuple[str, SymbolKind], List[Symbol]]] = None
+        self._n_symbols_in_spanned_scope: Dict[Tuple[str, SymbolKind], int] = {}
+        self._spanning_scope: Optional[Scope] = None
 
     def add_symbol(self, symbol: Symbol) -> None:
         r"""
@@ -73,13 +82,38 @@ class Scope:
         """
         self.delete_symbol(symbol)
         self.declared_elements.append(symbol)
+        key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        self.__get_symbols_for_update(key).append(symbol)
+        self.__update_n_symbols_in_spanned_scope({key: 1})
+
+    def share_symbols(self, scope: Scope) -> None:
+        r"""
+        Adds all symbols of the handed over scope to this scope, which should be empty. The symbols are not copied, and the index of the handed over scope is shared until symbols of the same name and kind are added to or deleted from this scope; the handed over scope itself should not be changed afterwards.
+        :param scope: a scope without sub-scopes, for instance the scope of predefined symbols (see ``SymbolTable.get_predefined_scope()``).
+        """
+        assert not self.declared_elements and not scope.get_scopes()
+        self.declared_elements = list(scope.declared_elements)
+        self._symbols_by_key = dict(scope._symbols_by_key)
+        self._shared_symbols_by_key = scope._symbols_by_key
+        self.__update_n_symbols_in_spanned_scope(scope._n_symbols_in_spanned_scope)
+
+    def __get_symbols_for_update(self, key: Tuple[str, SymbolKind]) -> List[Symbol]:
+        r"""
+        Private method: returns the list of symbols of this scope with the handed over name and kind, for adding or deleting symbols; a list that is shared with another scope is copied first.
+        """
+        symbols = self._symbols_by_key.get(key)
+        if symbols is None:
+            symbols = self._symbols_by_key[key] = []
+        elif self._shared_symbols_by_key is not None and symbols is self._shared_symbols_by_key.get(key):
+            symbols = self._symbols_by_key[key] = list(symbols)
+
+        return symbols
 
     def update_variable_symbol(self, _symbol: Symbol) -> None:
-        for symbol in self.get_symbols_in_this_scope():
-            if (symbol.get_symbol_kind() == SymbolKind.VARIABLE and symbol.get_symbol_name() == _symbol.get_symbol_name()):
-                self.declared_elements.remove(symbol)
-                self.add_symbol(_symbol)
-                break
+        symbols = self._symbols_by_key.get((_symbol.get_symbol_name(), SymbolKind.VARIABLE))
+        if symbols:
+            self.delete_symbol(symbols[0])
+            self.add_symbol(_symbol)
 
     def add_scope(self, scope: Scope) -> None:
         r"""
@@ -87,6 +121,9 @@ class Scope:
         :param scope: a single scope object.
         """
         self.declared_elements.append(scope)
+        self._scopes.append(scope)
+        scope._spanning_scope = self
+        self.__update_n_symbols_in_spanned_scope(scope._n_symbols_in_spanned_scope)
 
     def delete_symbol(self, symbol: Symbol) -> bool:
         r"""
@@ -95,8 +132,16 @@ class Scope:
         :type symbol: Symbol
         :return: True, if the element has been deleted, otherwise False.
         """
-        if symbol in self.declared_elements:
+        key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        symbols = self._symbols_by_key.get(key)
+        if symbols and symbol in symbols:
+            symbols = self.__get_symbols_for_update(key)
+            symbols.remove(symbol)
+            if not symbols:
+                del self._symbols_by_key[key]
+
             self.declared_elements.remove(symbol)
+            self.__update_n_symbols_in_spanned_scope({key: -1})
             return True
 
         return False
@@ -107,12 +152,31 @@ class Scope:
         :param scope: a single scope object.
         :return: True, if the element has been deleted, otherwise False.
         """
-        if scope in self.declared_elements:
+        if scope in self._scopes:
             self.declared_elements.remove(scope)
+            self._scopes.remove(scope)
+            scope._spanning_scope = None
+            self.__update_n_symbols_in_spanned_scope({key: -n for key, n in scope._n_symbols_in_spanned_scope.items()})
             return True
 
         return False
 
+    def __update_n_symbols_in_spanned_scope(self, delta: Dict[Tuple[str, SymbolKind], int]) -> None:
+        r"""
+        Private method: add the handed over numbers of symbols to the counts of this scope and of all scopes spanning it.
+        :param delta: the change in the number of symbols for each name and kind.
+        """
+        scope = self
+        while scope is not None:
+            for key, n in delta.items():
+                n_total = scope._n_symbols_in_spanned_scope.get(key, 0) + n
+                if n_total:
+                    scope._n_symbols_in_spanned_scope[key] = n_total
+                else:
+                    scope._n_symbols_in_spanned_scope.pop(key, None)
+
+            scope = scope._spanning_scope
+
     def get_symbols_in_this_scope(self) -> List[Symbol]:
         r"""
         Returns the set of elements as defined in this scope, but not in the corresponding super scope.
@@ -141,11 +205,7 @@ class Scope:
         :return: a list of scope objects
         :rtype: list
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Scope):
-                ret.append(elem)
-        return ret
+        return list(self._scopes)
 
     def resolve_to_all_scopes(self, name: str, kind: SymbolKind) -> Optional[Scope]:
         r"""
@@ -174,9 +234,11 @@ class Scope:
         :return: the corresponding scope object.
         """
         ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(self)
+        if not self._n_symbols_in_spanned_scope.get((name, kind)):
+            return ret
+
+        for _ in self._symbols_by_key.get((name, kind), []):
+            ret.append(self)
         for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
             temp = elem.__resolve_to_scope_in_spanned_scope(name, kind)
             if temp is not None:
@@ -213,9 +275,10 @@ class Scope:
         :return: the corresponding symbol object.
         """
         ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(sim)
+        if not self._n_symbols_in_spanned_scope.get((name, kind)):
+            return ret
+
+        ret.extend(self._symbols_by_key.get((name, kind), []))
 
         for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
             temp = elem.__resolve_to_symbol_in_spanned_scope(name, kind)
@@ -232,9 +295,8 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching scope.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return self
+        if (name, kind) in self._symbols_by_key:
+            return self
 
         if self.has_enclosing_scope():
             return self.get_enclosing_scope().resolve_to_scope(name, kind)
@@ -249,9 +311,9 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching symbol.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return sim
+        symbols = self._symbols_by_key.get((name, kind))
+        if symbols:
+            return symbols[0]
 
         if self.has_enclosing_scope():
             return self.get_enclosing_scope().resolve_to_symbol(name, kind)
@@ -35,6 +35,10 @@ class SymbolTable:
     name2model_scope = {}   # type: Mapping[str, Scope]
     source_location = None
 
+    # the scope returned by ``get_predefined_scope()``, and the dicts of predefined variables, functions and types it was created from
+    _predefined_scope = None
+    _predefined_scope_origin = None
+
     @classmethod
     def initialize_symbol_table(cls, source_position):
         """
@@ -79,6 +83,34 @@ class SymbolTable:
         del cls.name2model_scope
         cls.name2model_scope = {}
 
+    @classmethod
+    def get_predefined_scope(cls) -> Scope:
+        """
+        Returns a scope that contains all predefined variables, functions and types. The scope is shared by the global scopes of all models (see ``Scope.share_symbols()``), and is only created anew if predefined symbols were registered since it was last created.
+        :return: the scope of predefined symbols
+        """
+        from pynestml.symbols.predefined_functions import PredefinedFunctions
+        from pynestml.symbols.predefined_types import PredefinedTypes
+        from pynestml.symbols.predefined_variables import PredefinedVariables
+
+        variables = PredefinedVariables.get_variables()
+        functions = PredefinedFunctions.get_function_symbols()
+        types = PredefinedTypes.get_types()
+        origin = [(variables, len(variables)), (functions, len(functions)), (types, len(types))]
+        if cls._predefined_scope is None or any(a is not b or n_a != n_b for (a, n_a), (b, n_b) in zip(origin, cls._predefined_scope_origin)):
+            scope = Scope(scope_type=ScopeType.GLOBAL)
+            for symbol in variables.keys():
+                scope.add_symbol(variables[symbol])
+            for symbol in functions.keys():
+                scope.add_symbol(functions[symbol])
+            for symbol in types.keys():
+                scope.add_symbol(types[symbol])
+
+            cls._predefined_scope = scope
+            cls._predefined_scope_origin = origin
+
+        return cls._predefined_scope
+
     @classmethod
     def print_symbol_table(cls) -> str:
         """
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Mapping
+from typing import Hashable, Mapping
 
 from astropy.units.core import CompositeUnit
 from astropy.units.quantity import Quantity
@@ -44,8 +44,11 @@ class PredefinedTypes:
         BOOLEAN_TYPE  The identifier of the type 'boolean'. Type: str
         STRING_TYPE   The identifier of the type 'string'. Type: str
         INTEGER_TYPE  The identifier of the type 'integer'. Type: str
+
+    The type symbols of the units from astropy are registered lazily: a unit type symbol is only created when it is first looked up by means of get_type(name) (or when the complete set of types is requested by means of get_types()).
     """
     name2type = {}   # type: Mapping[str, TypeSymbol]
+    unit_key2name = {}   # type: Mapping[Hashable, str]
     REAL_TYPE = 'real'
     VOID_TYPE = 'void'
     BOOLEAN_TYPE = 'boolean'
@@ -59,7 +62,6 @@ class PredefinedTypes:
         valid and can be used.
         """
         cls.name2type = TypeDictionary()
-        cls.__register_units()
         cls.__register_real()
         cls.__register_void()
         cls.__register_boolean()
@@ -70,15 +72,34 @@ class PredefinedTypes:
     @classmethod
     def __register_units(cls):
         """
-        Adds all units as predefined type symbols to the list of available types.
+        Adds all units that have not been looked up yet as predefined type symbols to the list of available types.
         """
-        from pynestml.symbols.predefined_units import PredefinedUnits
-        from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+        unit_names = PredefinedUnits.get_astropy_unit_names()
+        if unit_names <= cls.name2type.keys():
+            return
+
+        # keep the unit types first, in their original order, followed by all other types
         units = PredefinedUnits.get_units()
-        for unitName in units.keys():
-            type_symbol = UnitTypeSymbol(unit=units[unitName])
-            cls.name2type[unitName] = type_symbol
-        return
+        name2type = TypeDictionary()
+        for unit_name in unit_names:
+            if unit_name in cls.name2type.keys():
+                name2type[unit_name] = cls.name2type.get(unit_name)
+            else:
+                name2type[unit_name] = UnitTypeSymbol(unit=units[unit_name])
+
+        for name, symbol in cls.name2type.items():
+            if name not in name2type.keys():
+                name2type[name] = symbol
+
+        cls.name2type = name2type
+
+    @classmethod
+    def __resolve_unit_type(cls, name: str) -> None:
+        """
+        Adds the type symbol for the unit of the given name, if it is a predefined unit that has not been looked up yet.
+        """
+        if name not in cls.name2type.keys() and name in PredefinedUnits.get_astropy_unit_names():
+            cls.name2type[name] = UnitTypeSymbol(unit=PredefinedUnits.get_unit(name))
 
     @classmethod
     def __register_real(cls):
@@ -137,6 +158,7 @@ class PredefinedTypes:
         :return: a copy of a list of all predefined types.
         :rtype: copy(list(TypeSymbol)
         """
+        cls.__register_units()
         return cls.name2type
 
     @classmethod
@@ -167,11 +189,19 @@ class PredefinedTypes:
         if isinstance(name, CompositeUnit) and len(name.bases) == 0:
             return cls.get_real_type()
         if isinstance(name, CompositeUnit):
-            cls.register_unit(name)
-            return cls.get_type(str(name))
+            # formatting and registering the unit is expensive, but only needs to be done once per unit
+            unit_key = UnitTypeSymbol.get_unit_key(name)
+            if unit_key not in cls.unit_key2name.keys():
+                cls.unit_key2name[unit_key] = str(name)
+            unit_name = cls.unit_key2name[unit_key]
+            if unit_name not in cls.name2type.keys() or unit_name not in PredefinedUnits.name2unit.keys():
+                cls.register_unit(name)
+            return cls.get_type(unit_name)
         if isinstance(name, Quantity):
             cls.register_unit(name.unit)
             return cls.get_type(str(name.unit))
+        if isinstance(name, str):
+            cls.__resolve_unit_type(name)
         if name in cls.name2type:
             return cls.name2type[name]
         else:
@@ -247,6 +277,8 @@ class PredefinedTypes:
         :param: a single type symbol.
         :type: UnitTypeSymbol
         """
+        if not symbol.is_primitive():
+            cls.__resolve_unit_type(symbol.unit.get_name())
         if not symbol.is_primitive() and symbol.unit.get_name() not in cls.name2type.keys():
             cls.name2type[symbol.unit.get_name()] = symbol
 
@@ -19,9 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Mapping, Sequence
-
-from astropy import units as u
+from typing import Any, Collection, Mapping, Optional
 
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
@@ -31,29 +29,71 @@ from pynestml.utils.unit_type import UnitType
 class PredefinedUnits:
     """
     This class represents a collection of physical units. Units can be retrieved by means of get_unit(name).
+
+    The units from astropy are registered lazily: a unit is only wrapped into a UnitType when it is first looked up (or when the complete set of units is requested by means of get_units()).
+
     Attribute:
-        name2unit (dict):  Dict of all predefined units, map from name to unit object.
+        name2unit (dict):  Dict of all registered units, map from name to unit object.
     """
     name2unit = {}   # type: Mapping[str, UnitType]
 
+    # all units in astropy.units by name; collected once per process, see __get_astropy_units()
+    __astropy_units = None   # type: Optional[Mapping[str, Any]]
+
     @classmethod
     def register_units(cls):
         """
         Registers all units in astropy.units (more specifically, from the si, cgs and astrophys submodules) as predefined units into NESTML.
         """
-        # first store all base units and the derived units without the prefix in a list
         cls.name2unit = {}
 
-        for unit_str in dir(u.si) + dir(u.cgs) + dir(u.astrophys):
-            try:
-                unit = eval("u." + unit_str)    # grab the unit object
-            except BaseException:
-                unit = None
+    @classmethod
+    def __get_astropy_units(cls) -> Mapping[str, Any]:
+        """
+        Returns all units in astropy.units (more specifically, from the si, cgs and astrophys submodules), mapped from each of their names to the unit object.
+        """
+        if cls.__astropy_units is None:
+            from astropy import units as u
+
+            astropy_units = {}
+            for unit_str in dir(u.si) + dir(u.cgs) + dir(u.astrophys):
+                try:
+                    unit = getattr(u, unit_str)    # grab the unit object
+                except Exception:
+                    unit = None
 
-            if issubclass(type(unit), u.core.UnitBase):
-                for unit_name in unit.names:
-                    temp_unit = UnitType(name=str(unit_name), unit=unit)
-                    cls.name2unit[str(unit_name)] = temp_unit
+                if issubclass(type(unit), u.core.UnitBase):
+                    for unit_name in unit.names:
+                        astropy_units[str(unit_name)] = unit
+
+            cls.__astropy_units = astropy_units
+
+        return cls.__astropy_units
+
+    @classmethod
+    def get_astropy_unit_names(cls) -> Collection[str]:
+        """
+        Returns the names of all units in astropy.units (more specifically, from the si, cgs and astrophys submodules), irrespective of whether they have been registered yet.
+        :return: a collection of unit names.
+        """
+        return cls.__get_astropy_units().keys()
+
+    @classmethod
+    def __resolve_unit(cls, name: str) -> Optional[UnitType]:
+        """
+        Returns the registered unit of the given name; if there is none, but astropy defines a unit with this name, it is registered first.
+        """
+        if name in cls.name2unit.keys():
+            return cls.name2unit[name]
+
+        unit = cls.__get_astropy_units().get(name)
+        if unit is None:
+            return None
+
+        unit_type = UnitType(name=name, unit=unit)
+        cls.name2unit[name] = unit_type
+
+        return unit_type
 
     @classmethod
     def get_unit(cls, name: str) -> UnitType:
@@ -62,12 +102,12 @@ class PredefinedUnits:
         :param name: the name of a unit
         :return: a single UnitType object, or None
         """
-        if name in cls.name2unit.keys():
-            return cls.name2unit[name]
-        else:
+        unit_type = cls.__resolve_unit(name)
+        if unit_type is None:
             code, message = Messages.get_unit_does_not_exist(name)
             Logger.log_message(code=code, message=message, log_level=LoggingLevel.ERROR)
-            return None
+
+        return unit_type
 
     @classmethod
     def is_unit(cls, name: str) -> bool:
@@ -76,7 +116,7 @@ class PredefinedUnits:
         :param name: a single name
         :return: True if unit name, otherwise False.
         """
-        return name in cls.name2unit.keys()
+        return name in cls.name2unit.keys() or name in cls.__get_astropy_units().keys()
 
     @classmethod
     def register_unit(cls, unit: UnitType) -> None:
@@ -88,9 +128,22 @@ class PredefinedUnits:
             cls.name2unit[unit.get_name()] = unit
 
     @classmethod
-    def get_units(cls) -> Sequence[UnitType]:
+    def get_units(cls) -> Mapping[str, UnitType]:
         """
-        Returns the list of all currently defined units.
-        :return: a list of all defined units.
+        Returns all currently defined units. All units from astropy that have not been looked up yet are registered first.
+        :return: a dict of all defined units.
         """
+        astropy_units = cls.__get_astropy_units()
+        if not astropy_units.keys() <= cls.name2unit.keys():
+            # keep the astropy units first, in their original order, followed by all other registered units
+            name2unit = {}
+            for name, unit in astropy_units.items():
+                name2unit[name] = cls.name2unit[name] if name in cls.name2unit.keys() else UnitType(name=name, unit=unit)
+
+            for name, unit_type in cls.name2unit.items():
+                if name not in name2unit.keys():
+                    name2unit[name] = unit_type
+
+            cls.name2unit = name2unit
+
         return cls.name2unit
@@ -228,9 +228,9 @@ class TypeSymbol(Symbol):
         return result
 
     def warn_implicit_cast_from_to(self, _from, _to):
-        from pynestml.utils.messages import Messages
-        code, message = Messages.get_implicit_cast_rhs_to_lhs(_to.print_symbol(), _from.print_symbol())
-        Logger.log_message(code=code, message=message,
+        from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
+        message = DeferredMessage(Messages.get_implicit_cast_rhs_to_lhs, _to, _from)
+        Logger.log_message(code=MessageCode.IMPLICIT_CAST, message=message,
                            error_position=self.get_referenced_object().get_source_position(),
                            log_level=LoggingLevel.WARNING)
         return _to
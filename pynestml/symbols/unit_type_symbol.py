@@ -19,14 +19,23 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
 from pynestml.symbols.type_symbol import TypeSymbol
 from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
 from pynestml.utils.unit_type import UnitType
 
 
 class UnitTypeSymbol(TypeSymbol):
+    r"""
+    Type symbol of a physical unit.
+
+    Arithmetic on astropy units is comparatively expensive, and the same few units are combined over and over while expressions are type checked and printed. The results of the unit algebra (products, quotients, powers and conversion factors) are therefore memoized on the canonical keys of the operands (see ``get_unit_key()``).
+    """
+
+    # (operator, keys of the operands) -> result
+    _unit_algebra_cache: Dict[Tuple, Any] = {}
 
     @property
     def astropy_unit(self):
@@ -65,7 +74,7 @@ class UnitTypeSymbol(TypeSymbol):
 
     def multiply_by(self, other):
         from pynestml.symbols.predefined_types import PredefinedTypes
-        return PredefinedTypes.get_type(self.astropy_unit * other.astropy_unit)
+        return PredefinedTypes.get_type(self._apply_unit_algebra("*", lambda lhs, rhs: lhs * rhs, self.astropy_unit, other.astropy_unit))
 
     def __truediv__(self, other):
         from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
@@ -82,7 +91,7 @@ class UnitTypeSymbol(TypeSymbol):
 
     def divide_by(self, other):
         from pynestml.symbols.predefined_types import PredefinedTypes
-        return PredefinedTypes.get_type(self.astropy_unit / other.astropy_unit)
+        return PredefinedTypes.get_type(self._apply_unit_algebra("/", lambda lhs, rhs: lhs / rhs, self.astropy_unit, other.astropy_unit))
 
     def __neg__(self):
         return self
@@ -104,7 +113,7 @@ class UnitTypeSymbol(TypeSymbol):
 
     def to_the_power_of(self, power):
         from pynestml.symbols.predefined_types import PredefinedTypes
-        return PredefinedTypes.get_type(self.astropy_unit ** power)
+        return PredefinedTypes.get_type(self._apply_unit_algebra("**", lambda lhs, rhs: lhs ** rhs, self.astropy_unit, power))
 
     def __add__(self, other):
         from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
@@ -139,8 +148,8 @@ class UnitTypeSymbol(TypeSymbol):
         if self.differs_only_in_magnitude(other):
             factor = UnitTypeSymbol.get_conversion_factor(other.astropy_unit, self.astropy_unit)
             other.referenced_object.set_implicit_conversion_factor(factor)
-            code, message = Messages.get_implicit_magnitude_conversion(self, other, factor)
-            Logger.log_message(code=code, message=message,
+            message = DeferredMessage(Messages.get_implicit_magnitude_conversion, self, other, factor)
+            Logger.log_message(code=MessageCode.IMPLICIT_CAST, message=message,
                                error_position=self.referenced_object.get_source_position(),
                                log_level=LoggingLevel.INFO)
 
@@ -153,6 +162,10 @@ class UnitTypeSymbol(TypeSymbol):
         """
         Calculates the conversion factor from _convertee_unit to target_unit. Behaviour is only well-defined if both units have the same physical base type.
         """
+        return cls._apply_unit_algebra("conversion_factor", cls.__compute_conversion_factor, _from, to)
+
+    @classmethod
+    def __compute_conversion_factor(cls, _from, to) -> Optional[float]:
         try:
             factor = (_from / to).si.scale
         except BaseException:
@@ -161,6 +174,40 @@ class UnitTypeSymbol(TypeSymbol):
 
         return factor
 
+    @classmethod
+    def get_unit_key(cls, unit) -> Hashable:
+        """
+        Returns a canonical, hashable key of an astropy unit or quantity: units with the same key have the same scale, bases and powers, and thus behave identically in all unit algebra.
+        :param unit: an astropy unit or quantity, or a number (e.g. an exponent)
+        :return: the key
+        """
+        from astropy.units.core import UnitBase
+        from astropy.units.quantity import Quantity
+
+        if isinstance(unit, Quantity):
+            return "quantity", float(unit.value), cls.get_unit_key(unit.unit)
+
+        if isinstance(unit, UnitBase):
+            return "unit", unit.scale, tuple(base.name for base in unit.bases), tuple(unit.powers)
+
+        return unit
+
+    @classmethod
+    def _apply_unit_algebra(cls, operator: str, operation: Callable[[Any, Any], Any], lhs, rhs):
+        """
+        Returns ``operation(lhs, rhs)``, which is only computed the first time it is requested for operands with the same keys.
+        """
+        key = (operator, cls.get_unit_key(lhs), cls.get_unit_key(rhs))
+        try:
+            return cls._unit_algebra_cache[key]
+        except KeyError:
+            pass
+
+        result = operation(lhs, rhs)
+        cls._unit_algebra_cache[key] = result
+
+        return result
+
     def is_castable_to(self, _other_type):
         if super(UnitTypeSymbol, self).is_castable_to(_other_type):
             return True
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+#
+# common_subexpression_elimination_transformer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+import sympy
+import sympy.parsing.sympy_parser
+from sympy.core.function import AppliedUndef
+
+from pynestml.meta_model.ast_model import ASTModel
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.transformers.transformer import Transformer
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+
+
+class CommonSubexpressionEliminationTransformer(Transformer):
+    r"""Perform common-subexpression elimination (CSE) on the propagators and update expressions of the analytic solver that ODE-toolbox returned for a model.
+
+    Sub-expressions that occur more than once are replaced by temporary variables. Temporary variables, as well as sub-expressions of the update expressions, that only depend on parameters, internals, propagators and the timestep ``__h`` are moved into the propagators (which are added to the internals block by the code generator), so that they are computed only once when the internals are recomputed, instead of during every timestep. Sub-expressions that depend on state variables or input ports are left in the update expressions.
+
+    The solver is given in the ``analytic_solver`` option and is modified in place. The transformer should be applied after ODE-toolbox analysis, and before the propagators are added to the internals block of the model. The model itself is not changed; it is only used to look up the symbols in the expressions.
+
+    Options:
+
+    - **analytic_solver**: The analytic solver dictionary as returned by ODE-toolbox.
+    - **temporary_variable_prefix**: The prefix for the names of the temporary variables. The variables are numbered, for instance ``__cse_0``, ``__cse_1``, etc.
+    """
+
+    _default_options = {
+        "analytic_solver": None,
+        "temporary_variable_prefix": "__cse_"
+    }
+
+    # functions that always return the same value for the same arguments; calls to other functions (e.g. ``random_normal()``) are never moved
+    _pure_function_names = {PredefinedFunctions.TIME_RESOLUTION, PredefinedFunctions.EXP, PredefinedFunctions.LN, PredefinedFunctions.LOG10,
+                            PredefinedFunctions.COS, PredefinedFunctions.SIN, PredefinedFunctions.TAN, PredefinedFunctions.COSH,
+                            PredefinedFunctions.SINH, PredefinedFunctions.TANH, PredefinedFunctions.ERF, PredefinedFunctions.ERFC,
+                            PredefinedFunctions.EXPM1, PredefinedFunctions.CLIP, PredefinedFunctions.POW, PredefinedFunctions.MAX,
+                            PredefinedFunctions.MIN, PredefinedFunctions.ABS, PredefinedFunctions.CEIL, PredefinedFunctions.FLOOR,
+                            PredefinedFunctions.ROUND, "log", "sqrt", "Piecewise"}
+
+    def __init__(self, options: Optional[Mapping[str, Any]] = None):
+        super(Transformer, self).__init__(options)
+
+    def transform(self, models: Union[ASTNode, Sequence[ASTNode]]) -> Union[ASTNode, Sequence[ASTNode]]:
+        single = False
+        if isinstance(models, ASTNode):
+            single = True
+            models = [models]
+
+        for model in models:
+            self.transform_analytic_solver(model, self.get_option("analytic_solver"))
+
+        if single:
+            return models[0]
+
+        return models
+
+    def transform_analytic_solver(self, model: ASTModel, analytic_solver: Optional[Dict[str, Any]]) -> None:
+        r"""
+        Perform CSE on the propagators and update expressions in ``analytic_solver`` (in place).
+        :param model: the model that the solver belongs to
+        :param analytic_solver: the analytic solver dictionary as returned by ODE-toolbox
+        """
+        if not analytic_solver or not analytic_solver["propagators"]:
+            return
+
+        propagators = analytic_solver["propagators"]
+        update_expressions = analytic_solver["update_expressions"]
+
+        try:
+            propagator_exprs = [self._parse(expr) for expr in propagators.values()]
+            update_exprs = [self._parse(expr) for expr in update_expressions.values()]
+        except Exception:
+            # not valid sympy syntax; leave the expressions unchanged
+            return
+
+        self._model = model
+        self._invariant_names = {"__h"} | set(propagators.keys())
+        self._temporaries: Dict[sympy.Expr, sympy.Symbol] = {}
+
+        all_exprs = propagator_exprs + update_exprs
+        self._used_names = set(str(sym) for expr in all_exprs for sym in expr.free_symbols)
+
+        self._symbols = self._get_temporary_variable_symbols()
+        replacements, reduced_exprs = sympy.cse(all_exprs, symbols=self._symbols)
+
+        # keep the temporary variables that can be computed together with the propagators; substitute the others back into the expressions
+        substitutions = {}
+        for sym, expr in replacements:
+            expr = expr.xreplace(substitutions)
+            if self._is_invariant(expr) and not self._is_trivial(expr):
+                self._invariant_names.add(str(sym))
+                self._temporaries[expr] = sym
+            else:
+                substitutions[sym] = expr
+
+        reduced_exprs = [expr.xreplace(substitutions) for expr in reduced_exprs]
+        propagator_exprs = reduced_exprs[:len(propagator_exprs)]
+        update_exprs = [self._hoist_invariant_subexpressions(expr) for expr in reduced_exprs[len(propagator_exprs):]]
+
+        internals = {str(sym): expr for expr, sym in self._temporaries.items()}
+        internals.update(zip(propagators.keys(), propagator_exprs))
+        sorted_names = self._sort_by_dependencies(internals)
+
+        # number the temporary variables consecutively, in the order in which they are computed
+        symbols = self._get_temporary_variable_symbols()
+        renamings = {sympy.Symbol(name): next(symbols) for name in sorted_names if name not in propagators.keys()}
+
+        analytic_solver["propagators"] = {str(renamings.get(sympy.Symbol(name), name)): ODEToolboxUtils.print_expression(internals[name].xreplace(renamings)) for name in sorted_names}
+        analytic_solver["update_expressions"] = {sym: ODEToolboxUtils.print_expression(expr.xreplace(renamings)) for sym, expr in zip(update_expressions.keys(), update_exprs)}
+
+    @classmethod
+    def _parse(cls, s: str) -> sympy.Expr:
+        return sympy.parsing.sympy_parser.parse_expr(s, global_dict=dict(ODEToolboxUtils._sympy_globals_no_functions))
+
+    def _get_temporary_variable_symbols(self) -> Iterator[sympy.Symbol]:
+        prefix = self.get_option("temporary_variable_prefix")
+        i = 0
+        while True:
+            name = prefix + str(i)
+            i += 1
+            if name in self._used_names or self._model.get_scope().resolve_to_symbol(name, SymbolKind.VARIABLE):
+                continue
+
+            yield sympy.Symbol(name)
+
+    def _is_invariant_symbol(self, name: str) -> bool:
+        if name in self._invariant_names:
+            return True
+
+        symbol = self._model.get_scope().resolve_to_symbol(name, SymbolKind.VARIABLE)
+
+        return symbol is not None and (symbol.is_parameters() or symbol.is_internals()) and not symbol.has_vector_parameter()
+
+    def _is_invariant(self, expr: sympy.Basic) -> bool:
+        r"""Return whether ``expr`` is a (real-valued) expression that can be computed together with the propagators."""
+        if not isinstance(expr, sympy.Expr):
+            # for instance, a condition or a tuple of arguments
+            return False
+
+        return all(self._is_invariant_symbol(str(sym)) for sym in expr.free_symbols) \
+            and all(func.func.__name__ in self._pure_function_names for func in expr.atoms(AppliedUndef))
+
+    @classmethod
+    def _is_trivial(cls, expr: sympy.Basic) -> bool:
+        r"""Return whether ``expr`` is too simple to be worth a temporary variable, for instance ``tau`` or ``-2 * tau``."""
+        if expr.is_Atom:
+            return True
+
+        return expr.is_Mul and len(expr.args) == 2 and expr.args[0].is_Number and expr.args[1].is_Atom
+
+    def _get_temporary(self, expr: sympy.Expr) -> sympy.Expr:
+        if expr.could_extract_minus_sign():
+            # use the same temporary variable for ``expr`` and ``-expr``
+            return -self._get_temporary(-expr)
+
+        if expr not in self._temporaries:
+            sym = next(self._symbols)
+            self._invariant_names.add(str(sym))
+            self._temporaries[expr] = sym
+
+        return self._temporaries[expr]
+
+    def _hoist_invariant_subexpressions(self, expr: sympy.Basic) -> sympy.Basic:
+        r"""Replace the largest sub-expressions of ``expr`` that can be computed together with the propagators by temporary variables."""
+        if self._is_invariant(expr):
+            if self._is_trivial(expr):
+                return expr
+
+            return self._get_temporary(expr)
+
+        if not expr.args:
+            return expr
+
+        if expr.is_Add or expr.is_Mul:
+            # combine the invariant terms or factors
+            invariant_args = [arg for arg in expr.args if self._is_invariant(arg)]
+            variant_args = [self._hoist_invariant_subexpressions(arg) for arg in expr.args if not self._is_invariant(arg)]
+            if len(invariant_args) > 1:
+                invariant_args = [self._hoist_invariant_subexpressions(expr.func(*invariant_args))]
+            else:
+                invariant_args = [self._hoist_invariant_subexpressions(arg) for arg in invariant_args]
+
+            return expr.func(*invariant_args, *variant_args)
+
+        return expr.func(*[self._hoist_invariant_subexpressions(arg) for arg in expr.args])
+
+    @classmethod
+    def _sort_by_dependencies(cls, exprs: Mapping[str, sympy.Expr]) -> List[str]:
+        r"""Return the names in ``exprs`` in an order such that each expression only depends on the names that come before it, keeping the original order where possible."""
+        sorted_names = []
+        remaining_names = list(exprs.keys())
+        while remaining_names:
+            for name in remaining_names:
+                if not any(str(sym) in remaining_names for sym in exprs[name].free_symbols if str(sym) != name):
+                    sorted_names.append(name)
+                    remaining_names.remove(name)
+                    break
+            else:
+                assert False, "Cyclic dependency between propagators"
+
+        return sorted_names
@@ -23,19 +23,19 @@ from __future__ import annotations
 
 from typing import List, Optional, Mapping, Any, Union, Sequence
 
-import re
-
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.transformers.transformer import Transformer
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.string_utils import removesuffix
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
 
 class InlineExpressionExpansionTransformer(Transformer):
@@ -43,9 +43,9 @@ class InlineExpressionExpansionTransformer(Transformer):
     Make inline expressions self contained, i.e. without any references to other inline expressions.
 
     Additionally, replace variable symbols referencing inline expressions in defining expressions of ODEs with the corresponding defining expressions from the inline expressions.
-    """
 
-    _variable_matching_template = r'(\b)({})(\b)'
+    References are replaced directly in the AST, by a clone of the defining expression in parentheses.
+    """
 
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
         super(Transformer, self).__init__(options)
@@ -75,30 +75,15 @@ class InlineExpressionExpansionTransformer(Transformer):
         r"""
         Make inline expressions self contained, i.e. without any references to other inline expressions.
 
+        The inline expressions are expanded in topological order, i.e. each after the inline expressions it references, so that every inline expression is expanded only once: each reference is replaced by a clone of the already expanded defining expression.
+
         :param inline_expressions: A sorted list with entries ASTInlineExpression.
         :return: A list with ASTInlineExpressions. Defining expressions don't depend on each other.
         """
-        from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
-
-        for source in inline_expressions:
-            source_position = source.get_source_position()
-            for target in inline_expressions:
-                matcher = re.compile(self._variable_matching_template.format(source.get_variable_name()))
-                target_definition = str(target.get_expression())
-                target_definition = re.sub(matcher, "(" + str(source.get_expression()) + ")", target_definition)
-                old_parent = target.expression.parent_
-                target.expression = ModelParser.parse_expression(target_definition)
-                target.expression.update_scope(source.get_scope())
-                target.expression.parent_ = old_parent
-                target.expression.accept(ASTParentVisitor())
-                target.expression.accept(ASTSymbolTableVisitor())
-
-                def log_set_source_position(node):
-                    if node.get_source_position().is_added_source_position():
-                        node.set_source_position(source_position)
-
-                target.expression.accept(ASTHigherOrderVisitor(visit_funcs=log_set_source_position))
+        name_to_inline_expression = {inline_expression.get_variable_name(): inline_expression for inline_expression in inline_expressions}
+        for inline_expression in self._sort_topologically(inline_expressions, name_to_inline_expression):
+            inline_expression.expression = self._expand_inline_expressions(inline_expression.get_expression(), name_to_inline_expression)
+            inline_expression.expression.parent_ = inline_expression
 
         return inline_expressions
 
@@ -109,34 +94,95 @@ class InlineExpressionExpansionTransformer(Transformer):
         Replace variable symbols referencing inline expressions in defining expressions of ODEs with the corresponding defining expressions from the inline expressions.
 
         :param definitions: A list of ODE definitions (**updated in-place**).
-        :param inline_expressions: A list of inline expression definitions.
+        :param inline_expressions: A list of self contained inline expression definitions (see ``make_inline_expressions_self_contained()``).
         :return: A list of updated ODE definitions (same as the ``definitions`` parameter).
         """
-        from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
-
-        for m in inline_expressions:
-            if "mechanism" not in [e.namespace for e in m.get_decorators()]:
-                """
-                exclude compartmental mechanism definitions in order to have the
-                inline as a barrier inbetween odes that are meant to be solved independently
-                """
-                source_position = m.get_source_position()
-                for target in definitions:
-                    matcher = re.compile(self._variable_matching_template.format(m.get_variable_name()))
-                    target_definition = str(target.get_rhs())
-                    target_definition = re.sub(matcher, "(" + str(m.get_expression()) + ")", target_definition)
-                    old_parent = target.rhs.parent_
-                    target.rhs = ModelParser.parse_expression(target_definition)
-                    target.update_scope(m.get_scope())
-                    target.rhs.parent_ = old_parent
-                    target.rhs.accept(ASTParentVisitor())
-                    target.accept(ASTSymbolTableVisitor())
-
-                    def log_set_source_position(node):
-                        if node.get_source_position().is_added_source_position():
-                            node.set_source_position(source_position)
-
-                    target.accept(ASTHigherOrderVisitor(visit_funcs=log_set_source_position))
+        # exclude compartmental mechanism definitions in order to have the inline as a barrier inbetween odes that are meant to be solved independently
+        name_to_inline_expression = {inline_expression.get_variable_name(): inline_expression for inline_expression in inline_expressions
+                                     if "mechanism" not in [e.namespace for e in inline_expression.get_decorators()]}
+        if not name_to_inline_expression:
+            return definitions
+
+        for target in definitions:
+            target.rhs = self._expand_inline_expressions(target.get_rhs(), name_to_inline_expression)
+            target.rhs.parent_ = target
 
         return definitions
+
+    @classmethod
+    def _sort_topologically(cls, inline_expressions: Sequence[ASTInlineExpression], name_to_inline_expression: Mapping[str, ASTInlineExpression]) -> List[ASTInlineExpression]:
+        r"""
+        Returns the inline expressions ordered such that each comes after the inline expressions it references. Cyclic references are ignored.
+        """
+        sorted_inline_expressions = []
+        visited = set()
+        for inline_expression in inline_expressions:
+            stack = [(inline_expression, False)]
+            while stack:
+                node, dependencies_done = stack.pop()
+                if dependencies_done:
+                    sorted_inline_expressions.append(node)
+                    continue
+
+                if node.get_variable_name() in visited:
+                    continue
+
+                visited.add(node.get_variable_name())
+                stack.append((node, True))
+                for name in reversed(cls._get_referenced_inline_expression_names(node.get_expression(), name_to_inline_expression)):
+                    if name not in visited:
+                        stack.append((name_to_inline_expression[name], False))
+
+        return sorted_inline_expressions
+
+    @classmethod
+    def _get_referenced_inline_expression_names(cls, expr: Union[ASTExpression, ASTSimpleExpression], name_to_inline_expression: Mapping[str, ASTInlineExpression]) -> List[str]:
+        names = []
+
+        def collect_name(node):
+            if isinstance(node, ASTSimpleExpression) and node.is_variable() and node.get_variable().get_complete_name() in name_to_inline_expression.keys():
+                names.append(node.get_variable().get_complete_name())
+
+        expr.accept(ASTHigherOrderVisitor(visit_funcs=collect_name))
+
+        return names
+
+    @classmethod
+    def _expand_inline_expressions(cls, expr: Union[ASTExpression, ASTSimpleExpression], name_to_inline_expression: Mapping[str, ASTInlineExpression]) -> Union[ASTExpression, ASTSimpleExpression]:
+        r"""
+        Returns a clone of the given expression in which each reference to one of the given inline expressions is replaced by a clone of its defining expression, in parentheses.
+        """
+        expanded_expr = cls._replace_references(expr.clone(), name_to_inline_expression)
+        expanded_expr.update_scope(expr.get_scope())
+        expanded_expr.accept(ASTParentVisitor())
+
+        return expanded_expr
+
+    @classmethod
+    def _replace_references(cls, expr: Union[ASTExpression, ASTSimpleExpression], name_to_inline_expression: Mapping[str, ASTInlineExpression]) -> Union[ASTExpression, ASTSimpleExpression]:
+        r"""
+        Replaces the references to inline expressions in the given expression (**updated in-place**).
+        :return: the updated expression, or the expression that replaces it if it is a reference itself
+        """
+        if isinstance(expr, ASTSimpleExpression):
+            if expr.is_variable() and expr.get_variable().get_complete_name() in name_to_inline_expression.keys():
+                inline_expression = name_to_inline_expression[expr.get_variable().get_complete_name()]
+                encapsulated_expr = ASTNodeFactory.create_ast_expression(is_encapsulated=True,
+                                                                         expression=inline_expression.get_expression().clone(),
+                                                                         source_position=inline_expression.get_source_position())
+                encapsulated_expr.update_scope(inline_expression.get_scope())
+                return encapsulated_expr
+
+            if expr.is_function_call():
+                args = expr.get_function_call().get_args()
+                for i, arg in enumerate(args):
+                    args[i] = cls._replace_references(arg, name_to_inline_expression)
+
+            return expr
+
+        for attr in ["expression", "lhs", "rhs", "condition", "if_true", "if_not"]:
+            child = getattr(expr, attr)
+            if child is not None:
+                setattr(expr, attr, cls._replace_references(child, name_to_inline_expression))
+
+        return expr
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+#
+# loop_invariant_hoisting_transformer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.meta_model.ast_assignment import ASTAssignment
+from pynestml.meta_model.ast_data_type import ASTDataType
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
+from pynestml.meta_model.ast_model import ASTModel
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_stmts_body import ASTStmtsBody
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.integer_type_symbol import IntegerTypeSymbol
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.real_type_symbol import RealTypeSymbol
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.type_symbol import TypeSymbol
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.symbols.variable_symbol import VariableSymbol
+from pynestml.transformers.transformer import Transformer
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
+from pynestml.utils.string_utils import removesuffix
+from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+
+class LoopInvariantHoistingTransformer(Transformer):
+    r"""Move expressions in the ``update`` and ``onReceive`` blocks of a model that only depend on parameters, internals and the simulation resolution into new internal variables.
+
+    The statements in these blocks are executed in every timestep, or for every incoming spike, whereas the internals are only recomputed when the parameters or the resolution change. For instance, in
+
+    .. code-block:: nestml
+
+       update:
+           V_m = V_m * exp(-resolution() / tau_m) + I_e / C_m * resolution()
+
+    the expressions ``exp(-resolution() / tau_m)`` and ``I_e / C_m * resolution()`` are replaced by references to the new internal variables ``__hoisted_0`` and ``__hoisted_1``.
+
+    An expression is invariant if it only consists of literals, physical units, the constants ``e`` and ``pi``, calls to mathematical functions, ``resolution()`` and ``steps()``, and variables that are declared in the parameters or internals block and that are never assigned to. Vectors, homogeneous parameters, and the NEST weight and delay variables of synapses are never invariant. Only the largest invariant sub-expressions of each statement are moved, without reordering terms or factors; single variables and literals are left in place, and identical expressions share one internal variable.
+
+    As the internals are always computed, expressions are not moved out of code that is only executed depending on an invariant condition, for instance the body of ``if tau_syn != tau_m:`` or the branches of ``tau_syn != tau_m ? ... : ...``, so that any such guard against, for instance, a division by zero remains effective. Code that depends on other conditions, for instance on the state of the model, is transformed as usual.
+
+    The transformation is off by default. For each model, the moved expressions are reported in the log, and can be retrieved with ``get_hoisted_expressions()``.
+
+    Options:
+
+    - **hoist_loop_invariant_expressions**: Set to True to move the invariant expressions.
+    - **hoisted_variable_prefix**: The prefix for the names of the new internal variables. The variables are numbered, for instance ``__hoisted_0``, ``__hoisted_1``, etc.
+    - **delay_variable**, **weight_variable**: The synapse delay and weight variables, as for the NEST code generator. They can be changed without the internals being recomputed, so expressions that contain them are not moved.
+    """
+
+    _default_options = {
+        "hoist_loop_invariant_expressions": False,
+        "hoisted_variable_prefix": "__hoisted_",
+        "delay_variable": {},
+        "weight_variable": {}
+    }
+
+    # functions that always return the same value for the same arguments; calls to other functions (e.g. ``random_normal()`` or ``timestep()``) are never moved
+    _pure_function_names = {PredefinedFunctions.TIME_RESOLUTION, PredefinedFunctions.TIME_STEPS, PredefinedFunctions.EXP,
+                            PredefinedFunctions.LN, PredefinedFunctions.LOG10, PredefinedFunctions.COS, PredefinedFunctions.SIN,
+                            PredefinedFunctions.TAN, PredefinedFunctions.COSH, PredefinedFunctions.SINH, PredefinedFunctions.TANH,
+                            PredefinedFunctions.ERF, PredefinedFunctions.ERFC, PredefinedFunctions.EXPM1, PredefinedFunctions.CLIP,
+                            PredefinedFunctions.POW, PredefinedFunctions.MAX, PredefinedFunctions.MIN, PredefinedFunctions.ABS,
+                            PredefinedFunctions.CEIL, PredefinedFunctions.FLOOR, PredefinedFunctions.ROUND}
+
+    def __init__(self, options: Optional[Mapping[str, Any]] = None):
+        super(Transformer, self).__init__(options)
+        self._hoisted_expressions: Dict[str, List[Tuple[str, str]]] = {}
+
+    def transform(self, models: Union[ASTNode, Sequence[ASTNode]]) -> Union[ASTNode, Sequence[ASTNode]]:
+        single = False
+        if isinstance(models, ASTNode):
+            single = True
+            models = [models]
+
+        if self.get_option("hoist_loop_invariant_expressions"):
+            for model in models:
+                self.hoist_loop_invariant_expressions(model)
+
+        if single:
+            return models[0]
+
+        return models
+
+    def get_hoisted_expressions(self) -> Dict[str, List[Tuple[str, str]]]:
+        r"""
+        Returns, for each transformed model (indexed by name), the names of the new internal variables together with the (NESTML) expressions that they were assigned.
+        """
+        return self._hoisted_expressions
+
+    def hoist_loop_invariant_expressions(self, model: ASTModel) -> ASTModel:
+        r"""
+        Move the invariant expressions in the ``update`` and ``onReceive`` blocks of ``model`` into the internals block (**updated in-place**).
+        :param model: the model to transform
+        :return: the transformed model
+        """
+        self._model = model
+        self._variant_names = self._get_assigned_variable_names(model) | self._get_synapse_weight_and_delay_variable_names(model)
+        self._hoisted_variables: Dict[str, str] = {}    # printed expression -> name of the internal variable
+        self._hoisted_expressions[model.get_name()] = []
+        self._next_index = 0
+
+        for block in model.get_update_blocks() + model.get_on_receive_blocks():
+            self._hoist_in_stmts_body(block.get_stmts_body())
+
+        if self._hoisted_expressions[model.get_name()]:
+            model.accept(ASTParentVisitor())
+            model.accept(ASTSymbolTableVisitor())
+
+            code, message = Messages.get_loop_invariant_expressions_hoisted(model.get_name(), self._hoisted_expressions[model.get_name()])
+            Logger.log_message(node=model, code=code, message=message, error_position=model.get_source_position(), log_level=LoggingLevel.INFO)
+
+        return model
+
+    @classmethod
+    def _get_assigned_variable_names(cls, model: ASTModel) -> Set[str]:
+        names = set()
+
+        def collect_name(node):
+            if isinstance(node, ASTAssignment):
+                names.add(node.get_variable().get_name())
+
+        model.accept(ASTHigherOrderVisitor(visit_funcs=collect_name))
+
+        return names
+
+    def _get_synapse_weight_and_delay_variable_names(self, model: ASTModel) -> Set[str]:
+        synapse_name_stripped = removesuffix(removesuffix(model.get_name().split("_with_")[0], "_"), FrontendConfiguration.suffix)
+
+        return {variable_names[synapse_name_stripped] for variable_names in [self.get_option("delay_variable"), self.get_option("weight_variable")]
+                if synapse_name_stripped in variable_names.keys()}
+
+    def _hoist_in_stmts_body(self, stmts_body: ASTStmtsBody) -> None:
+        for stmt in stmts_body.get_stmts():
+            if stmt.is_small_stmt():
+                small_stmt = stmt.small_stmt
+                if small_stmt.is_assignment():
+                    small_stmt.assignment.rhs = self._hoist(small_stmt.assignment.rhs)
+                elif small_stmt.is_declaration() and small_stmt.declaration.has_expression():
+                    small_stmt.declaration.expression = self._hoist(small_stmt.declaration.expression)
+                elif small_stmt.is_function_call():
+                    self._hoist_in_args(small_stmt.function_call.args)
+                elif small_stmt.is_return_stmt() and small_stmt.return_stmt.has_expression():
+                    small_stmt.return_stmt.expression = self._hoist(small_stmt.return_stmt.expression)
+
+                continue
+
+            compound_stmt = stmt.compound_stmt
+            if compound_stmt.is_if_stmt():
+                if_stmt = compound_stmt.if_stmt
+                for clause in [if_stmt.get_if_clause()] + if_stmt.get_elif_clauses():
+                    is_guard = self._is_invariant(clause.condition)
+                    clause.condition = self._hoist(clause.condition)
+                    if is_guard:
+                        # the remaining clauses may depend on the condition, for instance to avoid a division by zero
+                        break
+
+                    self._hoist_in_stmts_body(clause.get_stmts_body())
+                else:
+                    if if_stmt.has_else_clause():
+                        self._hoist_in_stmts_body(if_stmt.get_else_clause().get_stmts_body())
+            elif compound_stmt.is_while_stmt():
+                is_guard = self._is_invariant(compound_stmt.while_stmt.condition)
+                compound_stmt.while_stmt.condition = self._hoist(compound_stmt.while_stmt.condition)
+                if not is_guard:
+                    self._hoist_in_stmts_body(compound_stmt.while_stmt.get_stmts_body())
+            elif compound_stmt.is_for_stmt():
+                compound_stmt.for_stmt.start_from = self._hoist(compound_stmt.for_stmt.start_from)
+                compound_stmt.for_stmt.end_at = self._hoist(compound_stmt.for_stmt.end_at)
+                self._hoist_in_stmts_body(compound_stmt.for_stmt.get_stmts_body())
+
+    def _hoist_in_args(self, args: List[Union[ASTExpression, ASTSimpleExpression]]) -> None:
+        for i, arg in enumerate(args):
+            args[i] = self._hoist(arg)
+
+    def _hoist(self, expr: Union[ASTExpression, ASTSimpleExpression]) -> Union[ASTExpression, ASTSimpleExpression]:
+        r"""
+        Replaces the largest invariant sub-expressions of the given expression by references to internal variables (**updated in-place**).
+        :return: the updated expression, or the reference that replaces it if it is invariant itself
+        """
+        if self._is_invariant(expr) and not self._is_trivial(expr):
+            replacement = self._get_hoisted_variable_reference(expr)
+            if replacement is not None:
+                return replacement
+
+        if isinstance(expr, ASTSimpleExpression):
+            if expr.is_function_call():
+                self._hoist_in_args(expr.get_function_call().args)
+
+            return expr
+
+        if expr.is_ternary_operator():
+            guard_attr, guarded_attrs = "condition", ["if_true", "if_not"]
+        elif isinstance(expr.get_binary_operator(), ASTLogicalOperator):
+            # the right-hand side of ``and`` and ``or`` is only evaluated depending on the left-hand side
+            guard_attr, guarded_attrs = "lhs", ["rhs"]
+        else:
+            guard_attr, guarded_attrs = None, ["expression", "lhs", "rhs"]
+
+        if guard_attr is not None:
+            if self._is_invariant(getattr(expr, guard_attr)):
+                guarded_attrs = []
+
+            setattr(expr, guard_attr, self._hoist(getattr(expr, guard_attr)))
+
+        for attr in guarded_attrs:
+            child = getattr(expr, attr)
+            if child is not None:
+                setattr(expr, attr, self._hoist(child))
+
+        return expr
+
+    def _is_invariant_variable(self, variable: ASTVariable, scope) -> bool:
+        if variable.get_vector_parameter() is not None or variable.get_differential_order() > 0:
+            return False
+
+        symbol = scope.resolve_to_symbol(variable.get_name(), SymbolKind.VARIABLE)
+        if symbol is None:
+            return PredefinedUnits.is_unit(variable.get_name())
+
+        if not isinstance(symbol, VariableSymbol):
+            return False
+
+        if symbol.is_predefined:
+            # the predefined time variable ``t`` changes during the simulation
+            return variable.get_name() in [PredefinedVariables.E_CONSTANT, PredefinedVariables.PI_CONSTANT]
+
+        return (symbol.is_parameters() or symbol.is_internals()) and variable.get_name() not in self._variant_names \
+            and not symbol.has_vector_parameter() and not symbol.is_homogeneous()
+
+    def _is_invariant(self, expr: Union[ASTExpression, ASTSimpleExpression]) -> bool:
+        if isinstance(expr, ASTSimpleExpression):
+            if expr.is_function_call():
+                return expr.get_function_call().get_name() in self._pure_function_names \
+                    and all(self._is_invariant(arg) for arg in expr.get_function_call().get_args())
+
+            if expr.is_string() or expr.is_delay_variable():
+                return False
+
+            if expr.get_variable() is not None:
+                # a variable, or a numeric literal with a unit
+                return self._is_invariant_variable(expr.get_variable(), expr.get_scope())
+
+            return True
+
+        return all(self._is_invariant(getattr(expr, attr)) for attr in ["expression", "lhs", "rhs", "condition", "if_true", "if_not"]
+                   if getattr(expr, attr) is not None)
+
+    @classmethod
+    def _is_trivial(cls, expr: Union[ASTExpression, ASTSimpleExpression]) -> bool:
+        r"""Return whether ``expr`` is too simple to be worth an internal variable, for instance ``tau``, ``-1 ms`` or ``resolution()``."""
+        if isinstance(expr, ASTSimpleExpression):
+            return not expr.is_function_call() or not expr.get_function_call().get_args()
+
+        if expr.get_expression() is not None:
+            # parentheses, unary operator or logical not
+            return cls._is_trivial(expr.get_expression())
+
+        return False
+
+    def _get_hoisted_variable_reference(self, expr: Union[ASTExpression, ASTSimpleExpression]) -> Optional[ASTSimpleExpression]:
+        r"""
+        Returns a reference to the internal variable that is assigned ``expr``, declaring the variable if necessary; or None if the type of ``expr`` cannot be declared.
+        """
+        # the parentheses around the expression are not needed in the declaration
+        init_expression = expr
+        while isinstance(init_expression, ASTExpression) and init_expression.is_encapsulated and not init_expression.get_expression().get_implicit_conversion_factor():
+            init_expression = init_expression.get_expression()
+
+        expr_str = str(init_expression)
+        if expr_str not in self._hoisted_variables.keys():
+            data_type = self._create_data_type(init_expression.type)
+            if data_type is None:
+                return None
+
+            variable_name = self._get_new_variable_name()
+            init_expression = init_expression.clone()
+            init_expression.set_implicit_conversion_factor(None)
+            variable = ASTNodeFactory.create_ast_variable(variable_name, source_position=ASTSourceLocation.get_added_source_position())
+            declaration = ASTNodeFactory.create_ast_declaration(variables=[variable],
+                                                                data_type=data_type,
+                                                                expression=init_expression,
+                                                                source_position=ASTSourceLocation.get_added_source_position())
+            self._model.add_to_internals_block(declaration)
+
+            self._hoisted_variables[expr_str] = variable_name
+            self._hoisted_expressions[self._model.get_name()].append((variable_name, expr_str))
+
+        variable = ASTNodeFactory.create_ast_variable(self._hoisted_variables[expr_str], source_position=expr.get_source_position())
+        reference = ASTNodeFactory.create_ast_simple_expression(variable=variable, source_position=expr.get_source_position())
+        reference.update_scope(expr.get_scope())
+        reference.set_implicit_conversion_factor(expr.get_implicit_conversion_factor())
+
+        return reference
+
+    def _get_new_variable_name(self) -> str:
+        while True:
+            variable_name = self.get_option("hoisted_variable_prefix") + str(self._next_index)
+            self._next_index += 1
+            if self._model.get_scope().resolve_to_symbol(variable_name, SymbolKind.VARIABLE) is None:
+                return variable_name
+
+    @classmethod
+    def _create_data_type(cls, type_symbol: TypeSymbol) -> Optional[ASTDataType]:
+        r"""Return the data type for a variable of type ``type_symbol``, or None if the type is not numeric or cannot be expressed in NESTML."""
+        if isinstance(type_symbol, IntegerTypeSymbol):
+            data_type = ASTNodeFactory.create_ast_data_type(is_integer=True, source_position=ASTSourceLocation.get_added_source_position())
+        elif isinstance(type_symbol, RealTypeSymbol):
+            data_type = ASTNodeFactory.create_ast_data_type(is_real=True, source_position=ASTSourceLocation.get_added_source_position())
+        elif isinstance(type_symbol, UnitTypeSymbol):
+            unit = type_symbol.astropy_unit
+            if unit.scale != 1 or any(power != int(power) for power in unit.powers):
+                return None
+
+            from pynestml.utils.model_parser import ModelParser
+
+            unit_str = " * ".join(str(base) + ("" if power == 1 else "**" + str(int(power))) for base, power in zip(unit.bases, unit.powers))
+            try:
+                data_type = ModelParser.parse_data_type(unit_str)
+            except Exception:
+                return None
+        else:
+            # for instance, a boolean or a string
+            return None
+
+        data_type.accept(ASTDataTypeVisitor())
+        if not data_type.get_type_symbol().equals(type_symbol):
+            return None
+
+        return data_type
@@ -317,9 +317,10 @@ class SynapsePostNeuronTransformer(Transformer):
                                              for neuron_state_var in syn_to_neuron_state_vars if new_synapse.get_kernel_by_name(neuron_state_var) is None]
 
         # all state variables that will be moved from synapse to neuron
+        synapse_dependency_graph = synapse.get_variable_dependency_graph()
         syn_to_neuron_state_vars = []
         for var_name in recursive_vars_used:
-            if ASTUtils.get_state_variable_by_name(synapse, var_name) or ASTUtils.get_inline_expression_by_name(synapse, var_name) or ASTUtils.get_kernel_by_name(synapse, var_name):
+            if synapse_dependency_graph.is_state_variable(var_name) or synapse_dependency_graph.is_inline_expression(var_name) or synapse_dependency_graph.is_kernel_variable(var_name):
                 syn_to_neuron_state_vars.append(var_name)
 
         Logger.log_message(None, -1, "State variables that will be moved from synapse to neuron: " + str(syn_to_neuron_state_vars),
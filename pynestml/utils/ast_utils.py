@@ -19,12 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union
 
 import re
-import sympy
-
-import odetoolbox
 
 from pynestml.codegeneration.printers.ast_printer import ASTPrinter
 from pynestml.codegeneration.printers.cpp_variable_printer import CppVariablePrinter
@@ -33,13 +30,12 @@ from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_stmts_body import ASTStmtsBody
 from pynestml.meta_model.ast_block_with_variables import ASTBlockWithVariables
+from pynestml.meta_model.ast_data_type import ASTDataType
 from pynestml.meta_model.ast_declaration import ASTDeclaration
-from pynestml.meta_model.ast_elif_clause import ASTElifClause
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_external_variable import ASTExternalVariable
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
-from pynestml.meta_model.ast_if_clause import ASTIfClause
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 from pynestml.meta_model.ast_input_block import ASTInputBlock
 from pynestml.meta_model.ast_input_port import ASTInputPort
@@ -66,6 +62,7 @@ from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.utils.string_utils import removesuffix
+from pynestml.utils.variable_dependency_graph import VariableDependencyGraph
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_visitor import ASTVisitor
 
@@ -452,9 +449,7 @@ class ASTUtils:
                                                                    ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            block.parent_ = model.get_body()
 
         return model
 
@@ -472,9 +467,7 @@ class ASTUtils:
                                                                    ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            block.parent_ = model.get_body()
 
         return model
 
@@ -492,9 +485,7 @@ class ASTUtils:
                                                                    ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            block.parent_ = model.get_body()
 
         return model
 
@@ -512,9 +503,7 @@ class ASTUtils:
                                                               ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            block.parent_ = model.get_body()
 
         return model
 
@@ -810,8 +799,6 @@ class ASTUtils:
             raise Exception()
 
         node.accept(ASTHigherOrderVisitor(lambda x: replace_var(x)))
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        node.accept(ASTParentVisitor())
 
     @classmethod
     def add_suffix_to_decl_lhs(cls, decl, suffix: str):
@@ -902,6 +889,7 @@ class ASTUtils:
     @classmethod
     def move_decls(cls, var_name, from_block, to_block, var_name_suffix: str, block_type: BlockType, mode="move") -> List[ASTDeclaration]:
         r"""Move or copy declarations from ``from_block`` to ``to_block``."""
+        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
         assert mode in ["move", "copy"]
 
@@ -925,6 +913,8 @@ class ASTUtils:
                 if not decl.get_variables()[0].name.endswith(var_name_suffix) and var_name_suffix:
                     ASTUtils.add_suffix_to_decl_lhs(decl, suffix=var_name_suffix)
                 to_block.get_declarations().append(decl)
+                decl.parent_ = to_block
+                decl.accept(ASTParentVisitor())
                 decl.update_scope(to_block.get_scope())
 
                 ast_symbol_table_visitor = ASTSymbolTableVisitor()
@@ -932,9 +922,6 @@ class ASTUtils:
                 decl.accept(ast_symbol_table_visitor)
                 ast_symbol_table_visitor.block_type_stack.pop()
 
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        to_block.accept(ASTParentVisitor())
-
         return decls
 
     @classmethod
@@ -1115,20 +1102,76 @@ class ASTUtils:
                 return True
         return False
 
+    @classmethod
+    def _create_declaration(cls, variable_name: str, data_type: ASTDataType, expression: Union[ASTExpression, ASTSimpleExpression], scope: Scope) -> ASTDeclaration:
+        """
+        Creates the declaration ``variable_name data_type = expression``. If the expression contains a vector variable, the declared variable is given the same size.
+        :param variable_name: the name of the declared variable
+        :param data_type: the data type of the declared variable
+        :param expression: the initialization expression
+        :param scope: the scope in which to resolve the variables in the expression
+        :return: the declaration
+        """
+        variable = ASTNodeFactory.create_ast_variable(variable_name.rstrip("'"),
+                                                      differential_order=len(variable_name) - len(variable_name.rstrip("'")),
+                                                      source_position=ASTSourceLocation.get_added_source_position())
+        ast_declaration = ASTNodeFactory.create_ast_declaration(variables=[variable],
+                                                                data_type=data_type,
+                                                                expression=expression,
+                                                                source_position=ASTSourceLocation.get_added_source_position())
+        vector_variable = ASTUtils.get_vectorized_variable(expression, scope)
+        if vector_variable is not None:
+            ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
+
+        return ast_declaration
+
+    @classmethod
+    def update_symbol_table_for_node(cls, model: ASTModel, node: ASTNode, block_type: BlockType) -> None:
+        r"""
+        Update the symbol table of ``model`` for a node that was added to it (or changed) after the symbol table was built, without rebuilding the symbol table of the whole model: the node and its children are assigned to scopes, and symbols are created for the variables it declares. If ``node`` is a declaration, symbols that were previously created for it are replaced.
+
+        The scope of ``node`` should have been set to the scope of the block that contains it.
+
+        :param model: the model that contains the node
+        :param node: the added or changed node, for instance a declaration or a statement
+        :param block_type: the type of the block that contains the node
+        """
+        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+        if isinstance(node, ASTDeclaration):
+            for var in node.get_variables():
+                symbol = node.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
+                if symbol is not None and symbol.get_referenced_object() is node:
+                    symbol.get_corresponding_scope().delete_symbol(symbol)
+
+        symtable_visitor = ASTSymbolTableVisitor()
+        symtable_visitor.block_type_stack.push(block_type)
+        node.accept(symtable_visitor)
+        symtable_visitor.block_type_stack.pop()
+
+        if block_type == BlockType.STATE:
+            # the new state variables might be defined by ODEs or kernels
+            for equations_block in model.get_equations_blocks():
+                cls.assign_ode_to_variables(equations_block)
+
+        model.invalidate_variable_dependency_graph()
+
     @classmethod
     def add_declarations_to_internals(cls, neuron: ASTModel, declarations: Mapping[str, str]) -> ASTModel:
         """
         Adds the variables as stored in the declaration tuples to the neuron.
         :param neuron: a single neuron instance
-        :param declarations: a map of variable names to declarations
+        :param declarations: a map of variable names to initialization expressions, in the syntax returned by ODE-toolbox
         :return: a modified neuron
         """
+        from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+
         for variable in declarations:
-            cls.add_declaration_to_internals(neuron, variable, declarations[variable])
+            cls.add_declaration_to_internals(neuron, variable, ODEToolboxUtils.parse_expression(declarations[variable]))
         return neuron
 
     @classmethod
-    def add_declaration_to_internals(cls, neuron: ASTModel, variable_name: str, init_expression: str) -> ASTModel:
+    def add_declaration_to_internals(cls, neuron: ASTModel, variable_name: str, init_expression: Union[str, ASTExpression, ASTSimpleExpression]) -> ASTModel:
         """
         Adds the variable as stored in the declaration tuple to the neuron. The declared variable is of type real.
         :param neuron: a single neuron instance
@@ -1139,28 +1182,16 @@ class ASTUtils:
         assert len(neuron.get_internals_blocks()) <= 1, "Only one internals block supported for now"
 
         from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+        from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
 
-        tmp = ModelParser.parse_expression(init_expression)
-        vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
+        if isinstance(init_expression, str):
+            init_expression = ModelParser.parse_expression(init_expression)
 
-        declaration_string = variable_name + ' real' + (
-            '[' + vector_variable.get_vector_parameter() + ']'
-            if vector_variable is not None and vector_variable.has_vector_parameter() else '') + ' = ' + init_expression
-        ast_declaration = ModelParser.parse_declaration(declaration_string)
-        if vector_variable is not None:
-            ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
+        data_type = ASTNodeFactory.create_ast_data_type(is_real=True, source_position=ASTSourceLocation.get_added_source_position())
+        data_type.accept(ASTDataTypeVisitor())
+        ast_declaration = cls._create_declaration(variable_name, data_type, init_expression, neuron.get_scope())
         neuron.add_to_internals_block(ast_declaration)
 
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        neuron.accept(ASTParentVisitor())
-
-        ast_declaration.update_scope(neuron.get_internals_blocks()[0].get_scope())
-        symtable_visitor = ASTSymbolTableVisitor()
-        symtable_visitor.block_type_stack.push(BlockType.INTERNALS)
-        ast_declaration.accept(symtable_visitor)
-        symtable_visitor.block_type_stack.pop()
-
         return neuron
 
     @classmethod
@@ -1172,12 +1203,14 @@ class ASTUtils:
         :param initial_values: list of initial values
         :return: a modified neuron
         """
-        for variable, initial_value in zip(variables, initial_values):
+        from pynestml.utils.model_parser import ModelParser
+
+        for variable, initial_value in zip(variables, ModelParser.parse_expressions(initial_values)):
             cls.add_declaration_to_state_block(neuron, variable, initial_value)
         return neuron
 
     @classmethod
-    def add_declaration_to_state_block(cls, neuron: ASTModel, variable: str, initial_value: str, type_str: str = "real") -> ASTModel:
+    def add_declaration_to_state_block(cls, neuron: ASTModel, variable: str, initial_value: Union[str, ASTExpression, ASTSimpleExpression], type_str: str = "real") -> ASTModel:
         """
         Adds a single declaration to an arbitrary state block of the neuron. The declared variable is of type real.
         :param neuron: a neuron
@@ -1186,25 +1219,19 @@ class ASTUtils:
         :return: a modified neuron
         """
         from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+        from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
 
-        tmp = ModelParser.parse_expression(initial_value)
-        vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
-        declaration_string = variable + " " + type_str + (
-            '[' + vector_variable.get_vector_parameter() + ']'
-            if vector_variable is not None and vector_variable.has_vector_parameter() else '') + ' = ' + initial_value
-        ast_declaration = ModelParser.parse_declaration(declaration_string)
-        if vector_variable is not None:
-            ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
-        neuron.add_to_state_block(ast_declaration)
+        if isinstance(initial_value, str):
+            initial_value = ModelParser.parse_expression(initial_value)
 
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        neuron.accept(ASTParentVisitor())
+        if type_str == "real":
+            data_type = ASTNodeFactory.create_ast_data_type(is_real=True, source_position=ASTSourceLocation.get_added_source_position())
+            data_type.accept(ASTDataTypeVisitor())
+        else:
+            data_type = ModelParser.parse_data_type(type_str)
 
-        symtable_visitor = ASTSymbolTableVisitor()
-        symtable_visitor.block_type_stack.push(BlockType.STATE)
-        ast_declaration.accept(symtable_visitor)
-        symtable_visitor.block_type_stack.pop()
+        ast_declaration = cls._create_declaration(variable, data_type, initial_value, neuron.get_scope())
+        neuron.add_to_state_block(ast_declaration)
 
         return neuron
 
@@ -1245,9 +1272,11 @@ class ASTUtils:
                                               source_position=ASTSourceLocation.get_added_source_position())
         if not neuron.get_update_blocks():
             neuron.create_empty_update_block()
-        neuron.get_update_blocks()[0].get_stmts_body().get_stmts().append(stmt)
-        small_stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
+        neuron.get_update_blocks()[0].get_stmts_body().add_stmt(stmt)
         stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
+        if stmt.get_scope() is not None:
+            cls.update_symbol_table_for_node(neuron, stmt, BlockType.LOCAL)
+
         return neuron
 
     @classmethod
@@ -1265,9 +1294,11 @@ class ASTUtils:
                                               source_position=ASTSourceLocation.get_added_source_position())
         if not neuron.get_update_blocks():
             neuron.create_empty_update_block()
-        neuron.get_update_blocks()[0].get_stmts_body().get_stmts().append(stmt)
-        small_stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
+        neuron.get_update_blocks()[0].get_stmts_body().add_stmt(stmt)
         stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
+        if stmt.get_scope() is not None:
+            cls.update_symbol_table_for_node(neuron, stmt, BlockType.LOCAL)
+
         return neuron
 
     @classmethod
@@ -1773,7 +1804,7 @@ class ASTUtils:
     @classmethod
     def recursive_dependent_variables_search(cls, vars: List[str], model: ASTModel) -> List[str]:
         """
-        Collect all the variable names used in the defining expressions of a list of variables.
+        Collect the names of all variables that (directly or indirectly) depend on a list of variables, including these variables themselves.
         :param vars: list of variable names moved from synapse to neuron
         :param model: ASTModel to perform the recursive search
         :return: list of variable names from the recursive search
@@ -1782,15 +1813,7 @@ class ASTUtils:
         for var in vars:
             assert type(var) is str
 
-        vars_used = vars.copy()
-        i = 0
-        while i < len(vars_used):
-            new_vars = ASTUtils.get_dependent_variables(vars_used[i], model)
-            new_vars = list(set(new_vars) - set(vars_used))
-            vars_used.extend(new_vars)
-            i += 1
-
-        return list(set(vars_used))
+        return list(cls._get_variable_dependency_graph(model).get_recursively_dependent_variables(vars))
 
     @classmethod
     def recursive_necessary_variables_search(cls, vars: List[str], model: ASTModel) -> List[str]:
@@ -1804,15 +1827,7 @@ class ASTUtils:
         for var in vars:
             assert type(var) is str
 
-        vars_used = vars.copy()
-        i = 0
-        while i < len(vars_used):
-            new_vars = ASTUtils.get_necessary_variables(vars_used[i], model)
-            new_vars = list(set(new_vars) - set(vars_used))
-            vars_used.extend(new_vars)
-            i += 1
-
-        return list(set(vars_used))
+        return list(cls._get_variable_dependency_graph(model).get_recursively_necessary_variables(vars))
 
     @classmethod
     def remove_initial_values_for_kernels(cls, model: ASTModel) -> None:
@@ -1845,13 +1860,14 @@ class ASTUtils:
                 if decl in state_block.get_declarations():
                     state_block.get_declarations().remove(decl)
 
+        model.invalidate_variable_dependency_graph()
+
     @classmethod
     def update_initial_values_for_odes(cls, model: ASTModel, solver_dicts: List[dict]) -> None:
         """
         Update initial values for original ODE declarations (e.g. V_m', g_ahp'') that are present in the model before ODE-toolbox processing, with the formatted variable names and initial values returned by ODE-toolbox.
         """
-        from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
+        from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
         assert len(model.get_equations_blocks()) == 1, "Only one equation block should be present"
@@ -1870,11 +1886,10 @@ class ASTUtils:
                         iv_expr = cls.get_initial_value_from_ode_toolbox_result(
                             cls.to_ode_toolbox_processed_name(var_name), solver_dicts)
                         assert iv_expr is not None
-                        iv_expr = ModelParser.parse_expression(iv_expr)
+                        iv_expr = ODEToolboxUtils.parse_expression(iv_expr)
                         iv_expr.update_scope(state_block.get_scope())
                         iv_decl.set_expression(iv_expr)
 
-        model.accept(ASTParentVisitor())
         model.accept(ASTSymbolTableVisitor())
 
     @classmethod
@@ -1898,43 +1913,16 @@ class ASTUtils:
         return args_str
 
     @classmethod
-    def get_necessary_variables(cls, var: str, model: ASTExpression) -> List[ASTVariable]:
-        r"""Return a list of all right-hand side variables in the model that a certain, given left-hand side variable ``var`` depends on."""
-        class GetNecessaryVariablesVisitor(ASTVisitor):
-            r"""N.B. use get_name() rather than get_complete_name() so we grab higher orders as well"""
-            def __init__(self):
-                super().__init__()
-                self.vars = set()
-
-            def visit_declaration(self, node: ASTDeclaration) -> None:
-                for lhs_var in node.get_variables():
-                    if var == lhs_var.get_name():
-                        self.vars |= set(ASTUtils.get_all_variables_names_in_expression(node.get_expression()))
-
-            def visit_inline_expression(self, node: ASTInlineExpression) -> None:
-                if var == node.get_variable_name():
-                    self.vars |= set(ASTUtils.get_all_variables_names_in_expression(node.get_expression()))
-
-            def visit_ode_equation(self, node: ASTOdeEquation) -> None:
-                if var == node.get_lhs().get_name():
-                    self.vars |= set(ASTUtils.get_all_variables_names_in_expression(node.get_rhs()))
+    def _get_variable_dependency_graph(cls, node: ASTNode) -> VariableDependencyGraph:
+        if isinstance(node, ASTModel):
+            return node.get_variable_dependency_graph()
 
-            def visit_kernel(self, node: ASTKernel) -> None:
-                for expr in node.get_expressions():
-                    if var in ASTUtils.get_all_variables_names_in_expression(expr):
-                        self.vars |= set([str(s) for s in node.get_variable_names()])
+        return VariableDependencyGraph(node)
 
-            def visit_assignment(self, node: ASTAssignment) -> None:
-                if var == node.lhs.get_name():
-                    self.vars |= set(ASTUtils.get_all_variables_names_in_expression(node.get_expression()))
-
-        visitor = GetNecessaryVariablesVisitor()
-        model.accept(visitor)
-
-        if var in visitor.vars:
-            visitor.vars.remove(var)
-
-        return visitor.vars
+    @classmethod
+    def get_necessary_variables(cls, var: str, model: ASTNode) -> Set[str]:
+        r"""Return the names of all right-hand side variables in the model that a certain, given left-hand side variable ``var`` depends on. See ``VariableDependencyGraph``."""
+        return cls._get_variable_dependency_graph(model).get_necessary_variables(var)
 
     @classmethod
     def get_all_variables_assigned_to(cls, node: ASTNode):
@@ -1952,56 +1940,9 @@ class ASTUtils:
         return visitor.vars
 
     @classmethod
-    def get_dependent_variables(cls, var: str, model: ASTExpression) -> List[ASTVariable]:
-        r"""Return a list of all left-hand side variables in the model that depend on ``var`` in their right-hand side."""
-        class GetDependentVariablesVisitor(ASTVisitor):
-            def __init__(self):
-                super().__init__()
-                self.vars = set()
-
-            def visit_declaration(self, node: ASTDeclaration) -> None:
-                if var in ASTUtils.get_all_variables_names_in_expression(node.get_expression()):
-                    self.vars |= set([var.get_name() for var in node.get_variables()])
-
-            def visit_inline_expression(self, node: ASTInlineExpression) -> None:
-                if var in ASTUtils.get_all_variables_names_in_expression(node.get_expression()):
-                    self.vars.add(node.get_variable_name())
-
-            def visit_ode_equation(self, node: ASTOdeEquation) -> None:
-                if var in ASTUtils.get_all_variables_names_in_expression(node.get_rhs()):
-                    self.vars.add(node.get_lhs().get_name())
-
-            def visit_kernel(self, node: ASTKernel) -> None:
-                for expr in node.get_expressions():
-                    # exclude the special case "t" because a function-of-time kernel might depend on t
-                    if not var == "t" and var in ASTUtils.get_all_variables_names_in_expression(expr):
-                        self.vars |= set([var.get_name() for var in node.get_variables()])
-
-            def visit_assignment(self, node: ASTAssignment) -> None:
-                rhs_vars = ASTUtils.get_all_variables_names_in_expression(node.rhs)
-
-                if var in rhs_vars:
-                    self.vars.add(str(node.lhs))
-
-            def _visit_if_clause(self, node: ASTIfClause) -> None:
-                cond_vars = ASTUtils.get_all_variables_names_in_expression(node.condition)
-                if var in cond_vars:
-                    # collect all variables assigned to in the if-block -- they all depend on ``var``
-                    self.vars |= ASTUtils.get_all_variables_assigned_to(node.get_stmts_body())
-
-            def visit_if_clause(self, node: ASTIfClause) -> None:
-                self._visit_if_clause(node)
-
-            def visit_elif_clause(self, node: ASTElifClause) -> None:
-                self._visit_if_clause(node)
-
-        visitor = GetDependentVariablesVisitor()
-        model.accept(visitor)
-
-        if var in visitor.vars:
-            visitor.vars.remove(var)
-
-        return visitor.vars
+    def get_dependent_variables(cls, var: str, model: ASTNode) -> Set[str]:
+        r"""Return the names of all left-hand side variables in the model that depend on ``var`` in their right-hand side. See ``VariableDependencyGraph``."""
+        return cls._get_variable_dependency_graph(model).get_dependent_variables(var)
 
     @classmethod
     def get_all_variables_in_expression(cls, expr: ASTExpression) -> List[ASTVariable]:
@@ -2224,11 +2165,16 @@ class ASTUtils:
             for decl in decl_to_remove:
                 equations_block.get_declarations().remove(decl)
 
+        model.invalidate_variable_dependency_graph()
+
     @classmethod
     def get_delta_factors_(cls, neuron: ASTModel, equations_block: ASTEquationsBlock) -> dict:
         r"""
         For every occurrence of a convolution of the form `x^(n) = a * convolve(kernel, inport) + ...` where `kernel` is a delta function, add the element `(x^(n), inport) --> a` to the set.
         """
+        import sympy
+        import odetoolbox
+
         delta_factors = {}
 
         for ode_eq in equations_block.get_ode_equations():
@@ -2268,6 +2214,8 @@ class ASTUtils:
             for decl in decl_to_remove:
                 equations_block.get_declarations().remove(decl)
 
+        model.invalidate_variable_dependency_graph()
+
         return decl_to_remove
 
     @classmethod
@@ -2592,7 +2540,7 @@ class ASTUtils:
         visitor._numeric_state_variables = numeric_state_variable_names
         neuron.accept(visitor)
 
-        if "extra_on_emit_spike_stmts_from_synapse" in dir(neuron):
+        if hasattr(neuron, "extra_on_emit_spike_stmts_from_synapse"):
             for expr in neuron.extra_on_emit_spike_stmts_from_synapse:
                 expr.accept(visitor)
 
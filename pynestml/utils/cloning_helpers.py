@@ -18,7 +18,6 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-import numpy as np
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -30,6 +29,7 @@ def clone_numeric_literal(numeric_literal):
         # Python basic type
         return numeric_literal
 
+    import numpy as np
     if type(numeric_literal) in [np.int, np.int8, np.int16, np.int32, np.int64]:
         # NumPy types
         return numeric_literal.copy()
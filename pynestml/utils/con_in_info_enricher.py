@@ -21,7 +21,7 @@
 
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.utils.mechs_info_enricher import MechsInfoEnricher
-from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.sympy_to_ast_converter import SympyToASTConverter
 
 import sympy
 
@@ -46,7 +46,7 @@ class ConInInfoEnricher(MechsInfoEnricher):
             sympy_expr = sympy.parsing.sympy_parser.parse_expr(expr_str)
             sympy_expr = sympy.diff(sympy_expr, "v_comp")
 
-            ast_expression_d = ModelParser.parse_expression(str(sympy_expr))
+            ast_expression_d = SympyToASTConverter.convert(sympy_expr)
             # copy scope of the original inline_expression into the the derivative
             ast_expression_d.update_scope(inline_expression.get_scope())
             ast_expression_d.accept(ASTSymbolTableVisitor())
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# disk_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Optional
+
+import os
+import tempfile
+
+
+class DiskCache:
+    r"""
+    Base class for persistent on-disk caches. Entries are files in a cache directory, named after their (hexadecimal) key. The total size of all entries is capped; when the cap is exceeded, least recently used entries are evicted first. Recency is tracked through the modification time of the entry files.
+
+    Child classes set ``CACHE_NAME_`` (used as the name of the default cache directory) and ``FILE_EXTENSION_``, and implement the (de)serialisation of entries on top of ``_read_entry()`` and ``_write_entry()``.
+
+    Attributes:
+        enabled         Whether the cache is used at all.
+        cache_dir       Directory in which cache entries are stored. If None, a default location in the user cache directory is used.
+        max_size        Maximum total size of all cache entries (in bytes).
+    """
+    CACHE_NAME_: str = ""
+    FILE_EXTENSION_: str = ""
+    DEFAULT_MAX_SIZE_: int = 256 * 1024 * 1024
+
+    enabled = True
+    cache_dir = None
+    max_size = DEFAULT_MAX_SIZE_
+
+    @classmethod
+    def configure(cls, enabled: bool = True, cache_dir: Optional[str] = None, max_size: Optional[int] = None) -> None:
+        r"""
+        Set the cache options.
+
+        :param enabled: whether to use the cache
+        :param cache_dir: directory to store cache entries in, or None to use the default location
+        :param max_size: maximum total size of the cache (in bytes), or None to use the default
+        """
+        cls.enabled = enabled
+        cls.cache_dir = cache_dir
+        cls.max_size = max_size if max_size is not None else cls.DEFAULT_MAX_SIZE_
+
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        r"""
+        Returns the directory in which cache entries are stored.
+
+        :return: the cache directory path
+        """
+        if cls.cache_dir is not None:
+            return cls.cache_dir
+
+        base_dir = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+
+        return os.path.join(base_dir, "nestml", cls.CACHE_NAME_)
+
+    @classmethod
+    def _get_entry_path(cls, key: str) -> str:
+        return os.path.join(cls.get_cache_dir(), key + cls.FILE_EXTENSION_)
+
+    @classmethod
+    def _read_entry(cls, key: str) -> Optional[bytes]:
+        r"""
+        Read the raw contents of a cache entry, and mark it as most recently used.
+
+        :param key: the key of the entry
+        :return: the contents, or None if the cache is disabled or the entry does not exist
+        """
+        if not cls.enabled:
+            return None
+
+        entry_path = cls._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return data
+
+    @classmethod
+    def _write_entry(cls, key: str, data: bytes) -> None:
+        r"""
+        Atomically write a cache entry, then evict old entries if the cache has grown too large. Failures (e.g. an unwritable cache directory) are silently ignored.
+
+        :param key: the key of the entry
+        :param data: the contents of the entry
+        """
+        if not cls.enabled:
+            return
+
+        try:
+            os.makedirs(cls.get_cache_dir(), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cls.get_cache_dir(), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            os.replace(tmp_path, cls._get_entry_path(key))
+        except OSError:
+            return
+
+        cls.evict()
+
+    @classmethod
+    def _remove_entry(cls, key: str) -> None:
+        try:
+            os.remove(cls._get_entry_path(key))
+        except OSError:
+            pass
+
+    @classmethod
+    def evict(cls) -> None:
+        r"""
+        Remove least recently used entries until the total size of the cache is below ``max_size``.
+        """
+        try:
+            entries = []
+            for fn in os.listdir(cls.get_cache_dir()):
+                if fn.endswith(cls.FILE_EXTENSION_):
+                    stat = os.stat(os.path.join(cls.get_cache_dir(), fn))
+                    entries.append((stat.st_mtime, stat.st_size, fn))
+        except OSError:
+            return
+
+        total_size = sum([size for _, size, _ in entries])
+        for _, size, fn in sorted(entries):
+            if total_size <= cls.max_size:
+                break
+
+            try:
+                os.remove(os.path.join(cls.get_cache_dir(), fn))
+            except OSError:
+                pass
+
+            total_size -= size
+
+    @classmethod
+    def clear(cls) -> None:
+        r"""
+        Remove all entries from the cache.
+        """
+        if not os.path.isdir(cls.get_cache_dir()):
+            return
+
+        for fn in os.listdir(cls.get_cache_dir()):
+            if fn.endswith(cls.FILE_EXTENSION_):
+                try:
+                    os.remove(os.path.join(cls.get_cache_dir(), fn))
+                except OSError:
+                    pass
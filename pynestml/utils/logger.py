@@ -19,15 +19,15 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from enum import Enum
 import json
 
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.utils.ast_source_location import ASTSourceLocation
-from pynestml.utils.messages import MessageCode
+from pynestml.utils.messages import DeferredMessage, MessageCode
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 
 
@@ -63,6 +63,8 @@ class Logger:
         curr_message A counter indicating the current message, this enables a sorting by the number of message
         logging_level Indicates messages of which level shall be printed to the screen.
         current_node The currently processed model. This enables to retrieve all messages belonging to a certain model
+        max_messages If not None, only the last ``max_messages`` messages are kept in the log; the numbers of messages per level and artifact still count all messages.
+        log_stream An open file to which each message is written as soon as it is logged, as one JSON object per line.
     """
     log = {}
     curr_message = None
@@ -70,19 +72,47 @@ class Logger:
     logging_level = None
     current_node = None
     no_print = False
+    max_messages = None
+    log_stream = None
+
+    # the entries in ``log`` (with the number of times they occur), for detecting duplicates
+    _log_entries = Counter()    # type: Counter
+    # the number of logged messages for each level, and for each pair of artifact name and level
+    _n_messages_of_level = Counter()    # type: Counter
+    _n_messages_of_artifact_and_level = Counter()    # type: Counter
 
     @classmethod
-    def init_logger(cls, logging_level: LoggingLevel):
+    def init_logger(cls, logging_level: LoggingLevel, max_messages: Optional[int] = None, log_stream_path: Optional[str] = None):
         """
         Initializes the logger.
 
         :param logging_level: the logging level as required
         :type logging_level: LoggingLevel
+        :param max_messages: if not None, only the last ``max_messages`` messages are kept in the log
+        :param log_stream_path: if not None, the path of a file to which messages are written in JSON lines format as soon as they are logged
         """
         cls.logging_level = logging_level
         cls.curr_message = 0
         cls.log = {}
         cls.log_frozen = False
+        cls.max_messages = max_messages
+        cls._rebuild_index()
+
+        if cls.log_stream is not None:
+            cls.log_stream.close()
+            cls.log_stream = None
+
+        if log_stream_path is not None:
+            cls.log_stream = open(log_stream_path, "w", buffering=1)
+
+    @classmethod
+    def _rebuild_index(cls) -> None:
+        cls._log_entries = Counter(cls.log.values())
+        cls._n_messages_of_level = Counter()
+        cls._n_messages_of_artifact_and_level = Counter()
+        for (artifact_name, node, log_level, code, error_position, message) in cls.log.values():
+            cls._n_messages_of_level[log_level] += 1
+            cls._n_messages_of_artifact_and_level[(artifact_name, log_level)] += 1
 
     @classmethod
     def freeze_log(cls, do_freeze: bool = True):
@@ -110,16 +140,17 @@ class Logger:
         """
         cls.log = log
         cls.curr_message = counter
+        cls._rebuild_index()
 
     @classmethod
-    def log_message(cls, node: ASTNode = None, code: MessageCode = None, message: str = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None, allow_duplicates: bool = False):
+    def log_message(cls, node: ASTNode = None, code: MessageCode = None, message: Union[str, DeferredMessage] = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None, allow_duplicates: bool = False):
         """
         Logs the handed over message on the handed over node. If the current logging is appropriate, the message is also printed.
 
         :param node: the node in which the error occurred
         :param code: a single error code
         :param error_position: the position on which the error occurred.
-        :param message: a message.
+        :param message: a message. A ``DeferredMessage`` is only formatted when it is printed or retrieved from the log; duplicates of it are detected without formatting it.
         :param log_level: the corresponding log level.
         :param allow_duplicates: whether to ignore or suppress duplicate messages.
         """
@@ -147,10 +178,22 @@ class Logger:
 
             new_log_entry = (artifact_name, cls.current_node, log_level, code, error_position, message)
 
-        if not allow_duplicates and new_log_entry in cls.log.values():
+        if not allow_duplicates and new_log_entry in cls._log_entries:
             return
 
         cls.log[cls.curr_message] = new_log_entry
+        cls._log_entries[new_log_entry] += 1
+        cls._n_messages_of_level[log_level] += 1
+        cls._n_messages_of_artifact_and_level[(new_log_entry[0], log_level)] += 1
+
+        if cls.max_messages is not None and len(cls.log) > cls.max_messages:
+            oldest_log_entry = cls.log.pop(next(iter(cls.log)))
+            cls._log_entries[oldest_log_entry] -= 1
+            if cls._log_entries[oldest_log_entry] == 0:
+                del cls._log_entries[oldest_log_entry]
+
+        if cls.log_stream is not None:
+            cls.log_stream.write(json.dumps(cls._log_entry_to_json(new_log_entry)) + "\n")
 
         cls.curr_message += 1
         if cls.no_print:
@@ -265,7 +308,7 @@ class Logger:
         ret = list()
         for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
             if (level == logLevel if level is not None else True) and (node if node is not None else True) and (node_artifact_name == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
+                ret.append((node, logLevel, str(message)))
 
         return ret
 
@@ -283,7 +326,7 @@ class Logger:
         ret = list()
         for (artifactName, node, logLevel, code, errorPosition, message) in cls.log.values():
             if level == logLevel:
-                ret.append((node, logLevel, message))
+                ret.append((node, logLevel, str(message)))
 
         return ret
 
@@ -302,10 +345,31 @@ class Logger:
         for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
             if (node_i == node if node is not None else True) and \
                     (node.get_artifact_name() == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
+                ret.append((node, logLevel, str(message)))
 
         return ret
 
+    @classmethod
+    def get_number_of_messages_of_level_and_or_node(cls, node: Union[ASTNode, str], level: LoggingLevel) -> int:
+        """
+        Returns the number of messages which have a certain logging level, or have been reported for a certain node, or both, that is, the number of messages returned by ``get_all_messages_of_level_and_or_node()``. Messages that were dropped from the log because of ``max_messages`` are counted as well.
+
+        :param node: a single node instance
+        :param level: a logging level
+        :return: the number of messages
+        """
+        if node is None or isinstance(node, str):
+            # as in ``get_all_messages_of_level_and_or_node()``, messages are not filtered by artifact name
+            if level is None:
+                return sum(cls._n_messages_of_level.values())
+
+            return cls._n_messages_of_level[level]
+
+        if level is None:
+            return sum(n for (artifact_name, _), n in cls._n_messages_of_artifact_and_level.items() if artifact_name is None)
+
+        return cls._n_messages_of_artifact_and_level[(None, level)]
+
     @classmethod
     def has_errors(cls, node: ASTNode) -> bool:
         """
@@ -314,7 +378,23 @@ class Logger:
         :param node: a single node instance.
         :return: True if errors detected, otherwise False
         """
-        return len(cls.get_all_messages_of_level_and_or_node(node, LoggingLevel.ERROR)) > 0
+        return cls.get_number_of_messages_of_level_and_or_node(node, LoggingLevel.ERROR) > 0
+
+    @classmethod
+    def _log_entry_to_json(cls, log_entry) -> Dict[str, str]:
+        (artifact_name, node, log_level, code, error_position, message) = log_entry
+        ret = OrderedDict()
+        ret["filename"] = artifact_name
+        ret["nodeName"] = node.get_name() if node is not None else "GLOBAL"
+        ret["severity"] = str(log_level.name)
+        if code is not None:
+            ret["code"] = code.name
+
+        ret["row"] = str(error_position.get_start_line()) if error_position is not None else ""
+        ret["col"] = str(error_position.get_start_column()) if error_position is not None else ""
+        ret["message"] = str(message).replace('"', "'")
+
+        return ret
 
     @classmethod
     def get_json_format(cls) -> str:
@@ -322,36 +402,4 @@ class Logger:
         Returns the log in a format which can be used to be stored to a file.
         :return: a string containing the log
         """
-        ret = '['
-        for messageNr in cls.log.keys():
-            (artifactName, node, logLevel, code, errorPosition, message) = cls.log[messageNr]
-            ret += '{' + \
-                   '"filename":"' + \
-                   artifactName + \
-                   '", ' + \
-                   '"nodeName":"' + \
-                   (node.get_name() if node is not None else 'GLOBAL') + '", ' + \
-                   '"severity":"' \
-                   + str(logLevel.name) + '", '
-
-            if code is not None:
-                ret += '"code":"' + \
-                       code.name + \
-                       '", '
-            ret += '"row":"' + \
-                   (str(errorPosition.get_start_line()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"col":"' \
-                   + (str(errorPosition.get_start_column()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"message":"' + str(message).replace('"', "'") + '"}'
-            ret += ','
-
-        if len(cls.log.keys()) == 0:
-            parsed = json.loads('[]', object_pairs_hook=OrderedDict)
-        else:
-            ret = ret[:-1]  # delete the last ","
-            ret += ']'
-            parsed = json.loads(ret, object_pairs_hook=OrderedDict)
-
-        return json.dumps(parsed, indent=2, sort_keys=False)
+        return json.dumps([cls._log_entry_to_json(log_entry) for log_entry in cls.log.values()], indent=2, sort_keys=False)
@@ -36,8 +36,7 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.utils.ast_mechanism_information_collector import ASTMechanismInformationCollector
 from pynestml.utils.ast_utils import ASTUtils
-
-from odetoolbox import analysis
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
 
 
 class MechanismProcessing:
@@ -107,7 +106,7 @@ class MechanismProcessing:
         """calls ode-toolbox for each ode individually and collects the raw output"""
         for mechanism_name, mechanism_info in mechs_info.items():
             for ode_variable_name, ode_info in mechanism_info["ODEs"].items():
-                solver_result = analysis(ode_info["ode_toolbox_input"], disable_stiffness_check=True)
+                solver_result = ODEToolboxCache.analysis(ode_info["ode_toolbox_input"], disable_stiffness_check=True)
                 mechs_info[mechanism_name]["ODEs"][ode_variable_name]["ode_toolbox_output"] = solver_result
 
         return mechs_info
@@ -25,10 +25,9 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.utils.ast_vector_parameter_setter_and_printer_factory import ASTVectorParameterSetterAndPrinterFactory
-from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.utils.ast_utils import ASTUtils
-from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
 from pynestml.visitors.ast_visitor import ASTVisitor
 
 
@@ -68,7 +67,7 @@ class MechsInfoEnricher:
                                 variable_name,
                                 SymbolKind.VARIABLE)
 
-                        expression = ModelParser.parse_expression(rhs_str)
+                        expression = ODEToolboxUtils.parse_expression(rhs_str)
                         # pretend that update expressions are in "equations" block,
                         # which should always be present, as synapses have been
                         # defined to get here
@@ -96,7 +95,7 @@ class MechsInfoEnricher:
                         variable = neuron.get_equations_blocks()[0].get_scope().resolve_to_symbol(variable_name,
                                                                                                   SymbolKind.VARIABLE)
 
-                        expression = ModelParser.parse_expression(rhs_str)
+                        expression = ODEToolboxUtils.parse_expression(rhs_str)
                         # pretend that update expressions are in "equations" block,
                         # which should always be present, as synapses have been
                         # defined to get here
@@ -105,14 +104,13 @@ class MechsInfoEnricher:
 
                         update_expr_str = ode_info["ode_toolbox_output"][ode_solution_index]["update_expressions"][
                             variable_name]
-                        update_expr_ast = ModelParser.parse_expression(
+                        update_expr_ast = ODEToolboxUtils.parse_expression(
                             update_expr_str)
                         # pretend that update expressions are in "equations" block,
                         # which should always be present, as differential equations
                         # must have been defined to get here
                         update_expr_ast.update_scope(
                             neuron.get_scope())
-                        update_expr_ast.accept(ASTParentVisitor())
                         update_expr_ast.accept(ASTSymbolTableVisitor())
                         neuron.accept(ASTSymbolTableVisitor())
 
@@ -124,8 +122,6 @@ class MechsInfoEnricher:
 
                     mechanism_info["ODEs"][ode_var_name]["transformed_solutions"].append(solution_transformed)
 
-        neuron.accept(ASTParentVisitor())
-
         return mechs_info
 
     @classmethod
@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Callable, List, Tuple, Union
 
 from collections.abc import Iterable
 from enum import Enum
@@ -144,6 +144,51 @@ class MessageCode(Enum):
     WEIGHT_VARIABLE_NOT_SPECIFIED = 119
     DELAY_VARIABLE_NOT_FOUND = 120
     WEIGHT_VARIABLE_NOT_FOUND = 121
+    PARSE_CACHE_HIT = 122
+    ODE_TOOLBOX_CACHE_STATISTICS = 123
+    PARALLEL_GENERATION_NOT_SUPPORTED = 124
+    LOOP_INVARIANT_EXPRESSIONS_HOISTED = 125
+
+
+class DeferredMessage:
+    """
+    A message that is only formatted when it is converted to a string, for instance when it is printed or stored to a file. If the message is not needed, for instance because the log is frozen or the logging level is such that it is not printed, it is never formatted.
+
+    The message is formatted either by calling ``get_message(*args)``, which returns a message string or a (code, message) tuple as returned by the methods of ``Messages``, or by ``get_message.format(*args)`` if ``get_message`` is a string. Two deferred messages are equal if they are formatted by the same function (or format string) from equal arguments, so that duplicate messages can be detected without formatting them.
+    """
+
+    __slots__ = ("_get_message", "_args", "_message")
+
+    def __init__(self, get_message: Union[str, Callable], *args):
+        self._get_message = get_message
+        self._args = args
+        self._message = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            if isinstance(self._get_message, str):
+                self._message = self._get_message.format(*self._args)
+            else:
+                message = self._get_message(*self._args)
+                self._message = message[1] if isinstance(message, tuple) else message
+
+        return self._message
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DeferredMessage):
+            return NotImplemented
+
+        return self._get_message == other._get_message and self._args == other._args
+
+    def __hash__(self) -> int:
+        try:
+            return hash((self._get_message, self._args))
+        except TypeError:
+            # some of the arguments (for instance, template type symbols) are not hashable
+            return hash(self._get_message)
 
 
 class Messages:
@@ -164,6 +209,27 @@ class Messages:
         message = 'Start processing \'' + file_path + '\'!'
         return MessageCode.START_PROCESSING_FILE, message
 
+    @classmethod
+    def get_parse_cache_hit(cls, file_path: str) -> Tuple[MessageCode, str]:
+        message = "Loaded AST of '" + file_path + "' from parse cache"
+        return MessageCode.PARSE_CACHE_HIT, message
+
+    @classmethod
+    def get_ode_toolbox_cache_statistics(cls, hits: int, misses: int) -> Tuple[MessageCode, str]:
+        message = "ODE-toolbox analysis cache: " + str(hits) + " hit(s), " + str(misses) + " miss(es)"
+        return MessageCode.ODE_TOOLBOX_CACHE_STATISTICS, message
+
+    @classmethod
+    def get_parallel_generation_not_supported(cls, reason: str) -> Tuple[MessageCode, str]:
+        message = "Cannot generate code in parallel (" + reason + "); falling back to a single process"
+        return MessageCode.PARALLEL_GENERATION_NOT_SUPPORTED, message
+
+    @classmethod
+    def get_loop_invariant_expressions_hoisted(cls, model_name: str, hoisted_expressions: List[Tuple[str, str]]) -> Tuple[MessageCode, str]:
+        message = "Moved " + str(len(hoisted_expressions)) + " loop-invariant expression(s) of model '" + model_name + "' into the internals block: " \
+            + ", ".join(variable_name + " = " + expr for variable_name, expr in hoisted_expressions)
+        return MessageCode.LOOP_INVARIANT_EXPRESSIONS_HOISTED, message
+
     @classmethod
     def get_input_path_not_found(cls, path):
         message = 'Input path ("%s") not found!' % (path)
@@ -275,12 +341,18 @@ class Messages:
         Returns a message indicating that the type of the lhs does not correspond to the one of the rhs, but the rhs
         can be cast down to lhs type.
         :param rhs_type: the type of the rhs
-        :type rhs_type: str
+        :type rhs_type: Union[str, TypeSymbol]
         :param lhs_type: the type of the lhs
-        :type lhs_type: str
+        :type lhs_type: Union[str, TypeSymbol]
         :return: a message
         :rtype:(MessageCode,str)
         """
+        if not isinstance(rhs_type, str):
+            rhs_type = rhs_type.print_symbol()
+
+        if not isinstance(lhs_type, str):
+            lhs_type = lhs_type.print_symbol()
+
         message = 'Implicit casting from (compatible) type \'%s\' to \'%s\'.' % (
             rhs_type, lhs_type)
         return MessageCode.IMPLICIT_CAST, message
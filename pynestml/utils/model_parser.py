@@ -19,9 +19,12 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from antlr4 import CommonTokenStream, FileStream, InputStream
+import os
+
+from antlr4 import CommonTokenStream, FileStream, InputStream, ParserRuleContext
+from antlr4.atn.PredictionMode import PredictionMode
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
 from antlr4.error.Errors import ParseCancellationException
@@ -70,11 +73,12 @@ from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.error_listener import NestMLErrorListener
 from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
+from pynestml.utils.parse_cache import ParseCache
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.assign_implicit_conversion_factors_visitor import AssignImplicitConversionFactorsVisitor
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
-from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
 
@@ -89,15 +93,59 @@ class ModelParser:
         :rtype: ASTNestMLCompilationUnit
         """
         try:
+            with open(file_path, "rb") as f:
+                content = f.read()
             input_file = FileStream(file_path, encoding='utf-8')
         except IOError:
             code, message = Messages.get_input_path_not_found(path=file_path)
             Logger.log_message(node=None, code=None, message=message,
                                error_position=None, log_level=LoggingLevel.ERROR)
             return
-        code, message = Messages.get_start_processing_file(file_path)
-        Logger.log_message(node=None, code=code, message=message, error_position=None, log_level=LoggingLevel.INFO)
+        message = DeferredMessage(Messages.get_start_processing_file, file_path)
+        Logger.log_message(node=None, code=MessageCode.START_PROCESSING_FILE, message=message, error_position=None, log_level=LoggingLevel.INFO)
+
+        from pynestml.frontend.frontend_configuration import FrontendConfiguration
+        cache_key = ParseCache.compute_key(file_path, content, FrontendConfiguration.suffix)
+        ast = ParseCache.load(cache_key)
+        if ast is not None:
+            code, message = Messages.get_parse_cache_hit(file_path)
+            Logger.log_message(node=None, code=code, message=message, error_position=None, log_level=LoggingLevel.DEBUG)
+        else:
+            n_messages = len(Logger.get_log())
+            with Profiler.phase("parse", name=os.path.basename(file_path)):
+                ast = cls._parse_and_build(input_file)
+            if ast is None:
+                return
+
+            if len(Logger.get_log()) == n_messages:
+                # only cache models for which building the AST did not produce any messages, as these would not be reproduced when loading from the cache
+                ParseCache.store(cache_key, ast)
+
+        # create and update the corresponding symbol tables
+        SymbolTable.initialize_symbol_table(ast.get_source_position())
+        for model in ast.get_model_list():
+            with Profiler.phase("symbol_table", model=model.get_name()):
+                model.accept(ASTSymbolTableVisitor())
+                SymbolTable.add_model_scope(model.get_name(), model.get_scope())
+                Logger.set_current_node(model)
+                model.accept(AssignImplicitConversionFactorsVisitor())
+                Logger.set_current_node(None)
+
+        # store source paths
+        for model in ast.get_model_list():
+            model.file_path = file_path
+
+        ast.file_path = file_path
 
+        return ast
+
+    @classmethod
+    def _parse_and_build(cls, input_file: FileStream) -> Optional[ASTNestMLCompilationUnit]:
+        """
+        Runs the lexer and parser on the handed over input, and builds the AST from the parse tree.
+        :param input_file: the input stream of the model file
+        :return: a new compilation unit, or None if a lexer or parser error occurred
+        """
         # create a lexer and hand over the input
         lexer = PyNestMLLexer()
         lexer.removeErrorListeners()
@@ -124,10 +172,8 @@ class ModelParser:
         parser.removeErrorListeners()
         parserErrorListener = NestMLErrorListener()
         parser.addErrorListener(parserErrorListener)
-        # parser._errHandler = BailErrorStrategy()	# N.B. uncomment this line and the next to halt immediately on parse errors
-        # parser._errHandler.reset(parser)
         parser.setTokenStream(stream)
-        compilation_unit = parser.nestMLCompilationUnit()
+        compilation_unit = parse_two_stage(parser, PyNestMLParser.nestMLCompilationUnit)
         if parserErrorListener._error_occurred:
             error_location = ASTSourceLocation(parserErrorListener.line,
                                                parserErrorListener.column,
@@ -140,43 +186,51 @@ class ModelParser:
 
         # create a new visitor and return the new AST
         ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
-        ast = ast_builder_visitor.visit(compilation_unit)
-
-        # create links back from children in the tree to their parents
-        for model in ast.get_model_list():
-            model.parent_ = None   # root node has no parent
-            model.accept(ASTParentVisitor())
-
-        # create and update the corresponding symbol tables
-        SymbolTable.initialize_symbol_table(ast.get_source_position())
-        for model in ast.get_model_list():
-            model.accept(ASTSymbolTableVisitor())
-            SymbolTable.add_model_scope(model.get_name(), model.get_scope())
-            Logger.set_current_node(model)
-            model.accept(AssignImplicitConversionFactorsVisitor())
-            Logger.set_current_node(None)
 
-        # store source paths
-        for model in ast.get_model_list():
-            model.file_path = file_path
-
-        ast.file_path = file_path
-
-        return ast
+        return ast_builder_visitor.visit(compilation_unit)
 
     @classmethod
     def parse_expression(cls, string):
         # type: (str) -> ASTExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.expression())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.expression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
+    @classmethod
+    def parse_expressions(cls, strings: Iterable[str]) -> List[Union[ASTExpression, ASTSimpleExpression]]:
+        r"""
+        Parses a batch of expressions. The lexer and parser are created once and reused for all expressions, and each distinct expression string is parsed only once; for repeated strings, a clone of the expression is returned.
+        :param strings: the expressions to parse
+        :return: the parsed expressions, in the same order
+        """
+        lexer = PyNestMLLexer()
+        parser = PyNestMLParser(None)
+        parser.addErrorListener(BailConsoleErrorListener())
+
+        parsed: Dict[str, Union[ASTExpression, ASTSimpleExpression]] = {}
+        expressions = []
+        for string in strings:
+            if string in parsed.keys():
+                expressions.append(parsed[string].clone())
+                continue
+
+            lexer.inputStream = InputStream(string)
+            stream = CommonTokenStream(lexer)
+            stream.fill()
+            parser.setTokenStream(stream)
+            ret = ASTBuilderVisitor(stream.tokens).visit(parse_two_stage(parser, PyNestMLParser.expression))
+            ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
+            parsed[string] = ret
+            expressions.append(ret)
+
+        return expressions
+
     @classmethod
     def parse_declaration(cls, string):
         # type: (str) -> ASTDeclaration
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.declaration())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.declaration))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -184,7 +238,7 @@ class ModelParser:
     def parse_stmt(cls, string):
         # type: (str) -> ASTStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.stmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -192,7 +246,7 @@ class ModelParser:
     def parse_assignment(cls, string):
         # type: (str) -> ASTAssignment
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.assignment())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.assignment))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -200,7 +254,7 @@ class ModelParser:
     def parse_bit_operator(cls, string):
         # type: (str) -> ASTArithmeticOperator
         builder, parser = tokenize(string)
-        ret = builder.visit(parser.bitOperator())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.bitOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -208,14 +262,14 @@ class ModelParser:
     def parse_block_with_variables(cls, string):
         # type: (str) -> ASTBlockWithVariables
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.blockWithVariables())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.blockWithVariables))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_model_body(cls, string: str) -> ASTModelBody:
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.modelBody())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.modelBody))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -223,7 +277,7 @@ class ModelParser:
     def parse_comparison_operator(cls, string):
         # type: (str) -> ASTComparisonOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.comparisonOperator())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.comparisonOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -231,7 +285,7 @@ class ModelParser:
     def parse_compound_stmt(cls, string):
         # type: (str) -> ASTCompoundStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.compoundStmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.compoundStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -239,7 +293,7 @@ class ModelParser:
     def parse_data_type(cls, string):
         # type: (str) -> ASTDataType
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.dataType())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.dataType))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -247,7 +301,7 @@ class ModelParser:
     def parse_elif_clause(cls, string):
         # type: (str) -> ASTElifClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elifClause())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.elifClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -255,7 +309,7 @@ class ModelParser:
     def parse_else_clause(cls, string):
         # type: (str) -> ASTElseClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elseClause())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.elseClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -263,7 +317,7 @@ class ModelParser:
     def parse_equations_block(cls, string):
         # type: (str) -> ASTEquationsBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.equationsBlock())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.equationsBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -271,7 +325,7 @@ class ModelParser:
     def parse_for_stmt(cls, string):
         # type: (str) -> ASTForStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.forStmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.forStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -279,7 +333,7 @@ class ModelParser:
     def parse_function(cls, string):
         # type: (str) -> ASTFunction
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.function())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.function))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -287,7 +341,7 @@ class ModelParser:
     def parse_function_call(cls, string):
         # type: (str) -> ASTFunctionCall
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.functionCall())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.functionCall))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -295,7 +349,7 @@ class ModelParser:
     def parse_if_clause(cls, string):
         # type: (str) -> ASTIfClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifClause())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.ifClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -303,7 +357,7 @@ class ModelParser:
     def parse_if_stmt(cls, string):
         # type: (str) -> ASTIfStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifStmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.ifStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -311,7 +365,7 @@ class ModelParser:
     def parse_input_block(cls, string):
         # type: (str) -> ASTInputBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputBlock())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.inputBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -319,7 +373,7 @@ class ModelParser:
     def parse_input_port(cls, string):
         # type: (str) -> ASTInputPort
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputPort())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.inputPort))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -327,7 +381,7 @@ class ModelParser:
     def parse_input_qualifier(cls, string):
         # type: (str) -> ASTInputQualifier
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputQualifier())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.inputQualifier))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -335,7 +389,7 @@ class ModelParser:
     def parse_logic_operator(cls, string):
         # type: (str) -> ASTLogicalOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.logicalOperator())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.logicalOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -343,7 +397,7 @@ class ModelParser:
     def parse_nestml_compilation_unit(cls, string):
         # type: (str) -> ASTNestMLCompilationUnit
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.nestMLCompilationUnit())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.nestMLCompilationUnit))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -351,7 +405,7 @@ class ModelParser:
     def parse_model(cls, string):
         # type: (str) -> ASTModel
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.model())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.model))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -359,7 +413,7 @@ class ModelParser:
     def parse_ode_equation(cls, string):
         # type: (str) -> ASTOdeEquation
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeEquation())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.odeEquation))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -367,7 +421,7 @@ class ModelParser:
     def parse_inline_expression(cls, string):
         # type: (str) -> ASTInlineExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inlineExpression())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.inlineExpression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -375,7 +429,7 @@ class ModelParser:
     def parse_kernel(cls, string):
         # type: (str) -> ASTKernel
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.kernel())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.kernel))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -383,7 +437,7 @@ class ModelParser:
     def parse_output_block(cls, string):
         # type: (str) -> ASTOutputBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.outputBlock())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.outputBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -391,7 +445,7 @@ class ModelParser:
     def parse_parameter(cls, string):
         # type: (str) -> ASTParameter
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.parameter())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.parameter))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -399,7 +453,7 @@ class ModelParser:
     def parse_return_stmt(cls, string):
         # type: (str) -> ASTReturnStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.returnStmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.returnStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -407,7 +461,7 @@ class ModelParser:
     def parse_simple_expression(cls, string):
         # type: (str) -> ASTSimpleExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.simpleExpression())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.simpleExpression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -415,7 +469,7 @@ class ModelParser:
     def parse_small_stmt(cls, string):
         # type: (str) -> ASTSmallStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.smallStmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.smallStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -423,7 +477,7 @@ class ModelParser:
     def parse_unary_operator(cls, string):
         # type: (str) -> ASTUnaryOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unaryOperator())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.unaryOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -431,7 +485,7 @@ class ModelParser:
     def parse_unit_type(cls, string):
         # type: (str) -> ASTUnitType
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unitType())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.unitType))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -439,7 +493,7 @@ class ModelParser:
     def parse_update_block(cls, string):
         # type: (str) -> ASTUpdateBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.updateBlock())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.updateBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -447,7 +501,7 @@ class ModelParser:
     def parse_variable(cls, string):
         # type: (str) -> ASTVariable
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.variable())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.variable))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -455,7 +509,7 @@ class ModelParser:
     def parse_while_stmt(cls, string):
         # type: (str) -> ASTWhileStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.whileStmt())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.whileStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -463,7 +517,7 @@ class ModelParser:
     def parse_stmts_body(cls, string):
         # type: (str) -> ASTStmtsBody
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmtsBody())
+        ret = builder.visit(parse_two_stage(parser, PyNestMLParser.stmtsBody))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -490,5 +544,36 @@ def tokenize(string: str) -> Tuple[ASTBuilderVisitor, PyNestMLParser]:
     return builder, parser
 
 
+def parse_two_stage(parser: PyNestMLParser, rule: Callable[[PyNestMLParser], ParserRuleContext]) -> ParserRuleContext:
+    r"""
+    Parse the input of the handed over parser, starting from the given grammar rule.
+
+    Parsing is first attempted using SLL prediction, halting immediately on the first syntax error, without notifying the error listeners. This is much faster than full LL prediction, and succeeds for nearly all inputs. Only if it fails (either because of a syntax error, or because the input requires full LL prediction), the input is parsed again using full LL prediction and the error strategy and error listeners that were set on the parser, so that syntax errors are reported exactly as in a single LL pass.
+
+    :param parser: the parser, with the token stream set
+    :param rule: the parser method of the grammar rule to start from, e.g. ``PyNestMLParser.expression``
+    :return: the parse tree
+    """
+    error_handler = parser._errHandler
+    error_listeners = parser._listeners
+
+    parser._listeners = []
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return rule(parser)
+    except ParseCancellationException:
+        pass
+    finally:
+        parser._listeners = error_listeners
+        parser._errHandler = error_handler
+        parser._interp.predictionMode = PredictionMode.LL
+
+    # rewind the token stream and parse again using full LL prediction
+    parser.reset()
+
+    return rule(parser)
+
+
 def log_set_added_source_position(node):
     node.set_source_position(ASTSourceLocation.get_added_source_position())
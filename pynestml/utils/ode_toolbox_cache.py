@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+#
+# ode_toolbox_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import hashlib
+import importlib.metadata
+import json
+
+from pynestml.utils.disk_cache import DiskCache
+
+
+class ODEToolboxCache(DiskCache):
+    r"""
+    Persistent on-disk cache for ODE-toolbox analysis results.
+
+    ``ODEToolboxCache.analysis()`` is a drop-in replacement for ``odetoolbox.analysis()``. Results are keyed by a hash of the canonicalised (JSON, with sorted keys) input dictionary, the solver flags and the installed ODE-toolbox version, so that regenerating an unchanged model does not invoke sympy at all.
+
+    Attributes:
+        hits            Number of analysis calls that were answered from the cache.
+        misses          Number of analysis calls that invoked ODE-toolbox.
+    """
+    CACHE_NAME_ = "ode_toolbox_cache"
+    FILE_EXTENSION_ = ".json"
+
+    # keyword arguments to ``odetoolbox.analysis()`` that do not influence the result
+    _IGNORED_KWARGS_ = ["log_level"]
+
+    hits = 0
+    misses = 0
+
+    _odetoolbox_version = None
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def get_odetoolbox_version(cls) -> str:
+        if cls._odetoolbox_version is None:
+            try:
+                cls._odetoolbox_version = importlib.metadata.version("odetoolbox")
+            except importlib.metadata.PackageNotFoundError:
+                cls._odetoolbox_version = "unknown"
+
+        return cls._odetoolbox_version
+
+    @classmethod
+    def compute_key(cls, indict: Mapping[str, Any], kwargs: Mapping[str, Any]) -> str:
+        r"""
+        Compute the cache key for an ODE-toolbox invocation.
+
+        :param indict: the ODE-toolbox input dictionary
+        :param kwargs: the keyword arguments passed to ``odetoolbox.analysis()``
+        :return: the key as hexadecimal string
+        """
+        flags = {k: v for k, v in kwargs.items() if k not in cls._IGNORED_KWARGS_}
+        canonical_input = json.dumps([cls.get_odetoolbox_version(), indict, flags], sort_keys=True, default=str)
+
+        return hashlib.sha256(canonical_input.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def analysis(cls, indict: Mapping[str, Any], **kwargs) -> List[Dict]:
+        r"""
+        Run ODE-toolbox analysis on the given input, or retrieve the result from the cache if the same analysis has been performed before.
+
+        :param indict: the ODE-toolbox input dictionary
+        :param kwargs: keyword arguments passed on to ``odetoolbox.analysis()``
+        :return: the list of solver dictionaries, as returned by ``odetoolbox.analysis()``
+        """
+        key = cls.compute_key(indict, kwargs)
+
+        data = cls._read_entry(key)
+        if data is not None:
+            try:
+                solver_result = json.loads(data.decode("utf-8"))
+                cls.hits += 1
+                return solver_result
+            except ValueError:
+                # corrupted entry: remove it and treat as a miss
+                cls._remove_entry(key)
+
+        cls.misses += 1
+
+        import odetoolbox
+        solver_result = odetoolbox.analysis(indict, **kwargs)
+
+        try:
+            data = json.dumps(solver_result).encode("utf-8")
+        except (TypeError, ValueError):
+            # result cannot be represented in JSON; do not cache
+            return solver_result
+
+        cls._write_entry(key, data)
+
+        # return the result in the same form as it would be retrieved from the cache
+        return json.loads(data.decode("utf-8"))
+
+    @classmethod
+    def analysis_with_numeric_solver(cls, indict: Mapping[str, Any], **kwargs) -> Tuple[List[Dict], Optional[Dict]]:
+        r"""
+        Run ODE-toolbox analysis like ``analysis()``, and additionally return a numeric solver that integrates all state variables (including the analytically solvable ones), as would be obtained from a second analysis with ``disable_analytic_solver=True``.
+
+        The all-numeric solver is derived from the system of equations that was constructed during the first analysis, so that the input is only processed, and propagators only derived, once.
+
+        :param indict: the ODE-toolbox input dictionary
+        :param kwargs: keyword arguments passed on to ``odetoolbox.analysis()``
+        :return: a tuple of the list of solver dictionaries (as returned by ``odetoolbox.analysis()``) and the all-numeric solver dictionary (None if no numeric solver is required)
+        """
+        key = cls.compute_key(indict, {**kwargs, "__numeric_solver__": True})
+
+        data = cls._read_entry(key)
+        if data is not None:
+            try:
+                solver_result, numeric_solver = json.loads(data.decode("utf-8"))
+                cls.hits += 1
+                return solver_result, numeric_solver
+            except ValueError:
+                # corrupted entry: remove it and treat as a miss
+                cls._remove_entry(key)
+
+        cls.misses += 1
+        solver_result, numeric_solver = cls._analysis_with_numeric_solver(indict, **kwargs)
+
+        try:
+            data = json.dumps([solver_result, numeric_solver]).encode("utf-8")
+        except (TypeError, ValueError):
+            # result cannot be represented in JSON; do not cache
+            return solver_result, numeric_solver
+
+        cls._write_entry(key, data)
+
+        # return the result in the same form as it would be retrieved from the cache
+        solver_result, numeric_solver = json.loads(data.decode("utf-8"))
+
+        return solver_result, numeric_solver
+
+    @classmethod
+    def _analysis_with_numeric_solver(cls, indict: Mapping[str, Any], **kwargs) -> Tuple[List[Dict], Optional[Dict]]:
+        import odetoolbox
+        import sympy
+
+        try:
+            from odetoolbox import _find_variable_definition, _get_all_first_order_variables
+            from odetoolbox.config import Config
+            from odetoolbox.shapes import Shape
+            _analysis = odetoolbox._analysis
+        except (ImportError, AttributeError):
+            # this version of ODE-toolbox does not expose the system of equations; fall back to a second analysis pass
+            return cls._analysis_with_numeric_solver_two_pass(indict, **kwargs)
+
+        solver_result, shape_sys, shapes = _analysis(indict, **kwargs)
+
+        numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
+        if not numeric_solvers:
+            return solver_result, None
+
+        if len(numeric_solvers) == len(solver_result):
+            # there is no analytic solver, so the numeric solver already integrates all state variables
+            return solver_result, numeric_solvers[0]
+
+        if not kwargs.get("disable_stiffness_check", False):
+            # the stiffness test can only be performed as part of a full analysis
+            return solver_result, cls._get_numeric_solver(odetoolbox.analysis(indict, **{**kwargs, "disable_analytic_solver": True}))
+
+        # generate the numeric solver for the complete system, as ODE-toolbox does with ``disable_analytic_solver=True``
+        numeric_solver = shape_sys.get_sub_system(shape_sys.x_).generate_numeric_solver(state_variables=shape_sys.x_)
+        numeric_solver["solver"] = "numeric"
+
+        # copy the initial values from the input to the output
+        differential_order_symbol = Config().differential_order_symbol
+        numeric_solver["initial_values"] = {}
+        for shape in shapes:
+            for i in range(shape.order):
+                sym = str(sympy.Symbol(str(shape.symbol) + differential_order_symbol * i))
+                if sym in numeric_solver["state_variables"]:
+                    numeric_solver["initial_values"][sym] = str(shape.get_initial_value(sym.replace(differential_order_symbol, "'")))
+
+        # copy the values of those parameters that are used in the update expressions
+        if "parameters" in indict.keys():
+            numeric_solver["parameters"] = {}
+            used_symbols = set()
+            for expr in numeric_solver["update_expressions"].values():
+                used_symbols |= set([str(sym) for sym in expr.atoms()])
+
+            for param_name, param_expr in indict["parameters"].items():
+                if param_name in used_symbols:
+                    # ``parse_expr()`` adds ``__builtins__`` to the dict it is given, so pass a copy of ODE-toolbox's shared globals
+                    sympy_expr = sympy.parsing.sympy_parser.parse_expr(param_expr, global_dict=dict(Shape._sympy_globals))
+                    numeric_solver["parameters"][param_name] = str(sympy_expr.n())
+
+        # convert expressions from sympy to string
+        preserve_expressions = kwargs.get("preserve_expressions", False)
+        if type(preserve_expressions) is bool:
+            preserve_expressions = _get_all_first_order_variables(indict) if preserve_expressions else []
+
+        for sym, expr in numeric_solver["update_expressions"].items():
+            if sym in preserve_expressions:
+                numeric_solver["update_expressions"][sym] = _find_variable_definition(indict, sym, order=1).replace("'", differential_order_symbol)
+            else:
+                numeric_solver["update_expressions"][sym] = str(expr)
+
+        return solver_result, numeric_solver
+
+    @classmethod
+    def _analysis_with_numeric_solver_two_pass(cls, indict: Mapping[str, Any], **kwargs) -> Tuple[List[Dict], Optional[Dict]]:
+        import odetoolbox
+
+        solver_result = odetoolbox.analysis(indict, **kwargs)
+
+        numeric_solver = cls._get_numeric_solver(solver_result)
+        if numeric_solver is not None and len(solver_result) > 1:
+            numeric_solver = cls._get_numeric_solver(odetoolbox.analysis(indict, **{**kwargs, "disable_analytic_solver": True}))
+
+        return solver_result, numeric_solver
+
+    @classmethod
+    def _get_numeric_solver(cls, solver_result: Sequence[Dict]) -> Optional[Dict]:
+        numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
+        assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
+        if len(numeric_solvers) > 0:
+            return numeric_solvers[0]
+
+        return None
@@ -19,8 +19,13 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Dict, Union
+
 import sympy
-from sympy.printing.str import StrPrinter
+
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.utils.sympy_to_ast_converter import NESTMLSympyPrinter, SympyToASTConverter
 
 
 class ODEToolboxUtils:
@@ -28,33 +33,66 @@ class ODEToolboxUtils:
     A collection of helpful methods for interfacing with ODE-toolbox.
     """
 
+    _sympy_globals_no_functions = {"Symbol": sympy.Symbol,
+                                   "Integer": sympy.Integer,
+                                   "Float": sympy.Float,
+                                   "Function": sympy.Function}
+
+    # the classes that ``sympy.parsing.sympy_parser.parse_expr()`` uses to build unevaluated expressions
+    _sympy_globals_unevaluated = {**_sympy_globals_no_functions,
+                                  "Add": sympy.Add,
+                                  "Mul": sympy.Mul,
+                                  "Pow": sympy.Pow,
+                                  "Lt": sympy.Lt,
+                                  "Le": sympy.Le,
+                                  "Gt": sympy.Gt,
+                                  "Ge": sympy.Ge,
+                                  "Eq": sympy.Eq,
+                                  "Ne": sympy.Ne,
+                                  "And": sympy.And,
+                                  "Or": sympy.Or,
+                                  "Not": sympy.Not}
+
+    # sympy expressions that were printed by ``print_expression()``, by their string representation
+    _printed_expressions: Dict[str, sympy.Basic] = {}
+
     @classmethod
     def _rewrite_piecewise_into_ternary(cls, s: str) -> str:
         r"""Rewrite calls to ``Piecewise((expr_if_true, cond), (expr_if_false, True))`` in sympy syntax to ``cond ? expr_if_true : expr_if_false`` in NESTML syntax.
         """
+        sympy_expr = sympy.parsing.sympy_parser.parse_expr(s, global_dict=dict(cls._sympy_globals_no_functions))
+
+        return NESTMLSympyPrinter().doprint(sympy_expr)
 
-        _sympy_globals_no_functions = {"Symbol": sympy.Symbol,
-                                       "Integer": sympy.Integer,
-                                       "Float": sympy.Float,
-                                       "Function": sympy.Function}
+    @classmethod
+    def print_expression(cls, expr: sympy.Basic) -> str:
+        r"""Print a sympy expression in the syntax returned by ODE-toolbox, for instance to replace an expression in a solver dictionary. The expression is remembered, so that ``parse_expression()`` converts it directly instead of parsing the string.
+        """
+        s = str(expr)
+        cls._printed_expressions[s] = expr
 
-        sympy_expr = sympy.parsing.sympy_parser.parse_expr(s, global_dict=_sympy_globals_no_functions)
+        return s
 
-        class MySympyPrinter(StrPrinter):
-            """Resulting expressions will be parsed by NESTML parser. R
-            """
-            def _print_Function(self, expr):
-                if expr.func.__name__ == "Piecewise":
-                    assert len(expr.args) == 2, "Can only handle two-part piecewise conditional function"
-                    cond = self.doprint(expr.args[0][1])
-                    cond_always_true = expr.args[1][1]
-                    assert cond_always_true == sympy.true
-                    expr_if_true = self.doprint(expr.args[0][0])
-                    expr_if_false = self.doprint(expr.args[1][0])
-                    return "((" + cond + ") ? (" + expr_if_true + ") : (" + expr_if_false + "))"
+    @classmethod
+    def clear_printed_expressions(cls) -> None:
+        r"""Forget the expressions that were printed by ``print_expression()``.
+        """
+        cls._printed_expressions = {}
 
-                return super()._print_Function(expr)
+    @classmethod
+    def parse_expression(cls, s: str) -> Union[ASTExpression, ASTSimpleExpression]:
+        r"""Parse an expression in sympy syntax, as returned by ODE-toolbox, into a NESTML expression. Calls to ``Piecewise((expr_if_true, cond), (expr_if_false, True))`` are rewritten to ``cond ? expr_if_true : expr_if_false``.
 
-        s_reformatted = MySympyPrinter().doprint(sympy_expr)
+        The string is parsed by sympy without evaluating it, so that the expression is not simplified (for instance, ``2*3`` is not replaced by ``6``), and converted into the NESTML AST directly, which is much faster than parsing it using the NESTML parser. If the string was printed by ``print_expression()``, the sympy expression is converted without parsing the string at all.
+        """
+        sympy_expr = cls._printed_expressions.get(s)
+        if sympy_expr is None:
+            try:
+                # pass a copy of the globals, as ``parse_expr()`` adds ``__builtins__`` to them
+                sympy_expr = sympy.parsing.sympy_parser.parse_expr(s, global_dict=dict(cls._sympy_globals_unevaluated), evaluate=False)
+            except Exception:
+                # not valid sympy syntax (for instance, because a variable name is a Python keyword); leave it to the NESTML parser
+                from pynestml.utils.model_parser import ModelParser
+                return ModelParser.parse_expression(s)
 
-        return s_reformatted
+        return SympyToASTConverter.convert(sympy_expr)
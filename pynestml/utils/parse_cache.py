@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+#
+# parse_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import glob
+import hashlib
+import io
+import os
+import pickle
+
+import pynestml
+from pynestml.meta_model.ast_data_type import ASTDataType
+from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
+from pynestml.symbols.type_symbol import TypeSymbol
+from pynestml.utils.disk_cache import DiskCache
+
+
+class _ASTPickler(pickle.Pickler):
+    r"""Pickler that leaves out type symbols: these refer to the (process-global) predefined types and are re-derived after loading. All data type nodes encountered while pickling are collected in ``data_types``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.data_types = []
+        self.classes = set()
+
+    def persistent_id(self, obj):
+        if isinstance(obj, TypeSymbol):
+            return "type_symbol"
+
+        self.classes.add(type(obj))
+
+        if isinstance(obj, ASTDataType):
+            self.data_types.append(obj)
+
+        return None
+
+
+class _ASTUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return None
+
+
+class ParseCache(DiskCache):
+    r"""
+    Persistent, content-addressed on-disk cache for parsed models.
+
+    Each entry holds the AST of a compilation unit as it is returned by ``ASTBuilderVisitor`` (with parent links set, but before symbol tables are built). Entries are keyed by a hash of the file contents, the file name, the model name suffix, the NESTML version, the lexer/parser grammar and the sources of the AST classes and of the code that builds the AST, so that any change to either invalidates the entry.
+
+    As an additional safeguard, each entry records the ``__slots__`` of the classes of all objects in the AST; an entry for which these differ from the current classes is treated as a miss.
+    """
+    CACHE_NAME_ = "parse_cache"
+    FILE_EXTENSION_ = ".ast.pickle"
+
+    # source files (relative to the ``pynestml`` package) that determine the layout and contents of the cached ASTs
+    SOURCE_FILE_PATTERNS_ = [os.path.join("meta_model", "*.py"),
+                             os.path.join("visitors", "ast_builder_visitor.py"),
+                             os.path.join("visitors", "ast_parent_visitor.py"),
+                             os.path.join("utils", "ast_source_location.py"),
+                             os.path.join("utils", "parse_cache.py")]
+
+    _grammar_fingerprint = None
+    _source_fingerprint = None
+
+    @classmethod
+    def get_grammar_fingerprint(cls) -> str:
+        r"""
+        Returns a hash of the generated lexer and parser, so that cache entries are invalidated whenever the grammar changes.
+        """
+        if cls._grammar_fingerprint is None:
+            from pynestml.generated import PyNestMLLexer, PyNestMLParser
+
+            h = hashlib.sha256()
+            h.update(repr(PyNestMLLexer.serializedATN()).encode("utf-8"))
+            h.update(repr(PyNestMLParser.serializedATN()).encode("utf-8"))
+            cls._grammar_fingerprint = h.hexdigest()
+
+        return cls._grammar_fingerprint
+
+    @classmethod
+    def get_source_fingerprint(cls) -> str:
+        r"""
+        Returns a hash of the sources of the AST classes and of the code that builds the AST, so that cache entries are invalidated whenever these change (the NESTML version string is not necessarily changed during development).
+        """
+        if cls._source_fingerprint is None:
+            package_dir = os.path.dirname(os.path.abspath(pynestml.__file__))
+            h = hashlib.sha256()
+            for pattern in cls.SOURCE_FILE_PATTERNS_:
+                for fn in sorted(glob.glob(os.path.join(package_dir, pattern))):
+                    h.update(os.path.relpath(fn, package_dir).encode("utf-8"))
+                    h.update(b"\0")
+                    with open(fn, "rb") as f:
+                        h.update(f.read())
+
+            cls._source_fingerprint = h.hexdigest()
+
+        return cls._source_fingerprint
+
+    @classmethod
+    def _get_slot_layout(cls, classes: Iterable[type]) -> Dict[Tuple[str, str], Tuple[str, ...]]:
+        r"""
+        Returns the names of the slots of each of the given NESTML classes (including the slots of their base classes), indexed by module and qualified class name.
+        """
+        layout = {}
+        for klass in classes:
+            if not klass.__module__.startswith("pynestml."):
+                continue
+
+            slots = []
+            for base in klass.__mro__:
+                base_slots = base.__dict__.get("__slots__", ())
+                slots.extend([base_slots] if isinstance(base_slots, str) else base_slots)
+
+            layout[(klass.__module__, klass.__qualname__)] = tuple(slots)
+
+        return layout
+
+    @classmethod
+    def _has_current_slot_layout(cls, layout: Dict[Tuple[str, str], Tuple[str, ...]]) -> bool:
+        import importlib
+
+        for (module_name, qualname), slots in layout.items():
+            try:
+                klass = importlib.import_module(module_name)
+                for name in qualname.split("."):
+                    klass = getattr(klass, name)
+            except (ImportError, AttributeError):
+                return False
+
+            if cls._get_slot_layout([klass]).get((module_name, qualname)) != slots:
+                return False
+
+        return True
+
+    @classmethod
+    def compute_key(cls, file_path: str, content: bytes, suffix: str = "") -> str:
+        r"""
+        Compute the cache key for a model file.
+
+        :param file_path: path to the model file (only the base name is used, as it is stored in the AST as artifact name)
+        :param content: the raw contents of the model file
+        :param suffix: the suffix appended to all model names
+        :return: the key as hexadecimal string
+        """
+        h = hashlib.sha256()
+        for s in [pynestml.__version__, cls.get_grammar_fingerprint(), cls.get_source_fingerprint(), os.path.basename(file_path), suffix]:
+            h.update(s.encode("utf-8"))
+            h.update(b"\0")
+
+        h.update(content)
+
+        return h.hexdigest()
+
+    @classmethod
+    def load(cls, key: str) -> Optional[ASTNestMLCompilationUnit]:
+        r"""
+        Retrieve the AST for the given key from the cache.
+
+        :param key: the key as returned by ``compute_key()``
+        :return: the compilation unit, or None if it is not in the cache (or the entry could not be read)
+        """
+        data = cls._read_entry(key)
+        if data is None:
+            return None
+
+        try:
+            stream = io.BytesIO(data)
+            if not cls._has_current_slot_layout(pickle.load(stream)):
+                # stored by a version of the AST classes with different attributes
+                cls._remove_entry(key)
+                return None
+
+            unpickler = _ASTUnpickler(stream)
+            ast = unpickler.load()
+            data_types = unpickler.load()
+        except Exception:
+            # corrupted or incompatible entry: remove it and treat as a miss
+            cls._remove_entry(key)
+            return None
+
+        if not isinstance(ast, ASTNestMLCompilationUnit):
+            return None
+
+        # restore the type symbols of all data types
+        from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
+        for data_type in data_types:
+            data_type.accept(ASTDataTypeVisitor())
+
+        return ast
+
+    @classmethod
+    def store(cls, key: str, ast: ASTNestMLCompilationUnit) -> None:
+        r"""
+        Store the AST for the given key into the cache. Failures (e.g. an unwritable cache directory) are silently ignored.
+
+        :param key: the key as returned by ``compute_key()``
+        :param ast: the compilation unit to store
+        """
+        if not cls.enabled:
+            return
+
+        try:
+            buf = io.BytesIO()
+            pickler = _ASTPickler(buf, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.dump(ast)
+            data_types, pickler.data_types = pickler.data_types, []
+            pickler.dump(data_types)    # shares the memo with the previous call, so these refer to the nodes in the AST
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            return
+
+        # the slot layout is stored in front of the AST, so that it can be checked before the AST is loaded
+        cls._write_entry(key, pickle.dumps(cls._get_slot_layout(pickler.classes), protocol=pickle.HIGHEST_PROTOCOL) + buf.getvalue())
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import contextlib
+import cProfile
+import json
+import os
+import re
+import sys
+import time
+
+import pynestml
+
+
+class Profiler:
+    r"""
+    Records the wall time and peak resident set size (RSS) of the phases of the toolchain (parsing, symbol table construction, context condition checks, transformations, ODE-toolbox analysis, template rendering and building), per model where applicable.
+
+    Phases are recorded by wrapping them in ``Profiler.phase()``; when profiling is disabled, this has no effect. Phases can be nested; optionally, each outermost phase is additionally profiled using ``cProfile``.
+
+    Attributes:
+        enabled         Whether phases are recorded.
+        cprofile        Whether cProfile statistics are collected for each outermost phase.
+        records         The recorded phases, in the order in which they were completed.
+    """
+    enabled = False
+    cprofile = False
+    records = []   # type: List[Dict[str, Any]]
+    cprofile_stats = []   # type: List[Tuple[str, cProfile.Profile]]
+
+    _start_time = None   # type: Optional[float]
+    _depth = 0
+
+    @classmethod
+    def configure(cls, enabled: bool = False, cprofile: bool = False) -> None:
+        r"""
+        Enable or disable profiling, and discard all recorded phases.
+
+        :param enabled: whether to record phases
+        :param cprofile: whether to additionally collect cProfile statistics for each outermost phase
+        """
+        cls.enabled = enabled
+        cls.cprofile = enabled and cprofile
+        cls.reset()
+
+    @classmethod
+    def reset(cls) -> None:
+        r"""
+        Discard all recorded phases, and start measuring the total time from now.
+        """
+        cls.records = []
+        cls.cprofile_stats = []
+        cls._start_time = time.perf_counter()
+        cls._depth = 0
+
+    @classmethod
+    def get_peak_rss(cls) -> Optional[int]:
+        r"""
+        Returns the peak resident set size of this process so far in bytes, or None if it cannot be determined on this platform.
+        """
+        try:
+            import resource
+        except ImportError:
+            return None
+
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            # reported in bytes
+            return peak_rss
+
+        # reported in kilobytes
+        return peak_rss * 1024
+
+    @classmethod
+    @contextlib.contextmanager
+    def phase(cls, phase: str, name: Optional[str] = None, model: Optional[str] = None) -> Iterator[None]:
+        r"""
+        Context manager that records the wrapped code as a phase.
+
+        :param phase: the name of the phase, e.g. ``"transform"``
+        :param name: further identifies the phase, e.g. the name of the transformer or template
+        :param model: the name of the model that is processed in this phase, if any
+        """
+        if not cls.enabled:
+            yield
+            return
+
+        profile = None
+        if cls.cprofile and cls._depth == 0:
+            profile = cProfile.Profile()
+
+        cls._depth += 1
+        peak_rss_before = cls.get_peak_rss()
+        start_time = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+
+            end_time = time.perf_counter()
+            peak_rss = cls.get_peak_rss()
+            cls._depth -= 1
+
+            cls.records.append({"phase": phase,
+                                "name": name,
+                                "model": model,
+                                "depth": cls._depth,
+                                "start_time": start_time - cls._start_time,
+                                "wall_time": end_time - start_time,
+                                "peak_rss": peak_rss,
+                                "peak_rss_increase": peak_rss - peak_rss_before if peak_rss is not None else None})
+
+            if profile is not None:
+                cls.cprofile_stats.append(("_".join([str(len(cls.cprofile_stats)), phase] + [s for s in [name, model] if s]), profile))
+
+    @classmethod
+    def get_report(cls) -> Dict[str, Any]:
+        r"""
+        Returns the recorded phases, as well as the total wall time and peak RSS for each kind of phase.
+        """
+        summary = {}
+        for record in cls.records:
+            if record["phase"] not in summary.keys():
+                summary[record["phase"]] = {"count": 0, "wall_time": 0., "peak_rss": record["peak_rss"]}
+
+            summary[record["phase"]]["count"] += 1
+            summary[record["phase"]]["wall_time"] += record["wall_time"]
+            if record["peak_rss"] is not None:
+                summary[record["phase"]]["peak_rss"] = max(summary[record["phase"]]["peak_rss"], record["peak_rss"])
+
+        return {"nestml_version": pynestml.__version__,
+                "total_wall_time": time.perf_counter() - cls._start_time,
+                "peak_rss": cls.get_peak_rss(),
+                "summary": summary,
+                "phases": cls.records}
+
+    @classmethod
+    def store_report(cls, report_dir: str) -> None:
+        r"""
+        Write the report as ``profile.json`` into the given directory, and the cProfile statistics (if collected) as ``.prof`` files into its subdirectory ``profile``.
+
+        :param report_dir: path of the report directory
+        """
+        with open(os.path.join(report_dir, "profile.json"), "w") as f:
+            json.dump(cls.get_report(), f, indent=2)
+
+        if cls.cprofile_stats:
+            cprofile_dir = os.path.join(report_dir, "profile")
+            os.makedirs(cprofile_dir, exist_ok=True)
+            for fn, profile in cls.cprofile_stats:
+                profile.dump_stats(os.path.join(cprofile_dir, re.sub(r"[^\w.-]", "_", fn) + ".prof"))
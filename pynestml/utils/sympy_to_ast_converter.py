@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+#
+# sympy_to_ast_converter.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import List, Union
+
+import sympy
+from sympy.core.function import AppliedUndef
+from sympy.printing.precedence import precedence
+from sympy.printing.str import StrPrinter
+
+from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.utils.ast_source_location import ASTSourceLocation
+
+
+class NESTMLSympyPrinter(StrPrinter):
+    r"""
+    Prints sympy expressions such that they can be parsed by the NESTML parser. Calls to ``Piecewise((expr_if_true, cond), (expr_if_false, True))`` are printed as ``cond ? expr_if_true : expr_if_false``.
+    """
+
+    def _print_Function(self, expr):
+        if expr.func.__name__ == "Piecewise":
+            assert len(expr.args) == 2, "Can only handle two-part piecewise conditional function"
+            cond = self.doprint(expr.args[0][1])
+            cond_always_true = expr.args[1][1]
+            assert cond_always_true == sympy.true
+            expr_if_true = self.doprint(expr.args[0][0])
+            expr_if_false = self.doprint(expr.args[1][0])
+            return "((" + cond + ") ? (" + expr_if_true + ") : (" + expr_if_false + "))"
+
+        return super()._print_Function(expr)
+
+
+class SympyToASTConverter:
+    r"""
+    Converts sympy expressions into NESTML expressions directly, instead of printing them and parsing the result using the NESTML parser.
+
+    The conversion follows ``NESTMLSympyPrinter``: the resulting AST is equal to the AST that is obtained by printing the sympy expression and parsing the result, including the placement of parentheses. Sympy expressions that cannot be converted directly are printed and parsed.
+    """
+
+    _printer = NESTMLSympyPrinter()
+
+    _comparison_operators = {"<": "is_lt",
+                             "<=": "is_le",
+                             ">": "is_gt",
+                             ">=": "is_ge"}
+
+    @classmethod
+    def convert(cls, expr: sympy.Basic) -> Union[ASTExpression, ASTSimpleExpression]:
+        r"""
+        Convert a sympy expression into a NESTML expression.
+
+        :param expr: the sympy expression
+        :return: the NESTML expression
+        """
+        if expr.func.__name__ == "Piecewise":
+            return cls._convert_piecewise(expr)
+
+        if expr.is_Symbol:
+            return ASTNodeFactory.create_ast_simple_expression(variable=ASTNodeFactory.create_ast_variable(expr.name, source_position=cls._source_position()),
+                                                               source_position=cls._source_position())
+
+        if expr is sympy.true or expr is sympy.false:
+            return ASTNodeFactory.create_ast_simple_expression(boolean_literal=bool(expr), source_position=cls._source_position())
+
+        if expr.is_Integer:
+            return cls._convert_number(int(expr.p))
+
+        if expr.is_Rational:
+            return cls._create_binary_expression(cls._convert_number(int(expr.p)), "is_div_op", cls._convert_number(int(expr.q)))
+
+        if expr.is_Float and expr.is_finite:
+            return cls._convert_number(float(cls._printer.doprint(expr)))
+
+        if expr.is_Add:
+            return cls._convert_add(expr)
+
+        if expr.is_Mul:
+            return cls._convert_mul(expr)
+
+        if expr.is_Pow:
+            return cls._convert_pow(expr)
+
+        if expr.is_Function and cls._is_printed_as_function_call(expr):
+            args = [cls.convert(arg) for arg in expr.args]
+            function_call = ASTNodeFactory.create_ast_function_call(expr.func.__name__, args, source_position=cls._source_position())
+            return ASTNodeFactory.create_ast_simple_expression(function_call=function_call, source_position=cls._source_position())
+
+        if expr.is_Relational and expr.rel_op in cls._comparison_operators.keys():
+            prec = precedence(expr)
+            comparison_operator = ASTNodeFactory.create_ast_comparison_operator(**{cls._comparison_operators[expr.rel_op]: True}, source_position=cls._source_position())
+            return ASTNodeFactory.create_ast_compound_expression(lhs=cls._parenthesize(expr.lhs, prec),
+                                                                 binary_operator=comparison_operator,
+                                                                 rhs=cls._parenthesize(expr.rhs, prec),
+                                                                 source_position=cls._source_position())
+
+        return cls._convert_by_parsing(expr)
+
+    @classmethod
+    def _is_printed_as_function_call(cls, expr: sympy.Basic) -> bool:
+        r"""
+        Returns whether the printer prints the given function as a plain function call ``name(args)``, rather than using a dedicated method for it.
+        """
+        if isinstance(expr, AppliedUndef):
+            return True
+
+        if hasattr(expr, cls._printer.printmethod):
+            return False
+
+        for klass in type(expr).__mro__:
+            if hasattr(cls._printer, "_print_" + klass.__name__):
+                return klass is sympy.Function
+
+        return False
+
+    @classmethod
+    def _convert_by_parsing(cls, expr: sympy.Basic) -> Union[ASTExpression, ASTSimpleExpression]:
+        from pynestml.utils.model_parser import ModelParser
+
+        return ModelParser.parse_expression(cls._printer.doprint(expr))
+
+    @classmethod
+    def _convert_piecewise(cls, expr: sympy.Basic) -> Union[ASTExpression, ASTSimpleExpression]:
+        if len(expr.args) != 2 or expr.args[1][1] != sympy.true:
+            return cls._convert_by_parsing(expr)
+
+        ternary_expression = ASTNodeFactory.create_ast_ternary_expression(condition=cls._encapsulate(cls.convert(expr.args[0][1])),
+                                                                          if_true=cls._encapsulate(cls.convert(expr.args[0][0])),
+                                                                          if_not=cls._encapsulate(cls.convert(expr.args[1][0])),
+                                                                          source_position=cls._source_position())
+
+        return cls._encapsulate(ternary_expression)
+
+    @classmethod
+    def _convert_add(cls, expr: sympy.Add) -> Union[ASTExpression, ASTSimpleExpression]:
+        prec = precedence(expr)
+        node = None
+        for term in expr.as_ordered_terms():
+            term_node = cls.convert(term)
+            is_minus = not term.is_Add and cls._starts_with_unary_minus(term_node)
+            if is_minus:
+                term_node = cls._remove_unary_minus(term_node)
+
+            if precedence(term) < prec or term.is_Add:
+                term_node = cls._encapsulate(term_node)
+
+            if node is None:
+                node = cls._prepend_unary_minus(term_node) if is_minus else term_node
+            else:
+                node = cls._create_binary_expression(node, "is_minus_op" if is_minus else "is_plus_op", term_node)
+
+        return node
+
+    @classmethod
+    def _convert_mul(cls, expr: sympy.Mul) -> Union[ASTExpression, ASTSimpleExpression]:
+        prec = precedence(expr)
+        if expr.args[0] is sympy.S.One or any(isinstance(arg, sympy.Number) or arg.is_Pow and all(arg_arg.is_Integer for arg_arg in arg.args)
+                                              for arg in expr.args[1:]):
+            # unevaluated multiplication
+            return cls._convert_by_parsing(expr)
+
+        c, e = expr.as_coeff_Mul()
+        is_minus = c < 0
+        if is_minus:
+            expr = -expr
+
+        # gather factors for numerator and denominator
+        numerator = []
+        denominator = []
+        pow_paren = []    # powers with exponent -1 and more than one base element
+        for item in expr.as_ordered_factors():
+            if item.is_commutative and item.is_Pow and bool(item.exp.as_coeff_Mul()[0] < 0):
+                if item.exp is not sympy.S.NegativeOne:
+                    exp_args = list(sympy.Mul.make_args(item.exp))
+                    if exp_args[0] is sympy.S.NegativeOne:
+                        exp_args = exp_args[1:]
+                    else:
+                        exp_args[0] = -exp_args[0]
+
+                    denominator.append(sympy.Pow(item.base, sympy.Mul._from_args(exp_args), evaluate=False))
+                else:
+                    if len(item.args[0].args) != 1 and isinstance(item.base, (sympy.Mul, sympy.Pow)):
+                        pow_paren.append(item)
+
+                    denominator.append(item.base)
+            elif item.is_Rational and item is not sympy.S.Infinity:
+                if item.p != 1:
+                    numerator.append(sympy.Rational(item.p))
+
+                if item.q != 1:
+                    denominator.append(sympy.Rational(item.q))
+            else:
+                numerator.append(item)
+
+        numerator = numerator or [sympy.S.One]
+
+        numerator_nodes = [cls._parenthesize(factor, prec) for factor in numerator]
+        denominator_nodes = [cls._parenthesize(factor, prec) for factor in denominator]
+
+        for item in pow_paren:
+            if item.base in denominator:
+                idx = denominator.index(item.base)
+                denominator_nodes[idx] = cls._encapsulate(denominator_nodes[idx])
+
+        node = cls._create_product(numerator_nodes)
+        if len(denominator_nodes) == 1:
+            node = cls._create_binary_expression(node, "is_div_op", denominator_nodes[0])
+        elif len(denominator_nodes) > 1:
+            node = cls._create_binary_expression(node, "is_div_op", cls._encapsulate(cls._create_product(denominator_nodes)))
+
+        if is_minus:
+            node = cls._prepend_unary_minus(node)
+
+        return node
+
+    @classmethod
+    def _convert_pow(cls, expr: sympy.Pow) -> Union[ASTExpression, ASTSimpleExpression]:
+        prec = precedence(expr)
+        if expr.exp is sympy.S.Half:
+            return cls._create_function_call("sqrt", cls.convert(expr.base))
+
+        if expr.is_commutative:
+            if -expr.exp is sympy.S.Half:
+                return cls._create_binary_expression(cls._convert_number(1), "is_div_op", cls._create_function_call("sqrt", cls.convert(expr.base)))
+
+            if expr.exp is sympy.S.NegativeOne:
+                return cls._create_binary_expression(cls._convert_number(1), "is_div_op", cls._parenthesize(expr.base, prec))
+
+        return cls._create_binary_expression(cls._parenthesize(expr.base, prec), "is_pow_op", cls._parenthesize(expr.exp, prec))
+
+    @classmethod
+    def _convert_number(cls, value: Union[int, float]) -> Union[ASTExpression, ASTSimpleExpression]:
+        if value < 0:
+            return cls._prepend_unary_minus(cls._convert_number(-value))
+
+        return ASTNodeFactory.create_ast_simple_expression(numeric_literal=value, source_position=cls._source_position())
+
+    @classmethod
+    def _parenthesize(cls, expr: sympy.Basic, level: int) -> Union[ASTExpression, ASTSimpleExpression]:
+        node = cls.convert(expr)
+        if precedence(expr) <= level:
+            return cls._encapsulate(node)
+
+        return node
+
+    @classmethod
+    def _encapsulate(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        return ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=node, source_position=cls._source_position())
+
+    @classmethod
+    def _create_binary_expression(cls, lhs: Union[ASTExpression, ASTSimpleExpression], operator: str, rhs: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        binary_operator = ASTNodeFactory.create_ast_arithmetic_operator(**{operator: True}, source_position=cls._source_position())
+        return ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=binary_operator, rhs=rhs, source_position=cls._source_position())
+
+    @classmethod
+    def _create_product(cls, factors: List[Union[ASTExpression, ASTSimpleExpression]]) -> Union[ASTExpression, ASTSimpleExpression]:
+        node = factors[0]
+        for factor in factors[1:]:
+            node = cls._create_binary_expression(node, "is_times_op", factor)
+
+        return node
+
+    @classmethod
+    def _create_function_call(cls, name: str, arg: Union[ASTExpression, ASTSimpleExpression]) -> ASTSimpleExpression:
+        function_call = ASTNodeFactory.create_ast_function_call(name, [arg], source_position=cls._source_position())
+        return ASTNodeFactory.create_ast_simple_expression(function_call=function_call, source_position=cls._source_position())
+
+    @classmethod
+    def _is_left_operand_of_unary_minus(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> bool:
+        r"""
+        Returns whether a unary minus that is printed in front of the given node applies to its left operand rather than to the node itself. This is the case for binary operators that have a lower precedence than the unary minus, i.e. all except the power operator.
+        """
+        return isinstance(node, ASTExpression) and node.is_compound_expression() and not node.is_encapsulated \
+            and not (isinstance(node.get_binary_operator(), ASTArithmeticOperator) and node.get_binary_operator().is_pow_op)
+
+    @classmethod
+    def _prepend_unary_minus(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        if cls._is_left_operand_of_unary_minus(node):
+            return cls._replace_lhs(node, cls._prepend_unary_minus(node.get_lhs()))
+
+        unary_operator = ASTNodeFactory.create_ast_unary_operator(is_unary_minus=True, source_position=cls._source_position())
+        return ASTNodeFactory.create_ast_expression(unary_operator=unary_operator, expression=node, source_position=cls._source_position())
+
+    @classmethod
+    def _replace_lhs(cls, node: ASTExpression, lhs: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        return ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=node.get_binary_operator(), rhs=node.get_rhs(), source_position=node.get_source_position())
+
+    @classmethod
+    def _starts_with_unary_minus(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> bool:
+        if cls._is_left_operand_of_unary_minus(node):
+            return cls._starts_with_unary_minus(node.get_lhs())
+
+        return isinstance(node, ASTExpression) and not node.is_encapsulated and node.is_unary_operator() and node.get_unary_operator().is_unary_minus
+
+    @classmethod
+    def _remove_unary_minus(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> Union[ASTExpression, ASTSimpleExpression]:
+        if cls._is_left_operand_of_unary_minus(node):
+            return cls._replace_lhs(node, cls._remove_unary_minus(node.get_lhs()))
+
+        return node.get_expression()
+
+    @classmethod
+    def _source_position(cls) -> ASTSourceLocation:
+        return ASTSourceLocation.get_added_source_position()
@@ -31,8 +31,7 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.mechanism_processing import MechanismProcessing
 from pynestml.utils.messages import Messages
-
-from odetoolbox import analysis
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
 
 
 class SynapseProcessing(MechanismProcessing):
@@ -138,7 +137,7 @@ class SynapseProcessing(MechanismProcessing):
                               kernel_buffer):
         odetoolbox_indict = cls.create_ode_indict(
             neuron, parameters_block, kernel_buffer)
-        full_solver_result = analysis(
+        full_solver_result = ODEToolboxCache.analysis(
             odetoolbox_indict,
             disable_stiffness_check=True,
             log_level=FrontendConfiguration.logging_level)
@@ -30,7 +30,8 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.utils.mechs_info_enricher import MechsInfoEnricher
-from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+from pynestml.utils.sympy_to_ast_converter import SympyToASTConverter
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.visitors.ast_visitor import ASTVisitor
 
@@ -69,7 +70,7 @@ class SynsInfoEnricher(MechsInfoEnricher):
                     variable = neuron.get_equations_blocks()[0].get_scope().resolve_to_symbol(variable_name,
                                                                                               SymbolKind.VARIABLE)
 
-                    expression = ModelParser.parse_expression(expression_str)
+                    expression = ODEToolboxUtils.parse_expression(expression_str)
                     # pretend that update expressions are in "equations" block,
                     # which should always be present, as synapses have been
                     # defined to get here
@@ -77,7 +78,7 @@ class SynsInfoEnricher(MechsInfoEnricher):
                     expression.accept(ASTSymbolTableVisitor())
 
                     update_expr_str = analytic_solution["update_expressions"][variable_name]
-                    update_expr_ast = ModelParser.parse_expression(
+                    update_expr_ast = ODEToolboxUtils.parse_expression(
                         update_expr_str)
                     # pretend that update expressions are in "equations" block,
                     # which should always be present, as differential equations
@@ -95,7 +96,7 @@ class SynsInfoEnricher(MechsInfoEnricher):
                 for variable_name, expression_string in analytic_solution["propagators"].items(
                 ):
                     variable = SynsInfoEnricherVisitor.internal_variable_name_to_variable[variable_name]
-                    expression = ModelParser.parse_expression(
+                    expression = ODEToolboxUtils.parse_expression(
                         expression_string)
                     # pretend that update expressions are in "equations" block,
                     # which should always be present, as synapses have been
@@ -161,7 +162,7 @@ class SynsInfoEnricher(MechsInfoEnricher):
         sympy_expr = sympy.parsing.sympy_parser.parse_expr(expr_str)
         sympy_expr = sympy.diff(sympy_expr, "v_comp")
 
-        ast_expression_d = ModelParser.parse_expression(str(sympy_expr))
+        ast_expression_d = SympyToASTConverter.convert(sympy_expr)
         # copy scope of the original inline_expression into the the derivative
         ast_expression_d.update_scope(inline_expression.get_scope())
         ast_expression_d.accept(ASTSymbolTableVisitor())
@@ -21,7 +21,7 @@
 
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
 
 
 class TypeCaster:
@@ -33,9 +33,9 @@ class TypeCaster:
         _containing_expression.set_implicit_conversion_factor(
             UnitTypeSymbol.get_conversion_factor(_rhs_type_symbol.astropy_unit,
                                                  _lhs_type_symbol.astropy_unit))
-        code, message = Messages.get_implicit_magnitude_conversion(_lhs_type_symbol, _rhs_type_symbol,
-                                                                   _containing_expression.get_implicit_conversion_factor())
-        Logger.log_message(code=code, message=message,
+        message = DeferredMessage(Messages.get_implicit_magnitude_conversion, _lhs_type_symbol, _rhs_type_symbol,
+                                  _containing_expression.get_implicit_conversion_factor())
+        Logger.log_message(code=MessageCode.IMPLICIT_CAST, message=message,
                            error_position=_containing_expression.get_source_position(),
                            log_level=LoggingLevel.INFO)
 
@@ -58,10 +58,9 @@ class TypeCaster:
                     TypeCaster.do_magnitude_conversion_rhs_to_lhs(_rhs_type_symbol, _lhs_type_symbol, _containing_expression)
 
             # the units are mutually convertible (e.g. V and A*Ohm)
-            code, message = Messages.get_implicit_cast_rhs_to_lhs(_rhs_type_symbol.print_symbol(),
-                                                                  _lhs_type_symbol.print_symbol())
+            message = DeferredMessage(Messages.get_implicit_cast_rhs_to_lhs, _rhs_type_symbol, _lhs_type_symbol)
             Logger.log_message(error_position=_containing_expression.get_source_position(),
-                               code=code, message=message, log_level=LoggingLevel.INFO)
+                               code=MessageCode.IMPLICIT_CAST, message=message, log_level=LoggingLevel.INFO)
             return
 
         code, message = Messages.get_type_different_from_expected(_lhs_type_symbol, _rhs_type_symbol)
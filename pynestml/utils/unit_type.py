@@ -18,8 +18,6 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-from astropy.units.core import PrefixUnit, Unit, IrreducibleUnit, CompositeUnit
-from astropy.units.quantity import Quantity
 
 
 class UnitType:
@@ -40,6 +38,9 @@ class UnitType:
         :param unit: an astropy Unit object
         :type unit: astropy.units.core.Unit
         """
+        from astropy.units.core import PrefixUnit, Unit, IrreducibleUnit, CompositeUnit
+        from astropy.units.quantity import Quantity
+
         assert isinstance(name, str), \
             '(PyNestML.SymbolTable.UnitType) No or wrong type of name provided (%s)!' % type(name)
         assert (isinstance(unit, Unit) or isinstance(unit, PrefixUnit)
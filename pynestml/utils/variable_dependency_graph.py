@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#
+# variable_dependency_graph.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Dict, Iterable, List, Set
+
+from pynestml.meta_model.ast_assignment import ASTAssignment
+from pynestml.meta_model.ast_block_with_variables import ASTBlockWithVariables
+from pynestml.meta_model.ast_declaration import ASTDeclaration
+from pynestml.meta_model.ast_elif_clause import ASTElifClause
+from pynestml.meta_model.ast_if_clause import ASTIfClause
+from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
+from pynestml.meta_model.ast_kernel import ASTKernel
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class VariableDependencyGraph:
+    r"""
+    Def-use dependency graph between the variables of a model (or of any other AST node).
+
+    Edges are taken from declarations, inline expressions, ODEs, kernels and assignments: the variable on the left-hand side depends on all variables in the right-hand side. Kernels are an exception: all variables in a kernel's expressions are said to need the kernel variables, and the kernel variables depend on all variables in its expressions except ``t``. Moreover, all variables assigned to in the body of an ``if`` or ``elif`` clause depend on the variables in its condition.
+
+    Variables are identified by name, without differential order (``get_name()`` rather than ``get_complete_name()``), so that ``foo``, ``foo'`` and ``foo''`` are the same node in the graph. Only variables that resolve to a symbol are included.
+
+    The graph is built in a single traversal of the AST and is not updated afterwards. For models, use ``ASTModel.get_variable_dependency_graph()``, which caches the graph until the model is changed.
+    """
+
+    def __init__(self, node: ASTNode):
+        # variable name -> names of the variables that it depends on
+        self._necessary_variables: Dict[str, Set[str]] = {}
+
+        # variable name -> names of the variables that depend on it
+        self._dependent_variables: Dict[str, Set[str]] = {}
+
+        self._state_variable_names: Set[str] = set()
+        self._inline_expression_names: Set[str] = set()
+        self._kernel_variable_names: Set[str] = set()
+
+        node.accept(_VariableDependencyGraphBuilderVisitor(self))
+
+    def _add_necessary_variables(self, var: str, necessary_vars: Iterable[str]) -> None:
+        self._necessary_variables.setdefault(var, set()).update(necessary_vars)
+
+    def _add_dependent_variables(self, var: str, dependent_vars: Iterable[str]) -> None:
+        self._dependent_variables.setdefault(var, set()).update(dependent_vars)
+
+    def get_necessary_variables(self, var: str) -> Set[str]:
+        r"""Return the names of all variables that the variable ``var`` directly depends on (excluding ``var`` itself)."""
+        return self._necessary_variables.get(var, set()) - {var}
+
+    def get_dependent_variables(self, var: str) -> Set[str]:
+        r"""Return the names of all variables that directly depend on the variable ``var`` (excluding ``var`` itself)."""
+        return self._dependent_variables.get(var, set()) - {var}
+
+    def get_recursively_necessary_variables(self, vars: Iterable[str]) -> Set[str]:
+        r"""Return the names of the variables ``vars``, together with the names of all variables that they directly or indirectly depend on."""
+        return self._get_reachable(vars, self._necessary_variables)
+
+    def get_recursively_dependent_variables(self, vars: Iterable[str]) -> Set[str]:
+        r"""Return the names of the variables ``vars``, together with the names of all variables that directly or indirectly depend on them."""
+        return self._get_reachable(vars, self._dependent_variables)
+
+    @classmethod
+    def _get_reachable(cls, vars: Iterable[str], edges: Dict[str, Set[str]]) -> Set[str]:
+        reachable = set(vars)
+        worklist = list(reachable)
+        while worklist:
+            for next_var in edges.get(worklist.pop(), ()):
+                if next_var not in reachable:
+                    reachable.add(next_var)
+                    worklist.append(next_var)
+
+        return reachable
+
+    def is_state_variable(self, var: str) -> bool:
+        r"""Return whether ``var`` is declared in a state block."""
+        return var in self._state_variable_names
+
+    def is_inline_expression(self, var: str) -> bool:
+        r"""Return whether ``var`` is defined by an inline expression."""
+        return var in self._inline_expression_names
+
+    def is_kernel_variable(self, var: str) -> bool:
+        r"""Return whether ``var`` is one of the variables of a kernel (see ``ASTKernel.get_variable_names()``)."""
+        return var in self._kernel_variable_names
+
+
+class _VariableDependencyGraphBuilderVisitor(ASTVisitor):
+    r"""Collects the edges of a ``VariableDependencyGraph``."""
+
+    def __init__(self, graph: VariableDependencyGraph):
+        super().__init__()
+        self._graph = graph
+        self._in_state_block = False
+
+    @classmethod
+    def _get_variable_names(cls, expr) -> List[str]:
+        from pynestml.utils.ast_utils import ASTUtils
+
+        return ASTUtils.get_all_variables_names_in_expression(expr)
+
+    def _add_edges(self, lhs_vars: Iterable[str], rhs_vars: Iterable[str]) -> None:
+        lhs_vars = list(lhs_vars)
+        for lhs_var in lhs_vars:
+            self._graph._add_necessary_variables(lhs_var, rhs_vars)
+
+        for rhs_var in rhs_vars:
+            self._graph._add_dependent_variables(rhs_var, lhs_vars)
+
+    def visit_block_with_variables(self, node: ASTBlockWithVariables) -> None:
+        self._in_state_block = node.is_state
+
+    def endvisit_block_with_variables(self, node: ASTBlockWithVariables) -> None:
+        self._in_state_block = False
+
+    def visit_declaration(self, node: ASTDeclaration) -> None:
+        lhs_vars = [var.get_name() for var in node.get_variables()]
+        if self._in_state_block:
+            self._graph._state_variable_names.update(lhs_vars)
+
+        self._add_edges(lhs_vars, self._get_variable_names(node.get_expression()))
+
+    def visit_inline_expression(self, node: ASTInlineExpression) -> None:
+        self._graph._inline_expression_names.add(node.get_variable_name())
+        self._add_edges([node.get_variable_name()], self._get_variable_names(node.get_expression()))
+
+    def visit_ode_equation(self, node: ASTOdeEquation) -> None:
+        self._add_edges([node.get_lhs().get_name()], self._get_variable_names(node.get_rhs()))
+
+    def visit_kernel(self, node: ASTKernel) -> None:
+        kernel_variable_names = [str(s) for s in node.get_variable_names()]
+        self._graph._kernel_variable_names.update(kernel_variable_names)
+        for expr in node.get_expressions():
+            for var in self._get_variable_names(expr):
+                self._graph._add_necessary_variables(var, kernel_variable_names)
+                # exclude the special case "t" because a function-of-time kernel might depend on t
+                if not var == "t":
+                    self._graph._add_dependent_variables(var, [kernel_var.get_name() for kernel_var in node.get_variables()])
+
+    def visit_assignment(self, node: ASTAssignment) -> None:
+        rhs_vars = self._get_variable_names(node.get_expression())
+        self._graph._add_necessary_variables(node.lhs.get_name(), rhs_vars)
+        for rhs_var in rhs_vars:
+            self._graph._add_dependent_variables(rhs_var, [str(node.lhs)])
+
+    def _visit_if_clause(self, node) -> None:
+        from pynestml.utils.ast_utils import ASTUtils
+
+        assigned_vars = ASTUtils.get_all_variables_assigned_to(node.get_stmts_body())
+        for cond_var in self._get_variable_names(node.condition):
+            # all variables assigned to in the if-block depend on the variables in the condition
+            self._graph._add_dependent_variables(cond_var, assigned_vars)
+
+    def visit_if_clause(self, node: ASTIfClause) -> None:
+        self._visit_if_clause(node)
+
+    def visit_elif_clause(self, node: ASTElifClause) -> None:
+        self._visit_if_clause(node)
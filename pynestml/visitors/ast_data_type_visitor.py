@@ -19,8 +19,6 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from astropy import units
-
 from pynestml.meta_model.ast_unit_type import ASTUnitType
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
 from pynestml.symbols.predefined_types import PredefinedTypes
@@ -142,6 +140,8 @@ def handle_unit(unit_type):
     :return: a new type symbol
     :rtype: TypeSymbol
     """
+    from astropy import units
+
     # first ensure that it does not already exists, if not create it and register it in the set of predefined units
     # first clean up the unit of not required components, here it is the 1.0 in front of the unit
     # e.g., 1.0 * 1 / ms. This step is not mandatory for correctness, but makes  reporting easier
@@ -149,7 +149,7 @@ def handle_unit(unit_type):
         to_process = unit_type.unit
     else:
         to_process = unit_type
-    if str(to_process) not in PredefinedUnits.get_units().keys():
+    if not PredefinedUnits.is_unit(str(to_process)):
         unit_type_t = UnitType(name=str(to_process), unit=to_process)
         PredefinedUnits.register_unit(unit_type_t)
     # now create the corresponding type symbol if it does not exists
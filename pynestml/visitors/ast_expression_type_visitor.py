@@ -71,6 +71,10 @@ class ASTExpressionTypeVisitor(ASTVisitor):
         :param _node: a meta_model node.
         :type _node: AST_
         """
+        if _node.has_type():
+            # the type of this sub-expression is still valid, see ``ASTExpressionNode.invalidate_type()``
+            return
+
         self.traverse(_node)
         self.get_real_self().visit(_node)
         self.get_real_self().endvisit(_node)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# ast_fused_visitor.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTFusedVisitor(ASTVisitor):
+    """
+    Runs several visitors in a single traversal of the AST: each node is handed to the ``visit_*`` and ``endvisit_*`` methods of all visitors (or to their ``visit()`` and ``endvisit()`` methods, if these are overridden, as in ``ASTHigherOrderVisitor``), in the order in which the visitors were given. Methods that a visitor does not override are not called.
+
+    The result is the same as running the visitors one after another if each visitor uses the standard traversal (see ``can_fuse()``), and if the visitors do not depend on changes that the others make to the AST.
+    """
+
+    def __init__(self, visitors: Sequence[ASTVisitor]):
+        super(ASTFusedVisitor, self).__init__()
+        for visitor in visitors:
+            assert self.can_fuse(visitor), "(PyNestML.Visitor.ASTFusedVisitor) Visitor " + type(visitor).__name__ + " does not use the standard traversal"
+
+        self._visitors = list(visitors)
+
+        # node type -> (bound visit methods, bound endvisit methods)
+        self._handlers: Dict[type, Tuple[List[Callable], List[Callable]]] = {}
+
+    @classmethod
+    def can_fuse(cls, visitor: ASTVisitor) -> bool:
+        """
+        Indicates whether the handed over visitor can be run in a fused traversal, that is, whether it visits all nodes in the standard order: it may not override ``handle()``, ``traverse()`` or any of the ``traverse_*`` methods.
+        :param visitor: a single visitor
+        :return: True if the visitor can be fused, otherwise False
+        """
+        for name in dir(ASTVisitor):
+            if name in ["handle", "traverse"] or name.startswith("traverse_"):
+                if getattr(type(visitor), name) is not getattr(ASTVisitor, name):
+                    return False
+
+        return True
+
+    def _get_handlers(self, node: ASTNode) -> Tuple[List[Callable], List[Callable]]:
+        try:
+            return self._handlers[type(node)]
+        except KeyError:
+            pass
+
+        # this class does not override any ``visit_*`` or ``endvisit_*`` methods, so these are the (empty) defaults
+        default_visit_method, _, default_endvisit_method = self._get_dispatch_entry(node)
+
+        visit_handlers = []
+        endvisit_handlers = []
+        for visitor in self._visitors:
+            visit_method, _, endvisit_method = visitor._get_dispatch_entry(node)
+            if type(visitor).visit is not ASTVisitor.visit:
+                visit_handlers.append(visitor.visit)
+            elif visit_method is not default_visit_method:
+                visit_handlers.append(visit_method.__get__(visitor))
+
+            if type(visitor).endvisit is not ASTVisitor.endvisit:
+                endvisit_handlers.append(visitor.endvisit)
+            elif endvisit_method is not default_endvisit_method:
+                endvisit_handlers.append(endvisit_method.__get__(visitor))
+
+        self._handlers[type(node)] = (visit_handlers, endvisit_handlers)
+
+        return self._handlers[type(node)]
+
+    def visit(self, node: ASTNode):
+        for visit_handler in self._get_handlers(node)[0]:
+            visit_handler(node)
+
+    def endvisit(self, node: ASTNode):
+        for endvisit_handler in self._get_handlers(node)[1]:
+            endvisit_handler(node)
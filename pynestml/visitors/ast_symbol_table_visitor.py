@@ -28,10 +28,9 @@ from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.meta_model.ast_stmt import ASTStmt
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.symbol_table.scope import Scope, ScopeType
+from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.function_symbol import FunctionSymbol
-from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
-from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.symbols.variable_symbol import VariableSymbol, BlockType, VariableType
 from pynestml.utils.ast_utils import ASTUtils
@@ -58,20 +57,13 @@ class ASTSymbolTableVisitor(ASTVisitor):
         Used to visit a single model and create the corresponding global as well as local scopes.
         """
         Logger.set_current_node(node)
+        node.invalidate_variable_dependency_graph()
         scope = Scope(scope_type=ScopeType.GLOBAL,
                       source_position=node.get_source_position())
         node.update_scope(scope)
         node.get_body().update_scope(scope)
-        # now first, we add all predefined elements to the scope
-        variables = PredefinedVariables.get_variables()
-        functions = PredefinedFunctions.get_function_symbols()
-        types = PredefinedTypes.get_types()
-        for symbol in variables.keys():
-            node.get_scope().add_symbol(variables[symbol])
-        for symbol in functions.keys():
-            node.get_scope().add_symbol(functions[symbol])
-        for symbol in types.keys():
-            node.get_scope().add_symbol(types[symbol])
+        # now first, we add all predefined elements to the scope; these are shared with the global scopes of all other models
+        scope.share_symbols(SymbolTable.get_predefined_scope())
 
     def endvisit_model(self, node: ASTModel):
         # update the equations
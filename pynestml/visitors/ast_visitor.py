@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Callable, Dict, Optional, Tuple
+
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_bit_operator import ASTBitOperator
@@ -70,6 +72,52 @@ class ASTVisitor:
         real_self (ASTVisitor): The visitor which will be used during the visiting of a node.
     """
 
+    # node types and the suffix of the methods that handle them, in the order in which they are checked: the first match wins
+    _dispatch_order = ((ASTArithmeticOperator, "arithmetic_operator"),
+                       (ASTAssignment, "assignment"),
+                       (ASTBitOperator, "bit_operator"),
+                       (ASTStmtsBody, "block"),
+                       (ASTBlockWithVariables, "block_with_variables"),
+                       (ASTModelBody, "model_body"),
+                       (ASTComparisonOperator, "comparison_operator"),
+                       (ASTCompoundStmt, "compound_stmt"),
+                       (ASTDataType, "data_type"),
+                       (ASTDeclaration, "declaration"),
+                       (ASTElifClause, "elif_clause"),
+                       (ASTElseClause, "else_clause"),
+                       (ASTEquationsBlock, "equations_block"),
+                       (ASTExpression, "expression"),
+                       (ASTForStmt, "for_stmt"),
+                       (ASTFunction, "function"),
+                       (ASTFunctionCall, "function_call"),
+                       (ASTIfClause, "if_clause"),
+                       (ASTIfStmt, "if_stmt"),
+                       (ASTInputBlock, "input_block"),
+                       (ASTInputPort, "input_port"),
+                       (ASTInputQualifier, "input_qualifier"),
+                       (ASTLogicalOperator, "logical_operator"),
+                       (ASTNestMLCompilationUnit, "compilation_unit"),
+                       (ASTModel, "model"),
+                       (ASTOdeEquation, "ode_equation"),
+                       (ASTInlineExpression, "inline_expression"),
+                       (ASTKernel, "kernel"),
+                       (ASTOutputBlock, "output_block"),
+                       (ASTParameter, "parameter"),
+                       (ASTReturnStmt, "return_stmt"),
+                       (ASTSimpleExpression, "simple_expression"),
+                       (ASTSmallStmt, "small_stmt"),
+                       (ASTUnaryOperator, "unary_operator"),
+                       (ASTUnitType, "unit_type"),
+                       (ASTUpdateBlock, "update_block"),
+                       (ASTOnReceiveBlock, "on_receive_block"),
+                       (ASTOnConditionBlock, "on_condition_block"),
+                       (ASTVariable, "variable"),
+                       (ASTWhileStmt, "while_stmt"),
+                       (ASTStmt, "stmt"))
+
+    # visitor class -> node type -> (visit, traverse, endvisit) methods; filled on demand by _get_dispatch_entry()
+    _dispatch_tables: Dict[type, Dict[type, Tuple[Optional[Callable], Optional[Callable], Optional[Callable]]]] = {}
+
     def __init__(self):
         """
         Standard constructor.
@@ -731,135 +779,38 @@ class ASTVisitor:
         self.get_real_self().traverse(_node)
         self.get_real_self().endvisit(_node)
 
+    def _get_dispatch_entry(self, node: ASTNode) -> Tuple[Optional[Callable], Optional[Callable], Optional[Callable]]:
+        """
+        Returns the ``visit_*``, ``traverse_*`` and ``endvisit_*`` methods of this visitor's class that handle nodes of the type of the given node. The result is cached per visitor class and node type.
+        :param node: a node
+        :return: a tuple of unbound methods, or ``(None, None, None)`` if the node is not handled by any of them
+        """
+        try:
+            return ASTVisitor._dispatch_tables[type(self)][type(node)]
+        except KeyError:
+            pass
+
+        visitor_cls = type(self)
+        entry = (None, None, None)
+        for node_type, method_suffix in ASTVisitor._dispatch_order:
+            if isinstance(node, node_type):
+                entry = (getattr(visitor_cls, "visit_" + method_suffix),
+                         getattr(visitor_cls, "traverse_" + method_suffix),
+                         getattr(visitor_cls, "endvisit_" + method_suffix))
+                break
+
+        ASTVisitor._dispatch_tables.setdefault(visitor_cls, {})[type(node)] = entry
+
+        return entry
+
     def visit(self, node: ASTNode):
         """
         Dispatcher for visitor pattern.
         :param node: The ASTNode to visit
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.visit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.visit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.visit_bit_operator(node)
-            return
-        if isinstance(node, ASTStmtsBody):
-            self.visit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.visit_block_with_variables(node)
-            return
-        if isinstance(node, ASTModelBody):
-            self.visit_model_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.visit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.visit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.visit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.visit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.visit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.visit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.visit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.visit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.visit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.visit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.visit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.visit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.visit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.visit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.visit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.visit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.visit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.visit_compilation_unit(node)
-            return
-        if isinstance(node, ASTModel):
-            self.visit_model(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.visit_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.visit_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.visit_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.visit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.visit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.visit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.visit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.visit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.visit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.visit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.visit_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.visit_on_receive_block(node)
-            return
-        if isinstance(node, ASTOnConditionBlock):
-            self.visit_on_condition_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.visit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.visit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.visit_stmt(node)
-            return
-        return
+        visit_method = self._get_dispatch_entry(node)[0]
+        if visit_method is not None:
+            visit_method(self, node)
 
     def traverse(self, node):
         """
@@ -867,130 +818,9 @@ class ASTVisitor:
         :param node: The ASTElement to visit
         :type node: Inherited from ASTElement
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.traverse_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.traverse_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.traverse_bit_operator(node)
-            return
-        if isinstance(node, ASTStmtsBody):
-            self.traverse_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.traverse_block_with_variables(node)
-            return
-        if isinstance(node, ASTModelBody):
-            self.traverse_model_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.traverse_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.traverse_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.traverse_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.traverse_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.traverse_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.traverse_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.traverse_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.traverse_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.traverse_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.traverse_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.traverse_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.traverse_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.traverse_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.traverse_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.traverse_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.traverse_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.traverse_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.traverse_compilation_unit(node)
-            return
-        if isinstance(node, ASTModel):
-            self.traverse_model(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.traverse_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.traverse_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.traverse_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.traverse_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.traverse_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.traverse_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.traverse_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.traverse_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.traverse_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.traverse_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.traverse_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.traverse_on_receive_block(node)
-            return
-        if isinstance(node, ASTOnConditionBlock):
-            self.traverse_on_condition_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.traverse_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.traverse_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.traverse_stmt(node)
-            return
-        return
+        traverse_method = self._get_dispatch_entry(node)[1]
+        if traverse_method is not None:
+            traverse_method(self, node)
 
     def endvisit(self, node):
         """
@@ -998,129 +828,9 @@ class ASTVisitor:
         :param node: The ASTElement to endvisit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.endvisit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.endvisit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.endvisit_bit_operator(node)
-            return
-        if isinstance(node, ASTStmtsBody):
-            self.endvisit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.endvisit_block_with_variables(node)
-            return
-        if isinstance(node, ASTModelBody):
-            self.endvisit_model_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.endvisit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.endvisit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.endvisit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.endvisit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.endvisit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.endvisit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.endvisit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.endvisit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.endvisit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.endvisit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.endvisit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.endvisit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.endvisit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.endvisit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.endvisit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.endvisit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.endvisit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.endvisit_compilation_unit(node)
-            return
-        if isinstance(node, ASTModel):
-            self.endvisit_model(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.endvisit_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.endvisit_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.endvisit_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.endvisit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.endvisit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.endvisit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.endvisit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.endvisit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.endvisit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.endvisit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.endvisit_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.endvisit_on_receive_block(node)
-            return
-        if isinstance(node, ASTOnConditionBlock):
-            self.endvisit_on_condition_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.endvisit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.endvisit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.endvisit_stmt(node)
-            return
+        endvisit_method = self._get_dispatch_entry(node)[2]
+        if endvisit_method is not None:
+            endvisit_method(self, node)
 
     def traverse_arithmetic_operator(self, node):
         return
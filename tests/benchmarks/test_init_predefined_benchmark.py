@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# test_init_predefined_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbols.predefined_types import PredefinedTypes
+
+pytest.importorskip("pytest_benchmark")
+
+
+class TestInitPredefinedBenchmark:
+    """
+    Benchmarks the registration of the predefined units, types, functions and variables.
+    """
+
+    @pytest.mark.benchmark
+    def test_init_predefined(self, benchmark):
+        """units and unit types are registered lazily, on first lookup"""
+        benchmark(init_predefined)
+
+    @pytest.mark.benchmark
+    def test_init_predefined_all_types(self, benchmark):
+        """all units and unit types are registered, as was done unconditionally by ``init_predefined()`` before units were registered lazily"""
+        def init_predefined_all_types():
+            init_predefined()
+            PredefinedTypes.get_types()
+
+        benchmark(init_predefined_all_types)
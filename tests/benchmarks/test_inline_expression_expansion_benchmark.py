@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# test_inline_expression_expansion_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.transformers.inline_expression_expansion_transformer import InlineExpressionExpansionTransformer
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+pytest.importorskip("pytest_benchmark")
+
+
+def get_multisynapse_model(n_receptors: int) -> str:
+    r"""
+    Returns a conductance-based neuron model in the style of ``traub_cond_multisyn_neuron``, with ``n_receptors`` receptors. Each receptor contributes an inline expression for its synaptic current. These are summed up in groups of ten by further inline expressions (to keep the expressions shallow enough for the parser), the sum of which is referenced in the ODE of the membrane potential.
+    """
+    n_groups = (n_receptors + 9) // 10
+    model = "model multisynapse_neuron:\n"
+    model += "    state:\n"
+    model += "        V_m mV = E_L\n"
+    model += "".join("        g_" + str(i) + " nS = 0 nS\n" for i in range(n_receptors))
+    model += "\n    equations:\n"
+    model += "".join("        inline I_syn_" + str(i) + " pA = -g_" + str(i) + " * (V_m - E_rev_" + str(i) + ")"
+                     + (" / (1 + exp((V_act - V_m) / V_slope))" if i % 2 else "") + "\n" for i in range(n_receptors))
+    model += "".join("        inline I_syn_group_" + str(j) + " pA = " + " + ".join("I_syn_" + str(i) for i in range(10 * j, min(10 * j + 10, n_receptors))) + "\n"
+                     for j in range(n_groups))
+    model += "        inline I_syn pA = " + " + ".join("I_syn_group_" + str(j) for j in range(n_groups)) + "\n"
+    model += "        inline I_L pA = g_L * (E_L - V_m)\n"
+    model += "        V_m' = (I_syn + I_L + I_e) / C_m\n"
+    model += "".join("        g_" + str(i) + "' = -g_" + str(i) + " / tau_syn_" + str(i) + "\n" for i in range(n_receptors))
+    model += "\n    parameters:\n"
+    model += "        C_m pF = 100 pF\n"
+    model += "        g_L nS = 10 nS\n"
+    model += "        E_L mV = -70 mV\n"
+    model += "        I_e pA = 0 pA\n"
+    model += "        V_act mV = -25 mV\n"
+    model += "        V_slope mV = 12.5 mV\n"
+    model += "".join("        E_rev_" + str(i) + " mV = 0 mV\n        tau_syn_" + str(i) + " ms = 2 ms\n" for i in range(n_receptors))
+
+    return model
+
+
+class TestInlineExpressionExpansionBenchmark:
+    """
+    Benchmarks making the inline expressions of models with many receptors self contained, and expanding them into the ODEs.
+    """
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("n_receptors", [100, 300])
+    def test_expand_inline_expressions(self, benchmark, n_receptors):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        model_str = get_multisynapse_model(n_receptors)
+
+        def setup():
+            model = ModelParser.parse_model(model_str)
+            model.accept(ASTSymbolTableVisitor())
+
+            return (model,), {}
+
+        benchmark.pedantic(InlineExpressionExpansionTransformer().transform, setup=setup, rounds=3)
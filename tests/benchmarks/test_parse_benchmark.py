@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# test_parse_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from antlr4 import CommonTokenStream, FileStream, InputStream
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.model_parser import parse_two_stage
+
+pytest.importorskip("pytest_benchmark")
+
+MODELS_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models"))
+
+
+def get_synthetic_model(n_stmts: int) -> str:
+    r"""
+    Returns a neuron model with ``n_stmts`` state variables, each of which is updated by a statement in the update block.
+    """
+    model = "model synthetic_neuron:\n"
+    model += "    state:\n"
+    model += "".join("        x_" + str(i) + " mV = " + str(i) + " mV\n" for i in range(n_stmts))
+    model += "\n    parameters:\n"
+    model += "        tau ms = 10 ms\n"
+    model += "\n    update:\n"
+    model += "".join("        x_" + str(i) + " = x_" + str(i) + " * exp(-resolution() / tau) + x_" + str((i + 1) % n_stmts) + "\n" for i in range(n_stmts))
+    model += "        if x_0 > 0 mV and x_1 <= 1 mV:\n"
+    model += "            x_0 = 0 mV\n"
+
+    return model
+
+
+def tokenize(input_stream) -> CommonTokenStream:
+    stream = CommonTokenStream(PyNestMLLexer(input_stream))
+    stream.fill()
+
+    return stream
+
+
+def parse(stream: CommonTokenStream, two_stage: bool):
+    stream.seek(0)
+    parser = PyNestMLParser(stream)
+    parser.removeErrorListeners()
+    if two_stage:
+        return parse_two_stage(parser, PyNestMLParser.nestMLCompilationUnit)
+
+    return parser.nestMLCompilationUnit()
+
+
+class TestParseBenchmark:
+    """
+    Benchmarks parsing the largest bundled models and synthetically large models, with and without first attempting to parse using SLL prediction. The input is tokenized before, so that only the parser is benchmarked.
+    """
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("two_stage", [True, False])
+    @pytest.mark.parametrize("model_file", ["neurons/hill_tononi_neuron.nestml",
+                                            "neurons/traub_cond_multisyn_neuron.nestml",
+                                            "synapses/stdp_nn_pre_centered_synapse.nestml"])
+    def test_parse_model(self, benchmark, model_file, two_stage):
+        stream = tokenize(FileStream(os.path.join(MODELS_DIR, model_file), encoding="utf-8"))
+        benchmark(parse, stream, two_stage)
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("two_stage", [True, False])
+    @pytest.mark.parametrize("n_stmts", [1000, 3000])
+    def test_parse_synthetic_model(self, benchmark, n_stmts, two_stage):
+        stream = tokenize(InputStream(get_synthetic_model(n_stmts)))
+        benchmark.pedantic(parse, args=(stream, two_stage), rounds=3)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# test_scope_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+from tests.benchmarks.test_parse_benchmark import get_synthetic_model
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module", params=[100, 1000, 3000])
+def model(request):
+    init_predefined()
+    Logger.init_logger(LoggingLevel.ERROR)
+    model = ModelParser.parse_model(get_synthetic_model(request.param))
+    model.accept(ASTSymbolTableVisitor())
+
+    return model
+
+
+def get_variables(model):
+    """all references to variables in the model, excluding units"""
+    variables = []
+    model.accept(ASTHigherOrderVisitor(lambda node: variables.append(node) if isinstance(node, ASTVariable) and not PredefinedUnits.is_unit(node.get_name()) else None))
+
+    return variables
+
+
+class TestScopeBenchmark:
+    """
+    Benchmarks building the symbol table of, and resolving all variable references in, synthetic models with many declarations.
+    """
+
+    @pytest.mark.benchmark
+    def test_build_symbol_table(self, benchmark, model):
+        benchmark(lambda: model.accept(ASTSymbolTableVisitor()))
+
+    @pytest.mark.benchmark
+    def test_resolve_to_symbol(self, benchmark, model):
+        variables = get_variables(model)
+
+        def resolve():
+            for variable in variables:
+                assert variable.get_scope().resolve_to_symbol(variable.get_name(), SymbolKind.VARIABLE) is not None
+
+        benchmark(resolve)
+
+    @pytest.mark.benchmark
+    def test_resolve_to_all_symbols(self, benchmark, model):
+        variables = get_variables(model)
+
+        def resolve():
+            for variable in variables:
+                assert variable.get_scope().resolve_to_all_symbols(variable.get_name(), SymbolKind.VARIABLE) is not None
+
+        benchmark(resolve)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# test_synapse_post_neuron_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+import tracemalloc
+
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.transformers.synapse_post_neuron_transformer import SynapsePostNeuronTransformer
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+pytest.importorskip("pytest_benchmark")
+
+MODELS_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models"))
+
+
+def get_models(n_synapses: int):
+    r"""
+    Returns ``iaf_psc_exp_neuron`` and ``n_synapses`` copies of ``stdp_synapse`` (named ``stdp0_synapse``, ``stdp1_synapse``, etc.), together with the neuron-synapse pairs that pair each synapse with the neuron.
+    """
+    neuron = ModelParser.parse_file(os.path.join(MODELS_PATH, "neurons", "iaf_psc_exp_neuron.nestml")).get_model_list()[0]
+    with open(os.path.join(MODELS_PATH, "synapses", "stdp_synapse.nestml")) as f:
+        synapse_str = f.read()
+
+    synapse_str = synapse_str[synapse_str.index("model stdp_synapse"):]
+    models = [neuron]
+    for i in range(n_synapses):
+        models.append(ModelParser.parse_model(synapse_str.replace("model stdp_synapse", "model stdp" + str(i) + "_synapse")))
+
+    for model in models[1:]:
+        model.accept(ASTSymbolTableVisitor())
+
+    for model in models:
+        CoCosManager.check_cocos(model)
+
+    neuron_synapse_pairs = [{"neuron": "iaf_psc_exp_neuron", "synapse": "stdp" + str(i) + "_synapse", "post_ports": ["post_spikes"]} for i in range(n_synapses)]
+
+    return models, neuron_synapse_pairs
+
+
+class TestSynapsePostNeuronBenchmark:
+    """
+    Benchmarks co-generating one neuron with many synapses. The peak memory allocated during the transformation is reported as ``peak_memory_MB`` in the extra info of the benchmark.
+    """
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("n_synapses", [1, 5, 20])
+    def test_transform_neuron_synapse_pairs(self, benchmark, n_synapses):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+
+        def setup():
+            models, neuron_synapse_pairs = get_models(n_synapses)
+
+            return (SynapsePostNeuronTransformer({"neuron_synapse_pairs": neuron_synapse_pairs}), models), {}
+
+        def transform(transformer, models):
+            tracemalloc.start()
+            models = transformer.transform(models)
+            benchmark.extra_info["peak_memory_MB"] = tracemalloc.get_traced_memory()[1] / 1E6
+            tracemalloc.stop()
+
+            assert len(models) == 1 + 2 * n_synapses
+
+        benchmark.pedantic(transform, setup=setup, rounds=3)
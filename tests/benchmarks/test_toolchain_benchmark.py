@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# test_toolchain_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from tests.benchmarks.toolchain_benchmark import compare
+
+
+class TestToolchainBenchmark:
+    """
+    Tests the comparison of toolchain benchmark results against a baseline.
+    """
+
+    baseline = {"results": {"NEST": {"iaf_psc_exp_neuron": {"parse": 1., "generate_code": 2., "total": 3.},
+                                     "aeif_cond_exp_neuron": {"error": "errors occurred while processing the model"}}}}
+
+    def test_no_regressions(self):
+        benchmark = {"results": {"NEST": {"iaf_psc_exp_neuron": {"parse": 1.1, "generate_code": 1.5, "total": 2.6},
+                                          "aeif_cond_exp_neuron": {"parse": 1., "total": 1.}}}}
+        assert compare(self.baseline, benchmark, threshold=.2) == []
+
+    def test_regression(self):
+        benchmark = {"results": {"NEST": {"iaf_psc_exp_neuron": {"parse": 1.5, "generate_code": 2., "total": 3.5}}}}
+        regressions = compare(self.baseline, benchmark, threshold=.2)
+        assert [regression["phase"] for regression in regressions] == ["parse"]
+        assert regressions[0]["ratio"] == 1.5
+
+    def test_failure_is_regression(self):
+        benchmark = {"results": {"NEST": {"iaf_psc_exp_neuron": {"error": "errors occurred while processing the model"}}}}
+        regressions = compare(self.baseline, benchmark)
+        assert len(regressions) == 1
+        assert regressions[0]["wall_time"] is None
+
+    def test_min_wall_time(self):
+        baseline = {"results": {"NEST": {"iaf_psc_exp_neuron": {"parse": .01, "total": .01}}}}
+        benchmark = {"results": {"NEST": {"iaf_psc_exp_neuron": {"parse": .02, "total": .02}}}}
+        assert compare(baseline, benchmark, min_wall_time=.05) == []
+        assert len(compare(baseline, benchmark, min_wall_time=0.)) == 2
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# test_visitor_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import pytest
+
+from antlr4 import CommonTokenStream, FileStream
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import parse_two_stage
+from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+pytest.importorskip("pytest_benchmark")
+
+MODELS_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models"))
+
+
+@pytest.fixture(scope="module")
+def compilation_units():
+    init_predefined()
+    Logger.init_logger(LoggingLevel.ERROR)
+
+    compilation_units = []
+    for model_file in sorted(glob.glob(os.path.join(MODELS_DIR, "**", "*.nestml"), recursive=True)):
+        stream = CommonTokenStream(PyNestMLLexer(FileStream(model_file, encoding="utf-8")))
+        stream.fill()
+        parser = PyNestMLParser(stream)
+        parser.removeErrorListeners()
+        compilation_units.append(ASTBuilderVisitor(stream.tokens).visit(parse_two_stage(parser, PyNestMLParser.nestMLCompilationUnit)))
+
+    return compilation_units
+
+
+class TestVisitorBenchmark:
+    """
+    Benchmarks traversing the ASTs of all bundled models, which measures the overhead of dispatching each node to the ``visit_*``, ``traverse_*`` and ``endvisit_*`` methods of a visitor.
+    """
+
+    @pytest.mark.benchmark
+    def test_traverse_all_models(self, benchmark, compilation_units):
+        def traverse():
+            for compilation_unit in compilation_units:
+                compilation_unit.accept(ASTVisitor())
+
+        benchmark(traverse)
+
+    @pytest.mark.benchmark
+    def test_traverse_all_models_higher_order_visitor(self, benchmark, compilation_units):
+        n_nodes = [0]
+
+        def count(node):
+            n_nodes[0] += 1
+
+        def traverse():
+            for compilation_unit in compilation_units:
+                compilation_unit.accept(ASTHigherOrderVisitor(count))
+
+        benchmark(traverse)
+        assert n_nodes[0] > 0
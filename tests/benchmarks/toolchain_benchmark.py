@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# toolchain_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+r"""
+Benchmark of the toolchain performance over the bundled model library.
+
+For each target platform and each model in ``models/neurons`` and ``models/synapses``, code is generated (but not built) and the wall time of each processing phase is recorded. The results can be stored as a JSON baseline, and compared against a previously stored baseline:
+
+.. code-block:: bash
+
+   python tests/benchmarks/toolchain_benchmark.py --output baseline.json
+   python tests/benchmarks/toolchain_benchmark.py --compare baseline.json --threshold 0.2
+
+In comparison mode, the process exits with a non-zero exit code if any phase of any model takes longer than in the baseline by more than the given fraction.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import traceback
+
+import pynestml
+from pynestml.frontend.pynestml_frontend import configure_front_end, process
+from pynestml.utils.profiler import Profiler
+
+TARGETS = ["NEST", "PYTHON_STANDALONE", "SPINNAKER"]
+
+# phases recorded by the profiler, see ``Profiler.phase()``. The ODE-toolbox analysis and template rendering are part of code generation.
+PHASES = ["parse", "symbol_table", "check_cocos", "transform", "ode_toolbox_analysis", "render", "generate_code"]
+
+# code generator options that are needed to generate code without the target platform being installed
+CODEGEN_OPTS = {"NEST": {"nest_version": "v3.8"}}
+
+MODELS_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models"))
+
+
+def get_model_paths(model_names: Optional[Sequence[str]] = None) -> List[str]:
+    r"""
+    Returns the paths of all models in ``models/neurons`` and ``models/synapses``.
+
+    :param model_names: if given, only the models with these names (file names without extension) are returned
+    """
+    model_paths = []
+    for model_type in ["neurons", "synapses"]:
+        model_paths.extend(sorted(glob.glob(os.path.join(MODELS_DIR, model_type, "*.nestml"))))
+
+    if model_names is not None:
+        model_paths = [model_path for model_path in model_paths if os.path.splitext(os.path.basename(model_path))[0] in model_names]
+
+    return model_paths
+
+
+def benchmark_model(target_platform: str, model_path: str, repeat: int = 1) -> Dict[str, Any]:
+    r"""
+    Generate code for a single model and record the wall time of each phase. Caches are disabled, so that every phase is actually carried out.
+
+    :param target_platform: the target platform to generate code for
+    :param model_path: path of the model file
+    :param repeat: the number of times code is generated; the minimum wall time of each phase is reported
+    :return: the wall time of each phase, as well as the total wall time, in seconds. If code generation failed, the reason is given under the key ``error`` instead.
+    """
+    timings: Dict[str, float] = {}
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                configure_front_end(input_path=model_path,
+                                    target_platform=target_platform,
+                                    target_path=os.path.join(tmp_dir, "target"),
+                                    logging_level="NO",
+                                    module_name="nestmlmodule",
+                                    codegen_opts=CODEGEN_OPTS.get(target_platform),
+                                    parse_cache=False,
+                                    ode_toolbox_cache=False,
+                                    profile=True)
+                if process(build=False):
+                    return {"error": "errors occurred while processing the model"}
+            except (Exception, SystemExit) as e:
+                return {"error": "".join(traceback.format_exception_only(type(e), e)).strip()}
+            finally:
+                report = Profiler.get_report()
+                Profiler.configure(enabled=False)
+
+        run_timings = {phase: report["summary"][phase]["wall_time"] for phase in PHASES if phase in report["summary"].keys()}
+        run_timings["total"] = report["total_wall_time"]
+        for phase, wall_time in run_timings.items():
+            timings[phase] = min(timings.get(phase, wall_time), wall_time)
+
+    return timings
+
+
+def run_benchmarks(target_platforms: Sequence[str], model_paths: Sequence[str], repeat: int = 1, verbose: bool = False) -> Dict[str, Any]:
+    r"""
+    Benchmark all given models on all given target platforms.
+
+    :return: the results, in the format in which they are stored as baseline
+    """
+    # the default Python recursion limit is 1000, which might not be enough in practice when running an AST visitor on a deep tree, e.g. containing an automatically generated expression
+    sys.setrecursionlimit(10000)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for target_platform in target_platforms:
+        results[target_platform] = {}
+        for model_path in model_paths:
+            model_name = os.path.splitext(os.path.basename(model_path))[0]
+            results[target_platform][model_name] = benchmark_model(target_platform, model_path, repeat=repeat)
+            if verbose:
+                print(target_platform, model_name, json.dumps(results[target_platform][model_name]), flush=True)
+
+    return {"nestml_version": pynestml.__version__,
+            "python_version": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "results": results}
+
+
+def compare(baseline: Mapping[str, Any], benchmark: Mapping[str, Any], threshold: float = .2, min_wall_time: float = .05) -> List[Dict[str, Any]]:
+    r"""
+    Compare benchmark results against a baseline.
+
+    :param baseline: the baseline, as returned by ``run_benchmarks()``
+    :param benchmark: the results to compare, as returned by ``run_benchmarks()``
+    :param threshold: the fraction by which a phase may take longer than in the baseline before it is reported as regression
+    :param min_wall_time: phases that take less than this time (in seconds) in both the baseline and the results are not compared, as their timings are dominated by noise
+    :return: a list of regressions, each with the keys ``target_platform``, ``model``, ``phase``, ``baseline``, ``wall_time`` and ``ratio``. A model that could be processed in the baseline, but fails now, is reported as regression with wall time None.
+    """
+    regressions = []
+    for target_platform, baseline_models in baseline["results"].items():
+        for model_name, baseline_timings in baseline_models.items():
+            timings = benchmark["results"].get(target_platform, {}).get(model_name)
+            if timings is None or "error" in baseline_timings.keys():
+                # not benchmarked, or not comparable
+                continue
+
+            if "error" in timings.keys():
+                regressions.append({"target_platform": target_platform, "model": model_name, "phase": "total", "baseline": baseline_timings["total"], "wall_time": None, "ratio": None})
+                continue
+
+            for phase, baseline_wall_time in baseline_timings.items():
+                if phase not in timings.keys() or max(baseline_wall_time, timings[phase]) < min_wall_time:
+                    continue
+
+                ratio = timings[phase] / baseline_wall_time if baseline_wall_time > 0 else float("inf")
+                if ratio > 1 + threshold:
+                    regressions.append({"target_platform": target_platform, "model": model_name, "phase": phase, "baseline": baseline_wall_time, "wall_time": timings[phase], "ratio": ratio})
+
+    return regressions
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    argument_parser = argparse.ArgumentParser(description="Benchmark the NESTML toolchain (without building the generated code) over the bundled model library.")
+    argument_parser.add_argument("--targets", metavar="TARGET", nargs="+", type=str.upper, choices=TARGETS, help="Target platforms to benchmark. Default is all of " + ", ".join(TARGETS) + ".")
+    argument_parser.add_argument("--models", metavar="NAME", nargs="+", type=str, help="Names of the models to benchmark, e.g. \"iaf_psc_exp_neuron\". Default is all models.")
+    argument_parser.add_argument("--repeat", metavar="N", type=int, default=1, help="Number of times each model is processed; the minimum wall time of each phase is reported. Default is 1.")
+    argument_parser.add_argument("--output", metavar="PATH", type=str, help="Path of the JSON file to store the results in.")
+    argument_parser.add_argument("--compare", metavar="PATH", type=str, help="Path of a JSON file with baseline results to compare against. If given, only the targets and models in the baseline are benchmarked (unless specified otherwise).")
+    argument_parser.add_argument("--threshold", metavar="FRACTION", type=float, default=.2, help="Relative increase in wall time of a phase above which it is reported as regression. Default is 0.2.")
+    argument_parser.add_argument("--min_wall_time", metavar="SECONDS", type=float, default=.05, help="Phases that take less time than this, both in the baseline and in the benchmark, are not compared. Default is 0.05.")
+    parsed_args = argument_parser.parse_args(args)
+
+    baseline = None
+    target_platforms = parsed_args.targets
+    model_names = parsed_args.models
+    if parsed_args.compare:
+        with open(parsed_args.compare) as f:
+            baseline = json.load(f)
+
+        if target_platforms is None:
+            target_platforms = [target_platform for target_platform in TARGETS if target_platform in baseline["results"].keys()]
+
+        if model_names is None:
+            model_names = sorted(set(model_name for models in baseline["results"].values() for model_name in models.keys()))
+
+    if target_platforms is None:
+        target_platforms = TARGETS
+
+    benchmark = run_benchmarks(target_platforms, get_model_paths(model_names), repeat=parsed_args.repeat, verbose=True)
+
+    if parsed_args.output:
+        with open(parsed_args.output, "w") as f:
+            json.dump(benchmark, f, indent=2)
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(baseline, benchmark, threshold=parsed_args.threshold, min_wall_time=parsed_args.min_wall_time)
+    for regression in regressions:
+        if regression["wall_time"] is None:
+            print("REGRESSION: " + regression["target_platform"] + " " + regression["model"] + ": processing failed, but succeeded in the baseline")
+        else:
+            print("REGRESSION: " + regression["target_platform"] + " " + regression["model"] + " " + regression["phase"] + ": "
+                  + "{:.3f} s (baseline: {:.3f} s, +{:.0%})".format(regression["wall_time"], regression["baseline"], regression["ratio"] - 1))
+
+    if regressions:
+        print(str(len(regressions)) + " regression(s) beyond the threshold of {:.0%}".format(parsed_args.threshold))
+        return 1
+
+    print("No regressions beyond the threshold of {:.0%}".format(parsed_args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
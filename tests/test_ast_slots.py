@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_slots.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+class TestASTSlots:
+    """
+    Tests that AST nodes and source locations do not carry a per-instance ``__dict__``.
+    """
+
+    def test_no_instance_dict(self):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        model_file = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "hill_tononi_neuron.nestml"))
+        compilation_unit = ModelParser.parse_file(model_file)
+
+        nodes = []
+        compilation_unit.accept(ASTHigherOrderVisitor(nodes.append))
+        assert nodes
+        for node in nodes:
+            assert not hasattr(node, "__dict__"), type(node).__name__
+            assert not hasattr(node.get_source_position(), "__dict__")
+
+    def test_unset_fields(self):
+        """fields that are only set during code generation are absent until they are assigned"""
+        var = ASTVariable("V_m")
+        assert not hasattr(var, "_is_numeric")
+
+        var._is_numeric = True
+        assert var._is_numeric
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# test_cocos_fused.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import pytest
+import re
+
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_fused_visitor import ASTFusedVisitor
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_parent_aware_visitor import ASTParentAwareVisitor
+
+
+def get_model_files():
+    tests_path = os.path.realpath(os.path.dirname(__file__))
+    return sorted(glob.glob(os.path.join(tests_path, "valid", "*.nestml")) + glob.glob(os.path.join(tests_path, "invalid", "*.nestml")))
+
+
+def check_cocos(model_file: str, fused: bool):
+    """the messages logged while checking the cocos of all models in the file, irrespective of their order"""
+    Logger.init_logger(LoggingLevel.NO)
+    compilation_unit = ModelParser.parse_file(model_file)
+    if compilation_unit is None:
+        return None
+
+    Logger.init_logger(LoggingLevel.NO)
+    for model in compilation_unit.get_model_list():
+        CoCosManager.check_cocos(model, fused=fused)
+
+    return sorted((artifact_name, log_level.name, str(code), str(error_position), re.sub(" object at 0x[0-9a-f]+", "", str(message)))
+                  for artifact_name, _, log_level, code, error_position, message in Logger.get_log().values())
+
+
+class TestCoCosFused:
+    """
+    Tests that checking the cocos in a single traversal of the model gives the same messages as checking them one by one.
+    """
+
+    @pytest.fixture(scope="module", autouse=True)
+    def setUp(self):
+        init_predefined()
+
+    @pytest.mark.parametrize("model_file", get_model_files(), ids=os.path.basename)
+    def test_fused_cocos(self, model_file):
+        assert check_cocos(model_file, fused=True) == check_cocos(model_file, fused=False)
+
+    def test_can_fuse(self):
+        assert ASTFusedVisitor.can_fuse(ASTHigherOrderVisitor(lambda node: None))
+        assert not ASTFusedVisitor.can_fuse(ASTParentAwareVisitor())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# test_common_subexpression_elimination.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import os
+import random
+
+import pytest
+import sympy
+from sympy.core.function import AppliedUndef
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.transformers.common_subexpression_elimination_transformer import CommonSubexpressionEliminationTransformer
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+
+
+ANALYTIC_SOLVER = {
+    "solver": "analytical",
+    "state_variables": ["V_m", "I_syn"],
+    "initial_values": {"V_m": "E_L", "I_syn": "0"},
+    "parameters": {},
+    "propagators": {
+        "__P__V_m__V_m": "1.0*exp(-__h/tau_m)",
+        "__P__V_m__I_syn": "tau_m*tau_syn*(-exp(-__h/tau_m) + exp(-__h/tau_syn))/(C_m*(tau_m - tau_syn))",
+        "__P__I_syn__I_syn": "1.0*exp(-__h/tau_syn)"
+    },
+    "update_expressions": {
+        "V_m": "E_L + I_syn*__P__V_m__I_syn + __P__V_m__V_m*(-E_L + V_m - tau_m*(I_e + I_stim)/C_m) + tau_m*(I_e + I_stim)/C_m",
+        "I_syn": "I_syn*__P__I_syn__I_syn"
+    }
+}
+
+
+@pytest.fixture
+def model():
+    init_predefined()
+    Logger.init_logger(LoggingLevel.ERROR)
+
+    return ModelParser.parse_file(os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), "resources")), "common_subexpression_elimination_test.nestml")).get_model_list()[0]
+
+
+def parse(s: str):
+    return sympy.parsing.sympy_parser.parse_expr(s, global_dict=ODEToolboxUtils._sympy_globals_no_functions)
+
+
+def evaluate(analytic_solver, values):
+    r"""Evaluate the propagators in order, and then the update expressions, for the given values of the other variables."""
+    def _evaluate(s):
+        expr = parse(s).replace(lambda e: isinstance(e, AppliedUndef), lambda e: getattr(sympy, e.func.__name__)(*e.args))
+        return float(expr.subs(values))
+
+    for name, expr in analytic_solver["propagators"].items():
+        values[name] = _evaluate(expr)
+
+    return {sym: _evaluate(expr) for sym, expr in analytic_solver["update_expressions"].items()}
+
+
+class TestCommonSubexpressionElimination:
+    """
+    Tests common-subexpression elimination on the solver returned by ODE-toolbox.
+    """
+
+    def test_common_subexpression_elimination(self, model):
+        analytic_solver = copy.deepcopy(ANALYTIC_SOLVER)
+        CommonSubexpressionEliminationTransformer({"analytic_solver": analytic_solver}).transform(model)
+
+        # shared sub-expressions are computed once
+        propagators = analytic_solver["propagators"]
+        assert sum(expr.count("exp(") for expr in propagators.values()) == 2
+        assert list(propagators.keys())[-3:] == list(ANALYTIC_SOLVER["propagators"].keys())
+
+        # sub-expressions of the update expressions that only depend on parameters are computed with the propagators
+        update_expr = parse(analytic_solver["update_expressions"]["V_m"])
+        assert not {"C_m", "tau_m"} & set(str(sym) for sym in update_expr.free_symbols)
+        assert analytic_solver["update_expressions"]["I_syn"] == ANALYTIC_SOLVER["update_expressions"]["I_syn"]
+        for expr in propagators.values():
+            assert not {"V_m", "I_syn", "I_stim"} & set(str(sym) for sym in parse(expr).free_symbols)
+
+        for _ in range(10):
+            values = {name: random.uniform(1., 2.) for name in ["__h", "V_m", "I_syn", "E_L", "tau_m", "tau_syn", "C_m", "I_e", "I_stim"]}
+            expected = evaluate(ANALYTIC_SOLVER, dict(values))
+            actual = evaluate(analytic_solver, dict(values))
+            for sym in expected.keys():
+                assert actual[sym] == pytest.approx(expected[sym])
+
+    def test_impure_functions(self, model):
+        analytic_solver = copy.deepcopy(ANALYTIC_SOLVER)
+        analytic_solver["update_expressions"]["V_m"] += " + sigma*random_normal(0, 1)"
+        CommonSubexpressionEliminationTransformer({"analytic_solver": analytic_solver}).transform(model)
+
+        assert "random_normal" in analytic_solver["update_expressions"]["V_m"]
+        assert not any("random_normal" in expr for expr in analytic_solver["propagators"].values())
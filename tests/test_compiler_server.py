@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# test_compiler_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import json
+import os
+import socket
+import threading
+import time
+import pytest
+
+from pynestml.frontend import pynestml_frontend
+from pynestml.frontend.compiler_server import CompilerServer
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.symbols.predefined_units import PredefinedUnits
+
+
+class TestCompilerServer:
+    """
+    Tests that the compiler server handles consecutive requests independently of each other.
+    """
+
+    @pytest.fixture(autouse=True)
+    def resident_predefined(self):
+        pynestml_frontend.keep_predefined_resident()
+        yield
+        pynestml_frontend._resident_predefined = None
+
+    def _get_args(self, model_path, target_path, *args):
+        return ["--input_path", os.path.realpath(os.path.join(os.path.dirname(__file__), model_path)),
+                "--target_path", str(target_path),
+                "--target_platform", "NONE",
+                "--logging_level", "INFO",
+                "--no_parse_cache",
+                *args]
+
+    def test_consecutive_requests(self, tmp_path):
+        response = CompilerServer.handle_request({"args": self._get_args(os.path.join("invalid", "CoCoVariableNotDefined.nestml"), tmp_path, "--suffix", "_alt")})
+        assert response["exit_code"] == 1
+        assert any(message["severity"] == "ERROR" for message in response["messages"])
+        assert "ERROR" in response["output"]
+
+        # units registered while processing a model do not persist between requests
+        PredefinedUnits.name2unit["__test_unit"] = None
+
+        response = CompilerServer.handle_request({"args": self._get_args(os.path.join(os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"), tmp_path)})
+        assert response["exit_code"] == 0
+        assert not any(message["severity"] == "ERROR" for message in response["messages"])
+        assert not any("CoCoVariableNotDefined" in message["filename"] for message in response["messages"])
+        assert FrontendConfiguration.suffix == ""
+        assert "__test_unit" not in PredefinedUnits.name2unit.keys()
+
+    def test_invalid_requests(self):
+        assert CompilerServer.handle_line("not json")["exit_code"] == 1
+        assert CompilerServer.handle_request({"args": "--input_path"})["exit_code"] == 1
+        assert CompilerServer.handle_request({"command": "unknown"})["exit_code"] == 1
+
+        # missing required argument
+        response = CompilerServer.handle_request({"args": []})
+        assert response["exit_code"] == 2
+        assert "--input_path" in response["output"]
+
+    def test_serve_stdio(self, tmp_path):
+        request = {"args": self._get_args(os.path.join(os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"), tmp_path)}
+        instream = io.StringIO("\n".join([json.dumps(request), json.dumps(request), json.dumps({"command": "shutdown"}), json.dumps(request)]) + "\n")
+        outstream = io.StringIO()
+        CompilerServer.serve_stdio(instream, outstream)
+
+        responses = [json.loads(line) for line in outstream.getvalue().splitlines()]
+        assert len(responses) == 3
+        assert responses[0]["exit_code"] == 0
+        assert responses[1] == responses[0]
+        assert responses[2]["shutdown"]
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="UNIX domain sockets are not available on this platform")
+    def test_serve_socket(self, tmp_path):
+        socket_path = str(tmp_path / "nestml.sock")
+        server_thread = threading.Thread(target=CompilerServer.serve_socket, args=(socket_path,))
+        server_thread.start()
+        try:
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(.1)
+
+            response = CompilerServer.send_request(socket_path, {"args": self._get_args(os.path.join(os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"), tmp_path), "cwd": str(tmp_path)})
+            assert response["exit_code"] == 0
+        finally:
+            CompilerServer.send_request(socket_path, {"command": "shutdown"})
+            server_thread.join()
+
+        assert not os.path.exists(socket_path)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# test_expression_type_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from astropy import units as u
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+
+class TestExpressionTypeCache:
+    """
+    Tests that the type of an expression is kept until the expression is changed, and that the memoized unit algebra gives the same results as astropy.
+    """
+
+    def test_invalidate_type(self):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        model = ModelParser.parse_model("""model test:
+    parameters:
+        V mV = 1 mV
+        I pA = 1 pA
+        t ms = 1 ms
+        x mV / ms = V / t
+""")
+        model.accept(ASTSymbolTableVisitor())
+
+        expr = model.get_parameters_blocks()[0].get_declarations()[-1].get_expression()
+        assert expr.type.print_nestml_type() == "mV / ms"
+        assert expr.has_type() and expr.get_lhs().has_type()
+
+        # renaming a variable discards the types of the expressions that contain it
+        expr.get_lhs().get_variable().set_name("I")
+        assert not expr.has_type() and not expr.get_lhs().has_type()
+        assert expr.get_rhs().has_type()
+        assert expr.type.print_nestml_type() == "pA / ms"
+
+        # as does replacing it
+        variable = ASTNodeFactory.create_ast_variable("V")
+        variable.update_scope(expr.get_lhs().get_scope())
+        expr.get_lhs().set_variable(variable)
+        assert not expr.has_type()
+        assert expr.type.print_nestml_type() == "mV / ms"
+
+    def test_invalidate_type_differential_order(self):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        model = ModelParser.parse_model("""model test:
+    state:
+        V mV = 0 mV
+        V' mV / ms = 0 mV / ms
+
+    parameters:
+        tau ms = 1 ms
+
+    equations:
+        V'' = -V' / tau
+""")
+        model.accept(ASTSymbolTableVisitor())
+
+        expr = model.get_equations_blocks()[0].get_ode_equations()[0].get_rhs()
+        assert expr.type.print_nestml_type() == "mV / ms2"
+
+        # changing the differential order of a variable discards the types of the expressions that contain it
+        expr.get_lhs().get_expression().get_variable().set_differential_order(0)
+        assert not expr.has_type()
+        assert expr.type.print_nestml_type() == "mV / ms"
+
+    def test_unit_algebra(self):
+        init_predefined()
+        mV = PredefinedTypes.get_type("mV")
+        ms = PredefinedTypes.get_type("ms")
+
+        for _ in range(2):
+            assert mV.multiply_by(ms).print_nestml_type() == str(u.mV * u.ms)
+            assert mV.divide_by(ms).print_nestml_type() == str(u.mV / u.ms)
+            assert mV.to_the_power_of(2).print_nestml_type() == str(u.mV ** 2)
+            assert UnitTypeSymbol.get_conversion_factor(u.mV, u.V) == (u.mV / u.V).si.scale
+            assert UnitTypeSymbol.get_conversion_factor(1 / u.s, 2 / u.s) is None
+
+        assert UnitTypeSymbol.get_unit_key(u.mV / u.ms) == UnitTypeSymbol.get_unit_key(u.mV * u.ms ** -1)
+        assert UnitTypeSymbol.get_unit_key(u.mV / u.ms) != UnitTypeSymbol.get_unit_key(u.V / u.s)
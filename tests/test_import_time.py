@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# test_import_time.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Dict
+
+import os
+import re
+import subprocess
+import sys
+
+
+class TestImportTime:
+    """
+    Tests that importing the frontend does not import the heavy dependencies that are only needed in later processing phases (ODE-toolbox and sympy for analysis, jinja2 for rendering, astropy for unit checking), and that it stays within a time budget.
+    """
+
+    IMPORT_TIME_BUDGET = .5    # [s]
+
+    def _get_import_times(self, statement: str) -> Dict[str, float]:
+        r"""
+        Run the given import statement in a new interpreter with ``-X importtime``, and return the cumulative import time in seconds by module name.
+        """
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join([os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir))] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+
+        # run twice, so that the timing does not include writing the bytecode cache
+        for _ in range(2):
+            result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=env, capture_output=True, text=True, check=True)
+
+        import_times = {}
+        for line in result.stderr.splitlines():
+            match = re.match(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\S+)", line)
+            if match:
+                import_times[match.group(3)] = int(match.group(2)) * 1E-6
+
+        return import_times
+
+    def test_frontend_import(self):
+        import_times = self._get_import_times("import pynestml.frontend.pynestml_frontend")
+
+        for module in ["sympy", "odetoolbox", "jinja2", "astropy", "pynestml.cocos.co_cos_manager"]:
+            assert module not in import_times.keys(), "Importing the frontend should not import " + module
+
+        assert import_times["pynestml.frontend.pynestml_frontend"] < self.IMPORT_TIME_BUDGET
+
+    def test_cocos_import(self):
+        import_times = self._get_import_times("import pynestml.cocos.co_cos_manager")
+
+        for module in ["sympy", "odetoolbox", "jinja2"]:
+            assert module not in import_times.keys(), "Importing the context conditions should not import " + module
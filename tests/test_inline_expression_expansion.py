@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# test_inline_expression_expansion.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.transformers.inline_expression_expansion_transformer import InlineExpressionExpansionTransformer
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+
+class TestInlineExpressionExpansion:
+    """
+    Tests that inline expressions are expanded into each other and into the ODEs, irrespective of the order in which they are defined.
+    """
+
+    def test_inline_expression_expansion(self):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        model = ModelParser.parse_model("""model test_neuron:
+    state:
+        V_m mV = 0 mV
+
+    equations:
+        inline I_syn pA = I_exc + I_inh
+        inline I_exc pA = g_exc * (E_exc - V_m)
+        inline I_inh pA = g_inh * (E_inh - V_m) * exp(I_exc / pA)
+        V_m' = (I_syn + I_e) / C_m
+
+    parameters:
+        g_exc nS = 1 nS
+        g_inh nS = 1 nS
+        E_exc mV = 0 mV
+        E_inh mV = -80 mV
+        I_e pA = 0 pA
+        C_m pF = 250 pF
+""")
+        model.accept(ASTSymbolTableVisitor())
+        equations_block = model.get_equations_blocks()[0]
+        I_exc = equations_block.get_inline_expressions()[1].get_expression()
+
+        InlineExpressionExpansionTransformer().transform(model)
+
+        I_syn, I_exc_expanded, I_inh = [str(inline_expression.get_expression()) for inline_expression in equations_block.get_inline_expressions()]
+        assert I_exc_expanded == "g_exc * (E_exc - V_m)"
+        assert I_inh == "g_inh * (E_inh - V_m) * exp((g_exc * (E_exc - V_m)) / pA)"
+        assert I_syn == "(g_exc * (E_exc - V_m)) + (" + I_inh + ")"
+        assert str(equations_block.get_ode_equations()[0].get_rhs()) == "((" + I_syn + ") + I_e) / C_m"
+
+        # the expressions are replaced by expanded clones; parent links are set up
+        assert equations_block.get_inline_expressions()[1].get_expression() is not I_exc
+        for inline_expression in equations_block.get_inline_expressions():
+            assert inline_expression.get_expression().get_parent() is inline_expression
+        assert equations_block.get_ode_equations()[0].get_rhs().get_rhs().get_parent() is equations_block.get_ode_equations()[0].get_rhs()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# test_logger.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import DeferredMessage, MessageCode, Messages
+
+
+class TestLogger:
+    """
+    Tests duplicate suppression, message counts, the bounded-memory mode, the JSON lines output and deferred messages of the logger.
+    """
+
+    def teardown_method(self):
+        Logger.init_logger(LoggingLevel.ERROR)
+
+    def test_duplicates(self):
+        Logger.init_logger(LoggingLevel.NO)
+        position = ASTSourceLocation(1, 2, 1, 5)
+
+        Logger.log_message(code=MessageCode.CAST_NOT_POSSIBLE, message="a", error_position=position, log_level=LoggingLevel.ERROR)
+        Logger.log_message(code=MessageCode.CAST_NOT_POSSIBLE, message="a", error_position=ASTSourceLocation(1, 2, 1, 5), log_level=LoggingLevel.ERROR)
+        assert len(Logger.get_log()) == 1
+
+        Logger.log_message(code=MessageCode.CAST_NOT_POSSIBLE, message="a", error_position=position, log_level=LoggingLevel.ERROR, allow_duplicates=True)
+        Logger.log_message(code=MessageCode.CAST_NOT_POSSIBLE, message="b", error_position=position, log_level=LoggingLevel.WARNING)
+        assert len(Logger.get_log()) == 3
+
+        assert Logger.has_errors("model")
+        assert Logger.get_number_of_messages_of_level_and_or_node(None, LoggingLevel.ERROR) == 2
+        assert Logger.get_number_of_messages_of_level_and_or_node(None, LoggingLevel.WARNING) == 1
+        assert Logger.get_number_of_messages_of_level_and_or_node(None, None) == 3
+        assert Logger.get_number_of_messages_of_level_and_or_node(None, LoggingLevel.ERROR) == len(Logger.get_all_messages_of_level_and_or_node(None, LoggingLevel.ERROR))
+
+    def test_max_messages(self):
+        Logger.init_logger(LoggingLevel.NO, max_messages=2)
+        for i in range(5):
+            Logger.log_message(message=str(i), log_level=LoggingLevel.ERROR)
+
+        assert [message for (_, _, _, _, _, message) in Logger.get_log().values()] == ["3", "4"]
+        assert Logger.get_number_of_messages_of_level_and_or_node(None, LoggingLevel.ERROR) == 5
+
+        # messages that were dropped from the log are not detected as duplicates
+        Logger.log_message(message="0", log_level=LoggingLevel.ERROR)
+        Logger.log_message(message="4", log_level=LoggingLevel.ERROR)
+        assert [message for (_, _, _, _, _, message) in Logger.get_log().values()] == ["4", "0"]
+
+    def test_log_stream(self, tmp_path):
+        log_stream_path = str(tmp_path / "log.jsonl")
+        Logger.init_logger(LoggingLevel.NO, log_stream_path=log_stream_path)
+        Logger.log_message(code=MessageCode.CAST_NOT_POSSIBLE, message="a \"quoted\" message", error_position=ASTSourceLocation(1, 2, 1, 5), log_level=LoggingLevel.ERROR)
+        Logger.log_message(message="b", log_level=LoggingLevel.INFO)
+
+        with open(log_stream_path) as f:
+            assert [json.loads(line) for line in f] == json.loads(Logger.get_json_format())
+
+        assert json.loads(Logger.get_json_format())[0] == {"filename": "", "nodeName": "GLOBAL", "severity": "ERROR", "code": "CAST_NOT_POSSIBLE",
+                                                           "row": "1", "col": "2", "message": "a 'quoted' message"}
+
+    def test_deferred_message(self):
+        Logger.init_logger(LoggingLevel.NO)
+        n_formatted = []
+
+        def get_message(name):
+            n_formatted.append(name)
+            return Messages.get_start_processing_model(name)
+
+        Logger.freeze_log()
+        Logger.log_message(code=MessageCode.START_PROCESSING_MODEL, message=DeferredMessage(get_message, "iaf"), log_level=LoggingLevel.INFO)
+        Logger.freeze_log(False)
+        assert not n_formatted
+
+        Logger.log_message(code=MessageCode.START_PROCESSING_MODEL, message=DeferredMessage(get_message, "iaf"), log_level=LoggingLevel.INFO)
+        Logger.log_message(code=MessageCode.START_PROCESSING_MODEL, message=DeferredMessage(get_message, "iaf"), log_level=LoggingLevel.INFO)
+        Logger.log_message(message=DeferredMessage("Processing {} and {}", "a", 1), log_level=LoggingLevel.INFO)
+        Logger.log_message(message=DeferredMessage("Processing {} and {}", "a", 1), log_level=LoggingLevel.INFO)
+
+        # duplicates are detected without formatting the messages
+        assert not n_formatted
+
+        assert [message for (_, _, message) in Logger.get_all_messages_of_level(LoggingLevel.INFO)] == ["Starts processing of the model 'iaf'", "Processing a and 1"]
+        assert n_formatted == ["iaf"]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# test_loop_invariant_hoisting.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.transformers.loop_invariant_hoisting_transformer import LoopInvariantHoistingTransformer
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+@pytest.fixture
+def model():
+    init_predefined()
+    Logger.init_logger(LoggingLevel.ERROR)
+
+    return ModelParser.parse_file(os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), "resources")), "loop_invariant_hoisting_test.nestml")).get_model_list()[0]
+
+
+class TestLoopInvariantHoisting:
+    """
+    Tests moving loop-invariant expressions from the update and onReceive blocks into the internals block.
+    """
+
+    def test_loop_invariant_hoisting(self, model):
+        transformer = LoopInvariantHoistingTransformer({"hoist_loop_invariant_expressions": True})
+        transformer.transform(model)
+
+        assert transformer.get_hoisted_expressions()["hoisting_test_neuron"] == [("__hoisted_0", "exp(-resolution() / tau_syn)"),
+                                                                                 ("__hoisted_1", "exp(-resolution() / tau_m)"),
+                                                                                 ("__hoisted_2", "steps(t_ref)"),
+                                                                                 ("__hoisted_3", "C_m / tau_syn * ms")]
+
+        # the new internals are declared with the type of the expressions
+        for name, type_str in [("__hoisted_0", "real"), ("__hoisted_2", "integer"), ("__hoisted_3", "pF")]:
+            symbol = model.get_scope().resolve_to_symbol(name, SymbolKind.VARIABLE)
+            assert symbol.is_internals()
+            assert symbol.get_type_symbol().print_nestml_type() == type_str
+
+        stmts = [str(stmt) for block in model.get_update_blocks() + model.get_on_receive_blocks() for stmt in block.get_stmts_body().get_stmts()]
+        assert "I_syn = I_syn * __hoisted_0 + sigma * random_normal(0,1)" in stmts[0]
+        assert "V_m = E_L + (V_m - E_L) * __hoisted_1 + (I_offset + I_syn) / C_m * resolution()" in stmts[1]
+        assert "refr_counts = __hoisted_2" in stmts[2]
+
+        # expressions that are guarded by an invariant condition are left in place
+        assert "C_m / tau_m - C_m / tau_syn" in stmts[3]
+
+        # ``t`` changes during the simulation
+        assert "exp(-t / tau_syn) * __hoisted_3 / pF" in stmts[4]
+
+        CoCosManager.check_cocos(model)
+        assert not Logger.has_errors(model)
+
+    def test_disabled_by_default(self, model):
+        model_str = str(model)
+        LoopInvariantHoistingTransformer().transform(model)
+
+        assert str(model) == model_str
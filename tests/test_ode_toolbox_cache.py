@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# test_ode_toolbox_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+import odetoolbox
+from odetoolbox.shapes import Shape
+
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
+
+
+class TestODEToolboxCache:
+    """
+    Tests that ODE-toolbox analysis results are stored in and retrieved from the on-disk cache.
+    """
+
+    indict = {"dynamics": [{"expression": "x' = -x / tau",
+                            "initial_value": "0"}],
+              "parameters": {"tau": "10"}}
+
+    # a neuron with a non-linear membrane potential equation and an analytically solvable synaptic current
+    indict_mixed = {"dynamics": [{"expression": "V_m' = (-(V_m - E_L) + Delta_T * exp((V_m - V_th) / Delta_T) + I_syn) / tau_m",
+                                  "initial_value": "E_L"},
+                                 {"expression": "I_syn' = -I_syn / tau_syn",
+                                  "initial_value": "0"}],
+                    "parameters": {"E_L": "-70", "Delta_T": "2", "V_th": "-50", "tau_m": "10", "tau_syn": "2"},
+                    "options": {"output_timestep_symbol": "__h"}}
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        ODEToolboxCache.configure(cache_dir=str(tmp_path))
+        ODEToolboxCache.reset_statistics()
+        yield
+        ODEToolboxCache.configure()
+        ODEToolboxCache.reset_statistics()
+
+    def _get_cache_entries(self):
+        if not os.path.isdir(ODEToolboxCache.get_cache_dir()):
+            return []
+
+        return [fn for fn in os.listdir(ODEToolboxCache.get_cache_dir()) if fn.endswith(ODEToolboxCache.FILE_EXTENSION_)]
+
+    def test_cache_hit(self):
+        solver_result = ODEToolboxCache.analysis(self.indict, disable_stiffness_check=True)
+        assert ODEToolboxCache.hits == 0
+        assert ODEToolboxCache.misses == 1
+        assert len(self._get_cache_entries()) == 1
+
+        solver_result_cached = ODEToolboxCache.analysis(self.indict, disable_stiffness_check=True)
+        assert ODEToolboxCache.hits == 1
+        assert ODEToolboxCache.misses == 1
+        assert solver_result_cached == solver_result
+        assert solver_result[0]["solver"] == "analytical"
+
+    def test_cache_disabled(self):
+        ODEToolboxCache.configure(enabled=False, cache_dir=ODEToolboxCache.get_cache_dir())
+        ODEToolboxCache.analysis(self.indict, disable_stiffness_check=True)
+        ODEToolboxCache.analysis(self.indict, disable_stiffness_check=True)
+        assert ODEToolboxCache.hits == 0
+        assert ODEToolboxCache.misses == 2
+        assert len(self._get_cache_entries()) == 0
+
+    def test_cache_key(self):
+        key = ODEToolboxCache.compute_key(self.indict, {"disable_stiffness_check": True})
+        assert key == ODEToolboxCache.compute_key(dict(reversed(list(self.indict.items()))), {"disable_stiffness_check": True})
+        assert key == ODEToolboxCache.compute_key(self.indict, {"disable_stiffness_check": True, "log_level": "DEBUG"})
+        assert key != ODEToolboxCache.compute_key(self.indict, {"disable_stiffness_check": False})
+        assert key != ODEToolboxCache.compute_key(self.indict, {"disable_stiffness_check": True, "disable_analytic_solver": True})
+        assert key != ODEToolboxCache.compute_key({**self.indict, "parameters": {"tau": "20"}}, {"disable_stiffness_check": True})
+
+    @pytest.mark.parametrize("preserve_expressions", [False, True])
+    def test_numeric_solver_single_analysis(self, monkeypatch, preserve_expressions):
+        """
+        Test that the all-numeric solver is derived from a single ODE-toolbox analysis, and that it is identical to the one obtained from a second analysis with the analytic solver disabled.
+        """
+        ODEToolboxCache.configure(enabled=False)
+
+        solver_result_expected = odetoolbox.analysis(self.indict_mixed, disable_stiffness_check=True, preserve_expressions=preserve_expressions)
+        numeric_solver_expected = odetoolbox.analysis(self.indict_mixed, disable_stiffness_check=True, disable_analytic_solver=True, preserve_expressions=preserve_expressions)[0]
+
+        n_calls = [0]
+        orig_analysis = odetoolbox.analysis
+        orig__analysis = odetoolbox._analysis
+
+        def counting_analysis(*args, **kwargs):
+            n_calls[0] += 1
+            return orig_analysis(*args, **kwargs)
+
+        def counting__analysis(*args, **kwargs):
+            n_calls[0] += 1
+            return orig__analysis(*args, **kwargs)
+
+        monkeypatch.setattr(odetoolbox, "analysis", counting_analysis)
+        monkeypatch.setattr(odetoolbox, "_analysis", counting__analysis)
+
+        solver_result, numeric_solver = ODEToolboxCache.analysis_with_numeric_solver(self.indict_mixed, disable_stiffness_check=True, preserve_expressions=preserve_expressions)
+        assert n_calls[0] == 1
+
+        assert sorted([x["solver"] for x in solver_result]) == ["analytical", "numeric"]
+        assert solver_result == solver_result_expected
+        assert numeric_solver == numeric_solver_expected
+        assert sorted(numeric_solver["state_variables"]) == ["I_syn", "V_m"]
+
+        # ODE-toolbox's globals are shared by all analyses in the process, and must be left unchanged
+        assert "__builtins__" not in Shape._sympy_globals
+
+    def test_analysis_after_numeric_solver(self):
+        """
+        Test that ODE-toolbox can still analyse a system with parameters after the all-numeric solver has been derived.
+        """
+        ODEToolboxCache.configure(enabled=False)
+
+        sympy_globals = dict(Shape._sympy_globals)
+        ODEToolboxCache.analysis_with_numeric_solver(self.indict_mixed, disable_stiffness_check=True)
+        assert Shape._sympy_globals == sympy_globals
+
+        solver_result = odetoolbox.analysis(self.indict_mixed, disable_stiffness_check=True)
+        assert sorted([x["solver"] for x in solver_result]) == ["analytical", "numeric"]
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# test_parallel_code_generation.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import multiprocessing
+import os
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_target, get_independent_model_groups, init_predefined
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                    reason="Parallel code generation requires the fork start method")
+class TestParallelCodeGeneration:
+    """
+    Tests that generating code with several jobs gives the same result as generating code in a single process.
+    """
+
+    def _get_model_path(self, model_name: str) -> str:
+        return os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", model_name + ".nestml"))
+
+    def _generate(self, target_path, n_jobs):
+        os.makedirs(target_path)
+        generate_target(input_path=[self._get_model_path(model_name) for model_name in ["iaf_psc_exp_neuron", "iaf_psc_alpha_neuron", "izhikevich_neuron"]],
+                        target_platform="PYTHON_STANDALONE",
+                        target_path=target_path,
+                        logging_level="INFO",
+                        module_name="nestmlmodule",
+                        ode_toolbox_cache=False,
+                        n_jobs=n_jobs)
+
+        # the order of messages depends on the order in which models are processed
+        return sorted([message.replace(target_path, "") for (_, _, message) in Logger.get_all_messages_of_level(LoggingLevel.INFO)])
+
+    def _read_files(self, target_path):
+        contents = {}
+        for fn in os.listdir(target_path):
+            with open(os.path.join(target_path, fn)) as f:
+                # skip time stamps; the order of some lines depends on the order in which models are processed
+                contents[fn] = sorted([line for line in f.read().splitlines() if "Generated from NESTML" not in line])
+
+        return contents
+
+    def test_parallel_code_generation(self, tmp_path):
+        messages_serial = self._generate(str(tmp_path / "serial"), n_jobs=1)
+        messages_parallel = self._generate(str(tmp_path / "parallel"), n_jobs=2)
+
+        files_serial = self._read_files(str(tmp_path / "serial"))
+        files_parallel = self._read_files(str(tmp_path / "parallel"))
+
+        assert "izhikevich_neuron.py" in files_serial.keys()
+        assert "simulator.py" in files_serial.keys()
+        assert files_parallel == files_serial
+        assert messages_parallel == messages_serial
+
+    def test_model_groups(self):
+        init_predefined()
+        neuron, other_neuron = [ModelParser.parse_file(self._get_model_path(model_name)).get_model_list()[0] for model_name in ["iaf_psc_exp_neuron", "izhikevich_neuron"]]
+        synapse = ModelParser.parse_file(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "synapses", "stdp_synapse.nestml"))).get_model_list()[0]
+
+        # co-generated neuron and synapse
+        neuron.paired_synapse = synapse
+        synapse.paired_neuron = neuron
+
+        groups = get_independent_model_groups([synapse, other_neuron, neuron])
+        assert [[model.get_name() for model in group] for group in groups] == [["iaf_psc_exp_neuron", "stdp_synapse"], ["izhikevich_neuron"]]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# test_parent_links.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+def assert_doubly_linked(root: ASTNode):
+    def check(node):
+        for child in node.get_children():
+            assert child.get_parent() is node
+
+    root.accept(ASTHigherOrderVisitor(check))
+
+
+class TestParentLinks:
+    """
+    Tests that parent links are maintained by ``ASTNodeFactory`` and the mutators of the AST, without running the ``ASTParentVisitor``.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        ASTNode.check_parent_links = True
+        yield
+        ASTNode.check_parent_links = False
+
+    def test_parsed_model(self):
+        model_file = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "hill_tononi_neuron.nestml"))
+        model = ModelParser.parse_file(model_file).get_model_list()[0]
+
+        assert model.get_parent() is None
+        assert_doubly_linked(model)
+
+    def test_added_declaration(self):
+        model_file = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        model = ModelParser.parse_file(model_file).get_model_list()[0]
+
+        ASTUtils.add_declaration_to_internals(model, "__h", "resolution()")
+        ASTUtils.add_declaration_to_state_block(model, "x", "1 + y")
+
+        assert_doubly_linked(model)
+
+    def test_mutators(self):
+        expr = ModelParser.parse_expression("a + b")
+        simple_expr = expr.get_lhs()
+        var = ASTNodeFactory.create_ast_variable("c", source_position=ASTSourceLocation.get_added_source_position())
+        simple_expr.set_variable(var)
+
+        assert var.get_parent() is simple_expr
+        assert simple_expr.get_parent() is expr
+
+    def test_inconsistent_link(self):
+        expr = ModelParser.parse_expression("a + b")
+        rhs = expr.get_rhs()
+        expr.rhs = ModelParser.parse_expression("c")
+
+        with pytest.raises(AssertionError):
+            rhs.get_parent()
+
+        ASTNode.check_parent_links = False
+        assert rhs.get_parent() is expr
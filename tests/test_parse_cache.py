@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# test_parse_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.parse_cache import ParseCache
+
+
+class TestParseCache:
+    """
+    Tests that parsed models are stored in and correctly restored from the on-disk parse cache.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.INFO)
+        ParseCache.configure(cache_dir=str(tmp_path))
+        yield
+        ParseCache.configure()
+
+    def _get_model_path(self, model_name: str) -> str:
+        return os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", model_name + ".nestml"))
+
+    def _get_cache_entries(self):
+        return [fn for fn in os.listdir(ParseCache.get_cache_dir()) if fn.endswith(ParseCache.FILE_EXTENSION_)]
+
+    def test_cache_hit_gives_identical_model(self):
+        fn = self._get_model_path("aeif_cond_exp_neuron")
+        ast = ModelParser.parse_file(fn)
+        assert len(self._get_cache_entries()) == 1
+
+        ast_cached = ModelParser.parse_file(fn)
+        assert len(self._get_cache_entries()) == 1
+        assert ast_cached is not ast
+        assert str(ast_cached) == str(ast)
+
+        # symbol table and type symbols are rebuilt after loading
+        model = ast_cached.get_model_list()[0]
+        assert model.get_scope() is not None
+        V_m_symbol = model.get_scope().resolve_to_symbol("V_m", SymbolKind.VARIABLE)
+        assert V_m_symbol is not None
+        assert V_m_symbol.get_type_symbol().print_symbol() == "mV"
+
+        assert any([code is not None and code.name == "PARSE_CACHE_HIT" for (_, _, _, code, _, _) in Logger.get_log().values()])
+
+    def test_cache_disabled(self):
+        ParseCache.configure(enabled=False, cache_dir=ParseCache.get_cache_dir())
+        ModelParser.parse_file(self._get_model_path("iaf_psc_exp_neuron"))
+        assert len(self._get_cache_entries()) == 0
+
+    def test_cache_key(self):
+        fn = self._get_model_path("iaf_psc_exp_neuron")
+        with open(fn, "rb") as f:
+            content = f.read()
+
+        key = ParseCache.compute_key(fn, content)
+        assert key == ParseCache.compute_key(fn, content)
+        assert key != ParseCache.compute_key(fn, content + b"\n")
+        assert key != ParseCache.compute_key(fn, content, suffix="_nestml")
+
+        # changes to the sources of the AST classes invalidate the entries
+        source_fingerprint = ParseCache.get_source_fingerprint()
+        try:
+            ParseCache._source_fingerprint = "changed"
+            assert key != ParseCache.compute_key(fn, content)
+        finally:
+            ParseCache._source_fingerprint = source_fingerprint
+
+    def test_stale_slot_layout(self, monkeypatch):
+        fn = self._get_model_path("iaf_psc_exp_neuron")
+
+        # store an entry as if it was written when the AST classes did not have the ``parent_`` slot yet
+        get_slot_layout = ParseCache._get_slot_layout
+        monkeypatch.setattr(ParseCache, "_get_slot_layout", lambda classes: {k: tuple(slot for slot in v if slot != "parent_") for k, v in get_slot_layout(classes).items()})
+        ModelParser.parse_file(fn)
+        monkeypatch.undo()
+        assert len(self._get_cache_entries()) == 1
+
+        Logger.init_logger(LoggingLevel.INFO)
+        ast = ModelParser.parse_file(fn)
+        assert not any([code is not None and code.name == "PARSE_CACHE_HIT" for (_, _, _, code, _, _) in Logger.get_log().values()])
+        assert ast.get_model_list()[0].get_body().get_parent() is ast.get_model_list()[0]
+
+        # the entry was replaced by a current one
+        Logger.init_logger(LoggingLevel.INFO)
+        ModelParser.parse_file(fn)
+        assert any([code is not None and code.name == "PARSE_CACHE_HIT" for (_, _, _, code, _, _) in Logger.get_log().values()])
+
+    def test_lru_eviction(self):
+        fns = [self._get_model_path(model_name) for model_name in ["iaf_psc_exp_neuron", "iaf_psc_alpha_neuron", "iaf_psc_delta_neuron"]]
+        ModelParser.parse_file(fns[0])
+        entry_size = os.path.getsize(os.path.join(ParseCache.get_cache_dir(), self._get_cache_entries()[0]))
+
+        # leave room for about two entries
+        ParseCache.max_size = int(2.5 * entry_size)
+
+        ModelParser.parse_file(fns[1])
+        entries_before = set(self._get_cache_entries())
+        assert len(entries_before) == 2
+
+        # make sure the first entry is the least recently used one
+        for entry in entries_before:
+            os.utime(os.path.join(ParseCache.get_cache_dir(), entry), (0, 0))
+
+        ModelParser.parse_file(fns[0])
+        ModelParser.parse_file(fns[2])
+        entries_after = set(self._get_cache_entries())
+        assert len(entries_after) == 2
+
+        with open(fns[0], "rb") as f:
+            key_0 = ParseCache.compute_key(fns[0], f.read())
+
+        assert key_0 + ParseCache.FILE_EXTENSION_ in entries_after
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# test_predefined_units.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from astropy import units as u
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class TestPredefinedUnits:
+    """
+    Tests that units and unit types that are registered on first lookup are the same as when all units are registered up front.
+    """
+
+    def setup_method(self):
+        Logger.init_logger(LoggingLevel.INFO)
+        init_predefined()
+
+    def test_lookup(self):
+        assert "mV" not in PredefinedUnits.name2unit.keys()
+        assert PredefinedUnits.is_unit("mV")
+        assert PredefinedUnits.get_unit("mV").get_unit() == u.mV
+
+        type_symbol = PredefinedTypes.get_type("nS")
+        assert isinstance(type_symbol, UnitTypeSymbol)
+        assert type_symbol.unit.get_unit() == u.nS
+
+        assert not PredefinedUnits.is_unit("not_a_unit")
+        assert PredefinedUnits.get_unit("not_a_unit") is None
+        assert PredefinedTypes.get_type("not_a_unit") is None
+
+    def test_all_units(self):
+        # look up some units before all units are requested
+        PredefinedTypes.get_type("mV")
+        PredefinedTypes.register_unit(u.mV / u.ms)
+
+        expected_names = []
+        for unit_str in dir(u.si) + dir(u.cgs) + dir(u.astrophys):
+            unit = getattr(u, unit_str, None)
+            if isinstance(unit, u.UnitBase):
+                expected_names.extend([str(unit_name) for unit_name in unit.names if str(unit_name) not in expected_names])
+
+        assert list(PredefinedUnits.get_units().keys()) == expected_names + ["mV / ms"]
+        assert list(PredefinedTypes.get_types().keys()) == expected_names + ["real", "void", "boolean", "string", "integer", "mV / ms"]
+        assert all(PredefinedTypes.get_type(unit_name).unit.get_unit() == PredefinedUnits.get_unit(unit_name).get_unit() for unit_name in expected_names)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# test_profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import pstats
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_target
+from pynestml.utils.profiler import Profiler
+
+
+class TestProfiler:
+    """
+    Tests that the processing phases are recorded when profiling is enabled.
+    """
+
+    @pytest.fixture(autouse=True)
+    def disable_profiler(self):
+        yield
+        Profiler.configure(enabled=False)
+
+    def _generate(self, target_path, **kwargs):
+        generate_target(input_path=os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml")),
+                        target_platform="PYTHON_STANDALONE",
+                        target_path=target_path,
+                        logging_level="ERROR",
+                        parse_cache=False,
+                        ode_toolbox_cache=False,
+                        **kwargs)
+
+    def test_profile(self, tmp_path):
+        self._generate(str(tmp_path / "target"), profile=True)
+
+        with open(str(tmp_path / "report" / "profile.json")) as f:
+            report = json.load(f)
+
+        for phase in ["get_parsed_models", "parse", "symbol_table", "check_cocos", "ode_toolbox_analysis", "render", "generate_code"]:
+            assert phase in report["summary"].keys()
+            assert report["summary"][phase]["count"] >= 1
+
+        assert report["summary"]["render"]["count"] == len([record for record in report["phases"] if record["phase"] == "render"])
+        assert all(record["model"] == "iaf_psc_exp_neuron" for record in report["phases"] if record["phase"] in ["symbol_table", "check_cocos", "ode_toolbox_analysis"])
+
+        # nested phases are completed before the phase that contains them
+        phases = [record["phase"] for record in report["phases"]]
+        assert phases.index("parse") < phases.index("get_parsed_models")
+        assert phases.index("ode_toolbox_analysis") < phases.index("generate_code")
+        assert report["total_wall_time"] >= report["summary"]["generate_code"]["wall_time"]
+
+        assert not os.path.exists(str(tmp_path / "report" / "profile"))
+
+    def test_cprofile(self, tmp_path):
+        self._generate(str(tmp_path / "target"), cprofile=True)
+
+        assert os.path.isfile(str(tmp_path / "report" / "profile.json"))
+        prof_files = os.listdir(str(tmp_path / "report" / "profile"))
+        assert any("get_parsed_models" in fn for fn in prof_files)
+        assert any("generate_code" in fn for fn in prof_files)
+
+        # only outermost phases are profiled
+        assert not any("ode_toolbox_analysis" in fn for fn in prof_files)
+
+        for fn in prof_files:
+            pstats.Stats(str(tmp_path / "report" / "profile" / fn))
+
+    def test_profile_disabled(self, tmp_path):
+        self._generate(str(tmp_path / "target"))
+
+        assert not os.path.exists(str(tmp_path / "report" / "profile.json"))
+        assert Profiler.records == []
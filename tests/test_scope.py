@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# test_scope.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.symbol_table.scope import Scope, ScopeType
+from pynestml.symbols.symbol import Symbol, SymbolKind
+
+
+def create_symbol(scope: Scope, name: str, kind: SymbolKind = SymbolKind.VARIABLE) -> Symbol:
+    return Symbol(element_reference=None, scope=scope, name=name, symbol_kind=kind)
+
+
+class TestScope:
+    """
+    Tests symbol resolution in a tree of scopes while symbols and scopes are added and deleted.
+    """
+
+    def test_resolve_to_symbol(self):
+        global_scope = Scope(ScopeType.GLOBAL)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=global_scope)
+        global_scope.add_scope(update_scope)
+
+        x = create_symbol(global_scope, "x")
+        f = create_symbol(global_scope, "x", SymbolKind.FUNCTION)
+        global_scope.add_symbol(x)
+        global_scope.add_symbol(f)
+
+        assert update_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is x
+        assert update_scope.resolve_to_symbol("x", SymbolKind.FUNCTION) is f
+        assert update_scope.resolve_to_scope("x", SymbolKind.VARIABLE) is global_scope
+        assert update_scope.resolve_to_symbol("y", SymbolKind.VARIABLE) is None
+
+        # a local declaration shadows the global one
+        x_local = create_symbol(update_scope, "x")
+        update_scope.add_symbol(x_local)
+        assert update_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is x_local
+        assert update_scope.resolve_to_scope("x", SymbolKind.VARIABLE) is update_scope
+        assert global_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is x
+
+        assert update_scope.delete_symbol(x_local)
+        assert not update_scope.delete_symbol(x_local)
+        assert update_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is x
+
+    def test_update_variable_symbol(self):
+        scope = Scope(ScopeType.GLOBAL)
+        x = create_symbol(scope, "x")
+        y = create_symbol(scope, "y")
+        scope.add_symbol(x)
+        scope.add_symbol(y)
+
+        x_new = create_symbol(scope, "x")
+        scope.update_variable_symbol(x_new)
+        assert scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is x_new
+        assert scope.get_symbols_in_this_scope() == [y, x_new]
+
+    def test_resolve_to_all(self):
+        global_scope = Scope(ScopeType.GLOBAL)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=global_scope)
+        function_scope = Scope(ScopeType.FUNCTION, enclosing_scope=global_scope)
+
+        # symbols that are added before their scope is added to the tree are found as well
+        x_update = create_symbol(update_scope, "x")
+        update_scope.add_symbol(x_update)
+        global_scope.add_scope(update_scope)
+        global_scope.add_scope(function_scope)
+        x_function = create_symbol(function_scope, "x")
+        function_scope.add_symbol(x_function)
+        x_global = create_symbol(global_scope, "x")
+        global_scope.add_symbol(x_global)
+
+        assert function_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) == [x_global, x_update, x_function]
+        assert function_scope.resolve_to_all_scopes("x", SymbolKind.VARIABLE) == [global_scope, update_scope, function_scope]
+        assert global_scope.resolve_to_all_symbols("x", SymbolKind.FUNCTION) is None
+        assert global_scope.resolve_to_all_scopes("x", SymbolKind.FUNCTION) is None
+
+        global_scope.delete_scope(update_scope)
+        assert global_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) == [x_global, x_function]
+
+        global_scope.delete_symbol(x_global)
+        function_scope.delete_symbol(x_function)
+        assert global_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) is None
+
+        # the deleted scope still resolves through its enclosing scope
+        assert update_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is x_update
+        assert update_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) is None
+
+    def test_share_symbols(self):
+        predefined_scope = Scope(ScopeType.GLOBAL)
+        e = create_symbol(predefined_scope, "e")
+        t = create_symbol(predefined_scope, "t")
+        predefined_scope.add_symbol(e)
+        predefined_scope.add_symbol(t)
+
+        scope1 = Scope(ScopeType.GLOBAL)
+        scope2 = Scope(ScopeType.GLOBAL)
+        scope1.share_symbols(predefined_scope)
+        scope2.share_symbols(predefined_scope)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=scope1)
+        scope1.add_scope(update_scope)
+
+        assert update_scope.resolve_to_symbol("e", SymbolKind.VARIABLE) is e
+        assert scope1.get_symbols_in_this_scope() == [e, t]
+
+        # changes to one scope do not affect the shared symbols
+        e_redeclared = create_symbol(scope1, "e")
+        scope1.add_symbol(e_redeclared)
+        assert scope1.delete_symbol(t)
+        assert scope1.resolve_to_all_symbols("e", SymbolKind.VARIABLE) == [e, e_redeclared]
+        assert scope1.resolve_to_symbol("t", SymbolKind.VARIABLE) is None
+        assert scope1.get_symbols_in_this_scope() == [e, e_redeclared]
+
+        assert scope2.resolve_to_symbol("e", SymbolKind.VARIABLE) is e
+        assert scope2.resolve_to_symbol("t", SymbolKind.VARIABLE) is t
+        assert predefined_scope.resolve_to_all_symbols("e", SymbolKind.VARIABLE) is e
+        assert predefined_scope.get_symbols_in_this_scope() == [e, t]
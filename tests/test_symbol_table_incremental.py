@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# test_symbol_table_incremental.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_model import ASTModel
+from pynestml.symbol_table.scope import Scope
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import VariableSymbol
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+
+def get_symbol_table(scope: Scope):
+    """the variable and function symbols of a scope and its sub-scopes, irrespective of the order in which they were added"""
+    symbols = []
+    for symbol in scope.get_symbols_in_this_scope():
+        if symbol.get_symbol_kind() == SymbolKind.TYPE:
+            # derived unit types are registered in the global scope on demand
+            continue
+
+        properties = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        if isinstance(symbol, VariableSymbol):
+            properties += (symbol.get_block_type(), symbol.get_variable_type(), symbol.get_type_symbol().print_nestml_type(),
+                           str(symbol.get_declaring_expression()), str(symbol.get_ode_or_kernel()))
+        symbols.append(properties)
+
+    return (scope.get_scope_type(), sorted(symbols, key=str), [get_symbol_table(sub_scope) for sub_scope in scope.get_scopes()])
+
+
+class TestSymbolTableIncremental:
+    """
+    Tests that adding declarations and statements to a model gives the same symbol table as rebuilding it.
+    """
+
+    def test_incremental_update(self):
+        init_predefined()
+        Logger.init_logger(LoggingLevel.ERROR)
+        model_file = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        model: ASTModel = ModelParser.parse_file(model_file).get_model_list()[0]
+
+        ASTUtils.add_declaration_to_internals(model, "__h", "resolution()")
+        ASTUtils.add_declaration_to_state_block(model, "x", "1 + V_m / mV")
+        ASTUtils.add_declaration_to_update_block(ModelParser.parse_declaration("y real = x + __h / ms"), model)
+        ASTUtils.add_assignment_to_update_block(ModelParser.parse_assignment("x = y"), model)
+
+        for name in ["__h", "x", "y"]:
+            assert model.get_update_blocks()[0].get_stmts_body().get_scope().resolve_to_symbol(name, SymbolKind.VARIABLE) is not None
+
+        incremental_symbol_table = get_symbol_table(model.get_scope())
+        model.accept(ASTSymbolTableVisitor())
+        assert incremental_symbol_table == get_symbol_table(model.get_scope())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# test_sympy_to_ast_converter.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+import sympy
+
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+from pynestml.utils.sympy_to_ast_converter import NESTMLSympyPrinter, SympyToASTConverter
+
+
+class TestSympyToASTConverter:
+    """
+    Tests that converting a sympy expression directly into an AST gives the same result as printing it and parsing the printed string, and that expressions returned by ODE-toolbox are parsed as given.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        init_predefined()
+
+    _expr_strs = ["x", "-x", "-2", "1/2", "-1/2", "x - y", "-x*y", "-x**2", "x**-2", "x**(1/3)", "1/x", "1/(x*y)", "x/(y*z)",
+                  "-x/y", "2*x/3", "-2.5e-7*x", "exp(-h/tau)*V + (1 - exp(-h/tau))*E_L", "sqrt(x)", "1/sqrt(x + y)", "(x + y)**2",
+                  "x**y**z", "(x**y)**z", "-(x + y)", "x - (y - z)", "a*(b - c)/(d + e)", "1.0*x + 0.5", "-1.0*E_L*(exp(-h/tau) - 1)",
+                  "1/(x**2*y)", "x/(y**2)**3", "-x - y - 3", "3 - x", "1/(1 - exp(-x))", "(-x)**y", "x**(-y)", "exp(x)**2", "1/(x*exp(y))",
+                  "-(x*y)**(-1)", "__h*(a + b)/(a + b)", "2*3", "b*a", "1.0*(__h + tau)*exp(-__h/tau)/tau"]
+
+    @pytest.mark.parametrize("expr_str", _expr_strs)
+    def test_same_as_parse(self, expr_str):
+        converted = ODEToolboxUtils.parse_expression(expr_str)
+        parsed = ModelParser.parse_expression(expr_str)
+
+        # sympy may reorder terms without evaluating the expression, so compare the printed expressions mathematically
+        converted_expr = sympy.parsing.sympy_parser.parse_expr(NESTMLPrinter().print(converted))
+        parsed_expr = sympy.parsing.sympy_parser.parse_expr(NESTMLPrinter().print(parsed))
+        assert sympy.simplify(converted_expr - parsed_expr) == 0
+
+    @pytest.mark.parametrize("expr_str", ["2*3", "__h*(a + b)/(a + b)", "x/x", "0*x + y"])
+    def test_parse_not_evaluated(self, expr_str):
+        converted = ODEToolboxUtils.parse_expression(expr_str)
+
+        assert NESTMLPrinter().print(converted).replace(" ", "") == expr_str.replace(" ", "")
+
+    @pytest.mark.parametrize("expr_str", _expr_strs)
+    def test_parse_printed_expression(self, expr_str):
+        expr = sympy.parsing.sympy_parser.parse_expr(expr_str, global_dict=dict(ODEToolboxUtils._sympy_globals_no_functions))
+        s = ODEToolboxUtils.print_expression(expr)
+        try:
+            converted = ODEToolboxUtils.parse_expression(s)
+        finally:
+            ODEToolboxUtils.clear_printed_expressions()
+        parsed = ModelParser.parse_expression(s)
+
+        assert converted.equals(parsed)
+        assert NESTMLPrinter().print(converted) == NESTMLPrinter().print(parsed)
+
+    @pytest.mark.parametrize("evaluate", [True, False])
+    @pytest.mark.parametrize("expr_str", _expr_strs + ["Piecewise((x, y > 0), (z, True))", "x*Piecewise((1, x >= 2), (-x, True))"])
+    def test_convert_same_as_print_and_parse(self, expr_str, evaluate):
+        expr = sympy.parsing.sympy_parser.parse_expr(expr_str, global_dict=dict(ODEToolboxUtils._sympy_globals_unevaluated), evaluate=evaluate)
+
+        converted = SympyToASTConverter.convert(expr)
+        parsed = ModelParser.parse_expression(NESTMLSympyPrinter().doprint(expr))
+
+        assert converted.equals(parsed)
+        assert NESTMLPrinter().print(converted) == NESTMLPrinter().print(parsed)
+
+    @pytest.mark.parametrize("expr_str", ["-x*y", "-x/y - z", "-x**2*y + z", "-1.0*E_L*(exp(-h/tau) - 1)"])
+    def test_parent_links(self, expr_str):
+        expr = sympy.parsing.sympy_parser.parse_expr(expr_str, global_dict=dict(ODEToolboxUtils._sympy_globals_no_functions))
+
+        nodes = [SympyToASTConverter.convert(expr)]
+        while nodes:
+            node = nodes.pop()
+            for child in node.get_children():
+                assert child.get_parent() is node
+                nodes.append(child)
+
+    def test_parse_ode_toolbox_expression(self):
+        expr_str = "__P__V_m__V_m*V_m + __P__V_m__I_syn*I_syn + Piecewise((1.0, t > 0), (0, True))"
+        expected = ModelParser.parse_expression(ODEToolboxUtils._rewrite_piecewise_into_ternary(expr_str))
+        assert ODEToolboxUtils.parse_expression(expr_str).equals(expected)
+
+    def test_parse_expressions(self):
+        expr_strs = ["a + b", "exp(-h/tau)", "a + b", "x > 0 ? 1 : 2"]
+        exprs = ModelParser.parse_expressions(expr_strs)
+
+        assert len(exprs) == len(expr_strs)
+        for expr, expr_str in zip(exprs, expr_strs):
+            assert expr.equals(ModelParser.parse_expression(expr_str))
+
+        # repeated strings yield distinct nodes
+        assert exprs[0] is not exprs[2]
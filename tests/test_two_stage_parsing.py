@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# test_two_stage_parsing.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import pytest
+
+from antlr4 import CommonTokenStream, FileStream, InputStream
+from antlr4.atn.PredictionMode import PredictionMode
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.error_listener import NestMLErrorListener
+from pynestml.utils.model_parser import parse_two_stage
+
+
+class TestTwoStageParsing:
+    """
+    Tests that parsing with SLL prediction first, and falling back to full LL prediction, gives the same parse trees and syntax errors as parsing with full LL prediction only.
+    """
+
+    def _get_parser(self, input_stream):
+        stream = CommonTokenStream(PyNestMLLexer(input_stream))
+        stream.fill()
+        parser = PyNestMLParser(stream)
+        parser.removeErrorListeners()
+        error_listener = NestMLErrorListener()
+        parser.addErrorListener(error_listener)
+
+        return parser, error_listener
+
+    @pytest.mark.parametrize("model_file", sorted(glob.glob(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "*", "*.nestml")))))
+    def test_same_parse_tree(self, model_file):
+        parser, error_listener = self._get_parser(FileStream(model_file, encoding="utf-8"))
+        parse_tree = parse_two_stage(parser, PyNestMLParser.nestMLCompilationUnit)
+        assert not error_listener.error_occurred
+
+        parser_ll, _ = self._get_parser(FileStream(model_file, encoding="utf-8"))
+        parser_ll._interp.predictionMode = PredictionMode.LL
+        assert parse_tree.toStringTree(recog=parser) == parser_ll.nestMLCompilationUnit().toStringTree(recog=parser_ll)
+
+    def test_same_syntax_error(self):
+        model = "model test_neuron:\n    state:\n        V_m mV = -70 mV +\n"
+        parser, error_listener = self._get_parser(InputStream(model))
+        parse_two_stage(parser, PyNestMLParser.nestMLCompilationUnit)
+
+        parser_ll, error_listener_ll = self._get_parser(InputStream(model))
+        parser_ll.nestMLCompilationUnit()
+
+        assert error_listener.error_occurred
+        assert (error_listener.line, error_listener.column, error_listener.msg) == (error_listener_ll.line, error_listener_ll.column, error_listener_ll.msg)
+
+        # the error strategy and prediction mode of the parser are restored
+        assert parser._interp.predictionMode == PredictionMode.LL
+        assert parser._listeners == [error_listener]
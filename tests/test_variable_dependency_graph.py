@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# test_variable_dependency_graph.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+
+@pytest.fixture
+def model():
+    init_predefined()
+    Logger.init_logger(LoggingLevel.ERROR)
+
+    return ModelParser.parse_file(os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), "resources")), "variable_dependency_graph_test.nestml")).get_model_list()[0]
+
+
+class TestVariableDependencyGraph:
+    """
+    Tests the variable dependency graph of a model, and the dependency searches in ``ASTUtils`` that use it.
+    """
+
+    def test_direct_dependencies(self, model):
+        graph = model.get_variable_dependency_graph()
+
+        assert graph.get_necessary_variables("V_m") == {"E_L", "tau", "I_syn", "C_m"}
+        assert graph.get_necessary_variables("I_syn") == {"K", "spikes"}
+        assert graph.get_necessary_variables("w") == {"a"}
+        assert graph.get_necessary_variables("x") == {"w"}
+
+        # variables in a kernel expression need the kernel
+        assert graph.get_necessary_variables("tau") == {"K"}
+
+        assert graph.get_dependent_variables("w") == {"x"}
+        assert graph.get_dependent_variables("tau") == {"V_m", "K"}
+
+        # variables assigned to in an if-block depend on the condition; kernels do not depend on t
+        assert graph.get_dependent_variables("E_L") == {"V_m", "w"}
+        assert graph.get_dependent_variables("t") == set()
+
+        assert graph.is_state_variable("V_m") and not graph.is_state_variable("E_L")
+        assert graph.is_inline_expression("I_syn") and not graph.is_inline_expression("V_m")
+        assert graph.is_kernel_variable("K") and not graph.is_kernel_variable("I_syn")
+
+    def test_recursive_searches(self, model):
+        assert set(ASTUtils.recursive_necessary_variables_search(["x"], model)) == {"x", "w", "a"}
+        assert set(ASTUtils.recursive_necessary_variables_search(["I_syn"], model)) == {"I_syn", "K", "spikes"}
+        assert set(ASTUtils.recursive_dependent_variables_search(["a"], model)) == {"a", "w", "x"}
+        assert set(ASTUtils.recursive_dependent_variables_search(["C_m", "t"], model)) == {"C_m", "t", "V_m", "w", "x"}
+
+    def test_invalidation(self, model):
+        graph = model.get_variable_dependency_graph()
+        assert model.get_variable_dependency_graph() is graph
+
+        ASTUtils.add_declaration_to_state_block(model, "y", "x + a")
+        assert model.get_variable_dependency_graph() is not graph
+        assert ASTUtils.get_dependent_variables("x", model) == {"y"}
+        assert model.get_variable_dependency_graph().is_state_variable("y")
+
+        graph = model.get_variable_dependency_graph()
+        model.accept(ASTSymbolTableVisitor())
+        assert model.get_variable_dependency_graph() is not graph
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# test_visitor_dispatch.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_external_variable import ASTExternalVariable
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class RecordingVisitor(ASTVisitor):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def visit_variable(self, node):
+        self.calls.append(("visit_variable", node.get_name()))
+
+    def endvisit_variable(self, node):
+        self.calls.append(("endvisit_variable", node.get_name()))
+
+    def visit_simple_expression(self, node):
+        self.calls.append(("visit_simple_expression", str(node)))
+
+    def visit_expression(self, node):
+        self.calls.append(("visit_expression", str(node)))
+
+    def visit_stmt(self, node):
+        self.calls.append(("visit_stmt", str(node).strip()))
+
+
+class OtherRecordingVisitor(RecordingVisitor):
+    def visit_variable(self, node):
+        self.calls.append(("other_visit_variable", node.get_name()))
+
+
+class TestVisitorDispatch:
+    """
+    Tests that nodes are dispatched to the ``visit_*``, ``traverse_*`` and ``endvisit_*`` methods of the visitor's class.
+    """
+
+    def test_dispatch(self):
+        init_predefined()
+        visitor = RecordingVisitor()
+        ModelParser.parse_expression("a + b").accept(visitor)
+        assert visitor.calls == [("visit_expression", "a + b"),
+                                 ("visit_simple_expression", "a"),
+                                 ("visit_variable", "a"),
+                                 ("endvisit_variable", "a"),
+                                 ("visit_simple_expression", "b"),
+                                 ("visit_variable", "b"),
+                                 ("endvisit_variable", "b")]
+
+        visitor = RecordingVisitor()
+        ModelParser.parse_stmt("x = 1\n").accept(visitor)
+        assert visitor.calls[0] == ("visit_stmt", "x = 1")
+
+    def test_dispatch_subclass(self):
+        """node subclasses are dispatched as their base class; visitor subclasses use their own methods"""
+        node = ASTExternalVariable("x")
+
+        visitor = RecordingVisitor()
+        node.accept(visitor)
+        assert visitor.calls == [("visit_variable", "x"), ("endvisit_variable", "x")]
+
+        visitor = OtherRecordingVisitor()
+        node.accept(visitor)
+        assert visitor.calls == [("other_visit_variable", "x"), ("endvisit_variable", "x")]